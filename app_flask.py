@@ -9,14 +9,26 @@ from datetime import datetime
 import json
 import ast
 from nfl_edge.accuracy_tracker import create_tracker
+from nfl_edge.frame_cache import FrameCache
+from nfl_edge.game_index import GameIndex, TeamGameIndex
+from nfl_edge.team_mapping import to_abbr
+from nfl_edge.jobs import JobQueue
 from nfl_edge.bets.betonline_client import (
     load_ledger, get_weekly_summary
 )
 from live_bet_tracker import LiveBetTracker
+from team_snapshots import TeamSnapshotStore, empty_espn, empty_team_stats
 from edge_hunt.integrate_signals import enrich_predictions_with_signals
 
 app = Flask(__name__)
 
+# Loaded prediction frames, rebuilt only when an artifacts file changes
+_frames = FrameCache()
+_jobs = JobQueue()  # long scripts started from the dashboard
+
+# Simulator package root; callers add it to sys.path only if it is missing
+SIMULATOR_DIR = str(Path(__file__).parent / "simulation_engine" / "nflfastR_simulator")
+
 def _parse_signals(signals_data):
     """Safely parse edge_hunt_signals from CSV."""
     # Check for None first
@@ -240,7 +252,29 @@ def generate_betting_recommendations(df_pred, current_week=None):
     }
 
 # Load predictions functions
+SIMULATOR_BACKTEST_FILES = [
+    Path("simulation_engine/nflfastR_simulator/artifacts/backtest_all_games_conviction.csv"),
+    Path("simulation_engine/nflfastR_simulator/artifacts/backtest_week9_predictions.csv"),
+]
+
+
+def _simulator_sources():
+    return [Path("artifacts") / "simulator_predictions.csv", *SIMULATOR_BACKTEST_FILES]
+
+
+def _historical_sources():
+    artifacts = Path("artifacts")
+    return [*artifacts.glob("predictions_2025_*.csv"), *artifacts.glob("week_*_projections.csv")]
+
+
 def load_simulator_predictions(force_reload=False):
+    """Simulator predictions (cached until simulator_predictions.csv or the backtest files change)."""
+    if force_reload:
+        _frames.invalidate('simulator')
+    return _frames.get('simulator', _simulator_sources(), _build_simulator_predictions)
+
+
+def _build_simulator_predictions():
     """Load simulator predictions from backtest_all_games_conviction.py (formatted for frontend)."""
     simulator_file = Path("artifacts") / "simulator_predictions.csv"
 
@@ -262,8 +296,7 @@ def load_simulator_predictions(force_reload=False):
     
     # If formatted file doesn't exist, try to load and format backtest files directly
     print("⚠️  simulator_predictions.csv not found, trying to load backtest files directly...")
-    backtest_file = Path("simulation_engine/nflfastR_simulator/artifacts/backtest_all_games_conviction.csv")
-    week9_file = Path("simulation_engine/nflfastR_simulator/artifacts/backtest_week9_predictions.csv")
+    backtest_file, week9_file = SIMULATOR_BACKTEST_FILES
     
     dfs = []
     if backtest_file.exists():
@@ -303,7 +336,22 @@ def load_simulator_predictions(force_reload=False):
     
     return None
 
+def _latest_sources():
+    return [*_simulator_sources(), *Path("artifacts").glob("graded_results/graded_bets_*.csv"),
+            *_historical_sources()]
+
+
 def load_latest_predictions():
+    """Merged predictions for every route (cached until any source CSV is added or changes)."""
+    return _frames.get('latest', _latest_sources(), _build_latest_predictions)
+
+
+def load_game_index():
+    """(season, week, away, home) lookup over load_latest_predictions(), rebuilt with it."""
+    return _frames.memo('latest_index', _latest_sources(), lambda: GameIndex.from_frame(load_latest_predictions()))
+
+
+def _build_latest_predictions():
     """Load pre-computed graded results from backend - combines all weeks for historical data"""
     import glob
 
@@ -346,6 +394,11 @@ def load_latest_predictions():
     return load_all_historical_weeks()
 
 def load_all_historical_weeks():
+    """All week prediction files combined (cached until a week file is added or changes)."""
+    return _frames.get('historical', _historical_sources(), _build_all_historical_weeks)
+
+
+def _build_all_historical_weeks():
     """Load and combine all individual week prediction files"""
     import re
     
@@ -700,6 +753,11 @@ def api_best_bets():
 
     return jsonify(bets)
 
+@app.route('/api/cache-stats')
+def api_cache_stats():
+    """Hit/miss counters of the in-process predictions cache and team snapshot status"""
+    return jsonify({**_frames.stats(), 'team_snapshots': _snapshots.stats()})
+
 @app.route('/api/aii')
 def api_aii():
     """API endpoint for Analytics Intensity Index"""
@@ -726,6 +784,31 @@ def betting_guide():
     return render_template('betting_guide.html')
 
 
+def _build_team_profile(team, season, week):
+    """TeamProfile display dict (PFF/nflfastR metrics) from the local simulator data."""
+    import sys
+    if SIMULATOR_DIR not in sys.path:  # called per slate team on every snapshot refresh
+        sys.path.insert(0, SIMULATOR_DIR)
+    from simulator.team_profile import TeamProfile
+
+    # TeamProfile expects data_dir to point to nflfastR subdirectory
+    data_dir = Path(__file__).parent / "simulation_engine" / "nflfastR_simulator" / "data" / "nflfastR"
+    return TeamProfile(team, season, week, data_dir, debug=False).as_dict_for_audit()
+
+
+def _current_slate():
+    """(team, week) for both sides of every game in the latest predicted week."""
+    df = load_latest_predictions()
+    if df is None or 'week' not in df.columns or df.empty:
+        return []
+    away_col, home_col = ('away_team', 'home_team') if 'away_team' in df.columns else ('away', 'home')
+    latest = df[df['week'] == df['week'].max()]
+    return [(team, int(w)) for col in (away_col, home_col) for team, w in zip(latest[col], latest['week'])]
+
+
+_snapshots = TeamSnapshotStore(profile_builder=_build_team_profile, slate=_current_slate)
+
+
 @app.route('/game/<away>/<home>')
 @app.route('/game/<away>/<home>/<int:week>')
 def game_detail(away, home, week=None):
@@ -736,251 +819,44 @@ def game_detail(away, home, week=None):
         return render_template('error.html',
                              message="No predictions found. Run python3 run_week.py first.")
 
-    # Normalize column names - simulator uses away_team/home_team, older format uses away/home
-    if 'away_team' in df_pred.columns:
-        away_col = 'away_team'
-        home_col = 'home_team'
-    else:
-        away_col = 'away'
-        home_col = 'home'
-
-    # Find the specific game
-    if week and 'week' in df_pred.columns:
-        game = df_pred[
-            (df_pred[away_col] == away) &
-            (df_pred[home_col] == home) &
-            (df_pred['week'] == week)
-        ]
-    else:
-        game = df_pred[
-            (df_pred[away_col] == away) &
-            (df_pred[home_col] == home)
-        ]
+    # Find the specific game (simulator away_team/home_team or older away/home columns)
+    # Without a week, the first matching row (as before the index), not the latest meeting
+    game = load_game_index().get(away, home, week=week if week and 'week' in df_pred.columns else None,
+                                 latest=False)
 
-    if game.empty:
+    if game is None:
         return render_template('error.html',
                              message=f"Game {away} @ {home} not found.")
 
-    game_data = game.iloc[0].to_dict()
-
-    # Fetch comprehensive ESPN data
-    print(f"Loading game {away} @ {home}...", flush=True)
-    try:
-        from espn_data_fetcher import ESPNDataFetcher
-        espn_data = ESPNDataFetcher.fetch_comprehensive_game_data(away, home)
-
-        # Calculate basic rest days from schedule if not available
-        if espn_data['away'].get('rest_days') is None:
-            away_schedule = ESPNDataFetcher.fetch_team_schedule(away, 2025)
-            if away_schedule and len(away_schedule) >= 2:
-                # Use the last two games to estimate rest days
-                try:
-                    from datetime import datetime
-                    sorted_games = sorted(away_schedule, key=lambda x: x['date'])
-                    if len(sorted_games) >= 2:
-                        last_game = datetime.fromisoformat(sorted_games[-2]['date'].replace('Z', '+00:00'))
-                        current_game = datetime.fromisoformat(sorted_games[-1]['date'].replace('Z', '+00:00'))
-                        espn_data['away']['rest_days'] = (current_game - last_game).days
-                except Exception:
-                    espn_data['away']['rest_days'] = 7
-
-        if espn_data['home'].get('rest_days') is None:
-            home_schedule = ESPNDataFetcher.fetch_team_schedule(home, 2025)
-            if home_schedule and len(home_schedule) >= 2:
-                try:
-                    from datetime import datetime
-                    sorted_games = sorted(home_schedule, key=lambda x: x['date'])
-                    if len(sorted_games) >= 2:
-                        last_game = datetime.fromisoformat(sorted_games[-2]['date'].replace('Z', '+00:00'))
-                        current_game = datetime.fromisoformat(sorted_games[-1]['date'].replace('Z', '+00:00'))
-                        espn_data['home']['rest_days'] = (current_game - last_game).days
-                except Exception:
-                    espn_data['home']['rest_days'] = 7
-
-        # Set travel distance for home team to 0 (they don't travel)
-        if espn_data['home'].get('travel_distance') is None:
-            espn_data['home']['travel_distance'] = 0
-
-        # Set a default for away team if not calculated
-        if espn_data['away'].get('travel_distance') is None:
-            espn_data['away']['travel_distance'] = 0  # Default to 0 if not calculated
-
-        game_data['espn_data'] = espn_data
-        print(f"✓ ESPN data loaded for {away} @ {home}", flush=True)
-    except Exception as e:
-        print(f"⚠️ Could not fetch ESPN data: {e}", flush=True)
-        game_data['espn_data'] = {
-            'away': {'team_info': {}, 'leaders': {}, 'splits': {'overall': {'games': 0}}, 'last_five': [], 'rest_days': 7, 'travel_distance': 0},
-            'home': {'team_info': {}, 'leaders': {}, 'splits': {'overall': {'games': 0}}, 'last_five': [], 'rest_days': 7, 'travel_distance': 0},
-            'game_summary': {}
-        }
-
-    # Build team stats from ESPN data if available
-    espn = game_data.get('espn_data', {})
-    away_splits = espn.get('away', {}).get('splits', {})
-    home_splits = espn.get('home', {}).get('splits', {})
+    game_data = dict(game)  # rows are shared with the cached index
 
+    # Team stats come from the background snapshot store; the view never waits on ESPN/nflverse
+    _snapshots.start()
+    teams = {side: _snapshots.team(abbr) for side, abbr in (('away', away), ('home', home))}
+    if all(teams.values()):
+        print(f"✓ Team snapshots loaded for {away} @ {home}", flush=True)
+    else:
+        print(f"⚠️ No team snapshot yet for {away} @ {home} (refresh running)", flush=True)
+    espn = {side: snap['espn'] if snap else empty_espn() for side, snap in teams.items()}
+    espn['game_summary'] = {}
+    game_data['espn_data'] = espn
     game_data['team_stats'] = {
-        'away': {
-            'team': away,
-            'games': away_splits.get('overall', {}).get('games', 0),
-            'ppg': away_splits.get('overall', {}).get('ppg', 0),
-            'pa_pg': away_splits.get('overall', {}).get('papg', 0),
-            'off_epa': 0,
-            'def_epa': 0,
-            'pass_epa': 0,
-            'rush_epa': 0,
-            'def_pass_epa': 0,
-            'def_rush_epa': 0,
-            'passing_yards': 0,
-            'rushing_yards': 0,
-            'turnovers': 0,
-            'sacks_taken': 0,
-            'takeaways': 0,
-            'last_5_ppg': 0,
-            'last_5_pa': 0,
-        },
-        'home': {
-            'team': home,
-            'games': home_splits.get('overall', {}).get('games', 0),
-            'ppg': home_splits.get('overall', {}).get('ppg', 0),
-            'pa_pg': home_splits.get('overall', {}).get('papg', 0),
-            'off_epa': 0,
-            'def_epa': 0,
-            'pass_epa': 0,
-            'rush_epa': 0,
-            'def_pass_epa': 0,
-            'def_rush_epa': 0,
-            'passing_yards': 0,
-            'rushing_yards': 0,
-            'turnovers': 0,
-            'sacks_taken': 0,
-            'takeaways': 0,
-            'last_5_ppg': 0,
-            'last_5_pa': 0,
-        }
+        'away': teams['away']['team_stats'] if teams['away'] else empty_team_stats(away),
+        'home': teams['home']['team_stats'] if teams['home'] else empty_team_stats(home),
     }
 
-    # Get recent games from ESPN and transform to expected format
-    away_last_five = espn.get('away', {}).get('last_five', [])
-    home_last_five = espn.get('home', {}).get('last_five', [])
-
-    # Transform historical game data to template format
-    away_recent = []
-    for game in away_last_five:
-        away_recent.append({
-            'week': game.get('week', 'N/A'),
-            'opponent': game.get('opponent', 'Unknown'),
-            'points_scored': game.get('team_score', 0),
-            'points_allowed': game.get('opp_score', 0),
-            'result': game.get('result', '-')
-        })
-
-    home_recent = []
-    for game in home_last_five:
-        home_recent.append({
+    # Transform ESPN last five games to template format
+    def recent_games(last_five):
+        return [{
             'week': game.get('week', 'N/A'),
             'opponent': game.get('opponent', 'Unknown'),
             'points_scored': game.get('team_score', 0),
             'points_allowed': game.get('opp_score', 0),
             'result': game.get('result', '-')
-        })
+        } for game in last_five]
 
-    # Fetch nflverse data for stats - use RAW data with all columns
-    try:
-        import requests
-        import io
-        import pandas as pd
-        nflverse_url = "https://github.com/nflverse/nflverse-data/releases/download/stats_team/stats_team_week_2025.csv"
-        response = requests.get(nflverse_url, timeout=30)
-        df_raw = pd.read_csv(io.BytesIO(response.content))
-
-        # Get stats for both teams
-        away_stats = df_raw[df_raw['team'] == away]
-        home_stats = df_raw[df_raw['team'] == home]
-
-        if not away_stats.empty:
-            # Calculate points from TDs, FGs, etc. (nflverse doesn't have direct points column)
-            td_cols = ['passing_tds', 'rushing_tds', 'receiving_tds', 'def_tds', 'special_teams_tds']
-            sum(away_stats.get(col, pd.Series([0])).sum() if col in away_stats.columns else 0 for col in td_cols)
-            away_stats.get('fg_made', pd.Series([0])).sum() if 'fg_made' in away_stats.columns else 0
-            away_stats.get('pat_made', pd.Series([0])).sum() if 'pat_made' in away_stats.columns else 0
-            away_stats.get('def_safeties', pd.Series([0])).sum() if 'def_safeties' in away_stats.columns else 0
-            (away_stats.get('passing_2pt_conversions', pd.Series([0])).sum() if 'passing_2pt_conversions' in away_stats.columns else 0) + \
-                      (away_stats.get('rushing_2pt_conversions', pd.Series([0])).sum() if 'rushing_2pt_conversions' in away_stats.columns else 0) + \
-                      (away_stats.get('receiving_2pt_conversions', pd.Series([0])).sum() if 'receiving_2pt_conversions' in away_stats.columns else 0)
-            # Calculate points per game from recent games
-            away_recent_games = away_stats.head(5) if len(away_stats) >= 5 else away_stats
-            away_points_list = []
-            for _, row in away_recent_games.iterrows():
-                row_tds = sum(row.get(col, 0) for col in td_cols if col in row.index)
-                row_fgs = row.get('fg_made', 0) if 'fg_made' in row.index else 0
-                row_pats = row.get('pat_made', 0) if 'pat_made' in row.index else 0
-                row_safeties = row.get('def_safeties', 0) if 'def_safeties' in row.index else 0
-                row_2pt = (row.get('passing_2pt_conversions', 0) if 'passing_2pt_conversions' in row.index else 0) + \
-                         (row.get('rushing_2pt_conversions', 0) if 'rushing_2pt_conversions' in row.index else 0) + \
-                         (row.get('receiving_2pt_conversions', 0) if 'receiving_2pt_conversions' in row.index else 0)
-                pts = 6 * row_tds + 3 * row_fgs + 1 * row_pats + 2 * (row_safeties + row_2pt)
-                away_points_list.append(pts)
-            away_last_5_ppg = float(pd.Series(away_points_list).mean()) if away_points_list else 0
-
-            # For points allowed, we need opponent data - use ESPN data instead
-            away_last_5_pa = float(sum(game.get('opp_score', 0) for game in away_last_five[:5])) / min(len(away_last_five), 5) if len(away_last_five) > 0 else 0
-
-            game_data['team_stats']['away'].update({
-                'off_epa': float(away_stats['passing_epa'].mean() + away_stats['rushing_epa'].mean()),
-                'def_epa': float(away_stats['def_epa_per_play'].mean()) if 'def_epa_per_play' in away_stats.columns else 0,
-                'pass_epa': float(away_stats['passing_epa'].mean()),
-                'rush_epa': float(away_stats['rushing_epa'].mean()),
-                'passing_yards': float(away_stats['passing_yards'].mean()),
-                'rushing_yards': float(away_stats['rushing_yards'].mean()),
-                'turnovers': int(away_stats['passing_interceptions'].sum() + away_stats['sack_fumbles_lost'].sum() + away_stats['rushing_fumbles_lost'].sum()),
-                'takeaways': int(away_stats['def_interceptions'].sum() + away_stats['fumble_recovery_opp'].sum()),
-                'sacks_taken': int(away_stats['sacks_suffered'].sum()),
-                'def_pass_epa': 0,  # Not in raw data
-                'def_rush_epa': 0,  # Not in raw data
-                'last_5_ppg': away_last_5_ppg,
-                'last_5_pa': away_last_5_pa,
-            })
-
-        if not home_stats.empty:
-            # Calculate points from TDs, FGs, etc. (nflverse doesn't have direct points column)
-            td_cols = ['passing_tds', 'rushing_tds', 'receiving_tds', 'def_tds', 'special_teams_tds']
-            home_recent_games = home_stats.head(5) if len(home_stats) >= 5 else home_stats
-            home_points_list = []
-            for _, row in home_recent_games.iterrows():
-                row_tds = sum(row.get(col, 0) for col in td_cols if col in row.index)
-                row_fgs = row.get('fg_made', 0) if 'fg_made' in row.index else 0
-                row_pats = row.get('pat_made', 0) if 'pat_made' in row.index else 0
-                row_safeties = row.get('def_safeties', 0) if 'def_safeties' in row.index else 0
-                row_2pt = (row.get('passing_2pt_conversions', 0) if 'passing_2pt_conversions' in row.index else 0) + \
-                         (row.get('rushing_2pt_conversions', 0) if 'rushing_2pt_conversions' in row.index else 0) + \
-                         (row.get('receiving_2pt_conversions', 0) if 'receiving_2pt_conversions' in row.index else 0)
-                pts = 6 * row_tds + 3 * row_fgs + 1 * row_pats + 2 * (row_safeties + row_2pt)
-                home_points_list.append(pts)
-            home_last_5_ppg = float(pd.Series(home_points_list).mean()) if home_points_list else 0
-
-            # For points allowed, use ESPN data
-            home_last_5_pa = float(sum(game.get('opp_score', 0) for game in home_last_five[:5])) / min(len(home_last_five), 5) if len(home_last_five) > 0 else 0
-
-            game_data['team_stats']['home'].update({
-                'off_epa': float(home_stats['passing_epa'].mean() + home_stats['rushing_epa'].mean()),
-                'def_epa': float(home_stats['def_epa_per_play'].mean()) if 'def_epa_per_play' in home_stats.columns else 0,
-                'pass_epa': float(home_stats['passing_epa'].mean()),
-                'rush_epa': float(home_stats['rushing_epa'].mean()),
-                'passing_yards': float(home_stats['passing_yards'].mean()),
-                'rushing_yards': float(home_stats['rushing_yards'].mean()),
-                'turnovers': int(home_stats['passing_interceptions'].sum() + home_stats['sack_fumbles_lost'].sum() + home_stats['rushing_fumbles_lost'].sum()),
-                'takeaways': int(home_stats['def_interceptions'].sum() + home_stats['fumble_recovery_opp'].sum()),
-                'sacks_taken': int(home_stats['sacks_suffered'].sum()),
-                'def_pass_epa': 0,  # Not in raw data
-                'def_rush_epa': 0,  # Not in raw data
-                'last_5_ppg': home_last_5_ppg,
-                'last_5_pa': home_last_5_pa,
-            })
-        print(f"✅ Loaded nflverse stats for {away} and {home}")
-    except Exception as e:
-        print(f"⚠️ Warning: Could not fetch nflverse data: {e}")
+    away_recent = recent_games(espn['away'].get('last_five', []))
+    home_recent = recent_games(espn['home'].get('last_five', []))
 
     """
     # DISABLED CODE - was making 17 ESPN API calls on every page load
@@ -1218,7 +1094,9 @@ def game_detail(away, home, week=None):
     try:
         import os
         api_key = os.environ.get('ODDS_API_KEY', '')
-        if api_key:
+        # Only needed to fill in the Vegas consensus row
+        if api_key and 'vegas' in external_predictions:
+            import requests
             odds_url = "https://api.the-odds-api.com/v4/sports/americanfootball_nfl/odds"
             params = {
                 'apiKey': api_key,
@@ -1257,11 +1135,16 @@ def game_detail(away, home, week=None):
     trace_path = None
     if week and 'week' in df_pred.columns:
         from pathlib import Path
+        import sys
+        if SIMULATOR_DIR not in sys.path:
+            sys.path.insert(0, SIMULATOR_DIR)
+        from simulator.trace_sink import find_trace_file
+
         season = 2025  # Default season
         trace_dir = Path("artifacts/traces")
-        trace_filename = f"{away}_{home}_{week}_{season}.jsonl"
-        trace_path_check = trace_dir / trace_filename
-        trace_exists = trace_path_check.exists()
+        # Plain .jsonl or compressed .jsonl.gz / .jsonl.zst
+        trace_path_check = find_trace_file(trace_dir, f"{away}_{home}_{week}_{season}")
+        trace_exists = trace_path_check is not None
         if trace_exists:
             trace_path = str(trace_path_check)
 
@@ -1269,19 +1152,11 @@ def game_detail(away, home, week=None):
     away_profile_dict = None
     home_profile_dict = None
     try:
-        from pathlib import Path
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent / "simulation_engine" / "nflfastR_simulator"))
-        from simulator.team_profile import TeamProfile
-
-        season = 2025
         game_week = week if week else game_data.get('week', 10)
-        # FIXED: TeamProfile expects data_dir to point to nflfastR subdirectory
-        data_dir = Path(__file__).parent / "simulation_engine" / "nflfastR_simulator" / "data" / "nflfastR"
 
+        # Profile dicts are prebuilt for the current slate by the snapshot refresh
         try:
-            away_profile = TeamProfile(away, season, game_week, data_dir, debug=False)
-            away_profile_dict = away_profile.as_dict_for_audit()
+            away_profile_dict = dict(_snapshots.profile(away, game_week))
             print(f"✅ Loaded TeamProfile for {away}")
         except Exception as e:
             print(f"⚠️  Could not load TeamProfile for {away}: {e}")
@@ -1309,8 +1184,7 @@ def game_detail(away, home, week=None):
             }
 
         try:
-            home_profile = TeamProfile(home, season, game_week, data_dir, debug=False)
-            home_profile_dict = home_profile.as_dict_for_audit()
+            home_profile_dict = dict(_snapshots.profile(home, game_week))
             print(f"✅ Loaded TeamProfile for {home}")
         except Exception as e:
             print(f"⚠️  Could not load TeamProfile for {home}: {e}")
@@ -1759,360 +1633,70 @@ def line_movements():
                          week=CURRENT_WEEK,
                          season=CURRENT_SEASON)
 
-@app.route('/model-performance')
-def model_performance():
-    """Model Performance by Conviction Level - Backend Analysis"""
-    from pathlib import Path
-    import pandas as pd
+BACKTEST_FILE = Path("simulation_engine/nflfastR_simulator/artifacts/backtest_all_games_conviction.csv")
 
-    # Load backtest results
-    backtest_file = Path("simulation_engine/nflfastR_simulator/artifacts/backtest_all_games_conviction.csv")
 
-    if not backtest_file.exists():
-        return render_template('error.html',
-                             message="Backtest data not found. Run backtest_all_games_conviction.py first.")
+def load_backtest_summary():
+    """Precomputed model-performance aggregates (rebuilt only when the backtest CSV changes)."""
+    import sys
+    if SIMULATOR_DIR not in sys.path:  # called on every request; don't grow sys.path
+        sys.path.insert(0, SIMULATOR_DIR)
+    from simulator.performance_summary import load_summary
 
-    df = pd.read_csv(backtest_file)
+    return load_summary(BACKTEST_FILE)
 
-    # Calculate stats by conviction level (backend logic)
-    def calc_spread_stats(bets_df):
-        if len(bets_df) == 0:
-            return {'count': 0, 'wins': 0, 'losses': 0, 'pushes': 0,
-                    'win_rate': 0, 'roi': 0, 'avg_edge': 0}
-
-        # Count wins/losses from spread_result column
-        wins = int((bets_df['spread_result'] == 1.0).sum())
-        losses = int((bets_df['spread_result'] == 0.0).sum())
-        pushes = int(len(bets_df) - wins - losses)
-
-        win_rate = (wins / len(bets_df) * 100) if len(bets_df) > 0 else 0
-
-        # Assuming -110 odds: win +0.91, loss -1.00
-        profit = (wins * 0.91) - losses
-        roi = (profit / len(bets_df) * 100) if len(bets_df) > 0 else 0
-
-        # Get average edge from spread_edge column
-        avg_edge = (bets_df['spread_edge'].mean() * 100) if 'spread_edge' in bets_df.columns else 0
-
-        return {
-            'count': int(len(bets_df)),
-            'wins': wins,
-            'losses': losses,
-            'pushes': pushes,
-            'win_rate': round(win_rate, 1),
-            'roi': round(roi, 1),
-            'avg_edge': round(avg_edge, 1)
-        }
 
-    def calc_total_stats(bets_df):
-        if len(bets_df) == 0:
-            return {'count': 0, 'wins': 0, 'losses': 0, 'pushes': 0,
-                    'win_rate': 0, 'roi': 0, 'avg_edge': 0}
-
-        # Count wins/losses from total_result column
-        wins = int((bets_df['total_result'] == 1.0).sum())
-        losses = int((bets_df['total_result'] == 0.0).sum())
-        pushes = int(len(bets_df) - wins - losses)
-
-        win_rate = (wins / len(bets_df) * 100) if len(bets_df) > 0 else 0
-
-        # Assuming -110 odds: win +0.91, loss -1.00
-        profit = (wins * 0.91) - losses
-        roi = (profit / len(bets_df) * 100) if len(bets_df) > 0 else 0
-
-        # Get average edge from total_edge column
-        avg_edge = (bets_df['total_edge'].mean() * 100) if 'total_edge' in bets_df.columns else 0
-
-        return {
-            'count': int(len(bets_df)),
-            'wins': wins,
-            'losses': losses,
-            'pushes': pushes,
-            'win_rate': round(win_rate, 1),
-            'roi': round(roi, 1),
-            'avg_edge': round(avg_edge, 1)
-        }
-
-    # Spread bets by conviction
-    spread_bets = df[df['spread_bet'].notna() & (df['spread_bet'] != '')]
-    spread_high = spread_bets[spread_bets['spread_conviction'] == 'HIGH']
-    spread_medium = spread_bets[spread_bets['spread_conviction'] == 'MEDIUM']
-    spread_low = spread_bets[spread_bets['spread_conviction'] == 'LOW']
-
-    # Total bets by conviction
-    total_bets = df[df['total_bet'].notna() & (df['total_bet'] != '')]
-    total_high = total_bets[total_bets['total_conviction'] == 'HIGH']
-    total_medium = total_bets[total_bets['total_conviction'] == 'MEDIUM']
-    total_low = total_bets[total_bets['total_conviction'] == 'LOW']
-
-    # Calculate all stats on backend
-    stats = {
-        'total_games': len(df),
-        'weeks': sorted(df['week'].unique().tolist()),
-        'spread': {
-            'high': calc_spread_stats(spread_high),
-            'medium': calc_spread_stats(spread_medium),
-            'low': calc_spread_stats(spread_low),
-            'all': calc_spread_stats(spread_bets)
-        },
-        'total': {
-            'high': calc_total_stats(total_high),
-            'medium': calc_total_stats(total_medium),
-            'low': calc_total_stats(total_low),
-            'all': calc_total_stats(total_bets)
-        }
-    }
+@app.route('/model-performance')
+def model_performance():
+    """Model Performance by Conviction Level - Backend Analysis"""
+    summary = load_backtest_summary()
+    if summary is None:
+        return render_template('error.html',
+                             message="Backtest data not found. Run backtest_all_games_conviction.py first.")
 
+    stats = {key: summary[key] for key in ('total_games', 'weeks', 'spread', 'total')}
     return render_template('model_performance.html', stats=stats)
 
-@app.route('/model-performance/spread/<conviction>')
-def model_performance_spread_detail(conviction):
-    """Detailed breakdown of spread bets by conviction level"""
-    from pathlib import Path
-    import pandas as pd
-
+def _model_performance_detail(bet_type, conviction):
     conviction = conviction.upper()
     if conviction not in ['HIGH', 'MEDIUM', 'LOW']:
         return "Invalid conviction level", 400
 
-    # Load backtest results
-    backtest_file = Path("simulation_engine/nflfastR_simulator/artifacts/backtest_all_games_conviction.csv")
-    if not backtest_file.exists():
+    summary = load_backtest_summary()
+    if summary is None:
         return render_template('error.html',
                              message="Backtest data not found.")
 
-    df = pd.read_csv(backtest_file)
-
-    # Filter spread bets by conviction
-    spread_bets = df[
-        (df['spread_bet'].notna()) &
-        (df['spread_bet'] != '') &
-        (df['spread_conviction'] == conviction)
-    ].copy()
-
-    # Prepare bet details for display
-    bets = []
-    for idx, row in spread_bets.iterrows():
-        bets.append({
-            'week': int(row['week']),
-            'away_team': row['away_team'],
-            'home_team': row['home_team'],
-            'market_spread': row['spread_line'],
-            'our_spread': round(row['spread_mean'], 1),
-            'bet': row['spread_bet'],
-            'edge': round(row['spread_edge'] * 100, 1),
-            'result': 'WIN' if row['spread_result'] == 1.0 else 'LOSS' if row['spread_result'] == 0.0 else 'PUSH',
-            'actual_score': f"{int(row['actual_away_score'])}-{int(row['actual_home_score'])}" if pd.notna(row['actual_home_score']) else '-'
-        })
-
+    bets = summary['bets'][bet_type.lower()][conviction]
     return render_template('model_performance_detail.html',
-                         bet_type='Spread',
+                         bet_type=bet_type,
                          conviction=conviction,
                          bets=bets,
                          total=len(bets),
-                         wins=len([b for b in bets if b['result'] == 'WIN']),
-                         losses=len([b for b in bets if b['result'] == 'LOSS']))
+                         wins=sum(b['result'] == 'WIN' for b in bets),
+                         losses=sum(b['result'] == 'LOSS' for b in bets))
+
+@app.route('/model-performance/spread/<conviction>')
+def model_performance_spread_detail(conviction):
+    """Detailed breakdown of spread bets by conviction level"""
+    return _model_performance_detail('Spread', conviction)
 
 @app.route('/model-performance/total/<conviction>')
 def model_performance_total_detail(conviction):
     """Detailed breakdown of total bets by conviction level"""
-    from pathlib import Path
-    import pandas as pd
-
-    conviction = conviction.upper()
-    if conviction not in ['HIGH', 'MEDIUM', 'LOW']:
-        return "Invalid conviction level", 400
-
-    # Load backtest results
-    backtest_file = Path("simulation_engine/nflfastR_simulator/artifacts/backtest_all_games_conviction.csv")
-    if not backtest_file.exists():
-        return render_template('error.html',
-                             message="Backtest data not found.")
-
-    df = pd.read_csv(backtest_file)
-
-    # Filter total bets by conviction
-    total_bets = df[
-        (df['total_bet'].notna()) &
-        (df['total_bet'] != '') &
-        (df['total_conviction'] == conviction)
-    ].copy()
-
-    # Prepare bet details for display
-    bets = []
-    for idx, row in total_bets.iterrows():
-        bets.append({
-            'week': int(row['week']),
-            'away_team': row['away_team'],
-            'home_team': row['home_team'],
-            'market_total': row['total_line'],
-            'our_total': round(row['total_mean'], 1),
-            'bet': row['total_bet'],
-            'edge': round(row['total_edge'] * 100, 1),
-            'result': 'WIN' if row['total_result'] == 1.0 else 'LOSS' if row['total_result'] == 0.0 else 'PUSH',
-            'actual_total': int(row['actual_away_score'] + row['actual_home_score']) if pd.notna(row['actual_home_score']) else '-'
-        })
-
-    return render_template('model_performance_detail.html',
-                         bet_type='Total',
-                         conviction=conviction,
-                         bets=bets,
-                         total=len(bets),
-                         wins=len([b for b in bets if b['result'] == 'WIN']),
-                         losses=len([b for b in bets if b['result'] == 'LOSS']))
+    return _model_performance_detail('Total', conviction)
 
 @app.route('/model-performance/team-analysis')
 def model_performance_team_analysis():
     """Team-by-team performance analysis - identify biases"""
-    from pathlib import Path
-    import pandas as pd
-
-    # Load backtest results
-    backtest_file = Path("simulation_engine/nflfastR_simulator/artifacts/backtest_all_games_conviction.csv")
-    if not backtest_file.exists():
+    summary = load_backtest_summary()
+    if summary is None:
         return render_template('error.html',
                              message="Backtest data not found.")
 
-    df = pd.read_csv(backtest_file)
-
-    # Analyze spread bets by team
-    spread_bets = df[df['spread_bet'].notna() & (df['spread_bet'] != '')]
-    team_spread_stats = {}
-
-    for idx, row in spread_bets.iterrows():
-        home_team = row['home_team']
-        away_team = row['away_team']
-        spread_bet = str(row['spread_bet']).upper()
-        spread_result = row['spread_result']
-        conviction = row['spread_conviction']
-
-        # Determine which team we bet on
-        if 'HOME' in spread_bet or home_team in spread_bet:
-            bet_team = home_team
-        elif 'AWAY' in spread_bet or away_team in spread_bet:
-            bet_team = away_team
-        else:
-            continue
-
-        # Initialize team stats if not exists
-        if bet_team not in team_spread_stats:
-            team_spread_stats[bet_team] = {
-                'team': bet_team,
-                'bets': 0, 'wins': 0, 'losses': 0, 'pushes': 0,
-                'high_bets': 0, 'high_wins': 0,
-                'med_bets': 0, 'med_wins': 0,
-                'low_bets': 0, 'low_wins': 0
-            }
-
-        team_spread_stats[bet_team]['bets'] += 1
-        if spread_result == 1.0:
-            team_spread_stats[bet_team]['wins'] += 1
-        elif spread_result == 0.0:
-            team_spread_stats[bet_team]['losses'] += 1
-        else:
-            team_spread_stats[bet_team]['pushes'] += 1
-
-        # Track by conviction
-        if conviction == 'HIGH':
-            team_spread_stats[bet_team]['high_bets'] += 1
-            if spread_result == 1.0:
-                team_spread_stats[bet_team]['high_wins'] += 1
-        elif conviction == 'MEDIUM':
-            team_spread_stats[bet_team]['med_bets'] += 1
-            if spread_result == 1.0:
-                team_spread_stats[bet_team]['med_wins'] += 1
-        elif conviction == 'LOW':
-            team_spread_stats[bet_team]['low_bets'] += 1
-            if spread_result == 1.0:
-                team_spread_stats[bet_team]['low_wins'] += 1
-
-    # Analyze total bets by team (both teams involved in the game)
-    total_bets = df[df['total_bet'].notna() & (df['total_bet'] != '')]
-    team_total_stats = {}
-
-    for idx, row in total_bets.iterrows():
-        home_team = row['home_team']
-        away_team = row['away_team']
-        total_result = row['total_result']
-        conviction = row['total_conviction']
-
-        # Count both teams in the game
-        for team in [home_team, away_team]:
-            if team not in team_total_stats:
-                team_total_stats[team] = {
-                    'team': team,
-                    'bets': 0, 'wins': 0, 'losses': 0, 'pushes': 0,
-                    'high_bets': 0, 'high_wins': 0,
-                    'med_bets': 0, 'med_wins': 0,
-                    'low_bets': 0, 'low_wins': 0
-                }
-
-            team_total_stats[team]['bets'] += 1
-            if total_result == 1.0:
-                team_total_stats[team]['wins'] += 1
-            elif total_result == 0.0:
-                team_total_stats[team]['losses'] += 1
-            else:
-                team_total_stats[team]['pushes'] += 1
-
-            # Track by conviction
-            if conviction == 'HIGH':
-                team_total_stats[team]['high_bets'] += 1
-                if total_result == 1.0:
-                    team_total_stats[team]['high_wins'] += 1
-            elif conviction == 'MEDIUM':
-                team_total_stats[team]['med_bets'] += 1
-                if total_result == 1.0:
-                    team_total_stats[team]['med_wins'] += 1
-            elif conviction == 'LOW':
-                team_total_stats[team]['low_bets'] += 1
-                if total_result == 1.0:
-                    team_total_stats[team]['low_wins'] += 1
-
-    # Calculate win rates and prepare for display
-    spread_teams = []
-    for team, stats in team_spread_stats.items():
-        if stats['bets'] >= 3:  # Only teams with 3+ bets
-            win_rate = (stats['wins'] / stats['bets'] * 100) if stats['bets'] > 0 else 0
-            high_wr = (stats['high_wins'] / stats['high_bets'] * 100) if stats['high_bets'] > 0 else None
-            med_wr = (stats['med_wins'] / stats['med_bets'] * 100) if stats['med_bets'] > 0 else None
-            low_wr = (stats['low_wins'] / stats['low_bets'] * 100) if stats['low_bets'] > 0 else None
-
-            spread_teams.append({
-                'team': team,
-                'bets': stats['bets'],
-                'wins': stats['wins'],
-                'losses': stats['losses'],
-                'pushes': stats['pushes'],
-                'win_rate': round(win_rate, 1),
-                'high_wr': round(high_wr, 1) if high_wr is not None else None,
-                'med_wr': round(med_wr, 1) if med_wr is not None else None,
-                'low_wr': round(low_wr, 1) if low_wr is not None else None
-            })
-
-    total_teams = []
-    for team, stats in team_total_stats.items():
-        if stats['bets'] >= 3:  # Only teams with 3+ bets
-            win_rate = (stats['wins'] / stats['bets'] * 100) if stats['bets'] > 0 else 0
-            high_wr = (stats['high_wins'] / stats['high_bets'] * 100) if stats['high_bets'] > 0 else None
-            med_wr = (stats['med_wins'] / stats['med_bets'] * 100) if stats['med_bets'] > 0 else None
-            low_wr = (stats['low_wins'] / stats['low_bets'] * 100) if stats['low_bets'] > 0 else None
-
-            total_teams.append({
-                'team': team,
-                'bets': stats['bets'],
-                'wins': stats['wins'],
-                'losses': stats['losses'],
-                'pushes': stats['pushes'],
-                'win_rate': round(win_rate, 1),
-                'high_wr': round(high_wr, 1) if high_wr is not None else None,
-                'med_wr': round(med_wr, 1) if med_wr is not None else None,
-                'low_wr': round(low_wr, 1) if low_wr is not None else None
-            })
-
     return render_template('team_bias_analysis.html',
-                         spread_teams=spread_teams,
-                         total_teams=total_teams)
+                         spread_teams=summary['teams']['spread'],
+                         total_teams=summary['teams']['total'])
 
 @app.route('/performance')
 def performance():
@@ -2663,8 +2247,9 @@ def api_auto_grade_bets():
             games = tracker.get_live_games(sport)
             all_games.extend(games)
 
-        # Get final games only
-        final_games = [g for g in all_games if 'final' in g.get('status', '').lower()]
+        # Index games by team once instead of scanning them for every bet and leg
+        games_by_team = TeamGameIndex(all_games)
+        finals_by_team = games_by_team.filter(lambda g: 'final' in g.get('status', '').lower())
 
         for bet in pending_bets:
             bet_dict = dict(bet)
@@ -2715,12 +2300,7 @@ def api_auto_grade_bets():
                         total_match = re.search(r'(over|under)\s+(\d+(?:\.5)?)', leg, re.IGNORECASE)
 
                         # Try to find the game this leg is for
-                        leg_game = None
-                        for game in all_games:
-                            game_teams = [game.get('home_team', ''), game.get('away_team', '')]
-                            if any(team in leg for team in game_teams):
-                                leg_game = game
-                                break
+                        leg_game = games_by_team.in_text(leg)
 
                         if not leg_game:
                             # Can't find game - keep pending
@@ -2789,12 +2369,7 @@ def api_auto_grade_bets():
                         leg_parts = parts[1:]
 
                         # Find the game
-                        sgp_game = None
-                        for game in all_games:
-                            game_teams = [game.get('home_team', ''), game.get('away_team', '')]
-                            if any(team in game_part for team in game_teams):
-                                sgp_game = game
-                                break
+                        sgp_game = games_by_team.in_text(game_part)
 
                         if not sgp_game:
                             with open('/tmp/sgp_debug.log', 'a') as f:
@@ -2907,38 +2482,22 @@ def api_auto_grade_bets():
                             spread = float(leg_match.group(2))
 
                             # Find matching game
-                            game_found = False
-                            for game in all_games:
-                                if game.get('away_abbr') == team_abbr or game.get('home_abbr') == team_abbr:
-                                    game_found = True
-
-                                    # Check if game is completed (status contains "Final")
-                                    if 'final' not in game.get('status', '').lower():
-                                        all_legs_completed = False
-                                        # Don't break - keep checking other legs for losses
-                                        continue
-
-                                    # Determine if leg won or lost
-                                    if game.get('away_abbr') == team_abbr:
-                                        score_diff = game['away_score'] - game['home_score']
-                                    else:
-                                        score_diff = game['home_score'] - game['away_score']
-
-                                    effective_diff = score_diff + spread
-
-                                    if effective_diff < 0:
-                                        any_leg_lost = True
-                                        # IMMEDIATELY mark parlay as lost - don't wait for other games
-                                        break
-                                    elif effective_diff == 0:
-                                        # Push - treat as loss for parlays
-                                        any_leg_lost = True
-                                        break
-                                    break
-
-                            if not game_found:
+                            game = games_by_team.for_team(team_abbr)
+                            if game is None or 'final' not in game.get('status', '').lower():
+                                # Not found or not completed (status contains "Final") -
+                                # don't break, keep checking other legs for losses
                                 all_legs_completed = False
-                                # Don't break - keep checking other legs for losses
+                            else:
+                                # Determine if leg won or lost
+                                if to_abbr(game.get('away_abbr')) == to_abbr(team_abbr):
+                                    score_diff = game['away_score'] - game['home_score']
+                                else:
+                                    score_diff = game['home_score'] - game['away_score']
+
+                                # A push is treated as a loss for parlays; either way the
+                                # parlay is lost IMMEDIATELY, without waiting for other games
+                                if score_diff + spread <= 0:
+                                    any_leg_lost = True
 
                             # If we found a lost leg, immediately grade as lost
                             if any_leg_lost:
@@ -2967,13 +2526,8 @@ def api_auto_grade_bets():
                     'line': tracker._extract_line(description)
                 }
 
-                # Find matching game
-                matched_game = None
-                for game in final_games:
-                    teams = [game.get('home_team', ''), game.get('away_team', '')]
-                    if any(bet_data['team'] in team for team in teams):
-                        matched_game = game
-                        break
+                # Find matching final game
+                matched_game = finals_by_team.for_team(bet_data['team']) or finals_by_team.in_text(bet_data['team'])
 
                 if not matched_game:
                     still_pending += 1
@@ -3397,100 +2951,68 @@ def api_set_calibration():
             'message': f'Failed to update calibration: {str(e)}'
         }), 500
 
-@app.route('/api/generate-predictions', methods=['POST'])
-def api_generate_predictions():
-    """Generate predictions for next week"""
-    try:
-        import subprocess
-        from pathlib import Path
+def _job_started(job, created, message):
+    """202 response for a submitted (or already running) background job."""
+    return jsonify({
+        'success': True,
+        'job_id': job['id'],
+        'created': created,
+        'message': message if created else f"Already running (started {datetime.fromtimestamp(job['created']):%H:%M:%S})",
+        'job': job,
+    }), 202
 
-        # Run the prediction script
-        result = subprocess.run(
-            ['python3', '-c', 'from nfl_edge.main import run_week; run_week()'],
-            cwd='/Users/steveridder/Git/Football',
-            capture_output=True,
-            text=True,
-            timeout=300
-        )
 
-        if result.returncode == 0:
-            # Find the latest prediction file
-            artifacts_dir = Path('/Users/steveridder/Git/Football/artifacts')
-            csv_files = sorted(artifacts_dir.glob('predictions_*.csv'), reverse=True)
+@app.route('/api/jobs')
+def api_jobs():
+    """Recent background jobs (newest first)"""
+    return jsonify(_jobs.list(limit=request.args.get('limit', 20, type=int), kind=request.args.get('kind')))
 
-            if csv_files:
-                latest_file = csv_files[0]
-                return jsonify({
-                    'success': True,
-                    'message': 'Predictions generated successfully',
-                    'file': latest_file.name,
-                    'output': result.stdout
-                })
 
-        return jsonify({
-            'success': False,
-            'message': 'Prediction generation failed',
-            'error': result.stderr
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'message': f'Generation failed: {str(e)}'
-        })
+@app.route('/api/jobs/<job_id>')
+def api_job_status(job_id):
+    """Status, progress and log tail of one background job"""
+    job = _jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown job {job_id}'}), 404
+    job['log'] = _jobs.tail(job_id, request.args.get('lines', 50, type=int))
+    return jsonify(job)
 
-@app.route('/api/run-script/sim_week9_10', methods=['POST'])
-def api_run_simulator_predictions():
-    """Run simulator predictions for next 2 weeks (dynamically determined)"""
-    try:
-        import subprocess
-        from pathlib import Path
 
-        # Check if request specifies a specific week
-        week = None
-        if request.is_json:
-            data = request.get_json()
-            week = data.get('week')
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def api_cancel_job(job_id):
+    """Cancel a queued or running background job"""
+    if not _jobs.cancel(job_id):
+        return jsonify({'success': False, 'error': 'Job not found or already finished'}), 409
+    return jsonify({'success': True, 'job': _jobs.get(job_id)})
 
-        script_path = Path(__file__).parent / 'simulation_engine' / 'nflfastR_simulator' / 'scripts' / 'generate_week9_10_predictions.py'
 
-        # Build command with optional week argument
-        cmd = ['python3', str(script_path)]
-        if week:
-            cmd.append(str(week))
+@app.route('/api/generate-predictions', methods=['POST'])
+def api_generate_predictions():
+    """Generate predictions for next week (background job; poll /api/jobs/<id>)"""
+    job, created = _jobs.submit(
+        'generate_predictions',
+        ['python3', '-c', 'from nfl_edge.main import run_week; run_week()'],
+        cwd=str(Path(__file__).parent),
+    )
+    return _job_started(job, created, 'Prediction generation started')
 
-        # Run the simulator prediction script
-        result = subprocess.run(
-            cmd,
-            cwd='/Users/steveridder/Git/Football',
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+@app.route('/api/run-script/sim_week9_10', methods=['POST'])
+def api_run_simulator_predictions():
+    """Run simulator predictions for next 2 weeks (background job; poll /api/jobs/<id>)"""
+    # Check if request specifies a specific week
+    week = None
+    if request.is_json:
+        week = request.get_json().get('week')
 
-        if result.returncode == 0:
-            return jsonify({
-                'success': True,
-                'message': '✅ Predictions generated successfully! Reload page to see Week 10.',
-                'output': result.stdout
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'message': 'Prediction generation failed',
-                'error': result.stderr or 'Script failed to run',
-                'output': result.stdout
-            }), 500
+    script_path = Path(__file__).parent / 'simulation_engine' / 'nflfastR_simulator' / 'scripts' / 'generate_week9_10_predictions.py'
 
-    except subprocess.TimeoutExpired:
-        return jsonify({
-            'success': False,
-            'error': 'Script timed out after 5 minutes'
-        }), 500
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    # Build command with optional week argument
+    cmd = ['python3', str(script_path)]
+    if week:
+        cmd.append(str(week))
+
+    job, created = _jobs.submit('sim_predictions', cmd, cwd=str(Path(__file__).parent))
+    return _job_started(job, created, 'Simulator predictions started')
 
 @app.route('/api/predictions/history', methods=['GET'])
 def api_predictions_history():
@@ -3578,21 +3100,6 @@ def api_get_prediction_file(filename):
 def live_games():
     """Get all live games with scores and recommended bet status"""
     try:
-        # Team name to abbreviation mapping
-        TEAM_MAP = {
-            'Arizona Cardinals': 'ARI', 'Atlanta Falcons': 'ATL', 'Baltimore Ravens': 'BAL',
-            'Buffalo Bills': 'BUF', 'Carolina Panthers': 'CAR', 'Chicago Bears': 'CHI',
-            'Cincinnati Bengals': 'CIN', 'Cleveland Browns': 'CLE', 'Dallas Cowboys': 'DAL',
-            'Denver Broncos': 'DEN', 'Detroit Lions': 'DET', 'Green Bay Packers': 'GB',
-            'Houston Texans': 'HOU', 'Indianapolis Colts': 'IND', 'Jacksonville Jaguars': 'JAX',
-            'Kansas City Chiefs': 'KC', 'Las Vegas Raiders': 'LV', 'Los Angeles Chargers': 'LAC',
-            'Los Angeles Rams': 'LAR', 'Miami Dolphins': 'MIA', 'Minnesota Vikings': 'MIN',
-            'New England Patriots': 'NE', 'New Orleans Saints': 'NO', 'New York Giants': 'NYG',
-            'New York Jets': 'NYJ', 'Philadelphia Eagles': 'PHI', 'Pittsburgh Steelers': 'PIT',
-            'San Francisco 49ers': 'SF', 'Seattle Seahawks': 'SEA', 'Tampa Bay Buccaneers': 'TB',
-            'Tennessee Titans': 'TEN', 'Washington Commanders': 'WAS'
-        }
-
         tracker = LiveBetTracker()
 
         # Get all live games from ESPN
@@ -3601,24 +3108,17 @@ def live_games():
             games = tracker.get_live_games(sport)
             all_live_games.extend(games)
 
-        # Load predictions to match recommendations
-        df = load_latest_predictions()
+        # Predictions indexed by normalized teams to match recommendations
+        index = load_game_index()
 
         result = []
         for game in all_live_games:
             # Convert full names to abbreviations
-            away_abbr = TEAM_MAP.get(game['away_team'], game['away_team'])
-            home_abbr = TEAM_MAP.get(game['home_team'], game['home_team'])
-
-            # Try to find this game in predictions
-            game_row = None
-            if df is not None:
-                # Match by team abbreviations
-                for _, row in df.iterrows():
-                    if (away_abbr == row.get('away', '') and
-                        home_abbr == row.get('home', '')):
-                        game_row = row
-                        break
+            away_abbr = to_abbr(game['away_team'])
+            home_abbr = to_abbr(game['home_team'])
+
+            # Latest prediction for this matchup
+            game_row = index.get(away_abbr, home_abbr)
 
             # Determine if recommended bets are winning
             spread_status = None
@@ -3768,47 +3268,10 @@ def api_fetch_live_scores():
 
 @app.route('/api/run-weekly-prep', methods=['POST'])
 def api_run_weekly_prep():
-    """Run weekly data preparation script (NFLverse + calibration)"""
-    try:
-        import subprocess
-        from pathlib import Path
-        import os
-
-        script_path = Path(__file__).parent / 'scripts' / 'weekly_data_prep.sh'
-
-        # Make sure script is executable
-        os.chmod(script_path, 0o755)
-
-        result = subprocess.run(
-            ['bash', str(script_path)],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-
-        if result.returncode == 0:
-            return jsonify({
-                'success': True,
-                'message': '✅ Weekly data prep complete! NFLverse stats updated and calibration re-fit.',
-                'output': result.stdout
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': result.stderr or 'Script failed',
-                'output': result.stdout
-            })
-
-    except subprocess.TimeoutExpired:
-        return jsonify({
-            'success': False,
-            'error': 'Script timed out after 5 minutes. This is unusual - check logs.'
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        })
+    """Run weekly data preparation script (NFLverse + calibration) as a background job"""
+    script_path = Path(__file__).parent / 'scripts' / 'weekly_data_prep.sh'
+    job, created = _jobs.submit('weekly_prep', ['bash', str(script_path)])
+    return _job_started(job, created, 'Weekly data prep started (2-3 min)')
 
 @app.route('/api/generate-ai-picks', methods=['POST'])
 def generate_ai_picks_route():
@@ -3853,22 +3316,20 @@ def get_ai_picks():
 def get_trace(away, home, week):
     """API endpoint to get trace data for a game."""
     from pathlib import Path
-    import json
+    import sys
+    if SIMULATOR_DIR not in sys.path:
+        sys.path.insert(0, SIMULATOR_DIR)
+    from simulator.trace_sink import find_trace_file, read_trace_events
 
     season = 2025  # Default season
     trace_dir = Path("artifacts/traces")
-    trace_filename = f"{away}_{home}_{week}_{season}.jsonl"
-    trace_path = trace_dir / trace_filename
+    trace_path = find_trace_file(trace_dir, f"{away}_{home}_{week}_{season}")
 
-    if not trace_path.exists():
+    if trace_path is None:
         return jsonify({'error': 'Trace not found'}), 404
 
-    # Load trace events
-    events = []
-    with trace_path.open() as f:
-        for line in f:
-            if line.strip():
-                events.append(json.loads(line))
+    # Load trace events (decompressed transparently)
+    events = read_trace_events(trace_path)
 
     return jsonify({
         'game_id': f"{season}_{week}_{away}_{home}",
@@ -3882,5 +3343,6 @@ def trace_viewer(away, home, week):
     return render_template('trace_viewer.html', away=away, home=home, week=week)
 
 if __name__ == '__main__':
+    _snapshots.start()
     app.run(debug=False, port=9876, host='0.0.0.0')
 
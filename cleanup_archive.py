@@ -142,10 +142,8 @@ def should_keep(path: Path) -> bool:
             return True
     
     # Keep specific backtest/prediction scripts
-    if path.name in ['backtest_all_games_conviction.py', 'backtest_2023_2024.py', 
-                     'predict_game_correct.py', 'backtest_2022_2024.py',
-                     'backtest_ultra_fast.py', 'backtest_optimized.py',
-                     'backtest_with_pff.py']:
+    if path.name in ['backtest_runner.py', 'backtest_all_games_conviction.py',
+                     'predict_game_correct.py', 'backtest_with_pff.py']:
         return True
     
     # Keep scripts in simulation_engine (entire directory kept)
@@ -17,6 +17,9 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from nfl_edge.fetch_pool import fan_out
+from nfl_edge.http_cache import get as cached_get
+
 
 @dataclass
 class ESPNInjury:
@@ -81,7 +84,7 @@ def fetch_team_injuries_espn(team_abbr: str, retries: int = 3) -> List[ESPNInjur
     
     for attempt in range(retries):
         try:
-            response = requests.get(url, timeout=10)
+            response = cached_get(url, source="espn_injuries", timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -163,18 +166,15 @@ def fetch_all_injuries_espn() -> Dict[str, List[ESPNInjury]]:
     
     print("📥 Fetching injuries from ESPN for all 32 teams...")
     
-    for team_abbr in ESPN_TEAM_IDS.keys():
-        if team_abbr == "LA":  # Skip duplicate (LAR is canonical)
-            continue
-        
-        injuries = fetch_team_injuries_espn(team_abbr)
+    # Skip duplicate (LAR is canonical)
+    teams = [team_abbr for team_abbr in ESPN_TEAM_IDS.keys() if team_abbr != "LA"]
+    
+    # Concurrent; the HTTP layer rate-limits per host (be nice to ESPN)
+    for team_abbr, injuries in zip(teams, fan_out(fetch_team_injuries_espn, teams)):
         all_injuries[team_abbr] = injuries
         
         if injuries:
             print(f"  ✅ {team_abbr}: {len(injuries)} injuries")
-        
-        # Rate limiting (be nice to ESPN)
-        time.sleep(0.5)
     
     total = sum(len(inj) for inj in all_injuries.values())
     print(f"\n✅ Total: {total} injuries across {len(all_injuries)} teams")
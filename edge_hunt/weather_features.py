@@ -6,11 +6,12 @@ Converts raw forecasts into simple bins for model features and betting rules.
 """
 
 from __future__ import annotations
-import requests
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Tuple, Optional
 
+from nfl_edge.http_cache import get as cached_get
+
 # Stadium coordinates (lat, lon)
 STADIUMS: Dict[str, Tuple[float, float]] = {
     "ARI": (33.5276, -112.2626),
@@ -126,7 +127,7 @@ def fetch_open_meteo(lat: float, lon: float, hour_utc: datetime) -> Optional[dic
     }
     
     try:
-        r = requests.get(base, params=params, timeout=15)
+        r = cached_get(base, params=params, source="open_meteo", timeout=15)
         if r.status_code != 200:
             return None
         return r.json()
@@ -1,11 +1,13 @@
 """
 Comprehensive ESPN API data fetcher for detailed game and team information
 """
-import requests
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from math import radians, cos, sin, asin, sqrt
 
+from nfl_edge.fetch_pool import gather
+from nfl_edge.http_cache import get as cached_get
+
 
 class ESPNDataFetcher:
     """Fetch comprehensive data from ESPN API"""
@@ -39,7 +41,7 @@ class ESPNDataFetcher:
         try:
             # Get team info
             url = f"{cls.BASE_URL}/teams/{team_id}"
-            response = requests.get(url, timeout=10)
+            response = cached_get(url, source="espn", timeout=10)
             if response.status_code != 200:
                 return {}
             
@@ -85,7 +87,7 @@ class ESPNDataFetcher:
         
         try:
             url = f"{cls.STATS_URL}/seasons/{season}/types/2/teams/{team_id}/statistics"
-            response = requests.get(url, timeout=10)
+            response = cached_get(url, source="espn", timeout=10)
             if response.status_code != 200:
                 return {}
             
@@ -114,7 +116,7 @@ class ESPNDataFetcher:
         """Fetch comprehensive game summary including odds, injuries, weather"""
         try:
             url = f"{cls.BASE_URL}/summary?event={game_id}"
-            response = requests.get(url, timeout=10)
+            response = cached_get(url, source="espn", timeout=10)
             if response.status_code != 200:
                 return {}
             
@@ -213,7 +215,7 @@ class ESPNDataFetcher:
         """Fetch team statistical leaders from scoreboard"""
         try:
             url = f"{cls.BASE_URL}/scoreboard"
-            response = requests.get(url, timeout=10)
+            response = cached_get(url, source="espn", timeout=10)
             if response.status_code != 200:
                 return {}
             
@@ -305,7 +307,7 @@ class ESPNDataFetcher:
         try:
             url = f"{cls.BASE_URL}/teams/{team_id}/schedule"
             params = {'season': season}
-            response = requests.get(url, params=params, timeout=10)
+            response = cached_get(url, params=params, source="espn", timeout=10)
             if response.status_code != 200:
                 return []
             
@@ -417,7 +419,7 @@ class ESPNDataFetcher:
             # Fetch team schedule
             url = f"{cls.BASE_URL}/teams/{team_id}/schedule"
             params = {'season': season}
-            response = requests.get(url, params=params, timeout=10)
+            response = cached_get(url, params=params, source="espn", timeout=10)
             if response.status_code != 200:
                 return []
             
@@ -586,32 +588,37 @@ class ESPNDataFetcher:
         """Fetch all available data for a game - optimized version"""
         print(f"Fetching ESPN data for {away_abbr} @ {home_abbr}...")
         
-        result = {
-            'away': {
-                'team_info': cls.fetch_team_season_stats(away_abbr),
-                'detailed_stats': {},  # Skip for now
-                'leaders': cls.fetch_team_leaders(away_abbr),
-                'schedule': [],
-                'last_five': cls.fetch_last_five_games(away_abbr),
-                'splits': cls.calculate_performance_splits(away_abbr),
-                'rest_days': None,
-                'travel_distance': None
-            },
-            'home': {
-                'team_info': cls.fetch_team_season_stats(home_abbr),
+        # Independent requests run concurrently (rate-limited per host)
+        def team_calls(abbr):
+            return [
+                lambda: cls.fetch_team_season_stats(abbr),
+                lambda: cls.fetch_team_leaders(abbr),
+                lambda: cls.fetch_last_five_games(abbr),
+                lambda: cls.calculate_performance_splits(abbr),
+            ]
+        summary_call = [lambda: cls.fetch_game_summary(game_id)] if game_id else []
+        fetched = gather(*team_calls(away_abbr), *team_calls(home_abbr), *summary_call)
+        
+        def team_result(info, leaders, last_five, splits):
+            return {
+                'team_info': info,
                 'detailed_stats': {},  # Skip for now
-                'leaders': cls.fetch_team_leaders(home_abbr),
+                'leaders': leaders,
                 'schedule': [],
-                'last_five': cls.fetch_last_five_games(home_abbr),
-                'splits': cls.calculate_performance_splits(home_abbr),
+                'last_five': last_five,
+                'splits': splits,
                 'rest_days': None,
                 'travel_distance': None
-            },
+            }
+        
+        result = {
+            'away': team_result(*fetched[0:4]),
+            'home': team_result(*fetched[4:8]),
             'game_summary': {}  # Default empty, will be populated if game_id provided
         }
         
         if game_id:
-            game_summary = cls.fetch_game_summary(game_id)
+            game_summary = fetched[8]
             result['game_summary'] = game_summary
             
             # Calculate rest days and travel distance
@@ -4,9 +4,10 @@ Live Bet Tracker - Colors bets based on real-time game status
 Uses ESPN API for live scores (no auth required)
 """
 
-import requests
-import time
 from nfl_edge.bets.db import BettingDB
+from nfl_edge.fetch_pool import fan_out
+from nfl_edge.http_cache import get as cached_get
+from nfl_edge.team_mapping import to_abbr
 from player_stats_tracker import PlayerStatsTracker
 
 class LiveBetTracker:
@@ -237,7 +238,7 @@ class LiveBetTracker:
             return []
         
         try:
-            response = requests.get(url, timeout=5)
+            response = cached_get(url, source="espn_live", timeout=5)
             response.raise_for_status()
             data = response.json()
             
@@ -250,6 +251,7 @@ class LiveBetTracker:
                 if status.get('type', {}).get('state') in ['in', 'post']:
                     game_info = self._parse_game(event, competition, status)
                     if game_info:
+                        game_info['sport'] = sport.upper()
                         games.append(game_info)
             
             return games
@@ -259,21 +261,6 @@ class LiveBetTracker:
     
     def _parse_game(self, event, competition, status):
         """Parse game data from ESPN response"""
-        # Team name to abbreviation mapping
-        TEAM_MAP = {
-            'Arizona Cardinals': 'ARI', 'Atlanta Falcons': 'ATL', 'Baltimore Ravens': 'BAL',
-            'Buffalo Bills': 'BUF', 'Carolina Panthers': 'CAR', 'Chicago Bears': 'CHI',
-            'Cincinnati Bengals': 'CIN', 'Cleveland Browns': 'CLE', 'Dallas Cowboys': 'DAL',
-            'Denver Broncos': 'DEN', 'Detroit Lions': 'DET', 'Green Bay Packers': 'GB',
-            'Houston Texans': 'HOU', 'Indianapolis Colts': 'IND', 'Jacksonville Jaguars': 'JAX',
-            'Kansas City Chiefs': 'KC', 'Las Vegas Raiders': 'LV', 'Los Angeles Chargers': 'LAC',
-            'Los Angeles Rams': 'LAR', 'Miami Dolphins': 'MIA', 'Minnesota Vikings': 'MIN',
-            'New England Patriots': 'NE', 'New Orleans Saints': 'NO', 'New York Giants': 'NYG',
-            'New York Jets': 'NYJ', 'Philadelphia Eagles': 'PHI', 'Pittsburgh Steelers': 'PIT',
-            'San Francisco 49ers': 'SF', 'Seattle Seahawks': 'SEA', 'Tampa Bay Buccaneers': 'TB',
-            'Tennessee Titans': 'TEN', 'Washington Commanders': 'WAS'
-        }
-        
         competitors = competition.get('competitors', [])
         if len(competitors) < 2:
             return None
@@ -289,8 +276,8 @@ class LiveBetTracker:
             'name': event.get('name'),
             'home_team': home_team_name,
             'away_team': away_team_name,
-            'home_abbr': TEAM_MAP.get(home_team_name, home_team_name),
-            'away_abbr': TEAM_MAP.get(away_team_name, away_team_name),
+            'home_abbr': to_abbr(home_team_name),
+            'away_abbr': to_abbr(away_team_name),
             'home_score': int(home.get('score', 0)),
             'away_score': int(away.get('score', 0)),
             'status': status.get('type', {}).get('shortDetail', ''),
@@ -398,11 +385,10 @@ class LiveBetTracker:
     def update_all_bets(self):
         """Update status for all pending bets"""
         # Fetch live games for all sports
+        # (concurrently; the HTTP layer rate-limits per host)
         all_games = []
-        for sport in self.ESPN_SCOREBOARD_URLS.keys():
-            games = self.get_live_games(sport)
+        for games in fan_out(self.get_live_games, self.ESPN_SCOREBOARD_URLS.keys()):
             all_games.extend(games)
-            time.sleep(0.5)  # Rate limiting
         
         # Get all pending bets
         pending_bets = self.get_pending_bets()
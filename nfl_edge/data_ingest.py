@@ -7,6 +7,8 @@ from typing import Dict, Tuple, List, Optional
 import pandas as pd
 import requests
 
+from nfl_edge.http_cache import get as cached_get
+
 # ---------------------------------------------------------------------
 # TEAM-WEEK DATA (nflverse-data release)
 # ---------------------------------------------------------------------
@@ -14,7 +16,7 @@ import requests
 NFLVERSE_TEAM_BASE = "https://github.com/nflverse/nflverse-data/releases/download/stats_team/"
 
 def _read_url_csv(url: str) -> pd.DataFrame:
-    r = requests.get(url, timeout=30)
+    r = cached_get(url, source="nflverse", timeout=30)
     if not r.ok:
         raise RuntimeError(f"nflverse fetch failed: {url} status={r.status_code}")
     return pd.read_csv(io.BytesIO(r.content), compression="infer")
@@ -335,7 +337,7 @@ def fetch_weather_for_matchups(stadiums_csv="data/stadiums.csv", matchups=None,
             "windspeed_unit": "kmh",
             "timezone": "auto",
         }
-        r = requests.get(OPEN_METEO_URL, params=params, timeout=25)
+        r = cached_get(OPEN_METEO_URL, params=params, source="open_meteo", timeout=25)
         if not r.ok:
             raise RuntimeError(f"Weather fetch failed for {home}: status={r.status_code}")
         data = r.json()
@@ -0,0 +1,184 @@
+"""
+Incremental team features.
+
+build_features() recomputes every team's expanding and rolling-4 means
+from the full season each run. FeatureState keeps the same aggregates per
+team (running sum/count of non-null values plus the last four weekly
+values), persists them as JSON and absorbs only rows for weeks it has
+not seen yet. features() returns the same columns as build_features().
+
+    feats = incremental_features(teamweeks, recent_weight=0.88)
+
+Weeks already absorbed are never re-read, so stat corrections to old weeks
+need rebuild (or a fresh state file); check_consistency() compares the
+state against a full recompute.
+"""
+import json
+import math
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from nfl_edge.features import FEATURE_COLS, FEATURE_OUTPUT, build_features, blend_features
+
+DEFAULT_STATE_PATH = Path("artifacts/feature_state.json")
+WINDOW = 4
+
+
+class FeatureState:
+    """Per-team running sums, counts and last-4 windows for one season"""
+
+    def __init__(self, season: Optional[int] = None, teams: Optional[Dict] = None):
+        self.season = season
+        # team -> {"week": last absorbed week, "sum": {col: x}, "count": {col: n}, "last4": {col: [x|None]}}
+        self.teams = teams or {}
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_STATE_PATH) -> "FeatureState":
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text())
+        return cls(season=data.get("season"), teams=data.get("teams", {}))
+
+    def save(self, path: Path = DEFAULT_STATE_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps({"season": self.season, "teams": self.teams}))
+        tmp.replace(path)
+
+    def update(self, teamweeks: pd.DataFrame) -> int:
+        """
+        Absorb rows newer than each team's last absorbed week.
+
+        Args:
+            teamweeks: fetch_teamweeks_live() frame (one season)
+
+        Returns:
+            Number of rows absorbed
+        """
+        missing = [c for c in FEATURE_COLS if c not in teamweeks.columns]
+        if missing:
+            raise RuntimeError(f"Missing required column: {missing[0]}")
+        if teamweeks.empty:
+            return 0
+
+        if "season" in teamweeks.columns:
+            season = int(teamweeks["season"].max())
+            if self.season != season:
+                self.season, self.teams = season, {}
+            teamweeks = teamweeks[teamweeks["season"] == season]
+
+        last_week = teamweeks["team"].map(lambda t: self.teams.get(t, {}).get("week", 0))
+        new_rows = teamweeks[teamweeks["week"] > last_week].sort_values(["team", "week"])
+
+        for row in new_rows[["team", "week"] + FEATURE_COLS].itertuples(index=False):
+            team = self.teams.setdefault(row[0], {
+                "week": 0,
+                "sum": {c: 0.0 for c in FEATURE_COLS},
+                "count": {c: 0 for c in FEATURE_COLS},
+                "last4": {c: [] for c in FEATURE_COLS},
+            })
+            team["week"] = int(row[1])
+            for col, value in zip(FEATURE_COLS, row[2:]):
+                value = None if pd.isna(value) else float(value)
+                if value is not None:
+                    team["sum"][col] += value
+                    team["count"][col] += 1
+                team["last4"][col] = (team["last4"][col] + [value])[-WINDOW:]
+        return len(new_rows)
+
+    def features(self, recent_weight: float = 0.67) -> pd.DataFrame:
+        """Same output as build_features() over every absorbed row"""
+        rows = []
+        for team in sorted(self.teams):
+            state = self.teams[team]
+            row = {"team": team}
+            for col in FEATURE_COLS:
+                count = state["count"][col]
+                window = [v for v in state["last4"][col] if v is not None]
+                row[f"{col}_season"] = state["sum"][col] / count if count else np.nan
+                row[f"{col}_last4"] = math.fsum(window) / len(window) if window else np.nan
+            rows.append(row)
+        if not rows:
+            return pd.DataFrame(columns=["team"] + list(FEATURE_OUTPUT))
+        return blend_features(pd.DataFrame(rows), recent_weight)
+
+    def rebuild(self, teamweeks: pd.DataFrame) -> int:
+        """Discard the state and absorb teamweeks from scratch"""
+        self.season, self.teams = None, {}
+        return self.update(teamweeks)
+
+
+def check_consistency(state: FeatureState, teamweeks: pd.DataFrame, recent_weight: float = 0.67,
+                      atol: float = 1e-9) -> float:
+    """
+    Compare incremental features against a full build_features() recompute.
+
+    Returns:
+        Largest absolute difference
+
+    Raises:
+        RuntimeError: If teams differ or any value differs by more than atol
+    """
+    full = build_features(teamweeks, recent_weight).set_index("team").sort_index()
+    inc = state.features(recent_weight).set_index("team").sort_index()
+    if list(full.index) != list(inc.index):
+        raise RuntimeError(f"Feature state teams differ from full recompute: "
+                           f"{sorted(set(full.index) ^ set(inc.index))}")
+    a, b = full.to_numpy(dtype=float), inc[full.columns].to_numpy(dtype=float)
+    if not np.array_equal(np.isnan(a), np.isnan(b)):
+        raise RuntimeError("Feature state NaN pattern differs from full recompute")
+    diff = float(np.nanmax(np.abs(a - b))) if np.isfinite(a).any() else 0.0
+    if diff > atol:
+        raise RuntimeError(f"Feature state differs from full recompute by {diff:.3g} (atol={atol})")
+    return diff
+
+
+def incremental_features(teamweeks: pd.DataFrame, recent_weight: float = 0.67,
+                         path: Path = DEFAULT_STATE_PATH, verify: bool = False) -> pd.DataFrame:
+    """
+    Load the persisted state, absorb new weeks, save, and return features.
+
+    Args:
+        teamweeks: fetch_teamweeks_live() frame
+        recent_weight: Weight on the last-4 mean (rest on the season mean)
+        path: State file
+        verify: Also run check_consistency() against a full recompute
+    """
+    state = FeatureState.load(path)
+    if state.update(teamweeks):
+        state.save(path)
+    if verify:
+        check_consistency(state, teamweeks, recent_weight)
+    return state.features(recent_weight)
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+    from nfl_edge.data_ingest import fetch_teamweeks_live
+
+    season = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
+    teamweeks = fetch_teamweeks_live(season)
+    weeks = sorted(teamweeks["week"].unique())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "feature_state.json"
+        # Replay the season one week at a time, checking against a full recompute each week
+        for week in weeks:
+            seen = teamweeks[teamweeks["week"] <= week]
+            t0 = time.perf_counter()
+            incremental_features(seen, recent_weight=0.88, path=path)
+            inc_ms = (time.perf_counter() - t0) * 1000
+            t0 = time.perf_counter()
+            build_features(seen, recent_weight=0.88)
+            full_ms = (time.perf_counter() - t0) * 1000
+            diff = check_consistency(FeatureState.load(path), seen, recent_weight=0.88)
+            print(f"Week {week:>2}: incremental {inc_ms:6.1f} ms, full {full_ms:6.1f} ms, max diff {diff:.2e}")
+
+    print("✅ Incremental features match full recompute")
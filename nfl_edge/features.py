@@ -2,19 +2,26 @@
 import pandas as pd
 import numpy as np
 
+FEATURE_COLS = ["off_epa_per_play","def_epa_per_play","off_success_rate","def_success_rate","points","points_allowed","turnover_diff"]
+FEATURE_OUTPUT = {"OFF_EPA": "off_epa_per_play", "DEF_EPA": "def_epa_per_play",
+                  "OFF_SR": "off_success_rate", "DEF_SR": "def_success_rate",
+                  "PF_BLEND": "points", "PA_BLEND": "points_allowed", "TO_DIFF": "turnover_diff"}
+
 def build_features(teamweeks: pd.DataFrame, recent_weight: float = 0.67) -> pd.DataFrame:
     df = teamweeks.sort_values(["team","week"]).copy()
     g = df.groupby("team", as_index=False)
-    for col in ["off_epa_per_play","def_epa_per_play","off_success_rate","def_success_rate","points","points_allowed","turnover_diff"]:
+    for col in FEATURE_COLS:
         if col not in df.columns: raise RuntimeError(f"Missing required column: {col}")
         df[f"{col}_season"] = g[col].transform(lambda s: s.expanding().mean())
         df[f"{col}_last4"]  = g[col].transform(lambda s: s.rolling(4, min_periods=1).mean())
-    def blend(col): return recent_weight*df[f"{col}_last4"] + (1-recent_weight)*df[f"{col}_season"]
     out = df.sort_values(["team","week"]).groupby("team").tail(1).copy()
-    out["OFF_EPA"] = blend("off_epa_per_play"); out["DEF_EPA"] = blend("def_epa_per_play")
-    out["OFF_SR"]  = blend("off_success_rate");  out["DEF_SR"]  = blend("def_success_rate")
-    out["PF_BLEND"] = blend("points");           out["PA_BLEND"] = blend("points_allowed")
-    out["TO_DIFF"] = blend("turnover_diff")
+    return blend_features(out, recent_weight)
+
+def blend_features(out: pd.DataFrame, recent_weight: float) -> pd.DataFrame:
+    """Final feature columns from per-team {col}_season / {col}_last4 means (one row per team)."""
+    def blend(col): return recent_weight*out[f"{col}_last4"] + (1-recent_weight)*out[f"{col}_season"]
+    for name, col in FEATURE_OUTPUT.items():
+        out[name] = blend(col)
     
     # Apply regression to mean: cap extreme EPA values at ±0.10 to prevent overestimation
     # This prevents teams with outlier 2024 seasons from being overestimated in 2025
@@ -23,7 +30,7 @@ def build_features(teamweeks: pd.DataFrame, recent_weight: float = 0.67) -> pd.D
     out["OFF_EPA"] = out["OFF_EPA"].clip(-EPA_CAP, EPA_CAP)
     out["DEF_EPA"] = out["DEF_EPA"].clip(-EPA_CAP, EPA_CAP)
     
-    return out[["team","OFF_EPA","DEF_EPA","OFF_SR","DEF_SR","PF_BLEND","PA_BLEND","TO_DIFF"]]
+    return out[["team"] + list(FEATURE_OUTPUT)]
 
 def join_matchups(feats: pd.DataFrame, sched):
     f = feats.set_index("team"); rows = []
@@ -0,0 +1,95 @@
+"""
+Bounded concurrent fetching for the ESPN / weather fetchers.
+
+Per-team and per-sport fetches used to run one at a time with sleeps in
+between for rate limiting. fan_out() runs them on a bounded thread pool;
+politeness moved down to the network layer: every request that
+http_cache.get() actually sends goes through host_slot(), which takes a
+token from that host's bucket and a per-host concurrency slot. Cache hits
+skip both.
+
+    injuries = fan_out(fetch_team_injuries_espn, teams)          # results in input order
+    info, leaders = gather(lambda: stats(away), lambda: leaders(away))
+
+Limits are per process and configurable in HOST_LIMITS.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Tuple
+from urllib.parse import urlparse
+
+# host -> (requests per second, burst, max concurrent requests)
+HOST_LIMITS: Dict[str, Tuple[float, int, int]] = {
+    "site.api.espn.com": (20.0, 32, 16),
+    "sports.core.api.espn.com": (20.0, 32, 16),
+    "api.open-meteo.com": (10.0, 10, 8),
+    "default": (10.0, 10, 8),
+}
+
+MAX_WORKERS = 32
+
+
+class TokenBucket:
+    """Thread-safe token bucket: rate tokens/second, up to burst saved"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_hosts: Dict[str, Tuple[TokenBucket, threading.BoundedSemaphore]] = {}
+_hosts_lock = threading.Lock()
+
+
+def _host_limits(host: str) -> Tuple[TokenBucket, threading.BoundedSemaphore]:
+    with _hosts_lock:
+        if host not in _hosts:
+            rate, burst, concurrency = HOST_LIMITS.get(host, HOST_LIMITS["default"])
+            _hosts[host] = (TokenBucket(rate, burst), threading.BoundedSemaphore(concurrency))
+        return _hosts[host]
+
+
+@contextmanager
+def host_slot(url: str):
+    """Rate-limit and concurrency-cap one request to url's host"""
+    bucket, slots = _host_limits(urlparse(url).netloc)
+    with slots:
+        bucket.acquire()
+        yield
+
+
+def fan_out(fn: Callable, items: Iterable, max_workers: int = MAX_WORKERS) -> List:
+    """
+    Call fn(item) for every item concurrently.
+
+    Returns:
+        Results in the order of items (exceptions from fn are re-raised)
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(fn, items))
+
+
+def gather(*calls: Callable) -> List:
+    """Run zero-argument callables concurrently; results in argument order"""
+    return fan_out(lambda call: call(), calls)
@@ -0,0 +1,89 @@
+"""
+In-process DataFrame cache keyed on source files and their mtimes.
+
+The dashboard loaders re-read and re-normalize every predictions CSV on
+each request. FrameCache keeps the built frame in memory and rebuilds it
+only when the set of source files, or any file's mtime/size, changes:
+
+    _frames = FrameCache()
+
+    def load_predictions():
+        sources = [Path("artifacts/simulator_predictions.csv"), *Path("artifacts").glob("predictions_*.csv")]
+        return _frames.get("predictions", sources, _build_predictions)
+
+A hit costs one stat() per source file. Callers get a copy, so mutating
+the result never touches the cached frame; memo() caches read-only
+derived objects (e.g. a GameIndex) the same way without copying.
+hits/misses are counted per cache (stats()).
+"""
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+
+def _signature(sources: Iterable[Path]) -> Tuple:
+    """(path, mtime_ns, size) per source; missing files count as (path, None, None)"""
+    sig = []
+    for path in sorted({Path(p) for p in sources}):
+        try:
+            st = path.stat()
+            sig.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append((str(path), None, None))
+    return tuple(sig)
+
+
+class FrameCache:
+    """Named DataFrames rebuilt only when their source files change"""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple, Any]] = {}
+        self._lock = threading.RLock()  # builds may load other entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str, sources: Iterable[Path],
+            build: Callable[[], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+        """
+        Cached build() result for name.
+
+        Args:
+            name: Cache entry
+            sources: Every file build() may read (including ones that may not exist yet)
+            build: Zero-argument loader; may return None
+
+        Returns:
+            A copy of the frame (or None)
+        """
+        frame = self.memo(name, sources, build)
+        return frame.copy() if frame is not None else None
+
+    def memo(self, name: str, sources: Iterable[Path], build: Callable[[], Any]) -> Any:
+        """
+        Like get(), but for read-only objects derived from the sources
+        (lookup indexes): the cached value is returned as-is, not copied.
+        """
+        sig = _signature(sources)
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == sig:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            value = build()
+            self._entries[name] = (sig, value)
+            return value
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop one entry (or all)"""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": sorted(self._entries)}
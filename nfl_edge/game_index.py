@@ -0,0 +1,135 @@
+"""
+Hash lookups of games by (season, week, away, home) and by team.
+
+/api/live-games scanned the whole predictions frame with iterrows() for
+every ESPN game, and auto-grading scanned the ESPN game list for every bet
+and parlay leg. GameIndex is built once per predictions load (the
+dashboard caches it alongside the frame) and answers each lookup with a
+dict probe. Team names are normalized with team_mapping.to_abbr, so
+"Los Angeles Rams", "LA" and "LAR" hit the same game:
+
+    index = GameIndex.from_frame(df_pred)
+    row = index.get('KC', 'BUF', week=10)      # row dict or None
+    row = index.get('Kansas City Chiefs', 'Buffalo Bills')  # latest meeting
+
+    live = TeamGameIndex(tracker.get_live_games('NFL'))
+    game = live.for_team('Packers')            # ESPN game dict or None
+    game = live.in_text("Green Bay Packers +3 -110")  # full names only
+
+Nicknames and abbreviations only resolve to NFL games; other sports
+match by full team name, as the grading code always did.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from nfl_edge.team_mapping import to_abbr
+
+
+def _int_or_none(value) -> Optional[int]:
+    try:
+        return None if pd.isna(value) else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class GameIndex:
+    """Prediction rows keyed by normalized (season, week, away, home)"""
+
+    def __init__(self, rows: List[Dict], away_col: str = 'away_team', home_col: str = 'home_team'):
+        self.rows = rows
+        self._by_key: Dict[Tuple, int] = {}
+        self._by_week: Dict[Tuple, int] = {}
+        self._first: Dict[Tuple[str, str], int] = {}
+        self._latest: Dict[Tuple[str, str], Tuple[Tuple, int]] = {}
+        for pos, row in enumerate(rows):
+            away, home = to_abbr(row.get(away_col)), to_abbr(row.get(home_col))
+            season, week = _int_or_none(row.get('season')), _int_or_none(row.get('week'))
+            # First row wins for an exact key, like the boolean-mask lookups this replaces
+            self._by_key.setdefault((season, week, away, home), pos)
+            self._by_week.setdefault((week, away, home), pos)
+            self._first.setdefault((away, home), pos)
+            order = (season or 0, week or 0)
+            latest = self._latest.get((away, home))
+            if latest is None or order > latest[0]:
+                self._latest[(away, home)] = (order, pos)
+
+    @classmethod
+    def from_frame(cls, df: Optional[pd.DataFrame]) -> 'GameIndex':
+        """Index a predictions frame (simulator away_team/home_team or legacy away/home columns)"""
+        if df is None or df.empty:
+            return cls([])
+        away_col, home_col = ('away_team', 'home_team') if 'away_team' in df.columns else ('away', 'home')
+        return cls(df.to_dict('records'), away_col, home_col)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get(self, away, home, week=None, season=None, latest: bool = True) -> Optional[Dict]:
+        """
+        Row for a game, or None.
+
+        Without week, returns the most recent (season, week) meeting of
+        away @ home, or with latest=False the first matching row in frame order.
+        """
+        away, home = to_abbr(away), to_abbr(home)
+        if week is not None:
+            week = _int_or_none(week)
+            key = (_int_or_none(season), week, away, home) if season is not None else (week, away, home)
+            pos = (self._by_key if season is not None else self._by_week).get(key)
+        elif latest:
+            entry = self._latest.get((away, home))
+            pos = entry[1] if entry else None
+        else:
+            pos = self._first.get((away, home))
+        return self.rows[pos] if pos is not None else None
+
+
+class TeamGameIndex:
+    """
+    ESPN scoreboard games keyed by sport and team.
+
+    Every game is keyed by its full team names (case-sensitive, as ESPN
+    displays them). Only NFL games are also keyed by canonical abbreviation
+    and nickname, so an NHL "Florida Panthers" bet never lands on the NFL
+    Panthers game. Games without a 'sport' key are treated as NFL.
+    """
+
+    def __init__(self, games: Iterable[Dict]):
+        self.games = list(games)
+        self._by_name: Dict[str, Dict] = {}
+        self._nfl_by_abbr: Dict[str, Dict] = {}
+        for game in self.games:
+            for side in ('home', 'away'):
+                name = game.get(f'{side}_team')
+                if name:
+                    self._by_name.setdefault(name, game)
+                if game.get('sport', 'NFL') == 'NFL':
+                    self._nfl_by_abbr.setdefault(to_abbr(game.get(f'{side}_abbr') or name), game)
+        # Longest first so "New York Jets" is preferred over any shorter name inside it
+        names = sorted(self._by_name, key=len, reverse=True)
+        self._name_re = re.compile('|'.join(re.escape(n) for n in names)) if names else None
+
+    def for_team(self, team) -> Optional[Dict]:
+        """
+        Game of a team given as a full name (any sport), or as an NFL
+        abbreviation/nickname; falls back to the team being part of a full
+        name ("Cowboys" in "Dallas Cowboys").
+        """
+        if not team:
+            return None
+        game = self._by_name.get(team) or self._nfl_by_abbr.get(to_abbr(team))
+        if game is not None:
+            return game
+        return next((g for name, g in self._by_name.items() if team in name), None)
+
+    def in_text(self, text: str) -> Optional[Dict]:
+        """Game of the first full team name in text (bet descriptions, parlay legs)"""
+        if not text or self._name_re is None:
+            return None
+        match = self._name_re.search(text)
+        return self._by_name[match.group(0)] if match else None
+
+    def filter(self, predicate) -> 'TeamGameIndex':
+        return TeamGameIndex(g for g in self.games if predicate(g))
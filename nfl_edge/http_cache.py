@@ -0,0 +1,206 @@
+"""
+Shared on-disk HTTP cache for the external data fetchers.
+
+Every fetcher used to re-download on each call (multi-MB nflverse CSVs on
+every weekly run and dashboard render). get() is a drop-in for
+requests.get() that:
+
+- serves a stored response while it is younger than the source's TTL
+- revalidates stale entries with If-None-Match / If-Modified-Since, so an
+  unchanged file costs a 304 instead of a download
+- stores bodies content-addressed (objects/ab/<sha256>), so identical
+  payloads under different URLs are kept once
+- falls back to the stale copy if the network fails
+- rate-limits and caps concurrent requests per host (fetch_pool), so
+  fetchers can fan out on threads over one shared connection pool
+- in offline mode (NFL_EDGE_OFFLINE=1 or set_offline(True)) serves only
+  from cache and raises requests.ConnectionError on a miss
+
+    from nfl_edge.http_cache import get as cached_get
+    r = cached_get(url, params=params, source="open_meteo", timeout=25)
+    r.json()
+
+Only 200 responses are cached. The cache directory defaults to
+data/http_cache and can be moved with NFL_EDGE_HTTP_CACHE (e.g. to point
+tests at a fixture directory).
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nfl_edge.fetch_pool import MAX_WORKERS, host_slot
+
+# Seconds a response is served without revalidation
+SOURCE_TTLS: Dict[str, float] = {
+    "nflverse": 6 * 3600,       # release files rebuilt nightly
+    "open_meteo": 3600,         # hourly forecast
+    "espn": 15 * 60,            # team stats, schedules, summaries
+    "espn_injuries": 30 * 60,
+    "espn_live": 15,            # live scoreboard
+    "default": 10 * 60,
+}
+
+DEFAULT_CACHE_DIR = Path("data/http_cache")
+
+_offline: Optional[bool] = None
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def set_offline(offline: Optional[bool]):
+    """Force offline mode on/off (None = follow NFL_EDGE_OFFLINE)"""
+    global _offline
+    _offline = offline
+
+
+def is_offline() -> bool:
+    if _offline is not None:
+        return _offline
+    return os.getenv("NFL_EDGE_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+def cache_dir() -> Path:
+    return Path(os.getenv("NFL_EDGE_HTTP_CACHE", DEFAULT_CACHE_DIR))
+
+
+def _session_get(url, **kwargs) -> requests.Response:
+    """Network GET on the shared connection pool, under the host's rate limit"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=MAX_WORKERS)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+    with host_slot(url):
+        return _session.get(url, **kwargs)
+
+
+def _request_key(url: str, params: Optional[Dict]) -> str:
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    return hashlib.sha256(json.dumps([url, items]).encode()).hexdigest()
+
+
+def _paths(key: str):
+    root = cache_dir()
+    return root / "index" / f"{key}.json", root / "objects"
+
+
+def _object_path(objects: Path, digest: str) -> Path:
+    return objects / digest[:2] / digest
+
+
+def _write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def _load_entry(key: str):
+    index_path, objects = _paths(key)
+    if not index_path.exists():
+        return None, None
+    try:
+        entry = json.loads(index_path.read_text())
+        body = _object_path(objects, entry["sha256"]).read_bytes()
+    except (OSError, ValueError, KeyError):
+        return None, None
+    return entry, body
+
+
+def _store(key: str, url: str, response: requests.Response) -> Dict:
+    index_path, objects = _paths(key)
+    digest = hashlib.sha256(response.content).hexdigest()
+    obj = _object_path(objects, digest)
+    if not obj.exists():
+        _write_atomic(obj, response.content)
+    entry = {
+        "url": url,
+        "sha256": digest,
+        "fetched_at": time.time(),
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content_type": response.headers.get("Content-Type"),
+    }
+    _write_atomic(index_path, json.dumps(entry).encode())
+    return entry
+
+
+def _touch(key: str, entry: Dict):
+    entry["fetched_at"] = time.time()
+    _write_atomic(_paths(key)[0], json.dumps(entry).encode())
+
+
+def _cached_response(url: str, entry: Dict, body: bytes) -> requests.Response:
+    r = requests.Response()
+    r.status_code = 200
+    r.url = url
+    r._content = body
+    r.encoding = None
+    if entry.get("content_type"):
+        r.headers["Content-Type"] = entry["content_type"]
+    r.from_cache = True
+    return r
+
+
+def get(url: str, params: Optional[Dict] = None, source: str = "default",
+        ttl: Optional[float] = None, timeout: float = 30, **kwargs) -> requests.Response:
+    """
+    Cached GET with the requests.get() interface.
+
+    Args:
+        url: Request URL
+        params: Query parameters (part of the cache key)
+        source: Key into SOURCE_TTLS
+        ttl: Override the source TTL in seconds (0 = always revalidate)
+        timeout: Network timeout
+        **kwargs: Passed to requests (headers, ...)
+
+    Returns:
+        requests.Response; from_cache is True if the body came from disk
+    """
+    key = _request_key(url, params)
+    entry, body = _load_entry(key)
+    ttl = SOURCE_TTLS.get(source, SOURCE_TTLS["default"]) if ttl is None else ttl
+
+    if entry is not None and (is_offline() or time.time() - entry["fetched_at"] < ttl):
+        return _cached_response(url, entry, body)
+    if is_offline():
+        raise requests.ConnectionError(f"offline and not cached: {url}")
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        r = _session_get(url, params=params, headers=headers, timeout=timeout, **kwargs)
+    except requests.RequestException:
+        if entry is not None:
+            print(f"⚠️  Network error, serving cached copy of {url}")
+            return _cached_response(url, entry, body)
+        raise
+
+    if r.status_code == 304 and entry is not None:
+        _touch(key, entry)
+        return _cached_response(url, entry, body)
+    if r.status_code == 200:
+        _store(key, url, r)
+    r.from_cache = False
+    return r
+
+
+def clear():
+    """Delete every cached entry"""
+    import shutil
+    shutil.rmtree(cache_dir(), ignore_errors=True)
@@ -0,0 +1,276 @@
+"""
+Background job runner for the long dashboard scripts.
+
+The prediction, simulator and weekly-prep routes used to run their script
+with subprocess.run(timeout=300) inside the request, holding a Flask
+worker for minutes and losing the result if the browser gave up.
+JobQueue runs them as subprocesses on a small thread pool instead:
+
+    jobs = JobQueue()
+    job, created = jobs.submit("weekly_prep", ["bash", "scripts/weekly_data_prep.sh"])
+    jobs.get(job["id"])            # status, progress, message, returncode
+    jobs.tail(job["id"], 50)       # last 50 log lines
+    jobs.cancel(job["id"])
+
+- every job is a row in a SQLite table (data/jobs.db), so status survives
+  the request and can be polled by id
+- stdout/stderr stream to data/jobs/<id>.log; the last line becomes the
+  job message
+- progress comes from lines like "PROGRESS 40" / "PROGRESS 0.4" or "[3/16]"
+- single flight: submitting a command that is already queued or running
+  returns the existing job instead of starting another
+- jobs left queued/running by a previous process are marked failed on start
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+FINISHED = ("succeeded", "failed", "cancelled")
+
+DEFAULT_TIMEOUT = 30 * 60
+KILL_GRACE_SECONDS = 5
+
+_PROGRESS_RE = re.compile(r"PROGRESS[:\s]+(\d+(?:\.\d+)?)(%?)")
+_STEP_RE = re.compile(r"\[(\d+)\s*/\s*(\d+)\]")
+
+
+def parse_progress(line: str) -> Optional[float]:
+    """Fraction done (0-1) reported by a log line, if any"""
+    match = _PROGRESS_RE.search(line)
+    if match:
+        value = float(match.group(1))
+        return min(1.0, value / 100 if match.group(2) or value > 1 else value)
+    match = _STEP_RE.search(line)
+    if match and int(match.group(2)) > 0:
+        return min(1.0, int(match.group(1)) / int(match.group(2)))
+    return None
+
+
+def job_key(kind: str, cmd: Sequence[str], cwd: Optional[str] = None) -> str:
+    """Single-flight key: same kind, command and working directory"""
+    return hashlib.sha256(json.dumps([kind, list(cmd), cwd]).encode()).hexdigest()[:16]
+
+
+class JobQueue:
+    """Subprocess jobs on a thread pool, tracked in SQLite"""
+
+    def __init__(self, db_path: str = "data/jobs.db", log_dir: str = "data/jobs", max_workers: int = 2):
+        self.db_path = db_path
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._lock = threading.Lock()
+        self._procs: Dict[str, subprocess.Popen] = {}
+        self._cancelled = set()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                job_key TEXT NOT NULL,
+                cmd TEXT NOT NULL,
+                cwd TEXT,
+                status TEXT NOT NULL,
+                progress REAL,
+                message TEXT,
+                returncode INTEGER,
+                log_path TEXT NOT NULL,
+                created REAL NOT NULL,
+                started REAL,
+                finished REAL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_key ON jobs (job_key, status)")
+        # Whatever was in flight died with the previous process
+        conn.execute("UPDATE jobs SET status = 'failed', message = 'Interrupted (dashboard restarted)', finished = ? "
+                     "WHERE status IN ('queued', 'running')", (time.time(),))
+        conn.commit()
+        conn.close()
+
+    def _update(self, job_id: str, **fields):
+        conn = self._connect()
+        conn.execute(f"UPDATE jobs SET {', '.join(f'{k} = ?' for k in fields)} WHERE id = ?",
+                     (*fields.values(), job_id))
+        conn.commit()
+        conn.close()
+
+    # --- API ---
+
+    def submit(self, kind: str, cmd: Sequence[str], cwd: Optional[str] = None,
+               timeout: float = DEFAULT_TIMEOUT) -> Tuple[Dict, bool]:
+        """
+        Queue cmd, or join the identical job already queued/running.
+
+        Returns:
+            (job dict, created) - created is False when an existing job was returned
+        """
+        key = job_key(kind, cmd, cwd)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT * FROM jobs WHERE job_key = ? AND status IN ('queued', 'running') "
+                               "ORDER BY created DESC LIMIT 1", (key,)).fetchone()
+            if row is not None:
+                conn.close()
+                return self._as_dict(row), False
+            job_id = uuid.uuid4().hex[:12]
+            log_path = self.log_dir / f"{job_id}.log"
+            conn.execute("INSERT INTO jobs (id, kind, job_key, cmd, cwd, status, progress, message, log_path, created) "
+                         "VALUES (?, ?, ?, ?, ?, 'queued', 0, 'Queued', ?, ?)",
+                         (job_id, kind, key, json.dumps(list(cmd)), cwd, str(log_path), time.time()))
+            conn.commit()
+            conn.close()
+        self._pool.submit(self._run, job_id, list(cmd), cwd, log_path, timeout)
+        return self.get(job_id), True
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        conn = self._connect()
+        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        conn.close()
+        return self._as_dict(row) if row is not None else None
+
+    def list(self, limit: int = 20, kind: Optional[str] = None) -> List[Dict]:
+        """Most recent jobs first"""
+        conn = self._connect()
+        if kind:
+            rows = conn.execute("SELECT * FROM jobs WHERE kind = ? ORDER BY created DESC LIMIT ?", (kind, limit))
+        else:
+            rows = conn.execute("SELECT * FROM jobs ORDER BY created DESC LIMIT ?", (limit,))
+        jobs = [self._as_dict(row) for row in rows.fetchall()]
+        conn.close()
+        return jobs
+
+    def tail(self, job_id: str, lines: int = 50) -> List[str]:
+        """Last lines of a job's log (empty if it has not started)"""
+        job = self.get(job_id)
+        if job is None:
+            return []
+        path = Path(job["log_path"])
+        if not path.exists():
+            return []
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - 64 * 1024))  # enough for any reasonable tail
+            text = f.read().decode("utf-8", errors="replace")
+        return text.splitlines()[-lines:]
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job; False if it already finished"""
+        job = self.get(job_id)
+        if job is None or job["status"] in FINISHED:
+            return False
+        with self._lock:
+            self._cancelled.add(job_id)
+            started = job_id in self._procs
+            proc = self._procs.get(job_id)
+        if proc is not None:
+            threading.Thread(target=self._kill, args=(proc,), daemon=True).start()
+        elif not started:
+            self._update(job_id, status="cancelled", message="Cancelled", finished=time.time())
+        # else: the worker is starting it and checks the cancel flag once the process exists
+        return True
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs; with wait, block until running ones finish"""
+        self._pool.shutdown(wait=wait)
+
+    @staticmethod
+    def _as_dict(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job["cmd"] = json.loads(job["cmd"])
+        job.pop("job_key", None)
+        end = job["finished"] or time.time()
+        job["elapsed"] = round(end - job["started"], 1) if job["started"] else None
+        return job
+
+    # --- worker ---
+
+    def _run(self, job_id: str, cmd: List[str], cwd: Optional[str], log_path: Path, timeout: float):
+        with self._lock:
+            if job_id in self._cancelled:
+                self._cancelled.discard(job_id)
+                return
+            self._procs[job_id] = None  # starting
+        started = time.time()
+        self._update(job_id, status="running", started=started, message="Starting...")
+        env = {**os.environ, "PYTHONUNBUFFERED": "1"}  # stream prints as they happen
+        try:
+            with open(log_path, "w") as log:
+                proc = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT, text=True, bufsize=1)
+                with self._lock:
+                    self._procs[job_id] = proc
+                    cancelled = job_id in self._cancelled
+                if cancelled:
+                    self._kill(proc)
+                watchdog = threading.Timer(timeout, self._kill, (proc,))
+                watchdog.start()
+                last_update = 0.0
+                message, progress = None, None
+                for line in proc.stdout:
+                    log.write(line)
+                    log.flush()
+                    line = line.strip()
+                    if line:
+                        message = line[:200]
+                        reported = parse_progress(line)
+                        progress = reported if reported is not None else progress
+                    # Throttle DB writes for chatty scripts
+                    if time.monotonic() - last_update > 0.5:
+                        last_update = time.monotonic()
+                        fields = {"message": message} if progress is None else {"message": message, "progress": progress}
+                        self._update(job_id, **fields)
+                returncode = proc.wait()
+                watchdog.cancel()
+        except OSError as e:
+            with self._lock:
+                self._cancelled.discard(job_id)
+            self._update(job_id, status="failed", message=f"Could not start: {e}", finished=time.time())
+            return
+        finally:
+            with self._lock:
+                self._procs.pop(job_id, None)
+
+        with self._lock:
+            cancelled = job_id in self._cancelled
+            self._cancelled.discard(job_id)
+        if cancelled:
+            status, message = "cancelled", "Cancelled"
+        elif returncode == 0:
+            status, progress = "succeeded", 1.0
+        elif time.time() - started >= timeout:
+            status, message = "failed", f"Timed out after {timeout / 60:.0f} minutes"
+        else:
+            status = "failed"
+        fields = {"status": status, "returncode": returncode, "message": message, "finished": time.time()}
+        if progress is not None:
+            fields["progress"] = progress
+        self._update(job_id, **fields)
+
+    @staticmethod
+    def _kill(proc: subprocess.Popen):
+        """Terminate, then kill if the process ignores SIGTERM"""
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(KILL_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                proc.kill()
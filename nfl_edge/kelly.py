@@ -7,37 +7,48 @@ import numpy as np
 import pandas as pd
 
 
-def american_to_decimal(american_odds: float) -> float:
-    """Convert American odds (-110, +150) to decimal odds (1.91, 2.50)."""
-    if american_odds < 0:
-        return 1 + (100 / abs(american_odds))
-    else:
-        return 1 + (american_odds / 100)
+def _scalar_or_array(x):
+    """Return Python floats for scalar inputs, arrays otherwise."""
+    return float(x) if np.ndim(x) == 0 else x
+
+
+def american_to_decimal(american_odds):
+    """
+    Convert American odds (-110, +150) to decimal odds (1.91, 2.50).
+    
+    Accepts a scalar or an array of prices.
+    """
+    odds = np.asarray(american_odds, dtype=float)
+    with np.errstate(divide="ignore"):
+        decimal = np.where(odds < 0, 1 + 100 / np.abs(odds), 1 + odds / 100)
+    return _scalar_or_array(decimal)
 
 
-def implied_prob_from_american(american_odds: float) -> float:
+def implied_prob_from_american(american_odds):
     """
     Convert American odds to implied probability.
     
+    Accepts a scalar or an array of prices.
+    
     Examples:
         -110 → 52.4% (favorite)
         +150 → 40.0% (underdog)
     """
-    if american_odds < 0:
-        return abs(american_odds) / (abs(american_odds) + 100)
-    else:
-        return 100 / (american_odds + 100)
+    odds = np.asarray(american_odds, dtype=float)
+    prob = np.where(odds < 0, np.abs(odds) / (np.abs(odds) + 100), 100 / (odds + 100))
+    return _scalar_or_array(prob)
 
 
-def calculate_ev(model_prob: float, american_odds: float = -110) -> float:
+def calculate_ev(model_prob, american_odds=-110):
     """
     Calculate Expected Value (EV) for a bet.
     
     EV = (model_prob × net_win) - ((1 - model_prob) × stake)
     
     Args:
-        model_prob: Your model's win probability (0.0 to 1.0)
-        american_odds: Market odds (default -110, standard juice)
+        model_prob: Your model's win probability (0.0 to 1.0), scalar or array
+        american_odds: Market odds (default -110, standard juice), scalar or
+            array broadcastable against model_prob (e.g. per-row prices)
     
     Returns:
         EV as decimal (0.10 = 10% EV)
@@ -47,14 +58,14 @@ def calculate_ev(model_prob: float, american_odds: float = -110) -> float:
         Odds: -110 (need to risk $110 to win $100)
         EV = 0.60 × (100/110) - 0.40 × 1.0 = 0.145 (14.5% EV)
     """
-    decimal_odds = american_to_decimal(american_odds)
-    net_win_per_dollar = decimal_odds - 1
-    ev = (model_prob * net_win_per_dollar) - ((1 - model_prob) * 1.0)
-    return ev
+    p = np.asarray(model_prob, dtype=float)
+    net_win_per_dollar = np.asarray(american_to_decimal(american_odds)) - 1
+    ev = (p * net_win_per_dollar) - ((1 - p) * 1.0)
+    return _scalar_or_array(ev)
 
 
-def kelly_fraction(model_prob: float, american_odds: float = -110, 
-                   max_fraction: float = 0.25) -> float:
+def kelly_fraction(model_prob, american_odds=-110,
+                   max_fraction: float = 0.25):
     """
     Calculate Kelly Criterion bet size as fraction of bankroll.
     
@@ -64,8 +75,8 @@ def kelly_fraction(model_prob: float, american_odds: float = -110,
         b = decimal odds - 1
     
     Args:
-        model_prob: Model's win probability
-        american_odds: Market odds
+        model_prob: Model's win probability, scalar or array
+        american_odds: Market odds, scalar or array broadcastable against model_prob
         max_fraction: Cap (0.25 = quarter Kelly for safety)
     
     Returns:
@@ -76,16 +87,16 @@ def kelly_fraction(model_prob: float, american_odds: float = -110,
         Full Kelly: 14.5%
         Quarter Kelly (capped): 3.6%
     """
-    decimal_odds = american_to_decimal(american_odds)
-    b = decimal_odds - 1
+    p = np.asarray(model_prob, dtype=float)
+    b = np.asarray(american_to_decimal(american_odds)) - 1
     
     # Full Kelly formula
-    full_kelly = (model_prob * b - (1 - model_prob)) / b
+    full_kelly = (p * b - (1 - p)) / b
     
-    # Cap at max_fraction and floor at 0
-    capped_kelly = max(0.0, min(full_kelly, max_fraction))
+    # Cap at max_fraction and floor at 0 (undefined -> no bet)
+    capped_kelly = np.nan_to_num(np.clip(full_kelly, 0.0, max_fraction), nan=0.0)
     
-    return capped_kelly
+    return _scalar_or_array(capped_kelly)
 
 
 def calculate_confidence_level(predicted_margin: float) -> tuple:
@@ -108,18 +119,64 @@ def calculate_confidence_level(predicted_margin: float) -> tuple:
         return ("LOW", 46)
 
 
+def confidence_levels(predicted_margin) -> tuple:
+    """Vectorized calculate_confidence_level: (level array, pct array)."""
+    abs_margin = np.abs(np.asarray(predicted_margin, dtype=float))
+    high = (abs_margin >= 7) & (abs_margin <= 14)
+    medium = ((abs_margin >= 5) & (abs_margin < 7)) | ((abs_margin > 14) & (abs_margin <= 17))
+    levels = np.select([high, medium], ["HIGH", "MEDIUM"], default="LOW")
+    pcts = np.select([high, medium], [64, 54], default=46)
+    return levels, pcts
+
+
+# Optional per-row price columns (American odds); vig is used where absent
+PRICE_COLUMNS = {
+    "home_cover": "Price_home_cover",
+    "away_cover": "Price_away_cover",
+    "over": "Price_over",
+    "under": "Price_under",
+}
+
+
+def side_prices(df: pd.DataFrame, side: str, vig=-110) -> np.ndarray:
+    """
+    American odds per row for one side ("home_cover", "away_cover", "over", "under").
+    
+    Reads the side's PRICE_COLUMNS column; rows without a price (or frames
+    without the column) get vig.
+    """
+    col = PRICE_COLUMNS[side]
+    default = np.broadcast_to(np.asarray(vig, dtype=float), (len(df),))
+    if col not in df.columns:
+        return default
+    return np.where(df[col].isna(), default, df[col].to_numpy(dtype=float))
+
+
+def _recommendations(mask, text_fn, n: int) -> np.ndarray:
+    """'SKIP' everywhere except rows in mask, which get text_fn(index array)."""
+    recs = np.full(n, "SKIP", dtype=object)
+    idx = np.flatnonzero(mask)
+    if len(idx):
+        recs[idx] = text_fn(idx)
+    return recs
+
+
 def add_betting_columns(df: pd.DataFrame, 
                        bankroll: float = 10000.0,
-                       vig: int = -110,
+                       vig = -110,
                        min_ev: float = 0.02,
                        kelly_fraction_cap: float = 0.25) -> pd.DataFrame:
     """
     Add EV, Kelly sizing, confidence levels, and bet recommendations to projections.
     
+    All EV/Kelly math is vectorized over rows. Per-row prices can be given
+    in Price_home_cover / Price_away_cover / Price_over / Price_under
+    columns (e.g. one row per book); missing prices fall back to vig.
+    
     Args:
         df: Projections dataframe with probabilities
         bankroll: Starting bankroll for stake calculations
-        vig: American odds (default -110)
+        vig: American odds (default -110), scalar or per-row array
         min_ev: Minimum EV to recommend a bet (default 2%)
         kelly_fraction_cap: Max Kelly fraction (default 25%)
     
@@ -136,108 +193,89 @@ def add_betting_columns(df: pd.DataFrame,
             - Best_bet: Overall best play for this game
     """
     df = df.copy()
+    n = len(df)
     
     # Convert percentages to probabilities
-    home_cover_prob = df["Home cover %"] / 100.0
+    home_cover_prob = df["Home cover %"].to_numpy(dtype=float) / 100.0
     away_cover_prob = 1.0 - home_cover_prob
-    over_prob = df["Over %"] / 100.0
+    over_prob = df["Over %"].to_numpy(dtype=float) / 100.0
     under_prob = 1.0 - over_prob
     
+    price_home, price_away = side_prices(df, "home_cover", vig), side_prices(df, "away_cover", vig)
+    price_over, price_under = side_prices(df, "over", vig), side_prices(df, "under", vig)
+    
     # Calculate EV for each bet type
-    df["EV_home_cover"] = [calculate_ev(p, vig) for p in home_cover_prob]
-    df["EV_away_cover"] = [calculate_ev(p, vig) for p in away_cover_prob]
-    df["EV_over"] = [calculate_ev(p, vig) for p in over_prob]
-    df["EV_under"] = [calculate_ev(p, vig) for p in under_prob]
+    ev_home = np.asarray(calculate_ev(home_cover_prob, price_home))
+    ev_away = np.asarray(calculate_ev(away_cover_prob, price_away))
+    ev_over = np.asarray(calculate_ev(over_prob, price_over))
+    ev_under = np.asarray(calculate_ev(under_prob, price_under))
+    df["EV_home_cover"] = ev_home
+    df["EV_away_cover"] = ev_away
+    df["EV_over"] = ev_over
+    df["EV_under"] = ev_under
     
     # Best spread side (home or away)
-    df["EV_spread"] = np.maximum(df["EV_home_cover"], df["EV_away_cover"])
-    df["Spread_side"] = ["HOME" if h > a else "AWAY" 
-                         for h, a in zip(df["EV_home_cover"], df["EV_away_cover"])]
-    df["Spread_prob"] = [h if h > a else a 
-                         for h, a in zip(home_cover_prob, away_cover_prob)]
+    home_side = ev_home > ev_away
+    df["EV_spread"] = np.maximum(ev_home, ev_away)
+    df["Spread_side"] = np.where(home_side, "HOME", "AWAY")
+    df["Spread_prob"] = np.where(home_side, home_cover_prob, away_cover_prob)
+    spread_price = np.where(home_side, price_home, price_away)
     
     # Best total side (over or under)
-    df["EV_total"] = np.maximum(df["EV_over"], df["EV_under"])
-    df["Total_side"] = ["OVER" if o > u else "UNDER" 
-                        for o, u in zip(df["EV_over"], df["EV_under"])]
-    df["Total_prob"] = [o if o > u else u 
-                        for o, u in zip(over_prob, under_prob)]
+    over_side = ev_over > ev_under
+    df["EV_total"] = np.maximum(ev_over, ev_under)
+    df["Total_side"] = np.where(over_side, "OVER", "UNDER")
+    df["Total_prob"] = np.where(over_side, over_prob, under_prob)
+    total_price = np.where(over_side, price_over, price_under)
     
     # Kelly sizing
-    df["Kelly_spread_pct"] = [kelly_fraction(p, vig, kelly_fraction_cap) * 100 
-                              for p in df["Spread_prob"]]
-    df["Kelly_total_pct"] = [kelly_fraction(p, vig, kelly_fraction_cap) * 100 
-                             for p in df["Total_prob"]]
+    df["Kelly_spread_pct"] = np.asarray(kelly_fraction(df["Spread_prob"].to_numpy(), spread_price, kelly_fraction_cap)) * 100
+    df["Kelly_total_pct"] = np.asarray(kelly_fraction(df["Total_prob"].to_numpy(), total_price, kelly_fraction_cap)) * 100
     
     # Dollar stakes
     df["Stake_spread"] = (df["Kelly_spread_pct"] / 100.0) * bankroll
     df["Stake_total"] = (df["Kelly_total_pct"] / 100.0) * bankroll
     
-    # Recommendations
-    recs_spread = []
-    recs_total = []
-    
-    for _, r in df.iterrows():
-        # Spread recommendation
-        if r["EV_spread"] >= min_ev:
-            team = r["home"] if r["Spread_side"] == "HOME" else r["away"]
-            line = r["Spread used (home-)"]
-            if r["Spread_side"] == "AWAY":
-                line = -line
-            ev_pct = r["EV_spread"] * 100
-            prob_pct = r["Spread_prob"] * 100
-            recs_spread.append(
-                f"BET {team} {line:+.1f} @ {r['Kelly_spread_pct']:.1f}% "
-                f"(EV: {ev_pct:+.1f}%, Prob: {prob_pct:.1f}%)"
-            )
-        else:
-            recs_spread.append("SKIP")
-        
-        # Total recommendation
-        if r["EV_total"] >= min_ev:
-            side = r["Total_side"]
-            line = r["Total used"]
-            ev_pct = r["EV_total"] * 100
-            prob_pct = r["Total_prob"] * 100
-            recs_total.append(
-                f"BET {side} {line:.1f} @ {r['Kelly_total_pct']:.1f}% "
-                f"(EV: {ev_pct:+.1f}%, Prob: {prob_pct:.1f}%)"
-            )
-        else:
-            recs_total.append("SKIP")
-    
-    df["Rec_spread"] = recs_spread
-    df["Rec_total"] = recs_total
+    # Recommendations (text is only built for rows that clear min_ev)
+    spread_ok = df["EV_spread"].to_numpy() >= min_ev
+    total_ok = df["EV_total"].to_numpy() >= min_ev
+    
+    def spread_text(idx):
+        team = np.where(home_side[idx], df["home"].to_numpy()[idx], df["away"].to_numpy()[idx])
+        line = df["Spread used (home-)"].to_numpy(dtype=float)[idx]
+        line = np.where(home_side[idx], line, -line)
+        kelly = df["Kelly_spread_pct"].to_numpy()[idx]
+        ev_pct = df["EV_spread"].to_numpy()[idx] * 100
+        prob_pct = df["Spread_prob"].to_numpy()[idx] * 100
+        return [f"BET {t} {l:+.1f} @ {k:.1f}% (EV: {e:+.1f}%, Prob: {p:.1f}%)"
+                for t, l, k, e, p in zip(team, line, kelly, ev_pct, prob_pct)]
+    
+    def total_text(idx):
+        side = df["Total_side"].to_numpy()[idx]
+        line = df["Total used"].to_numpy(dtype=float)[idx]
+        kelly = df["Kelly_total_pct"].to_numpy()[idx]
+        ev_pct = df["EV_total"].to_numpy()[idx] * 100
+        prob_pct = df["Total_prob"].to_numpy()[idx] * 100
+        return [f"BET {s} {l:.1f} @ {k:.1f}% (EV: {e:+.1f}%, Prob: {p:.1f}%)"
+                for s, l, k, e, p in zip(side, line, kelly, ev_pct, prob_pct)]
+    
+    rec_spread = _recommendations(spread_ok, spread_text, n)
+    rec_total = _recommendations(total_ok, total_text, n)
+    df["Rec_spread"] = rec_spread
+    df["Rec_total"] = rec_total
     
     # Overall best bet for this game
-    best_bets = []
-    for _, r in df.iterrows():
-        if r["EV_spread"] >= min_ev and r["EV_total"] >= min_ev:
-            if r["EV_spread"] > r["EV_total"]:
-                best_bets.append(f"SPREAD: {r['Rec_spread']}")
-            else:
-                best_bets.append(f"TOTAL: {r['Rec_total']}")
-        elif r["EV_spread"] >= min_ev:
-            best_bets.append(f"SPREAD: {r['Rec_spread']}")
-        elif r["EV_total"] >= min_ev:
-            best_bets.append(f"TOTAL: {r['Rec_total']}")
-        else:
-            best_bets.append("NO PLAY")
-    
-    df["Best_bet"] = best_bets
+    spread_best = spread_ok & (~total_ok | (df["EV_spread"].to_numpy() > df["EV_total"].to_numpy()))
+    df["Best_bet"] = np.select(
+        [spread_best, total_ok],
+        ["SPREAD: " + rec_spread, "TOTAL: " + rec_total],
+        default="NO PLAY",
+    )
     
     # Add confidence levels based on predicted margin
-    confidence_levels = []
-    confidence_pcts = []
-    
-    for _, r in df.iterrows():
-        predicted_margin = abs(r["Model spread home-"])
-        conf_level, conf_pct = calculate_confidence_level(predicted_margin)
-        confidence_levels.append(conf_level)
-        confidence_pcts.append(conf_pct)
-    
-    df["confidence_level"] = confidence_levels
-    df["confidence_pct"] = confidence_pcts
+    levels, pcts = confidence_levels(df["Model spread home-"].to_numpy(dtype=float))
+    df["confidence_level"] = levels.astype(object)
+    df["confidence_pct"] = pcts
     
     return df
 
@@ -9,10 +9,12 @@ try:
 except Exception:
     from schedules import THIS_WEEK
 from nfl_edge.data_ingest import fetch_teamweeks_live, fetch_market_lines_live, fetch_weather_for_matchups, fetch_injury_index
-from nfl_edge.features import build_features, join_matchups, apply_weather_and_injuries
+from nfl_edge.features import join_matchups, apply_weather_and_injuries
+from nfl_edge.feature_state import incremental_features
 from nfl_edge.model import fit_expected_points_model, predict_expected_points
 from nfl_edge.simulate import monte_carlo
 from nfl_edge.kelly import add_betting_columns, generate_betting_card
+from nfl_edge.portfolio import add_portfolio_columns
 from nfl_edge.situational_features import add_all_situational_features
 from nfl_edge.xgb_integration import add_xgb_predictions
 
@@ -36,7 +38,8 @@ def run_week(week_number=None, matchups=None, use_xgb=True):
     games = matchups if matchups is not None else THIS_WEEK
     current_week = week_number if week_number is not None else 1
     
-    feats = build_features(teamweeks, recent_weight=cfg["recent_weight"])
+    # Persisted per-team state absorbs only newly completed weeks
+    feats = incremental_features(teamweeks, recent_weight=cfg["recent_weight"])
     base = join_matchups(feats, games)
     weather = fetch_weather_for_matchups(matchups=games)
     injuries = fetch_injury_index(matchups=games)
@@ -65,7 +68,7 @@ def run_week(week_number=None, matchups=None, use_xgb=True):
         for g in missing_games:
             print(f"  - {g}")
     spread = np.array(spread, dtype=float); total = np.array(total, dtype=float)
-    out = monte_carlo(muA, muH, team_sd=cfg["team_sd"], n_sims=cfg["n_sims"], spread_home=spread, total_line=total)
+    out = monte_carlo(muA, muH, team_sd=cfg["team_sd"], n_sims=cfg["n_sims"], spread_home=spread, total_line=total, return_samples=True)
     df = matches.copy()
     df["Exp score (away-home)"] = [f"{round(a)}-{round(h)}" for a,h in zip(muA, muH)]
     df["Model spread home-"] = out["model_spread_home"]
@@ -85,6 +88,12 @@ def run_week(week_number=None, matchups=None, use_xgb=True):
     
     df = add_betting_columns(df, bankroll=bankroll, min_ev=min_ev, kelly_fraction_cap=kelly_cap)
     
+    # Size the recommended bets jointly over the simulated scores (correlated card)
+    df = add_portfolio_columns(df, out["home_samples"], out["away_samples"], bankroll=bankroll,
+                               max_bet=cfg.get("portfolio_max_bet", 0.05),
+                               max_game=cfg.get("portfolio_max_game", 0.08),
+                               max_total=cfg.get("portfolio_max_total", 0.25))
+    
     # Add XGBoost predictions if enabled
     if use_xgb:
         try:
@@ -108,7 +117,8 @@ def run_week(week_number=None, matchups=None, use_xgb=True):
     base_cols = ["away","home","Exp score (away-home)","Model spread home-","Spread used (home-)","Edge_pts",
                  "Model total","Total used","Edge_total_pts","Home win %","Home cover %","Over %",
                  "EV_spread","EV_total","Kelly_spread_pct","Kelly_total_pct",
-                 "Stake_spread","Stake_total","Rec_spread","Rec_total","Best_bet",
+                 "Stake_spread","Stake_total","Port_stake_spread","Port_stake_total",
+                 "Rec_spread","Rec_total","Best_bet",
                  "confidence_level","confidence_pct"]
     
     # Add XGBoost columns if they exist
@@ -1,6 +1,6 @@
 
 import numpy as np
-def monte_carlo(mu_away, mu_home, team_sd: float, n_sims: int, spread_home=None, total_line=None):
+def monte_carlo(mu_away, mu_home, team_sd: float, n_sims: int, spread_home=None, total_line=None, return_samples=False):
     mu_away = np.asarray(mu_away, dtype=float); mu_home = np.asarray(mu_home, dtype=float)
     n_games = len(mu_away)
     away = np.random.normal(mu_away, team_sd, (n_sims, n_games))
@@ -10,6 +10,10 @@ def monte_carlo(mu_away, mu_home, team_sd: float, n_sims: int, spread_home=None,
     if spread_home is None or total_line is None:
         raise RuntimeError("Market lines required (no fallback).")
     over = (total > total_line).mean(axis=0); home_cover = (diff > -spread_home).mean(axis=0); home_win = (diff > 0).mean(axis=0)
-    return {"model_spread_home": model_spread, "model_total": model_total,
-            "spread_used": spread_home, "total_used": total_line,
-            "over_prob": over, "home_cover_prob": home_cover, "home_win_prob": home_win}
+    out = {"model_spread_home": model_spread, "model_total": model_total,
+           "spread_used": spread_home, "total_used": total_line,
+           "over_prob": over, "home_cover_prob": home_cover, "home_win_prob": home_win}
+    if return_samples:
+        # Joint (n_sims, n_games) scores, e.g. for portfolio sizing
+        out["home_samples"] = home; out["away_samples"] = away
+    return out
@@ -161,3 +161,32 @@ def validate_team(team: str) -> bool:
     """Check if team abbreviation is valid."""
     return team in CANONICAL_TEAMS
 
+
+
+# Nicknames as they appear in sportsbook descriptions ("Packers +3", "Chiefs/Bills over 47")
+NICKNAME_TO_CANONICAL = {
+    name.rsplit(' ', 1)[-1]: abbr
+    for name, abbr in ODDS_API_TO_CANONICAL.items()
+    if name != "Washington Football Team"
+}
+
+# Every known spelling -> canonical, for lookups that don't know their source
+_ANY_TO_CANONICAL = {
+    **{team: team for team in CANONICAL_TEAMS},
+    **ESPN_TO_CANONICAL,
+    **NFLVERSE_TO_CANONICAL,
+    **ODDS_API_TO_CANONICAL,
+    **NICKNAME_TO_CANONICAL,
+}
+_ANY_TO_CANONICAL_UPPER = {name.upper(): abbr for name, abbr in _ANY_TO_CANONICAL.items()}
+
+def to_abbr(team) -> str:
+    """
+    Canonical abbreviation for a team in any form (abbreviation, full name
+    or nickname, any source). Unknown values are returned unchanged.
+    """
+    if not isinstance(team, str):
+        return team
+    team = team.strip()
+    return _ANY_TO_CANONICAL.get(team) or _ANY_TO_CANONICAL_UPPER.get(team.upper(), team)
+
@@ -0,0 +1,697 @@
+#!/usr/bin/env python3
+"""
+Backtest Runner: one engine for every simulator backtest.
+
+Replaces the per-season backtest_* scripts, which each reimplemented game
+loading, ProcessPoolExecutor fan-out, market centering and grading.
+
+- Games are sharded by (season, week). A worker simulates a whole week, so
+  the week's PressureCalibrator fit, the team data files and the
+  probability calibrators are loaded once per worker instead of per game.
+- Workers receive compact GameSpec tuples, not pandas rows.
+- Each finished week is appended to a JSONL checkpoint; re-running the
+  same command after a crash resumes from it.
+- Every run emits the same results schema (RESULT_COLUMNS), the one
+  format_for_frontend.py and the calibration scripts read.
+- With --histograms, each game's joint score histogram is stored under
+  the run's model version, so other lines can be priced later without
+  re-simulating (see simulator/score_histogram.py).
+- The dashboard's model-performance aggregates are written next to the
+  results CSV (<output>.summary.json, see simulator/performance_summary.py).
+- With --batch, each game's trials run at once on the vectorized
+  BatchGameSimulator (same score distribution, much faster at high
+  --n-sims) instead of the per-trial play-by-play loop.
+
+Each game's trials draw from trial_rngs([seed, crc32(game_id)]), so
+results do not depend on the worker count or shard order.
+
+Usage:
+    python backtest_runner.py --seasons 2025 --weeks 1-8
+    python backtest_runner.py --seasons 2022 2023 2024 --n-sims 100 --workers 8
+    python backtest_runner.py --seasons 2025 --n-sims 10000 --batch
+    python backtest_runner.py --games-csv games.csv --output artifacts/my_backtest.csv
+
+API:
+    from backtest_runner import load_games, game_specs, run_backtest
+    df = run_backtest(game_specs(load_games([2024], range(1, 9))), n_sims=100)
+"""
+
+# Kill hidden oversubscription
+import os
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+import argparse
+import json
+import pickle
+import sys
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from simulator.game_simulator import GameSimulator
+from simulator.market_centering import center_scores_to_market
+from simulator.performance_summary import write_summary
+from simulator.probability_calibration import (CompactCalibrator, calibrate_probabilities,
+                                               calibrate_total_probabilities, load_calibrators)
+from simulator.rng import trial_rngs
+from simulator.score_histogram import HistogramStore, ScoreHistogram, model_version
+from simulator.team_profile import TeamProfile
+from simulator.tracing import SimTrace
+
+DATA_DIR = Path(__file__).parent / "data" / "nflfastR"
+ARTIFACTS_DIR = Path(__file__).parent / "artifacts"
+
+# Conviction tiers (edge thresholds)
+MEDIUM_EDGE = 0.03  # 3% edge
+HIGH_EDGE = 0.06    # 6% edge
+MAX_EDGE_CAP = 0.25  # Cap extreme edges at 25% to prevent outlier-driven ROI
+BREAKEVEN = 0.524  # -110 vig breakeven
+
+# Linear score calibration: calibrated_mean = 26.45 + 0.571 * raw_mean
+LINEAR_ALPHA = 26.45
+LINEAR_BETA = 0.571
+
+RESULT_COLUMNS = [
+    'game_id', 'season', 'week', 'away_team', 'home_team', 'spread_line', 'total_line',
+    # Calibrated mean scores for frontend display - THIS IS "OUR SCORE"
+    'home_score_mean', 'away_score_mean',
+    # Market-centered distribution
+    'spread_mean', 'total_mean', 'spread_sd', 'total_sd',
+    # Raw (pre-centered) for calibration
+    'spread_raw', 'spread_raw_sd', 'total_raw', 'total_raw_sd',
+    'p_home_cover', 'p_away_cover', 'p_over', 'p_under',
+    'p_home_cover_centered', 'p_over_centered', 'calibration_method',
+    'spread_bet', 'spread_edge', 'spread_conviction',
+    'total_bet', 'total_edge', 'total_conviction',
+    'actual_home_score', 'actual_away_score', 'n_sims',
+]
+
+
+class GameSpec(NamedTuple):
+    """Everything a worker needs to simulate and grade one game."""
+    game_id: str
+    season: int
+    week: int
+    away_team: str
+    home_team: str
+    spread_line: float  # home - away (positive = home favored)
+    total_line: float
+    home_score: float  # NaN if not played yet
+    away_score: float
+
+
+# ============================================================================
+# Game loading
+# ============================================================================
+
+def load_games(seasons: Sequence[int], weeks: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """
+    Load games with closing lines and results from the nflverse schedule.
+
+    nflverse uses home - away for spread_line (positive = home favored), the
+    same convention as the simulator. total_line is also copied to
+    closing_total for older callers.
+    """
+    import nfl_data_py as nfl
+
+    schedule = nfl.import_schedules(list(seasons))
+    print(f"   Loaded {len(schedule)} games from nfl_data_py")
+
+    if weeks is not None:
+        schedule = schedule[schedule['week'].isin(list(weeks))].copy()
+        print(f"   Filtered to {len(schedule)} games in weeks {min(weeks)}-{max(weeks)}")
+
+    schedule = schedule[schedule['spread_line'].notna() & schedule['total_line'].notna()].copy()
+    schedule['closing_total'] = schedule['total_line']
+
+    print(f"✅ Loaded {len(schedule)} games with lines")
+    print(f"   Games with results: {schedule['home_score'].notna().sum()}/{len(schedule)}")
+    return schedule
+
+
+def game_specs(games: pd.DataFrame) -> List[GameSpec]:
+    """
+    Convert a games frame (schedule or CSV) to compact GameSpecs.
+
+    Frames from the historical odds CSV carry spread_home (the home team's
+    handicap, negative when favored) instead of spread_line; it is negated
+    into the home - away convention the grading uses.
+    """
+    if 'spread_line' not in games.columns and 'spread_home' in games.columns:
+        games = games.assign(spread_line=-games['spread_home'])
+    total_col = 'total_line' if 'total_line' in games.columns else 'closing_total'
+    home_col = 'home_score' if 'home_score' in games.columns else 'home_final'
+    away_col = 'away_score' if 'away_score' in games.columns else 'away_final'
+
+    specs = []
+    for row in games.to_dict('records'):
+        season, week = int(row['season']), int(row['week'])
+        away, home = str(row['away_team']), str(row['home_team'])
+        game_id = row.get('game_id')
+        if not isinstance(game_id, str) or not game_id:
+            game_id = f"{season}_{week:02d}_{away}_{home}"
+        specs.append(GameSpec(
+            game_id=game_id, season=season, week=week, away_team=away, home_team=home,
+            spread_line=float(row['spread_line']), total_line=float(row[total_col]),
+            home_score=_score(row.get(home_col)), away_score=_score(row.get(away_col)),
+        ))
+    return specs
+
+
+def _score(value) -> float:
+    return float(value) if value is not None and pd.notna(value) else np.nan
+
+
+# ============================================================================
+# Worker: per-process cache + one week per task
+# ============================================================================
+
+_worker: Dict = {}
+
+
+def _init_worker(data_dir: Path, calibrate_pressure: bool, histograms: Optional[tuple] = None,
+                 batch: bool = False):
+    """Reset this process's profile/calibrator cache (ProcessPoolExecutor initializer)."""
+    _worker.clear()
+    _worker.update(
+        data_dir=Path(data_dir),
+        calibrate_pressure=calibrate_pressure,
+        batch=batch,
+        profiles={},
+        pressure={},
+        prob_calibrators=None,
+        histograms=HistogramStore(*histograms) if histograms else None,
+    )
+
+
+def _profile(team: str, season: int, week: int) -> TeamProfile:
+    key = (team, season, week)
+    if key not in _worker['profiles']:
+        _worker['profiles'][key] = TeamProfile(team, season, week, data_dir=_worker['data_dir'], debug=False)
+    return _worker['profiles'][key]
+
+
+def _pressure_calibrator(season: int, week: int):
+    """PressureCalibrator fit through the previous week (None = legacy pressure model)."""
+    key = (season, week)
+    if key not in _worker['pressure']:
+        calibrator = None
+        pressure_file = _worker['data_dir'] / "pressure_rates_weekly.csv"
+        if _worker['calibrate_pressure'] and pressure_file.exists():
+            try:
+                from simulator.pressure_calibration import PressureCalibrator, PressureConfig
+                calibrator = PressureCalibrator(PressureConfig(
+                    weeks_lookback=5,
+                    ema_alpha=0.45,
+                    ol_dl_beta=0.018
+                ))
+                calibrator.fit_from_file(pressure_file, season=season, week=week)
+            except Exception:
+                # If calibrator fails, continue without it (fallback to old system)
+                calibrator = None
+        _worker['pressure'][key] = calibrator
+    return _worker['pressure'][key]
+
+
+def _load_pickle(path: Path):
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _prob_calibrators() -> Dict:
+    """Fitted spread/total probability calibrators from artifacts/ (loaded once per worker)."""
+    if _worker['prob_calibrators'] is None:
+        cal = {}
+
+        # Isotonic calibrators from fit_isotonic_calibrators.py (compact JSON when current)
+        try:
+            isotonic = load_calibrators(ARTIFACTS_DIR / "isotonic_calibrators.pkl")
+        except Exception:
+            isotonic = {}
+        for market in ('spread', 'total'):
+            if market in isotonic and isotonic[market].is_fitted:
+                cal[f'{market}_isotonic'] = isotonic[market]
+
+        # Older probability calibrators (isotonic, else Platt) take precedence when present
+        for market in ('spread', 'total'):
+            path = ARTIFACTS_DIR / f"{market}_calibrator_isotonic.pkl"
+            if not path.exists():
+                path = ARTIFACTS_DIR / f"{market}_calibrator_platt.pkl"
+            calibrator = _load_pickle(path) if path.exists() else None
+            if calibrator is not None and calibrator.is_fitted:
+                cal[f'{market}_probability'] = CompactCalibrator.from_calibrator(calibrator)
+
+        _worker['prob_calibrators'] = cal
+    return _worker['prob_calibrators']
+
+
+def price_game(spec: GameSpec, home_scores: np.ndarray, away_scores: np.ndarray) -> Dict:
+    """
+    Turn simulated scores into probabilities, bets and conviction tiers.
+
+    Priority: probability calibrators (if fitted) > linear score
+    calibration with margin bias correction. Market-centered
+    probabilities are kept for comparison.
+    """
+    from bias_calibration import get_score_adjustment
+
+    spread_line, total_line = spec.spread_line, spec.total_line
+
+    # Raw (pre-centered) stats for calibration
+    spreads_raw = home_scores - away_scores
+    totals_raw = home_scores + away_scores
+    spread_raw_mean = float(np.mean(spreads_raw))
+    total_raw_mean = float(np.mean(totals_raw))
+    spread_raw_sd = float(np.std(spreads_raw))
+    total_raw_sd = float(np.std(totals_raw))
+
+    # 1. Market-centered (for display/comparison)
+    home_c, away_c = center_scores_to_market(home_scores, away_scores, spread_line, total_line)
+    spreads_c = home_c - away_c
+    totals_c = home_c + away_c
+    p_home_cover_centered = float(np.mean(spreads_c > spread_line))
+    p_over_centered = float(np.mean(totals_c > total_line))
+
+    # 2. Linear calibration (score-level), raw SD kept for sharper probabilities
+    calibrated_total_mean = LINEAR_ALPHA + LINEAR_BETA * total_raw_mean
+    raw_home_mean = (total_raw_mean + spread_raw_mean) / 2.0
+    raw_away_mean = (total_raw_mean - spread_raw_mean) / 2.0
+    home_score_mean = LINEAR_ALPHA / 2.0 + LINEAR_BETA * raw_home_mean
+    away_score_mean = LINEAR_ALPHA / 2.0 + LINEAR_BETA * raw_away_mean
+
+    # Margin-only bias correction (venue-aware, clamped to ±1.0, then halved);
+    # the total stays unchanged
+    total_cal = home_score_mean + away_score_mean
+    home_net = get_score_adjustment(spec.home_team, spec.season, spec.week, mode='net',
+                                    span_ewm=2, clip_points=1.0, venue='home')
+    away_net = get_score_adjustment(spec.away_team, spec.season, spec.week, mode='net',
+                                    span_ewm=2, clip_points=1.0, venue='away')
+    margin_adj = (home_score_mean - away_score_mean) + np.clip(home_net - away_net, -1.0, 1.0) * 0.5
+    home_score_mean = (total_cal + margin_adj) / 2.0
+    away_score_mean = (total_cal - margin_adj) / 2.0
+
+    p_home_cover = float(np.clip(1 - norm.cdf((spread_line - margin_adj) / max(spread_raw_sd, 1e-6)), 0.01, 0.99))
+    p_over = float(np.clip(1 - norm.cdf((total_line - calibrated_total_mean) / max(total_raw_sd, 1e-6)), 0.01, 0.99))
+    calibration_method = 'linear'
+
+    # 3. Probability calibrators - PRIORITY over linear
+    cal = _prob_calibrators()
+    if 'spread_isotonic' in cal:
+        p = cal['spread_isotonic'].predict(np.array([spread_raw_mean]), np.array([spread_raw_sd]),
+                                           np.array([spread_line]))[0]
+        p_home_cover = float(np.clip(p, 0.01, 0.99))
+        calibration_method = 'isotonic'
+    if 'total_isotonic' in cal:
+        p = cal['total_isotonic'].predict(np.array([total_raw_mean]), np.array([total_raw_sd]),
+                                          np.array([total_line]))[0]
+        p_over = float(np.clip(p, 0.01, 0.99))
+    if 'spread_probability' in cal:
+        p_home_cover = calibrate_probabilities(spread_raw_mean, spread_raw_sd, spread_line,
+                                               cal['spread_probability'])['p_home_cover']
+        calibration_method = 'isotonic'
+    if 'total_probability' in cal:
+        p_over = calibrate_total_probabilities(total_raw_mean, total_raw_sd, total_line,
+                                               cal['total_probability'])['p_over']
+        calibration_method = 'isotonic'
+
+    spread_bet, spread_edge, spread_conviction = _bet(p_home_cover, 'HOME', 'AWAY')
+    total_bet, total_edge, total_conviction = _bet(p_over, 'OVER', 'UNDER')
+
+    return {
+        'game_id': spec.game_id,
+        'season': spec.season,
+        'week': spec.week,
+        'away_team': spec.away_team,
+        'home_team': spec.home_team,
+        'spread_line': spread_line,
+        'total_line': total_line,
+        'home_score_mean': float(home_score_mean),
+        'away_score_mean': float(away_score_mean),
+        'spread_mean': float(spreads_c.mean()),
+        'total_mean': float(totals_c.mean()),
+        'spread_sd': float(spreads_c.std()),
+        'total_sd': float(totals_c.std()),
+        'spread_raw': spread_raw_mean,
+        'spread_raw_sd': spread_raw_sd,
+        'total_raw': total_raw_mean,
+        'total_raw_sd': total_raw_sd,
+        'p_home_cover': p_home_cover,
+        'p_away_cover': 1 - p_home_cover,
+        'p_over': p_over,
+        'p_under': 1 - p_over,
+        'p_home_cover_centered': p_home_cover_centered,
+        'p_over_centered': p_over_centered,
+        'calibration_method': calibration_method,
+        'spread_bet': spread_bet,
+        'spread_edge': spread_edge,
+        'spread_conviction': spread_conviction,
+        'total_bet': total_bet,
+        'total_edge': total_edge,
+        'total_conviction': total_conviction,
+        'actual_home_score': spec.home_score,
+        'actual_away_score': spec.away_score,
+        'n_sims': int(len(home_scores)),
+    }
+
+
+def _bet(p_first: float, first: str, second: str):
+    """Side, capped edge and conviction tier for a two-way market (no bet below breakeven)."""
+    if p_first > BREAKEVEN:
+        side, edge = first, min(p_first - BREAKEVEN, MAX_EDGE_CAP)
+    elif 1 - p_first > BREAKEVEN:
+        side, edge = second, min(1 - p_first - BREAKEVEN, MAX_EDGE_CAP)
+    else:
+        return None, 0.0, None
+    conviction = 'HIGH' if edge >= HIGH_EDGE else 'MEDIUM' if edge >= MEDIUM_EDGE else 'LOW'
+    return side, float(edge), conviction
+
+
+def simulate_game(spec: GameSpec, n_sims: int, seed: int) -> Dict:
+    """Simulate one game n_sims times and price it."""
+    home_profile = _profile(spec.home_team, spec.season, spec.week)
+    away_profile = _profile(spec.away_team, spec.season, spec.week)
+
+    game_seed = [seed, zlib.crc32(spec.game_id.encode())]
+    sim = GameSimulator(
+        home_profile,
+        away_profile,
+        game_id=spec.game_id,
+        season=spec.season,
+        week=spec.week,
+        trace=SimTrace(game_id=spec.game_id, enable=False),
+        seed=game_seed,
+        pressure_calibrator=_pressure_calibrator(spec.season, spec.week)
+    )
+
+    if _worker['batch']:
+        games = sim.batch_simulator().simulate_games(n_sims)
+        home_scores = games['home_score'].astype(float)
+        away_scores = games['away_score'].astype(float)
+    else:
+        home_scores = np.empty(n_sims)
+        away_scores = np.empty(n_sims)
+        for i, rng in enumerate(trial_rngs(game_seed, n_sims)):
+            result = sim.simulate_game(rng=rng)
+            home_scores[i] = result['home_score']
+            away_scores[i] = result['away_score']
+
+    if _worker['histograms'] is not None:
+        _worker['histograms'].put(spec.game_id, ScoreHistogram.from_scores(home_scores, away_scores))
+    return price_game(spec, home_scores, away_scores)
+
+
+def simulate_week(args) -> List[Dict]:
+    """Worker task: simulate every game of one (season, week) shard."""
+    specs, n_sims, seed = args
+    results = []
+    for spec in specs:
+        try:
+            results.append(simulate_game(spec, n_sims, seed))
+        except Exception as e:
+            import traceback
+            print(f"❌ Error on {spec.game_id} ({spec.away_team}@{spec.home_team}): {e}")
+            print(f"   Full traceback: {traceback.format_exc()}")
+    return results
+
+
+# ============================================================================
+# Checkpointing
+# ============================================================================
+
+def _read_checkpoint(path: Path, config: Dict) -> List[Dict]:
+    """Results already in the checkpoint (a torn last line from a crash is ignored)."""
+    if not path.exists():
+        return []
+    results = []
+    with open(path) as f:
+        lines = f.read().splitlines()
+    if not lines:
+        return []
+    header = json.loads(lines[0])
+    if header.get('config') != config:
+        raise ValueError(f"Checkpoint {path} was written with {header.get('config')}, "
+                         f"not {config} - rerun with --fresh to discard it")
+    for line in lines[1:]:
+        try:
+            results.append(json.loads(line))
+        except json.JSONDecodeError:
+            break
+    return results
+
+
+def _append_checkpoint(path: Path, config: Dict, results: List[Dict]):
+    """Append finished games and fsync, so a crash loses at most the running weeks."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    new = not path.exists() or path.stat().st_size == 0
+    with open(path, 'a') as f:
+        if new:
+            f.write(json.dumps({'config': config}) + "\n")
+        for result in results:
+            f.write(json.dumps(result, default=_json_default) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# ============================================================================
+# Engine
+# ============================================================================
+
+def run_backtest(specs: Sequence[GameSpec], n_sims: int = 100, seed: int = 42,
+                 workers: Optional[int] = None, checkpoint: Optional[Path] = None,
+                 data_dir: Path = DATA_DIR, calibrate_pressure: bool = True,
+                 histogram_dir: Optional[Path] = None, batch: bool = False) -> pd.DataFrame:
+    """
+    Simulate, price and grade games.
+
+    Args:
+        specs: Games to run (see load_games / game_specs)
+        n_sims: Simulations per game
+        seed: Base seed; each game's trials are spawned from (seed, game_id)
+        workers: Worker processes (default min(8, cpu_count)); 1 runs in-process
+        checkpoint: Optional JSONL file; finished weeks are appended and
+            skipped when the run is repeated
+        data_dir: nflfastR data directory
+        calibrate_pressure: Use the weekly PressureCalibrator (else legacy pressure model)
+        histogram_dir: Optional directory; each game's ScoreHistogram is stored
+            under histogram_dir/<model version>/<game_id>.npz
+        batch: Simulate each game's trials at once on BatchGameSimulator
+
+    Returns:
+        Graded DataFrame with RESULT_COLUMNS plus grading columns
+    """
+    config = {'n_sims': n_sims, 'seed': seed, 'calibrate_pressure': calibrate_pressure}
+    if batch:
+        # Only when set, so existing checkpoints and histogram versions stay valid
+        config['batch'] = True
+    results = _read_checkpoint(Path(checkpoint), config) if checkpoint else []
+    done = {r['game_id'] for r in results}
+    if done:
+        print(f"♻️  Resuming: {len(done)} games already in {checkpoint}")
+
+    shards = defaultdict(list)
+    for spec in specs:
+        if spec.game_id not in done:
+            shards[(spec.season, spec.week)].append(spec)
+    tasks = {key: (shards[key], n_sims, seed) for key in sorted(shards)}
+
+    histograms = None
+    if histogram_dir:
+        histograms = (str(histogram_dir), model_version(config))
+        print(f"📦 Score histograms: {Path(histogram_dir) / histograms[1]}")
+
+    n_remaining = sum(len(s) for s in shards.values())
+    if workers is None:
+        workers = min(8, os.cpu_count() or 1)
+    workers = max(1, min(workers, len(tasks) or 1))
+    print(f"🚀 Running {n_remaining} games × {n_sims} sims in {len(tasks)} weekly shards on {workers} workers")
+
+    start = time.time()
+    n_done = 0
+
+    def collect(key, week_results):
+        nonlocal n_done
+        n_done += len(tasks[key][0])
+        if checkpoint:
+            _append_checkpoint(Path(checkpoint), config, week_results)
+        results.extend(week_results)
+        print(f"   ✅ {key[0]} W{key[1]:02d}: {len(week_results)} games ({n_done}/{n_remaining}, {time.time() - start:.0f}s)")
+
+    if workers == 1:
+        _init_worker(data_dir, calibrate_pressure, histograms, batch)
+        for key, task in tasks.items():
+            collect(key, simulate_week(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(data_dir, calibrate_pressure, histograms, batch)) as ex:
+            futures = {ex.submit(simulate_week, task): key for key, task in tasks.items()}
+            for future in as_completed(futures):
+                collect(futures[future], future.result())
+
+    print(f"✅ Completed in {time.time() - start:.1f} seconds")
+
+    df = pd.DataFrame(results, columns=RESULT_COLUMNS)
+    df = df.sort_values(['season', 'week', 'game_id']).reset_index(drop=True)
+    return grade_results(df)
+
+
+def grade_results(df: pd.DataFrame) -> pd.DataFrame:
+    """Add actuals and bet outcomes (1.0 win, 0.0 loss, NaN for push / no bet / unplayed)."""
+    df = df.copy()
+    df['actual_spread'] = df['actual_home_score'] - df['actual_away_score']
+    df['actual_total'] = df['actual_home_score'] + df['actual_away_score']
+
+    df['home_covered'] = np.select(
+        [df['actual_spread'] > df['spread_line'], df['actual_spread'] < df['spread_line']],
+        [1.0, 0.0], np.nan)
+    df['over_hit'] = np.select(
+        [df['actual_total'] > df['total_line'], df['actual_total'] < df['total_line']],
+        [1.0, 0.0], np.nan)
+
+    df['spread_result'] = np.select(
+        [df['spread_bet'] == 'HOME', df['spread_bet'] == 'AWAY'],
+        [df['home_covered'], 1.0 - df['home_covered']], np.nan)
+    df['total_result'] = np.select(
+        [df['total_bet'] == 'OVER', df['total_bet'] == 'UNDER'],
+        [df['over_hit'], 1.0 - df['over_hit']], np.nan)
+    return df
+
+
+def _print_market(label: str, bets: pd.DataFrame, result_col: str, edge_col: str, conviction_col: str):
+    print(f"\n📊 {label} BETS: {len(bets)} total")
+
+    def record(tier_bets):
+        wins = (tier_bets[result_col] == 1.0).sum()
+        losses = (tier_bets[result_col] == 0.0).sum()
+        pushes = tier_bets[result_col].isna().sum()
+        if wins + losses == 0:
+            return None
+        win_rate = wins / (wins + losses) * 100
+        roi = ((wins * 0.909 - losses) / len(tier_bets)) * 100
+        return f"{wins}W-{losses}L-{pushes}P | Win Rate: {win_rate:.1f}% | ROI: {roi:+.1f}%"
+
+    for conviction in ['HIGH', 'MEDIUM', 'LOW']:
+        tier_bets = bets[bets[conviction_col] == conviction]
+        if len(tier_bets) == 0:
+            print(f"\n   {conviction} Conviction (0 bets)")
+            continue
+        line = record(tier_bets)
+        if line:
+            avg_edge = tier_bets[edge_col].mean() * 100
+            print(f"\n   {conviction} Conviction ({len(tier_bets)} bets, avg edge: {avg_edge:.1f}%):")
+            print(f"      {line}")
+
+    line = record(bets)
+    if line:
+        print(f"\n   ALL {label.title()} Bets ({len(bets)} total):")
+        print(f"      {line}")
+
+
+def print_summary(df: pd.DataFrame):
+    """Print performance by conviction tier."""
+    print("\n" + "=" * 70)
+    print("BACKTEST - ALL GAMES BY CONVICTION")
+    print("=" * 70)
+    print(f"\nTotal games analyzed: {len(df)}")
+
+    spread_bets = df[df['spread_bet'].notna()]
+    if len(spread_bets) > 0:
+        _print_market("SPREAD", spread_bets, 'spread_result', 'spread_edge', 'spread_conviction')
+    total_bets = df[df['total_bet'].notna()]
+    if len(total_bets) > 0:
+        _print_market("TOTAL", total_bets, 'total_result', 'total_edge', 'total_conviction')
+
+    print("\n" + "=" * 70)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def _parse_weeks(text: str) -> List[int]:
+    """'1-8' or '1,3,5' -> list of weeks."""
+    weeks = []
+    for part in text.split(','):
+        if '-' in part:
+            lo, hi = part.split('-')
+            weeks.extend(range(int(lo), int(hi) + 1))
+        else:
+            weeks.append(int(part))
+    return weeks
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description='Run a simulator backtest')
+    parser.add_argument('--seasons', type=int, nargs='+', default=[2025], help='Seasons to load (nflverse schedule)')
+    parser.add_argument('--weeks', type=_parse_weeks, default=None, help="Weeks, e.g. '1-8' or '1,3,5' (default: all)")
+    parser.add_argument('--games-csv', type=Path, help='Games file instead of the schedule (season, week, away_team, '
+                                                       'home_team, spread_line, total_line, home_score, away_score)')
+    parser.add_argument('--n-sims', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: min(8, CPUs))')
+    parser.add_argument('--output', type=Path, help='Results CSV (default: artifacts/backtest_<seasons>.csv)')
+    parser.add_argument('--checkpoint', type=Path, help='Checkpoint file (default: <output>.checkpoint.jsonl)')
+    parser.add_argument('--fresh', action='store_true', help='Discard an existing checkpoint')
+    parser.add_argument('--no-pressure-calibration', action='store_true', help='Use the legacy pressure model')
+    parser.add_argument('--bias-pipeline', action='store_true', help='Write bias history and calibration artifacts')
+    parser.add_argument('--histograms', type=Path, help='Store per-game joint score histograms in this directory')
+    parser.add_argument('--batch', action='store_true', help='Vectorized engine (untraced; for large --n-sims)')
+    args = parser.parse_args(argv)
+
+    if args.games_csv:
+        games = pd.read_csv(args.games_csv)
+        if args.weeks:
+            games = games[games['week'].isin(args.weeks)]
+        tag = args.games_csv.stem
+    else:
+        games = load_games(args.seasons, args.weeks)
+        tag = "_".join(str(s) for s in args.seasons)
+        if args.weeks:
+            tag += f"_w{min(args.weeks)}-{max(args.weeks)}"
+
+    output = args.output or ARTIFACTS_DIR / f"backtest_{tag}.csv"
+    checkpoint = args.checkpoint or output.with_name(output.stem + ".checkpoint.jsonl")
+    if args.fresh and checkpoint.exists():
+        checkpoint.unlink()
+
+    df = run_backtest(game_specs(games), n_sims=args.n_sims, seed=args.seed, workers=args.workers,
+                      checkpoint=checkpoint, calibrate_pressure=not args.no_pressure_calibration,
+                      histogram_dir=args.histograms, batch=args.batch)
+
+    if args.bias_pipeline:
+        # --- Bias pipeline: residuals, calibration curves, weekly ROI ---
+        from bias_calibration import run_bias_pipeline
+        run_bias_pipeline(df, team_for_curve="PIT", save_artifacts=True)
+        print("\n📈 Bias history and calibration artifacts written to ./artifacts")
+
+    print_summary(df)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(output, index=False)
+    checkpoint.unlink(missing_ok=True)
+    print(f"\n💾 Saved to: {output}")
+    print(f"💾 Performance summary: {write_summary(df, output)}")
+    return df
+
+
+if __name__ == "__main__":
+    main()
@@ -19,15 +19,11 @@ import numpy as np
 from concurrent.futures import ProcessPoolExecutor
 import time
 
-# Import from backtest_ultra_fast
-from backtest_ultra_fast import (
-    load_games_2024,
-    center_scores_to_market,
-    BREAKEVEN,
-    EDGE_THRESHOLD,
-)
+from backtest_runner import load_games
+from simulator.market_centering import center_scores_to_market
 
 from simulator.game_simulator import GameSimulator
+from simulator.rng import trial_rngs
 from simulator.team_profile import TeamProfile
 
 # Load PFF z-scores
@@ -65,6 +61,7 @@ def simulate_one_game_with_pff(args):
         week = int(row.get('week', 1))
         away = row.get('away_team', row.get('away'))
         home = row.get('home_team', row.get('home'))
+        # nflverse convention: home - away, positive = home favored (not the odds CSV's spread_home)
         spread_line = float(row.get('spread_line', 0))
         total_line = float(row.get('total_line', 0))
         
@@ -93,11 +90,8 @@ def simulate_one_game_with_pff(args):
         home_scores = []
         away_scores = []
         
-        for sim_i in range(n_sims):
-            sim_seed = (idx * 10000 + sim_i) * (2 if use_pff else 1)
-            np.random.seed(int(sim_seed))
-            
-            result = simulator.simulate_game()
+        for rng in trial_rngs([idx, int(use_pff)], n_sims):
+            result = simulator.simulate_game(rng=rng)
             
             home_scores.append(result['home_score'])
             away_scores.append(result['away_score'])
@@ -159,7 +153,7 @@ def run_backtest(use_pff=False, n_sims=50):
     print(f"BACKTEST {'WITH' if use_pff else 'WITHOUT'} PFF")
     print(f"{'='*60}")
     
-    games = load_games_2024()
+    games = load_games([2024], range(1, 9))
     n_games = len(games)
     
     # Convert to list of dicts
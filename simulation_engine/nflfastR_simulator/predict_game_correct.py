@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 import numpy as np
 from simulator.game_simulator import GameSimulator
+from simulator.rng import trial_rngs
 from simulator.team_profile import TeamProfile
 
 def center_scores_to_market(
@@ -93,9 +94,8 @@ def predict_game(away_team, home_team, spread_line, total_line, season=2024, wee
     home_scores = []
     away_scores = []
     
-    for sim_i in range(n_sims):
-        np.random.seed(42 + sim_i)
-        result = simulator.simulate_game()
+    for rng in trial_rngs(42, n_sims):
+        result = simulator.simulate_game(rng=rng)
         home_scores.append(result['home_score'])
         away_scores.append(result['away_score'])
     
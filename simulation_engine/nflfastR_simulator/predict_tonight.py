@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 import numpy as np
 from simulator.game_simulator import GameSimulator
+from simulator.rng import trial_rngs
 from simulator.team_profile import TeamProfile
 
 # Game details
@@ -55,10 +56,8 @@ simulator = GameSimulator(home_profile, away_profile)
 home_scores = []
 away_scores = []
 
-for sim_i in range(N_SIMS):
-    np.random.seed(42 + sim_i)  # Reproducible
-    
-    result = simulator.simulate_game()
+for rng in trial_rngs(42, N_SIMS):  # Reproducible
+    result = simulator.simulate_game(rng=rng)
     
     home_scores.append(result['home_score'])
     away_scores.append(result['away_score'])
@@ -9,17 +9,21 @@ echo "==========================================================================
 cd "$(dirname "$0")"
 
 echo ""
-echo "1/3 Extracting QB pressure splits..."
+echo "1/4 Extracting QB pressure splits..."
 python3 extract_qb_splits.py
 
 echo ""
-echo "2/3 Extracting play-calling tendencies..."
+echo "2/4 Extracting play-calling tendencies..."
 python3 extract_playcalling.py
 
 echo ""
-echo "3/3 Extracting drive probabilities..."
+echo "3/4 Extracting drive probabilities..."
 python3 extract_drive_probs.py
 
+echo ""
+echo "4/4 Building columnar cache..."
+python3 build_columnar.py
+
 echo ""
 echo "=============================================================================="
 echo "✅ ALL DATA EXTRACTION COMPLETE"
@@ -0,0 +1,62 @@
+"""
+Build typed columnar copies of the extracted nflfastR CSVs.
+
+Runs after the extract_* scripts. For every CSV in data/nflfastR/ (and the
+PFF team grades) writes data/.../.columnar/<name>.feather (or .pkl without
+pyarrow) with categorical team/bucket columns. The simulator loaders prefer
+these copies and rebuild any that are older than their CSV, so this step
+only moves the conversion cost out of the first backtest worker.
+
+Usage:
+    python3 preprocessing/build_columnar.py
+    python3 preprocessing/build_columnar.py --force
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulator.columnar import columnar_path, is_stale, write_columnar
+
+DATA_DIRS = [
+    Path(__file__).parent.parent / "data" / "nflfastR",
+    Path(__file__).parent.parent.parent / "phase1_validation" / "pff_raw",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build columnar copies of simulator CSVs')
+    parser.add_argument('--force', action='store_true',
+                       help='Rebuild even if the columnar copy is up to date')
+    args = parser.parse_args()
+
+    print("="*80)
+    print("BUILD COLUMNAR CACHE")
+    print("="*80)
+
+    built = 0
+    for data_dir in DATA_DIRS:
+        if not data_dir.exists():
+            print(f"⚠️  {data_dir} not found, skipping...")
+            continue
+
+        for csv_path in sorted(data_dir.glob("*.csv")):
+            if not args.force and not is_stale(csv_path):
+                continue
+            df = pd.read_csv(csv_path)
+            out = write_columnar(df, csv_path)
+            csv_kb = csv_path.stat().st_size / 1024
+            out_kb = out.stat().st_size / 1024
+            print(f"   ✅ {csv_path.name}: {len(df):,} rows, {csv_kb:,.0f} KB -> {out_kb:,.0f} KB")
+            built += 1
+
+    print(f"\n✅ Built {built} columnar file(s) ({columnar_path(Path('x.csv')).suffix})")
+
+
+if __name__ == "__main__":
+    main()
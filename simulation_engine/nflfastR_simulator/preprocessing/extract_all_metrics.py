@@ -9,6 +9,8 @@ Runs all extraction scripts in sequence:
 5. Red Zone Stats
 6. Special Teams
 7. Situational Factors
+
+Then rebuilds the columnar copies the simulator loads (build_columnar.py).
 """
 
 import subprocess
@@ -25,6 +27,7 @@ EXTRACTION_SCRIPTS = [
     'extract_special_teams.py',
     'extract_situational_factors.py',
     'extract_drive_probs.py',  # Added drive probabilities extraction
+    'build_columnar.py',  # Typed binary copies for the simulator loaders (run last)
 ]
 
 
@@ -34,8 +34,7 @@ for i, game in enumerate(test_games, 1):
     home = TeamProfile(game['home'], 2024, 1, data_dir)
     
     # Simulate
-    sim = GameSimulator(away, home)
-    np.random.seed(42 + i)
+    sim = GameSimulator(away, home, seed=42 + i)
     
     home_scores = []
     away_scores = []
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold-start data loading, CSV text vs columnar copies.
+
+Each measurement runs in a fresh interpreter (like a new backtest worker)
+and builds TeamProfiles for a slate of games plus a fitted pressure
+calibrator. Reports wall time to load, resident memory of the parsed
+frames, and the process's peak RSS.
+
+Usage:
+    python scripts/benchmark_data_loading.py
+    python scripts/benchmark_data_loading.py --season 2024 --week 6 --repeats 5
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "nflfastR"
+TEAMS = ['KC', 'BUF', 'BAL', 'PHI', 'SF', 'DET', 'MIA', 'DAL',
+         'GB', 'CIN', 'LAR', 'HOU', 'NYJ', 'PIT', 'SEA', 'MIN']
+
+
+def run_worker(mode: str, season: int, week: int) -> dict:
+    """Load every input once in this process and report timings."""
+    t0 = time.perf_counter()
+    import simulator.data_store as data_store
+    from simulator.team_profile import TeamProfile
+    from simulator.pressure_calibration import PressureCalibrator
+    t_import = time.perf_counter() - t0
+
+    store = data_store.DataStore(columnar=(mode == "columnar"))
+    data_store._data_store = store
+
+    t0 = time.perf_counter()
+    for team in TEAMS:
+        TeamProfile(team, season, week, DATA_DIR)
+    PressureCalibrator().fit_from_file(DATA_DIR / "pressure_rates_weekly.csv", season, week)
+    t_load = time.perf_counter() - t0
+
+    frame_bytes = sum(int(df.memory_usage(deep=True).sum()) for _, df in store._frames.values())
+    # ru_maxrss is KB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_mb = rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+    return {
+        "mode": mode,
+        "import_s": t_import,
+        "load_s": t_load,
+        "frames_mb": frame_bytes / 1024 / 1024,
+        "peak_rss_mb": rss_mb,
+        "files": store.stats()["files"],
+    }
+
+
+def measure(mode: str, season: int, week: int) -> dict:
+    """Run one worker in a fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, __file__, "--worker", mode, "--season", str(season), "--week", str(week)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark simulator input loading')
+    parser.add_argument('--season', type=int, default=2024)
+    parser.add_argument('--week', type=int, default=6)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--worker', choices=['csv', 'columnar'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.season, args.week)))
+        return
+
+    print("="*80)
+    print(f"DATA LOADING BENCHMARK: {len(TEAMS)} profiles, {args.season} W{args.week}")
+    print("="*80)
+
+    # Warm-up run builds any missing/stale columnar copies
+    measure("columnar", args.season, args.week)
+
+    results = {}
+    for mode in ("csv", "columnar"):
+        runs = [measure(mode, args.season, args.week) for _ in range(args.repeats)]
+        best = min(runs, key=lambda r: r["load_s"])
+        best["peak_rss_mb"] = max(r["peak_rss_mb"] for r in runs)
+        results[mode] = best
+
+    print(f"\n{'mode':<10} {'load (s)':>10} {'frames (MB)':>12} {'peak RSS (MB)':>14} {'files':>6}")
+    for mode, r in results.items():
+        print(f"{mode:<10} {r['load_s']:>10.3f} {r['frames_mb']:>12.2f} {r['peak_rss_mb']:>14.1f} {r['files']:>6}")
+
+    csv, col = results["csv"], results["columnar"]
+    print(f"\nCold-start load: {csv['load_s'] / col['load_s']:.1f}x faster")
+    print(f"Parsed frames:   {csv['frames_mb'] / col['frames_mb']:.1f}x smaller")
+    print(f"Peak RSS:        {csv['peak_rss_mb'] - col['peak_rss_mb']:+.1f} MB saved")
+
+
+if __name__ == "__main__":
+    main()
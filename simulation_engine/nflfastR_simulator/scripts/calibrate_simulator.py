@@ -73,7 +73,7 @@ def simulate_many_games(n_games: int, seed: int = 42) -> Dict:
         away = TeamProfile(away_team, 2023, 10, data_dir)
         
         # Simulate
-        sim = GameSimulator(away, home)
+        sim = GameSimulator(away, home, seed=[seed, i])
         result = sim.simulate_game()
         
         # Collect stats
@@ -132,10 +132,13 @@ if __name__ == "__main__":
     # First, we need to re-run backtest with spread_mean and total_mean
     print("⚠️  Re-running backtest to get shape metrics...")
     import subprocess
-    subprocess.run([sys.executable, "backtest_ultra_fast.py"], check=True)
+    root = Path(__file__).parent.parent
+    results_csv = root / "artifacts" / "backtest_2024_w1-8.csv"
+    subprocess.run([sys.executable, str(root / "backtest_runner.py"), "--seasons", "2024", "--weeks", "1-8",
+                    "--output", str(results_csv)], cwd=str(root), check=True)
     
     # Now run gates on the new results
-    passed = run_ci_gates("artifacts/backtest_2024_w1-8.csv")
+    passed = run_ci_gates(str(results_csv))
     
     sys.exit(0 if passed else 1)
 
@@ -21,9 +21,9 @@ print(f"✅ Loaded {len(pff)} PFF team records")
 
 # Load 2024 games
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from backtest_ultra_fast import load_games_2024
+from backtest_runner import load_games
 
-games = load_games_2024()
+games = load_games([2024], range(1, 9))
 print(f"✅ Loaded {len(games)} games from 2024 weeks 1-8")
 
 # Prepare PFF data - use abbreviation for matching
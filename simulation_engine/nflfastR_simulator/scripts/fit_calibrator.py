@@ -105,10 +105,7 @@ def fit_spread_calibrator(method: str = 'isotonic'):
     # Validate calibration with reliability plot
     print(f"\n📊 Calibration Validation (Reliability):")
     z_scores = calculate_z_scores(sim_spreads, sim_sds, market_spreads_valid)
-    pred_probs = np.array([
-        calibrator.predict_proba(sim_spreads[i], sim_sds[i], market_spreads_valid[i])
-        for i in range(len(sim_spreads))
-    ])
+    pred_probs = calibrator.predict(sim_spreads, sim_sds, market_spreads_valid)
     
     # Bin predictions and compare to actual
     n_bins = 10
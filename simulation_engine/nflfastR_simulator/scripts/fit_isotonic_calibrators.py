@@ -12,6 +12,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scripts.improve_calibration import AdvancedProbabilityCalibrator
+from simulator.probability_calibration import save_compact_calibrators
 import json
 
 def load_backtest_data():
@@ -119,6 +120,10 @@ def fit_isotonic_calibrators():
         pickle.dump(calibrators, f)
     
     print(f"\n💾 Saved isotonic calibrators to: {artifacts_dir / 'isotonic_calibrators.pkl'}")
+
+    # Compact breakpoints for sklearn-free loading (simulator.probability_calibration.load_calibrators)
+    save_compact_calibrators(calibrators, artifacts_dir / "isotonic_calibrators.json")
+    print(f"💾 Saved compact calibrators to: {artifacts_dir / 'isotonic_calibrators.json'}")
     
     return calibrators
 
@@ -11,6 +11,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scripts.improve_calibration import AdvancedProbabilityCalibrator
+from simulator.probability_calibration import save_compact_calibrators
 import pickle
 
 def load_training_data():
@@ -22,7 +23,7 @@ def load_training_data():
         # Fall back to main backtest file and filter
         backtest_file = Path(__file__).parent.parent / "artifacts" / "backtest_all_games_conviction.csv"
         if not backtest_file.exists():
-            raise FileNotFoundError(f"Backtest file not found. Please run backtest_2023_2024.py first to generate backtest_2022_2024.csv")
+            raise FileNotFoundError(f"Backtest file not found. Please run `backtest_runner.py --seasons 2022 2023 2024` first to generate backtest_2022_2024.csv")
     
     df = pd.read_csv(backtest_file)
     completed = df[df['actual_home_score'].notna()].copy()
@@ -134,6 +135,8 @@ def fit_isotonic_on_training_only():
     with open(artifacts_dir / "isotonic_calibrators_2022_2024.pkl", 'wb') as f:
         pickle.dump(calibrators, f)
     
+    save_compact_calibrators(calibrators, artifacts_dir / "isotonic_calibrators.json")
+
     print(f"\n💾 Saved to: {artifacts_dir / 'isotonic_calibrators.pkl'}")
     print(f"💾 Backup saved to: {artifacts_dir / 'isotonic_calibrators_2022_2024.pkl'}")
     print(f"\n✅ Calibrators now trained on 2022-2024 ONLY (no 2025 leakage)")
@@ -11,12 +11,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import pandas as pd
 import numpy as np
 from simulator.game_simulator import GameSimulator
+from simulator.rng import trial_rngs
 from simulator.team_profile import TeamProfile
 from simulator.market_centering import center_scores_to_market
 from concurrent.futures import ProcessPoolExecutor
 import time
 from scipy.stats import norm
 import os
+import zlib
 
 # Define paths at module level for multiprocessing safety
 # This script is in: simulation_engine/nflfastR_simulator/scripts/
@@ -40,7 +42,7 @@ LINEAR_BETA = 0.571
 
 def simulate_one_game(args):
     """Simulate one game and return predictions."""
-    idx, row, n_sims = args
+    idx, row, n_sims, batch = args
     
     try:
         away = row['away_team']
@@ -67,36 +69,43 @@ def simulate_one_game(args):
             trace_path = None
             SimTrace = None
         
+        # One random stream per trial, spawned from the game's seed (crc32 is stable across runs,
+        # unlike hash() under PYTHONHASHSEED randomization)
+        game_seed = zlib.crc32(str(game_id).encode())
+        # (with batch: one stream for the traced trial, one for the vectorized rest)
+        rngs = trial_rngs(game_seed, 2 if batch else n_sims)
+        
         # Create trace for first simulation (if tracing is available)
         if SimTrace is not None and trace_path is not None:
-            trace = SimTrace(game_id=game_id, out_path=trace_path, seed=hash(f"{game_id}_0") % (2**32))
-            trace.enable = True  # Enable for first sim
+            # Only the first of the n_sims trials is recorded; a rerun replaces the file
+            trace = SimTrace(game_id=game_id, out_path=trace_path, seed=game_seed,
+                             sample_every=n_sims, rotate=True)
         else:
             trace = None
         
         sim = GameSimulator(home_profile, away_profile, 
                            game_id=game_id, season=season, week=week,
-                           trace=trace, seed=hash(f"{game_id}_0") % (2**32) if trace else None)
+                           trace=trace, seed=game_seed)
         
         # Run first simulation with trace
-        np.random.seed(hash(f"{game_id}_0") % (2**32))
-        result_0 = sim.simulate_game()
+        result_0 = sim.simulate_game(rng=rngs[0])
         home_scores = [result_0['home_score']]
         away_scores = [result_0['away_score']]
         
-        # Disable trace for remaining simulations (if tracing enabled)
-        if trace is not None:
-            trace.enable = False
-        
-        # Run remaining simulations (faster, no trace)
-        for sim_i in range(1, n_sims):
-            np.random.seed(hash(f"{game_id}_{sim_i}") % (2**32))
-            result = sim.simulate_game()
-            home_scores.append(result['home_score'])
-            away_scores.append(result['away_score'])
+        # Run remaining simulations (faster, not sampled by the trace)
+        if batch:
+            # Vectorized engine: same score distribution, not draw-for-draw equal to the loop
+            games = sim.batch_simulator(rng=rngs[1]).simulate_games(n_sims - 1)
+            home_scores.extend(games['home_score'])
+            away_scores.extend(games['away_score'])
+        else:
+            for sim_i in range(1, n_sims):
+                result = sim.simulate_game(rng=rngs[sim_i])
+                home_scores.append(result['home_score'])
+                away_scores.append(result['away_score'])
         
-        home_scores = np.asarray(home_scores)
-        away_scores = np.asarray(away_scores)
+        home_scores = np.asarray(home_scores, dtype=float)
+        away_scores = np.asarray(away_scores, dtype=float)
         
         # Store raw (pre-centered) stats for calibration
         spreads_raw = home_scores - away_scores
@@ -216,14 +225,11 @@ def simulate_one_game(args):
         use_calibration = 'linear'
         
         try:
-            import pickle
+            from simulator.probability_calibration import load_calibrators
             artifacts_dir = Path(__file__).parent.parent / "artifacts"
-            isotonic_file = artifacts_dir / "isotonic_calibrators.pkl"
+            isotonic_calibrators = load_calibrators(artifacts_dir / "isotonic_calibrators.pkl")
             
-            if isotonic_file.exists():
-                with open(isotonic_file, 'rb') as f:
-                    isotonic_calibrators = pickle.load(f)
-                
+            if isotonic_calibrators:
                 if 'spread' in isotonic_calibrators:
                     spread_cal = isotonic_calibrators['spread']
                     if spread_cal.is_fitted:
@@ -448,16 +454,19 @@ if __name__ == "__main__":
     import sys
     
     # Allow command-line argument to specify which week(s) to generate
-    # Usage: python3 generate_week9_10_predictions.py [week_number]
-    # If no argument, generates current week + next week
-    if len(sys.argv) > 1:
+    # Usage: python3 generate_week9_10_predictions.py [week_number] [--batch]
+    # If no week, generates current week + next week; --batch runs all but the
+    # traced first trial on the vectorized BatchGameSimulator
+    batch = '--batch' in sys.argv
+    argv = [a for a in sys.argv[1:] if a != '--batch']
+    if argv:
         try:
-            weeks_to_generate = [int(sys.argv[1])]
+            weeks_to_generate = [int(argv[0])]
             print("="*70)
             print(f"GENERATE WEEK {weeks_to_generate[0]} PREDICTIONS")
             print("="*70)
         except ValueError:
-            print(f"❌ Invalid week number: {sys.argv[1]}")
+            print(f"❌ Invalid week number: {argv[0]}")
             sys.exit(1)
     else:
         # Default: generate current week + next week (determined dynamically)
@@ -505,10 +514,10 @@ if __name__ == "__main__":
     print(f"\n✅ Loaded {len(games_df)} total games ({weeks_str})")
     
     print(f"\n🚀 Running {len(games_df)} games × {N_SIMS} sims = {len(games_df) * N_SIMS:,} total")
-    print(f"   Using 8 CPU cores\n")
+    print(f"   Using 8 CPU cores{' (batch engine)' if batch else ''}\n")
     
     games_list = games_df.to_dict('records')
-    args_list = [(idx, row, N_SIMS) for idx, row in enumerate(games_list)]
+    args_list = [(idx, row, N_SIMS, batch) for idx, row in enumerate(games_list)]
     
     start = time.time()
     
@@ -5,14 +5,15 @@ This script runs simulations for week 9 games (future games without results).
 """
 import sys
 from pathlib import Path
+import zlib
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pandas as pd
 import numpy as np
 from simulator.game_simulator import GameSimulator
+from simulator.rng import trial_rngs
 from simulator.team_profile import TeamProfile
 from simulator.market_centering import center_scores_to_market
-from backtest_ultra_fast import load_games_2025
 
 # Conviction tiers (same as backtest)
 LOW_EDGE = 0.0
@@ -31,8 +32,8 @@ def get_conviction_level(edge):
     else:
         return 'LOW'
 
-def simulate_week9_game(row):
-    """Simulate one week 9 game."""
+def simulate_week9_game(row, batch=False):
+    """Simulate one week 9 game (batch: all trials at once on BatchGameSimulator)."""
     try:
         away = row['away_team']
         home = row['home_team']
@@ -54,14 +55,18 @@ def simulate_week9_game(row):
         home_scores = []
         away_scores = []
         
-        for sim_i in range(N_SIMS):
-            np.random.seed(hash(f"{game_id}_{sim_i}") % (2**32))
-            result = sim.simulate_game()
-            home_scores.append(result['home_score'])
-            away_scores.append(result['away_score'])
+        game_seed = zlib.crc32(str(game_id).encode())
+        if batch:
+            games = sim.batch_simulator(rng=trial_rngs(game_seed, 1)[0]).simulate_games(N_SIMS)
+            home_scores, away_scores = games['home_score'], games['away_score']
+        else:
+            for rng in trial_rngs(game_seed, N_SIMS):
+                result = sim.simulate_game(rng=rng)
+                home_scores.append(result['home_score'])
+                away_scores.append(result['away_score'])
         
-        home_scores = np.asarray(home_scores)
-        away_scores = np.asarray(away_scores)
+        home_scores = np.asarray(home_scores, dtype=float)
+        away_scores = np.asarray(away_scores, dtype=float)
         
         # Store raw (pre-centered) scores and SDs for calibration
         spreads_raw = home_scores - away_scores
@@ -110,7 +115,6 @@ def simulate_week9_game(row):
         # Load calibrators if available
         try:
             import pickle
-            from pathlib import Path
             artifacts_dir = Path(__file__).parent.parent / "artifacts"
             
             spread_cal_file = artifacts_dir / "spread_calibrator_isotonic.pkl"
@@ -253,6 +257,8 @@ def simulate_week9_game(row):
         return None
 
 if __name__ == "__main__":
+    # Usage: python3 generate_week9_predictions.py [--batch]
+    batch = '--batch' in sys.argv
     print("="*80)
     print("GENERATE WEEK 9 PREDICTIONS")
     print("="*80)
@@ -321,7 +327,7 @@ if __name__ == "__main__":
     
     results = []
     for idx, row in week9_games.iterrows():
-        result = simulate_week9_game(row.to_dict())
+        result = simulate_week9_game(row.to_dict(), batch=batch)
         if result:
             results.append(result)
         print(f"   Completed: {result['away_team']} @ {result['home_team']}")
@@ -19,14 +19,14 @@ def run_backtest_2022_2024():
     print("STEP 1: Running backtest on 2022-2024 data")
     print("="*70)
     
-    script_path = Path(__file__).parent.parent / "backtest_2023_2024.py"
+    script_path = Path(__file__).parent.parent / "backtest_runner.py"
+    output_file = Path(__file__).parent.parent / "artifacts" / "backtest_2022_2024.csv"
     
     print(f"\n📊 Running: {script_path}")
-    print("   This will generate artifacts/backtest_2022_2024.csv")
-    print("   (Note: script name still says 2023_2024 but it loads 2022-2024)\n")
+    print(f"   This will generate {output_file.relative_to(script_path.parent)}\n")
     
     result = subprocess.run(
-        [sys.executable, str(script_path)],
+        [sys.executable, str(script_path), "--seasons", "2022", "2023", "2024", "--output", str(output_file)],
         cwd=str(script_path.parent),
         capture_output=False
     )
@@ -36,7 +36,6 @@ def run_backtest_2022_2024():
         return False
     
     # Check if file was created
-    output_file = Path(__file__).parent.parent / "artifacts" / "backtest_2022_2024.csv"
     if not output_file.exists():
         print("❌ Backtest output file not found!")
         return False
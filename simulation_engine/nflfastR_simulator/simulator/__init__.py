@@ -4,6 +4,7 @@ from .game_state import GameState
 from .team_profile import TeamProfile
 from .play_simulator import PlaySimulator
 from .game_simulator import GameSimulator
+from .batch_simulator import BatchGameSimulator
 
-__all__ = ['GameState', 'TeamProfile', 'PlaySimulator', 'GameSimulator']
+__all__ = ['GameState', 'TeamProfile', 'PlaySimulator', 'GameSimulator', 'BatchGameSimulator']
 
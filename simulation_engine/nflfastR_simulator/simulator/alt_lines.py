@@ -0,0 +1,207 @@
+"""
+Alt-line and teaser pricing from simulated (market-centered) distributions.
+
+Callers priced one line at a time with np.mean(spreads_c > line), one
+pass over every trial per line. LinePricer bins each game's outcomes
+once into an integer-point cumulative histogram; after that any
+number of lines, for every game on the slate, is a table lookup:
+
+    home_c, away_c = center_scores_to_market(home, away, spread_line, total_line)
+    spreads = LinePricer(home_c - away_c)
+    cover, push, away_cover = spreads.probs([-3.5, -3.0, -2.5])
+
+    spread_ladder(spreads_c, spread_line)        # every half-point alt spread
+    total_ladder(totals_c, total_line)
+    teaser_legs(spreads_c, spread_line)          # 6 / 6.5 / 7 point legs, both sides
+    key_number_mass(spreads_c)                   # P(margin = +-3, +-7, ...)
+
+Values may be (n_sims,) for one game or (n_sims, n_games) for a slate.
+Outcomes are rounded to whole points before binning, since real margins
+and totals are integers; this is what gives integer lines their push
+mass and leaves half-point lines priced as before.
+
+Lines follow the simulator's convention: spread_line is home - away
+(positive = home favored) and home covers when spread > spread_line.
+"""
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+TEASER_POINTS = (6.0, 6.5, 7.0)
+
+# Most common NFL final margins
+KEY_NUMBERS = (3, 7, 10, 14, 6, 4, 1)
+
+
+class LinePricer:
+    """Cumulative integer histogram of per-trial outcomes for one or more games."""
+
+    def __init__(self, values):
+        """
+        Args:
+            values: Simulated outcomes (spread or total), (n_sims,) or (n_sims, n_games)
+        """
+        values = np.asarray(values, dtype=float)
+        self.single = values.ndim == 1
+        outcomes = np.rint(values.reshape(len(values), -1)).astype(np.int64)
+        self.n_sims, self.n_games = outcomes.shape
+
+        # One bincount over the whole slate: game g's outcomes land in row g
+        self.lo = int(outcomes.min())
+        self.width = int(outcomes.max()) - self.lo + 1
+        offsets = np.arange(self.n_games) * self.width
+        counts = np.bincount((outcomes - self.lo + offsets).ravel(),
+                             minlength=self.n_games * self.width)
+        self.pmf = counts.reshape(self.n_games, self.width) / self.n_sims
+        # cdf[:, k] = P(outcome <= lo + k - 1); cdf[:, 0] = 0
+        self.cdf = np.concatenate([np.zeros((self.n_games, 1)), np.cumsum(self.pmf, axis=1)], axis=1)
+
+    def _cdf_at(self, k: np.ndarray) -> np.ndarray:
+        """P(outcome <= k) for integer k, per game (k shaped (n_games, n_lines))."""
+        idx = np.clip(k - self.lo + 1, 0, self.width)
+        return np.take_along_axis(self.cdf, idx, axis=1)
+
+    def probs(self, lines):
+        """
+        (P(outcome > line), P(push), P(outcome < line)).
+
+        Args:
+            lines: Scalar, (n_lines,) shared by every game, or (n_games, n_lines)
+
+        Returns:
+            Floats for a scalar line on one game, else arrays shaped like the
+            broadcast (n_games, n_lines) (the game axis dropped for one game)
+        """
+        lines = np.asarray(lines, dtype=float)
+        grid = np.atleast_1d(lines)
+        if grid.ndim == 1:
+            grid = np.broadcast_to(grid, (self.n_games, grid.size))
+        floor = np.floor(grid).astype(np.int64)
+        is_int = grid == floor
+
+        at_or_below = self._cdf_at(floor)
+        push = np.where(is_int, at_or_below - self._cdf_at(floor - 1), 0.0)
+        above = 1.0 - at_or_below
+        below = at_or_below - push
+
+        if self.single:
+            above, push, below = above[0], push[0], below[0]
+            if lines.ndim == 0:
+                return float(above[0]), float(push[0]), float(below[0])
+        return above, push, below
+
+    def mass(self, values) -> np.ndarray:
+        """P(outcome == v) for integer values, (n_games, len(values)) (game axis dropped for one game)."""
+        values = np.atleast_1d(np.asarray(values, dtype=np.int64))
+        k = np.broadcast_to(values, (self.n_games, len(values)))
+        out = self._cdf_at(k) - self._cdf_at(k - 1)
+        return out[0] if self.single else out
+
+
+def half_point_ladder(center, half_width: float = 10.0, step: float = 0.5) -> np.ndarray:
+    """Lines from center - half_width to center + half_width, snapped to the half-point grid."""
+    center = np.round(np.asarray(center, dtype=float) * 2) / 2
+    offsets = np.arange(-half_width, half_width + step / 2, step)
+    return center[..., None] + offsets if center.ndim else center + offsets
+
+
+def _ladder_frame(pricer: LinePricer, lines: np.ndarray, names: Sequence[str]) -> pd.DataFrame:
+    above, push, below = pricer.probs(lines)
+    above, push, below = np.atleast_2d(above), np.atleast_2d(push), np.atleast_2d(below)
+    grid = np.broadcast_to(np.atleast_2d(lines), above.shape)
+    return pd.DataFrame({
+        'game': np.repeat(np.arange(above.shape[0]), above.shape[1]),
+        'line': grid.ravel(),
+        names[0]: above.ravel(),
+        'p_push': push.ravel(),
+        names[1]: below.ravel(),
+    })
+
+
+def spread_ladder(spreads, spread_line, half_width: float = 10.0, step: float = 0.5) -> pd.DataFrame:
+    """
+    Cover/push probabilities for every alt spread around the posted line.
+
+    Args:
+        spreads: Simulated home - away, (n_sims,) or (n_sims, n_games)
+        spread_line: Posted line (scalar, or one per game)
+        half_width, step: Ladder range and spacing in points
+
+    Returns:
+        DataFrame: game, line, p_home_cover, p_push, p_away_cover
+    """
+    return _ladder_frame(LinePricer(spreads), half_point_ladder(spread_line, half_width, step),
+                         ('p_home_cover', 'p_away_cover'))
+
+
+def total_ladder(totals, total_line, half_width: float = 10.0, step: float = 0.5) -> pd.DataFrame:
+    """Over/push/under probabilities for every alt total (see spread_ladder)."""
+    return _ladder_frame(LinePricer(totals), half_point_ladder(total_line, half_width, step),
+                         ('p_over', 'p_under'))
+
+
+def teaser_legs(spreads, spread_line, points: Sequence[float] = TEASER_POINTS) -> pd.DataFrame:
+    """
+    Win/push/loss probability of each teaser leg on both sides.
+
+    Teasing home by t moves its line to spread_line - t (home must win by
+    more than spread_line - t); teasing away moves it to spread_line + t.
+
+    Returns:
+        DataFrame: game, side, points, line, p_win, p_push, p_loss
+    """
+    pricer = LinePricer(spreads)
+    line = np.broadcast_to(np.asarray(spread_line, dtype=float), (pricer.n_games,))[:, None]
+    points = np.asarray(points, dtype=float)
+    home_lines, away_lines = line - points, line + points
+
+    frames = []
+    for side, lines in (('home', home_lines), ('away', away_lines)):
+        above, push, below = pricer.probs(lines)
+        above, push, below = np.atleast_2d(above), np.atleast_2d(push), np.atleast_2d(below)
+        win, loss = (above, below) if side == 'home' else (below, above)
+        frames.append(pd.DataFrame({
+            'game': np.repeat(np.arange(pricer.n_games), len(points)),
+            'side': side,
+            'points': np.tile(points, pricer.n_games),
+            'line': lines.ravel(),
+            'p_win': win.ravel(),
+            'p_push': push.ravel(),
+            'p_loss': loss.ravel(),
+        }))
+    return pd.concat(frames, ignore_index=True).sort_values(['game', 'side', 'points'], ignore_index=True)
+
+
+def key_number_mass(spreads, keys: Sequence[int] = KEY_NUMBERS) -> pd.DataFrame:
+    """
+    Probability the final margin lands on each key number, either team winning.
+
+    Returns:
+        DataFrame with one row per game and columns key_<k> = P(|margin| == k)
+    """
+    pricer = LinePricer(spreads)
+    keys = np.asarray(keys, dtype=np.int64)
+    mass = np.atleast_2d(pricer.mass(keys)) + np.atleast_2d(pricer.mass(-keys))
+    return pd.DataFrame(mass, columns=[f'key_{k}' for k in keys])
+
+
+if __name__ == "__main__":
+    import time
+
+    # Full ladder for a 16-game slate of 10k centered trials
+    rng = np.random.default_rng(0)
+    n_sims, n_games = 10000, 16
+    lines = rng.normal(0, 5, n_games).round() + 0.5
+    spreads = rng.normal(lines, 13.5, (n_sims, n_games))
+    totals = rng.normal(45, 13.0, (n_sims, n_games))
+
+    t0 = time.perf_counter()
+    spread_table = spread_ladder(spreads, lines)
+    total_table = total_ladder(totals, 45.5)
+    teasers = teaser_legs(spreads, lines)
+    keys = key_number_mass(spreads)
+    elapsed = time.perf_counter() - t0
+    print(f"Priced {len(spread_table) + len(total_table) + len(teasers)} lines "
+          f"for {n_games} games in {elapsed * 1000:.1f} ms")
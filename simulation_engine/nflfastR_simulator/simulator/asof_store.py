@@ -0,0 +1,149 @@
+"""
+AsOfTable: Leakage-free "state as of week W-1" lookups on weekly team data.
+
+TeamProfile's weekly loaders used to slice every team's rows for every
+backtest week and then average the weeks before W. An AsOfTable sorts
+each (team, season) group by week once and keeps cumulative sums and
+counts per value column. An as-of query is then a lookup of the prefix
+length plus one subtraction:
+
+    table = get_data_store().asof(anya_df, 'posteam')
+    table.prior_mean('KC', 2024, 6, ['off_anya', 'def_anya_allowed'])   # weeks 1-5
+    table.prior_mean('KC', 2024, 6, ['off_anya'], last_n=3)             # weeks 3-5
+    table.prior_ema('KC', 2024, 6, ['off_anya'], alpha=0.45)
+    table.latest('KC', 2024, 6)                                          # week 5 row
+
+Leakage guarantee: every accessor takes the target week W and only reads
+the prefix of rows with week < W (searchsorted 'left' on the sorted
+weeks). Rows at or after W never enter a sum, count, EMA or slice, so
+changing them cannot change any result (see test_asof_store.py).
+
+Means skip NaN values like pandas .mean(); a column with no prior values
+gives NaN. Queries with no prior rows return None.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class _Group:
+    """One (team, season): rows sorted by week plus lazily built prefix sums."""
+
+    __slots__ = ('frame', 'weeks', 'sums', 'emas')
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.weeks = frame['week'].to_numpy()
+        # (column, clip) -> (prefix sums, prefix non-NaN counts), length n + 1
+        self.sums: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = {}
+        # (column, alpha) -> EMA after each row
+        self.emas: Dict[Tuple, np.ndarray] = {}
+
+    def prefix(self, week: int) -> int:
+        """Number of rows strictly before week."""
+        return int(np.searchsorted(self.weeks, week, side='left'))
+
+    def cumulative(self, col: str, clip: Optional[Tuple[float, float]]):
+        key = (col, clip)
+        if key not in self.sums:
+            values = self.frame[col].to_numpy(dtype=float)
+            if clip is not None:
+                values = np.clip(values, clip[0], clip[1])
+            valid = ~np.isnan(values)
+            self.sums[key] = (np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0)))),
+                              np.concatenate(([0], np.cumsum(valid))))
+        return self.sums[key]
+
+    def ema(self, col: str, alpha: float) -> np.ndarray:
+        key = (col, alpha)
+        if key not in self.emas:
+            values = self.frame[col].to_numpy(dtype=float)
+            out = np.empty(len(values))
+            state = np.nan
+            for i, value in enumerate(values):
+                if not np.isnan(value):
+                    state = value if np.isnan(state) else alpha * value + (1 - alpha) * state
+                out[i] = state
+            self.emas[key] = out
+        return self.emas[key]
+
+
+class AsOfTable:
+    """Per-(team, season) prefix aggregates over a weekly frame."""
+
+    def __init__(self, df: pd.DataFrame, team_col: str):
+        """
+        Args:
+            df: Weekly frame with team_col, 'season' and 'week' columns
+            team_col: Team key column ('posteam' or 'team')
+        """
+        self.team_col = team_col
+        self._groups: Dict[Tuple, _Group] = {}
+        if len(df):
+            ordered = df.sort_values([team_col, 'season', 'week'], kind='stable')
+            for key, frame in ordered.groupby([team_col, 'season'], sort=False, observed=True):
+                self._groups[key] = _Group(frame)
+
+    def _group(self, team: str, season: int) -> Optional[_Group]:
+        return self._groups.get((team, season))
+
+    def prior_rows(self, team: str, season: int, week: int) -> pd.DataFrame:
+        """Rows of (team, season) with week < week, in week order."""
+        group = self._group(team, season)
+        if group is None:
+            return pd.DataFrame()
+        return group.frame.iloc[:group.prefix(week)]
+
+    def latest(self, team: str, season: int, week: int) -> Optional[pd.Series]:
+        """Most recent row before week (the team's state as of week - 1)."""
+        group = self._group(team, season)
+        n = group.prefix(week) if group is not None else 0
+        return group.frame.iloc[n - 1] if n else None
+
+    def prior_mean(self, team: str, season: int, week: int, cols: Sequence[str],
+                   last_n: Optional[int] = None,
+                   clip: Optional[Dict[str, Tuple[float, float]]] = None) -> Optional[Dict[str, float]]:
+        """
+        Mean of cols over the rows before week.
+
+        Args:
+            team, season, week: Target team and week (only weeks < week are used)
+            cols: Value columns
+            last_n: Only the last N prior rows (rolling window)
+            clip: Optional {column: (lo, hi)} to clip values before averaging
+
+        Returns:
+            {column: mean}, or None if there are no prior rows
+        """
+        group = self._group(team, season)
+        end = group.prefix(week) if group is not None else 0
+        if end == 0:
+            return None
+        start = max(0, end - last_n) if last_n else 0
+
+        out = {}
+        for col in cols:
+            sums, counts = group.cumulative(col, (clip or {}).get(col))
+            count = counts[end] - counts[start]
+            out[col] = float((sums[end] - sums[start]) / count) if count else float('nan')
+        return out
+
+    def prior_ema(self, team: str, season: int, week: int, cols: Sequence[str],
+                  alpha: float) -> Optional[Dict[str, float]]:
+        """
+        Exponential moving average of cols through the last row before week.
+
+        EMA_t = alpha * x_t + (1 - alpha) * EMA_{t-1}, seeded with the first
+        non-NaN value.
+        """
+        group = self._group(team, season)
+        end = group.prefix(week) if group is not None else 0
+        if end == 0:
+            return None
+        return {col: float(group.ema(col, alpha)[end - 1]) for col in cols}
+
+    def teams(self) -> List[Tuple]:
+        """(team, season) keys in the table."""
+        return list(self._groups)
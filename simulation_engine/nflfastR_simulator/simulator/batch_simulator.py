@@ -0,0 +1,433 @@
+"""
+BatchGameSimulator: Vectorized Monte Carlo engine for one matchup.
+
+Runs N independent games in lockstep. Every game state field is a NumPy
+array of length N, and each step advances every unfinished game by one
+iteration of GameSimulator._simulate_drive's play loop. The pass/run,
+pressure, completion, turnover, FG and punt logic mirrors PlaySimulator
+and GameSimulator exactly; only the random number consumption differs,
+so results match the scalar path in distribution (see
+test_batch_simulator.py) rather than draw-for-draw.
+
+Per-matchup constants (QB splits, PFF adjustments, injury multipliers,
+pass-rate tables) are resolved once at construction and stored per
+possession (0 = home offense, 1 = away offense).
+
+Usage:
+    batch = BatchGameSimulator(home_profile, away_profile, seed=42)
+    mc = batch.simulate_monte_carlo(n_sims=10000)  # same keys as GameSimulator
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+try:
+    from .game_state import TIME_BUCKETS
+    from .team_profile import TeamProfile
+    from .fourth_down_model import get_fourth_down_decisions, DECISION_GO, DECISION_FG
+    from .matchup import MatchupParams
+    from .score_histogram import ScoreHistogram
+except ImportError:
+    from game_state import TIME_BUCKETS
+    from team_profile import TeamProfile
+    from fourth_down_model import get_fourth_down_decisions, DECISION_GO, DECISION_FG
+    from matchup import MatchupParams
+    from score_histogram import ScoreHistogram
+
+
+HOME, AWAY = 0, 1
+
+# Bucket edges matching GameState.distance_bucket / score_diff_bucket / time_bucket
+_DISTANCE_EDGES = np.array([3, 7])
+_SCORE_DIFF_EDGES = np.array([-14, -7, -1, 0, 6, 13])
+_TIME_EDGES = np.array([120, 900, 1800, 2700])
+
+
+def distance_bucket_index(ydstogo: np.ndarray) -> np.ndarray:
+    """Index into DISTANCE_BUCKETS for each yards-to-go value."""
+    return np.searchsorted(_DISTANCE_EDGES, ydstogo, side='left')
+
+
+def score_diff_bucket_index(score_diff: np.ndarray) -> np.ndarray:
+    """Index into SCORE_DIFF_BUCKETS for each possession-relative score differential."""
+    return np.searchsorted(_SCORE_DIFF_EDGES, score_diff, side='left')
+
+
+def time_bucket_index(game_seconds_remaining: np.ndarray) -> np.ndarray:
+    """Index into TIME_BUCKETS for each game-seconds-remaining value."""
+    return len(TIME_BUCKETS) - 1 - np.searchsorted(_TIME_EDGES, game_seconds_remaining, side='right')
+
+
+def _trunc(x: np.ndarray) -> np.ndarray:
+    """int() semantics (truncate toward zero) for float arrays."""
+    return np.trunc(x).astype(np.int64)
+
+
+class BatchGameSimulator:
+    """Simulates many games of one matchup at once using NumPy arrays."""
+
+    def __init__(self, home_team: TeamProfile, away_team: TeamProfile,
+                 pressure_calibrator=None, seed: Optional[int] = None,
+                 rng: Optional[np.random.Generator] = None):
+        """
+        Initialize batch simulator.
+
+        Args:
+            home_team: Home team profile
+            away_team: Away team profile
+            pressure_calibrator: Optional PressureCalibrator for team-specific pressure rates
+            seed: Optional random seed (ignored if rng is given)
+            rng: Optional numpy Generator to draw from
+        """
+        self.home_team = home_team
+        self.away_team = away_team
+        self.pressure_calibrator = pressure_calibrator
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+
+        self._build_params()
+
+    def _build_params(self):
+        """Precompute per-possession play model constants."""
+        teams = (self.home_team, self.away_team)
+        pairs = ((self.home_team, self.away_team), (self.away_team, self.home_team))
+
+        # Validates PFF grades and folds the per-matchup constants
+        matchups = [MatchupParams(off, de, self.pressure_calibrator) for off, de in pairs]
+
+        self.pace = np.array([t.pace for t in teams], dtype=float)
+        self.pass_rates = np.stack([t.pass_rate_table for t in teams])
+        self.early_down_bonus = np.array([max(0, (t.early_down_success_rate - 0.48) * 0.3) for t in teams])
+        self.turnover_factor = np.array([t.turnover_regression_factor for t in teams])
+        self.fg_adjustment = np.array([(t.field_goal_make_pct - 0.85) * 0.3 for t in teams])
+
+        # Pressure: matchup base (calibrated) or final rate (legacy)
+        self.pressure_base = np.array([m.pressure_base for m in matchups])
+
+        # Pass model, indexed [possession, is_pressure]
+        self.completion = np.array([m.completion for m in matchups])
+        self.yards_per_att = np.array([m.yards_per_att for m in matchups])
+        self.explosive_rate = np.array([m.explosive_rate for m in matchups])
+        self.int_mult = np.array([m.int_mult for m in matchups])
+        self.completion_adj = np.array([m.completion_adj for m in matchups])
+        self.outdoor = np.array([m.outdoor for m in matchups], dtype=bool)
+        self.rest_adj = np.array([m.rest_adj for m in matchups])
+        self.ypa_advantage = np.array([m.ypa_advantage for m in matchups], dtype=float)
+        self.run_avg = np.array([m.run_avg for m in matchups])
+
+    def simulate_games(self, n_games: int) -> Dict[str, np.ndarray]:
+        """
+        Simulate n_games full games.
+
+        Returns:
+            Dict with 'home_score' and 'away_score' integer arrays
+        """
+        rng = self.rng
+        n = int(n_games)
+
+        quarter = np.ones(n, dtype=np.int64)
+        time_rem = np.full(n, 900, dtype=np.int64)
+        poss = (rng.random(n) >= 0.5).astype(np.int64)  # coin toss: home if < 0.5
+        down = np.ones(n, dtype=np.int64)
+        togo = np.full(n, 10, dtype=np.int64)
+        yardline = np.full(n, 25, dtype=np.int64)
+        score = np.zeros((n, 2), dtype=np.int64)
+        last_yards = np.zeros(n, dtype=np.int64)
+
+        # Per-drive-call state (one _simulate_drive invocation)
+        drive_team = poss.copy()
+        plays_run = np.zeros(n, dtype=np.int64)
+        tpp = np.zeros(n, dtype=np.int64)
+        new_drive = np.ones(n, dtype=bool)
+
+        active = np.ones(n, dtype=bool)
+
+        while active.any():
+            g = np.flatnonzero(active)
+
+            # Start of a _simulate_drive call: pace-based clock, hurry-up under 2:00
+            start = g[new_drive[g]]
+            if start.size:
+                gsr = (4 - quarter[start]) * 900 + time_rem[start]
+                per_play = np.clip(40.0 / (self.pace[poss[start]] / 6.0), 25.0, 50.0)
+                per_play[gsr < 120] = 25.0
+                tpp[start] = _trunc(per_play)
+                drive_team[start] = poss[start]
+                plays_run[start] = 0
+                new_drive[start] = False
+
+            plays_run[g] += 1
+            o = poss[g]
+            diff = score[g, o] - score[g, 1 - o]
+            gsr = (4 - quarter[g]) * 900 + time_rem[g]
+
+            # 4th down: FG / punt end the drive without using clock
+            kick = np.zeros(g.size, dtype=bool)
+            fourth = down[g] == 4
+            if fourth.any():
+                f = np.flatnonzero(fourth)
+                decision = get_fourth_down_decisions(
+                    yardline[g[f]], togo[g[f]], gsr[f], diff[f], quarter[g[f]]
+                )
+                fg = f[decision == DECISION_FG]
+                if fg.size:
+                    gi = g[fg]
+                    distance = 117 - yardline[gi]
+                    base = np.select([distance < 30, distance < 40, distance < 50], [0.90, 0.85, 0.70], 0.50)
+                    make = np.clip(base + self.fg_adjustment[o[fg]], 0.05, 0.98)
+                    made = rng.random(fg.size) < make
+                    score[gi[made], o[fg][made]] += 3
+                kicked = f[decision != DECISION_GO]
+                if kicked.size:
+                    # Punt net yards don't matter: start_new_drive() resets to the 25
+                    gi = g[kicked]
+                    poss[gi] = 1 - poss[gi]
+                    yardline[gi] = 25
+                    down[gi] = 1
+                    togo[gi] = 10
+                    new_drive[gi] = True
+                    kick[kicked] = True
+
+            # Regular snap for everyone else
+            s = np.flatnonzero(~kick)
+            if s.size == 0:
+                continue
+            gi = g[s]
+            o = o[s]
+            diff = diff[s]
+            gsr = gsr[s]
+            yl = yardline[gi]
+            dn = down[gi]
+            tg = togo[gi]
+            m = gi.size
+
+            pass_prob = self.pass_rates[
+                o, dn - 1,
+                distance_bucket_index(tg),
+                score_diff_bucket_index(diff),
+                time_bucket_index(gsr)
+            ]
+            is_pass = rng.random(m) < pass_prob
+
+            yards = np.zeros(m, dtype=np.int64)
+            td = np.zeros(m, dtype=bool)
+            turnover = np.zeros(m, dtype=bool)
+            clock_stops = np.zeros(m, dtype=bool)
+
+            p = np.flatnonzero(is_pass)
+            if p.size:
+                py, ptd, pto, pstop = self._pass_plays(
+                    o[p], dn[p], tg[p], yl[p], -diff[p], quarter[gi[p]], time_rem[gi[p]],
+                    gsr[p], diff[p], last_yards[gi[p]]
+                )
+                yards[p], td[p], turnover[p], clock_stops[p] = py, ptd, pto, pstop
+
+            r = np.flatnonzero(~is_pass)
+            if r.size:
+                ry = _trunc(rng.normal(self.run_avg[o[r]], 3.5))
+                ry = np.minimum(np.clip(ry, -5, 80), 100 - yl[r])
+                yards[r] = ry
+                td[r] = yl[r] + ry >= 100
+                turnover[r] = self._lost_fumble(0.50 * 0.010 * self.turnover_factor[o[r]])
+            clock_stops |= turnover
+
+            # GameState.update_from_play
+            new_yl = np.clip(yl + yards, 0, 100)
+            last_yards[gi] = yards
+            first = yards >= tg
+            on_downs = ~td & ~turnover & ~first & (dn + 1 > 4)
+            change = td | turnover | on_downs
+
+            score[gi[td], o[td]] += 7
+            keep = ~change
+            down[gi[keep & first]] = 1
+            togo[gi[keep & first]] = np.minimum(10, 100 - new_yl[keep & first])
+            down[gi[keep & ~first]] = dn[keep & ~first] + 1
+            togo[gi[keep & ~first]] = tg[keep & ~first] - yards[keep & ~first]
+            yardline[gi] = np.where(change, 25, new_yl)
+            poss[gi[change]] = 1 - o[change]
+            down[gi[change]] = 1
+            togo[gi[change]] = 10
+
+            # Clock
+            run_clock = ~clock_stops
+            time_rem[gi[run_clock]] = np.maximum(0, time_rem[gi[run_clock]] - tpp[gi[run_clock]])
+
+            # Quarter expiry: same team keeps going, otherwise the drive call ends
+            expired = (time_rem[gi] == 0) & (quarter[gi] < 4)
+            if expired.any():
+                e = gi[expired]
+                quarter[e] += 1
+                time_rem[e] = 900
+                half = e[quarter[e] == 3]
+                poss[half] = 1 - poss[half]
+                yardline[half] = 100 - yardline[half]
+                new_drive[e[poss[e] != drive_team[e]]] = True
+
+            # Early-down success bonus (skipped when the quarter just ended)
+            live = ~expired & ~turnover & (dn <= 2)
+            yards_needed = np.where(dn == 1, 0.4, 0.5) * tg
+            cand = live & (yards >= yards_needed) & (down[gi] > 1) & (yards >= tg * 0.8)
+            if cand.any():
+                c = np.flatnonzero(cand)
+                hit = c[rng.random(c.size) < self.early_down_bonus[o[c]]]
+                down[gi[hit]] = 1
+                togo[gi[hit]] = np.minimum(10, 100 - yardline[gi[hit]])
+
+            # Drive ends on TD, turnover, turnover on downs, or the 30-play safety cap
+            new_drive[gi[~expired & change]] = True
+            new_drive[gi[plays_run[gi] >= 30]] = True
+
+            over = (quarter[gi] == 4) & (time_rem[gi] == 0)
+            active[gi[over]] = False
+
+        return {
+            'home_score': score[:, HOME],
+            'away_score': score[:, AWAY],
+        }
+
+    def _lost_fumble(self, p_fumble: np.ndarray) -> np.ndarray:
+        """Fumble at rate p_fumble, lost on a 50% recovery."""
+        n = len(p_fumble)
+        return (self.rng.random(n) < p_fumble) & (self.rng.random(n) < 0.50)
+
+    def _pass_plays(self, o, dn, tg, yl, trailing_by, quarter, time_rem, gsr, diff, last_yards):
+        """
+        Vectorized PlaySimulator.simulate_pass_play.
+
+        Returns:
+            (yards, td, turnover, clock_stops) arrays
+        """
+        rng = self.rng
+        m = o.size
+
+        # Pressure
+        if self.pressure_calibrator:
+            sec_left = time_rem % 900
+            sec_left[(sec_left == 0) & (quarter < 4)] = 900
+            pressure_rate = self.pressure_calibrator.pressure_probs(
+                self.pressure_base[o],
+                down=dn, ydstogo=tg, quarter=quarter,
+                sec_left_in_quarter=sec_left,
+                offense_trailing_by=trailing_by,
+                half=np.where(quarter <= 2, 1, 2),
+                play_action=False, shotgun=True
+            )
+        else:
+            pressure_rate = self.pressure_base[o]
+        pressured = rng.random(m) < pressure_rate
+        split = pressured.astype(np.int64)
+
+        # Completion % and YPA after ANY/A, boost, injuries and drive persistence
+        comp = self.completion[o, split]
+        persist = last_yards > 4
+        comp = np.where(persist, np.minimum(0.85, comp * 1.15), comp)
+        ypa = self.yards_per_att[o, split]
+
+        yards = np.zeros(m, dtype=np.int64)
+        td = np.zeros(m, dtype=bool)
+        turnover = np.zeros(m, dtype=bool)
+        stops = np.zeros(m, dtype=bool)
+
+        # Pressure outlets: scramble 18%, throwaway 10%, sack 28%
+        outlet = rng.random(m)
+        scramble = pressured & (outlet < 0.18)
+        throwaway = pressured & (outlet >= 0.18) & (outlet < 0.28)
+        sack = pressured & (outlet >= 0.28) & (outlet < 0.56)
+
+        if scramble.any():
+            sy = np.clip(_trunc(rng.normal(5, 4, scramble.sum())), -2, 15)
+            yards[scramble] = sy
+            td[scramble] = yl[scramble] + sy >= 100
+        stops[throwaway] = True
+        if sack.any():
+            yards[sack] = rng.integers(-10, -1, sack.sum())
+            turnover[sack] = self._lost_fumble(0.50 * 0.006 * self.turnover_factor[o[sack]])
+            stops[sack] = True
+
+        # Attempted passes: interception first
+        att = ~(scramble | throwaway | sack)
+        a = np.flatnonzero(att)
+        if a.size == 0:
+            return yards, td, turnover, stops
+
+        air_yards = np.where(rng.random(a.size) < 0.20, 15, 8)
+        p_int = np.where(pressured[a], 0.035, 0.015) + 0.002 * np.maximum(0, air_yards - 12)
+        desperate = (gsr[a] < 120) & (diff[a] < -8)
+        p_int = np.where(desperate, np.minimum(p_int, 0.06), p_int)
+        p_int = p_int * self.int_mult[o[a]]
+        intercepted = rng.random(a.size) < p_int
+        turnover[a[intercepted]] = True
+        stops[a[intercepted]] = True
+
+        a = a[~intercepted]
+        if a.size == 0:
+            return yards, td, turnover, stops
+        oa = o[a]
+
+        completion_pct = np.clip(comp[a] + self.completion_adj[oa], 0.30, 0.90)
+        completion_pct = np.where(self.outdoor[oa], np.clip(completion_pct - 0.02, 0.30, 0.90), completion_pct)
+        completion_pct = np.clip(completion_pct + self.rest_adj[oa], 0.30, 0.90)
+
+        complete = rng.random(a.size) < completion_pct
+        stops[a[~complete]] = True
+
+        c = a[complete]
+        if c.size == 0:
+            return yards, td, turnover, stops
+        oc = o[c]
+        clean = ~pressured[c]
+
+        explosive = clean & (rng.random(c.size) < self.explosive_rate[oc, split[c]])
+        big = np.clip(_trunc(rng.lognormal(3.2, 0.9, c.size)), 15, 80)
+
+        comp_c = comp[c]
+        base_ypa = np.where(comp_c > 0, ypa[c] / np.where(comp_c > 0, comp_c, 1.0), 7.0)
+        avg_yards = base_ypa + self.ypa_advantage[oc] * 1.2
+        avg_yards = np.where(self.outdoor[oc], avg_yards * 0.93, avg_yards)
+        avg_yards = np.maximum(3.0, avg_yards)
+        normal = np.clip(_trunc(rng.gamma(2, avg_yards / 2)), 0, 80)
+
+        cy = np.minimum(np.where(explosive, big, normal), 100 - yl[c])
+        yards[c] = cy
+        td[c] = yl[c] + cy >= 100
+        turnover[c] = self._lost_fumble(0.50 * 0.002 * self.turnover_factor[oc])
+        stops[c] |= turnover[c]
+
+        return yards, td, turnover, stops
+
+    def simulate_monte_carlo(self, n_sims: int = 10000) -> Dict:
+        """
+        Run Monte Carlo simulation in one batch.
+
+        Args:
+            n_sims: Number of simulations to run
+
+        Returns:
+            Dict with the same keys as GameSimulator.simulate_monte_carlo()
+        """
+        games = self.simulate_games(n_sims)
+        home_scores = games['home_score']
+        away_scores = games['away_score']
+        spreads = away_scores - home_scores
+        totals = home_scores + away_scores
+
+        results = [
+            {'home_score': int(h), 'away_score': int(a), 'spread': int(s), 'total': int(t)}
+            for h, a, s, t in zip(home_scores, away_scores, spreads, totals)
+        ]
+
+        return {
+            'results': results,
+            'home_score_avg': np.mean(home_scores),
+            'home_score_median': np.median(home_scores),
+            'away_score_avg': np.mean(away_scores),
+            'away_score_median': np.median(away_scores),
+            'spread_avg': np.mean(spreads),
+            'spread_median': np.median(spreads),
+            'total_avg': np.mean(totals),
+            'total_median': np.median(totals),
+            'home_win_prob': float(np.mean(home_scores > away_scores)),
+            'spread_distribution': spreads,
+            'total_distribution': totals,
+            'score_histogram': ScoreHistogram.from_scores(home_scores, away_scores)
+        }
@@ -86,7 +86,7 @@ class InstrumentedGameSimulator(GameSimulator):
 
     def _simulate_drive_instrumented(self, game_state, offense, defense, drive_log):
         """Simulate drive with logging."""
-        play_sim = PlaySimulator(offense, defense)
+        play_sim = PlaySimulator(offense, defense, rng=self.rng)
 
         max_plays = 20
         plays_run = 0
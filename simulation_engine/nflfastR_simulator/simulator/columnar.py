@@ -0,0 +1,117 @@
+"""
+Columnar cache: typed binary copies of the simulator's CSV inputs.
+
+Every worker used to re-parse data/nflfastR/*.csv as text. Each CSV now
+gets a sibling binary copy in a .columnar/ directory next to it, with the
+team and bucket columns stored as pandas categoricals:
+
+    data/nflfastR/playcalling_tendencies_weekly.csv
+    data/nflfastR/.columnar/playcalling_tendencies_weekly.feather
+
+Feather is used when pyarrow is installed, otherwise a pandas pickle (same
+dtypes, no extra dependency). Pickles only load reliably in the pandas
+version that wrote them, so their file name carries that version
+(playcalling_tendencies_weekly.pandas-2.2.3.pkl). The preprocessing
+pipeline writes these via preprocessing/build_columnar.py; read_columnar()
+rebuilds a copy on the fly whenever the CSV is newer or the copy cannot be
+loaded, so the CSV stays the source of truth.
+
+Categorical columns change groupby defaults: group with observed=True or
+unobserved category combinations come back as empty (NaN) groups.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    COLUMNAR_SUFFIX = ".feather"
+except ImportError:
+    COLUMNAR_SUFFIX = f".pandas-{pd.__version__}.pkl"
+
+COLUMNAR_DIR = ".columnar"
+
+# Low-cardinality string keys stored as categoricals (plus any *_bucket column)
+CATEGORICAL_COLUMNS = ('posteam', 'defteam', 'team', 'home_team', 'away_team', 'abbreviation')
+
+
+def columnar_path(csv_path: Path) -> Path:
+    """Location of the binary copy for csv_path."""
+    csv_path = Path(csv_path)
+    return csv_path.parent / COLUMNAR_DIR / (csv_path.stem + COLUMNAR_SUFFIX)
+
+
+def to_columnar(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df with team/bucket string columns converted to categoricals."""
+    out = df.copy()
+    for col in out.columns:
+        # object on pandas < 3, the str dtype on pandas >= 3
+        is_text = out[col].dtype == object or pd.api.types.is_string_dtype(out[col].dtype)
+        if (col in CATEGORICAL_COLUMNS or col.endswith('_bucket')) and is_text:
+            out[col] = out[col].astype('category')
+    return out.reset_index(drop=True)
+
+
+def write_columnar(df: pd.DataFrame, csv_path: Path) -> Path:
+    """
+    Write the typed binary copy of a CSV's contents.
+
+    Args:
+        df: Frame as parsed from csv_path
+        csv_path: Source CSV the copy belongs to
+
+    Returns:
+        Path of the written file
+    """
+    path = columnar_path(csv_path)
+    path.parent.mkdir(exist_ok=True)
+    typed = to_columnar(df)
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    if COLUMNAR_SUFFIX == ".feather":
+        typed.to_feather(tmp)
+    else:
+        typed.to_pickle(tmp)
+    # Atomic so concurrent workers never read a half-written file
+    os.replace(tmp, path)
+    return path
+
+
+def is_stale(csv_path: Path) -> bool:
+    """True if the binary copy is missing or older than the CSV."""
+    path = columnar_path(csv_path)
+    try:
+        return os.stat(path).st_mtime_ns < os.stat(csv_path).st_mtime_ns
+    except FileNotFoundError:
+        return True
+
+
+def read_columnar(csv_path: Path) -> pd.DataFrame:
+    """
+    Load a CSV through its binary copy, rebuilding the copy if stale.
+
+    Args:
+        csv_path: Source CSV path
+
+    Returns:
+        DataFrame with categorical team/bucket columns
+    """
+    if not is_stale(csv_path):
+        path = columnar_path(csv_path)
+        try:
+            if COLUMNAR_SUFFIX == ".feather":
+                return pd.read_feather(path)
+            return pd.read_pickle(path)
+        except Exception:
+            # Corrupt or unreadable copy (e.g. written by another pandas/pyarrow):
+            # fall through and rebuild it from the CSV
+            pass
+
+    df = to_columnar(pd.read_csv(csv_path))
+    try:
+        write_columnar(df, csv_path)
+    except OSError:
+        # Read-only data dir: still serve the typed frame
+        pass
+    return df
@@ -5,6 +5,10 @@ Per strategy:
 - Load only data available up to week-1
 - Stamp cutoff for audit trail
 - Never peek at future data
+
+These helpers filter a whole frame per call. For repeated per-team,
+per-week lookups (backtests, TeamProfile) use DataStore.asof() /
+AsOfTable, which precomputes prior-week aggregates once per file.
 """
 
 from datetime import datetime
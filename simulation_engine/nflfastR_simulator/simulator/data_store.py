@@ -0,0 +1,179 @@
+"""
+DataStore: Process-level cache for the simulator's CSV inputs.
+
+Every TeamProfile reads ~15 files from data/nflfastR. A backtest builds two
+profiles per game inside every worker, so the same files used to be parsed
+thousands of times. The store parses each file once per process and keeps
+it until the file's mtime or size changes.
+
+Lookups by (team, season[, week]) go through hash indexes built lazily per
+key set, so profile construction is in-memory slicing:
+
+    store = get_data_store()
+    df = store.read_csv(data_dir / "team_anya_weekly.csv")
+    prior = store.rows(df, posteam='KC', season=2024, week_before=5)
+
+Prior-week aggregates (means over weeks < W, rolling windows, EMAs) go
+through an AsOfTable built once per (frame, team column):
+
+    store.asof(df, 'posteam').prior_mean('KC', 2024, 5, ['off_anya'])
+
+Frames returned by read_csv() are shared between callers and must be
+treated as read-only. rows() always returns a new frame. Files are parsed
+through their typed binary copy (see columnar.py), so team and bucket
+columns come back as categoricals.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .asof_store import AsOfTable
+    from .columnar import read_columnar
+except ImportError:
+    from asof_store import AsOfTable
+    from columnar import read_columnar
+
+
+class DataStore:
+    """Memoized, mtime-invalidated CSV reader with key indexes."""
+
+    def __init__(self, columnar: bool = True):
+        """
+        Args:
+            columnar: Parse via the binary columnar copies (False reads CSV text)
+        """
+        self.columnar = columnar
+        # path -> ((mtime_ns, size), frame)
+        self._frames: Dict[str, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+        # (id(frame), key columns) -> {key tuple: row positions}
+        self._indexes: Dict[Tuple[int, Tuple[str, ...]], Dict] = {}
+        # (id(frame), team column) -> AsOfTable
+        self._asof: Dict[Tuple[int, str], AsOfTable] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def read_csv(self, path: Path) -> pd.DataFrame:
+        """
+        Return the parsed CSV at path, re-reading only if the file changed.
+
+        Args:
+            path: CSV file path
+
+        Returns:
+            Shared DataFrame (do not modify in place)
+        """
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        signature = (st.st_mtime_ns, st.st_size)
+
+        cached = self._frames.get(key)
+        if cached is not None and cached[0] == signature:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        if cached is not None:
+            self._drop_indexes(cached[1])
+        df = self._parse(key)
+        self._frames[key] = (signature, df)
+        return df
+
+    def _parse(self, path: str) -> pd.DataFrame:
+        """Parse a source file (single hook for alternate storage formats)."""
+        if self.columnar:
+            return read_columnar(path)
+        return pd.read_csv(path)
+
+    def rows(self, df: pd.DataFrame, *, week_before: Optional[int] = None, **match) -> pd.DataFrame:
+        """
+        Select rows of a store-owned frame by exact key match.
+
+        Equivalent to chaining (df[col] == value) masks for each keyword,
+        but uses a hash index built once per (frame, key columns).
+
+        Args:
+            df: Frame returned by read_csv() (other frames fall back to masks)
+            week_before: If given, keep only rows with week < week_before
+            **match: column=value pairs, e.g. posteam='KC', season=2024
+
+        Returns:
+            New DataFrame with matching rows in file order
+        """
+        cols = tuple(match)
+        if self._owns(df):
+            index = self._indexes.get((id(df), cols))
+            if index is None:
+                index = self._build_index(df, cols)
+            key = tuple(match.values())
+            positions = index.get(key if len(cols) > 1 else key[0])
+            out = df.iloc[positions] if positions is not None else df.iloc[0:0]
+        else:
+            mask = np.ones(len(df), dtype=bool)
+            for col, value in match.items():
+                mask &= (df[col] == value).to_numpy()
+            out = df[mask]
+
+        if week_before is not None:
+            out = out[out['week'] < week_before]
+        return out
+
+    def asof(self, df: pd.DataFrame, team_col: str = 'posteam') -> AsOfTable:
+        """
+        As-of table for a weekly frame, built once per (frame, team column).
+
+        Args:
+            df: Weekly frame with team_col, 'season' and 'week' columns
+            team_col: Team key column
+
+        Returns:
+            AsOfTable (cached only for store-owned frames)
+        """
+        if not self._owns(df):
+            return AsOfTable(df, team_col)
+        key = (id(df), team_col)
+        table = self._asof.get(key)
+        if table is None:
+            table = self._asof[key] = AsOfTable(df, team_col)
+        return table
+
+    def _owns(self, df: pd.DataFrame) -> bool:
+        return any(frame is df for _, frame in self._frames.values())
+
+    def _build_index(self, df: pd.DataFrame, cols: Tuple[str, ...]) -> Dict:
+        by = list(cols) if len(cols) > 1 else cols[0]
+        index = df.groupby(by, sort=False, observed=True).indices if len(df) else {}
+        self._indexes[(id(df), cols)] = index
+        return index
+
+    def _drop_indexes(self, df: pd.DataFrame):
+        for key in [k for k in self._indexes if k[0] == id(df)]:
+            del self._indexes[key]
+        for key in [k for k in self._asof if k[0] == id(df)]:
+            del self._asof[key]
+
+    def clear(self):
+        """Forget all cached frames and indexes."""
+        self._frames.clear()
+        self._indexes.clear()
+        self._asof.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters for diagnostics."""
+        return {"files": len(self._frames), "hits": self.hits, "misses": self.misses}
+
+
+# Singleton instance (one per process / pool worker)
+_data_store = None
+
+
+def get_data_store() -> DataStore:
+    """Get singleton data store instance."""
+    global _data_store
+    if _data_store is None:
+        _data_store = DataStore()
+    return _data_store
@@ -13,6 +13,13 @@ Uses nflfastR decision curves and published 4th down models.
 
 from typing import Dict, Tuple
 
+import numpy as np
+
+# Integer decision codes for the vectorized batch engine
+DECISION_GO = 0
+DECISION_FG = 1
+DECISION_PUNT = 2
+
 
 def get_fourth_down_decision(
     yardline: int,
@@ -95,6 +102,52 @@ def get_fourth_down_decision(
     return "Punt", reasoning
 
 
+def get_fourth_down_decisions(
+    yardline: np.ndarray,
+    ydstogo: np.ndarray,
+    time_remaining: np.ndarray,
+    score_diff: np.ndarray,
+    quarter: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized get_fourth_down_decision for many game states at once.
+
+    Applies exactly the same rule order as the scalar version, without
+    building reasoning dicts (used by BatchGameSimulator).
+
+    Args:
+        yardline: Field positions (0-100)
+        ydstogo: Yards to go
+        time_remaining: Seconds remaining in game
+        score_diff: Score differentials from offense perspective
+        quarter: Current quarters (1-4)
+
+    Returns:
+        Array of decision codes (DECISION_GO, DECISION_FG, DECISION_PUNT)
+    """
+    yardline = np.asarray(yardline)
+    ydstogo = np.asarray(ydstogo)
+    time_remaining = np.asarray(time_remaining)
+    score_diff = np.asarray(score_diff)
+    quarter = np.asarray(quarter)
+
+    fg_distance = (100 - yardline) + 17
+    desperation = (score_diff < -7) & (time_remaining < 120)
+    in_fg_range = (yardline >= 83) & (fg_distance <= 34)
+    fg_range_go = (ydstogo <= 1) | ((ydstogo <= 3) & (yardline >= 90))
+
+    go_short = (ydstogo <= 2) & ((yardline >= 40) | (score_diff < -3))
+    go_medium = (ydstogo <= 3) & (yardline >= 50)
+    go_late = (score_diff < -3) & (time_remaining < 600) & (quarter >= 3) & (ydstogo <= 5)
+
+    decisions = np.full(yardline.shape, DECISION_PUNT, dtype=np.int8)
+    outside_fg_go = go_short | go_medium | go_late
+    decisions[~in_fg_range & outside_fg_go] = DECISION_GO
+    decisions[in_fg_range] = np.where(fg_range_go[in_fg_range], DECISION_GO, DECISION_FG)
+    decisions[desperation] = DECISION_GO
+    return decisions
+
+
 def calculate_epa_for_decision(
     yardline: int,
     ydstogo: int,
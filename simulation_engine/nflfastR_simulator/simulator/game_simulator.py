@@ -21,11 +21,21 @@ try:
     from .team_profile import TeamProfile
     from .play_simulator import PlaySimulator
     from .tracing import SimTrace
+    from .game_stats import GameStats
+    from .matchup import MatchupParams
+    from .rng import seed_sequence, trial_rngs
+    from .score_histogram import ScoreHistogram
+    from .batch_simulator import BatchGameSimulator
 except ImportError:
     from game_state import GameState
     from team_profile import TeamProfile
     from play_simulator import PlaySimulator
     from tracing import SimTrace
+    from game_stats import GameStats
+    from matchup import MatchupParams
+    from rng import seed_sequence, trial_rngs
+    from score_histogram import ScoreHistogram
+    from batch_simulator import BatchGameSimulator
 
 
 class GameSimulator:
@@ -34,7 +44,7 @@ class GameSimulator:
     def __init__(self, home_team: TeamProfile, away_team: TeamProfile,
                  game_id: str = None, season: int = None, week: int = None,
                  trace: Optional[SimTrace] = None, seed: Optional[int] = None,
-                 pressure_calibrator = None):
+                 pressure_calibrator = None, rng: Optional[np.random.Generator] = None):
         """
         Initialize game simulator.
         
@@ -45,8 +55,9 @@ class GameSimulator:
             season: Optional season for situational factors
             week: Optional week for situational factors
             trace: Optional SimTrace for logging (creates new one if None)
-            seed: Optional random seed for reproducibility
+            seed: Optional random seed (int, int sequence or SeedSequence) for reproducibility
             pressure_calibrator: Optional PressureCalibrator for team-specific pressure rates
+            rng: Optional numpy Generator for simulate_game() (default: seeded from seed)
         """
         self.home_team = home_team
         self.away_team = away_team
@@ -58,14 +69,25 @@ class GameSimulator:
             trace = SimTrace(game_id=game_id_str, seed=seed)
         self.trace = trace
 
-        # Set random seed if provided
-        if seed is not None:
-            np.random.seed(seed)
+        # Per-game realism counters (reset by simulate_game)
+        self.stats = GameStats()
+        self.realism_violations = []
+
+        # Random streams: simulate_game() draws from self.rng, Monte Carlo
+        # trials from children spawned off seed_seq (see rng.py)
+        self.seed_seq = seed_sequence(seed)
+        self.rng = rng if rng is not None else np.random.default_rng(self.seed_seq)
 
         # Load situational factors if game info provided
         if game_id and season and week:
             self._load_situational_factors(game_id, season, week)
 
+        # Play model constants per possession, after situational factors are set
+        self.matchups = {
+            'home': MatchupParams(self.home_team, self.away_team, pressure_calibrator),
+            'away': MatchupParams(self.away_team, self.home_team, pressure_calibrator)
+        }
+
         # Log input audit
         self.trace.log("inputs.audit", {
             "home": self.home_team.as_dict_for_audit(),
@@ -119,10 +141,14 @@ class GameSimulator:
                 wind=float(row.get('wind')) if pd.notna(row.get('wind')) else None
             )
 
-    def simulate_game(self) -> Dict:
+    def simulate_game(self, rng: Optional[np.random.Generator] = None) -> Dict:
         """
         Run one simulation of the game.
         
+        Args:
+            rng: Optional Generator for this trial (e.g. from rng.trial_rngs);
+                replaces self.rng, so later calls keep drawing from it
+        
         Returns:
             Dict with keys:
                 - home_score: Final home score
@@ -130,13 +156,20 @@ class GameSimulator:
                 - spread: Away score - home score
                 - total: Combined score
         """
+        if rng is not None:
+            self.rng = rng
+
+        # Scope trace events to this trial (and apply trace sampling)
+        self.trace.begin_trial()
+        self.stats.reset()
+
         # Initialize game state
         game_state = GameState()
 
         # FIXED: Randomize opening possession (coin toss simulation)
         # Real NFL: coin toss winner chooses to receive or defer
         # We'll randomize: 50% home, 50% away
-        opening_possession = 'home' if np.random.random() < 0.5 else 'away'
+        opening_possession = 'home' if self.rng.random() < 0.5 else 'away'
         game_state.possession = opening_possession
         game_state.start_new_drive()
 
@@ -152,51 +185,26 @@ class GameSimulator:
             self._simulate_drive(game_state, offense, defense)
 
         # Calculate game metrics for realism guards
-        all_drives = self.trace.get_events("drive.summary")
-        total_drives = len(all_drives)
-        drives_per_team = total_drives / 2 if total_drives > 0 else 0
-
-        td_count = sum(1 for d in all_drives if d.get('result') == 'TD')
-        fg_count = sum(1 for d in all_drives if 'FG' in str(d.get('result', '')))
-        to_count = sum(1 for d in all_drives if 'Turnover' in str(d.get('result', '')))
-
-        total_plays = sum(d.get('plays', 0) for d in all_drives)
-        plays_per_drive = total_plays / total_drives if total_drives > 0 else 0
-
-        td_pct = td_count / total_drives if total_drives > 0 else 0
-        fg_pct = fg_count / total_drives if total_drives > 0 else 0
-        to_pct = to_count / total_drives if total_drives > 0 else 0
-
-        # Get explosive plays from anchor_slice events
-        anchor_slices = self.trace.get_events("anchor_slice")
-        explosive_count = sum(s.get('explosive_count', 0) for s in anchor_slices)
-        explosive_rate = explosive_count / total_plays if total_plays > 0 else 0
-
-        # Get pass rate from play events
-        play_events = self.trace.get_events("call.pass_run")
-        pass_count = sum(1 for p in play_events if p.get('choice') == 'pass')
-        pass_rate = pass_count / len(play_events) if len(play_events) > 0 else 0
+        metrics = self.stats.metrics()
+        total_points = game_state.home_score + game_state.away_score
 
         # Log game summary
-        self.trace.log("game.summary", {
-            "home_score": game_state.home_score,
-            "away_score": game_state.away_score,
-            "spread": game_state.away_score - game_state.home_score,
-            "total": game_state.home_score + game_state.away_score,
-            "drives_per_team": drives_per_team,
-            "plays_per_drive": plays_per_drive,
-            "td_pct": td_pct,
-            "fg_pct": fg_pct,
-            "turnover_pct": to_pct,
-            "explosive_rate": explosive_rate,
-            "pass_rate": pass_rate
-        })
+        if self.trace.active:
+            self.trace.log("game.summary", {
+                "home_score": game_state.home_score,
+                "away_score": game_state.away_score,
+                "spread": game_state.away_score - game_state.home_score,
+                "total": total_points,
+                **metrics
+            })
 
         # Run realism guards
-        self._check_realism_guards(
-            plays_per_drive, drives_per_team, td_pct, fg_pct, to_pct,
-            explosive_rate, pass_rate, game_state.home_score + game_state.away_score
+        self.realism_violations = self._check_realism_guards(
+            metrics["plays_per_drive"], metrics["drives_per_team"], metrics["td_pct"],
+            metrics["fg_pct"], metrics["turnover_pct"], metrics["explosive_rate"],
+            metrics["pass_rate"], total_points
         )
+        self.trace.flush()
 
         return {
             'home_score': game_state.home_score,
@@ -218,7 +226,10 @@ class GameSimulator:
             offense, 
             defense, 
             trace=self.trace,
-            pressure_calibrator=self.pressure_calibrator
+            pressure_calibrator=self.pressure_calibrator,
+            stats=self.stats,
+            matchup=self.matchups[game_state.possession],
+            rng=self.rng
         )
 
         # Track drive metrics for anchor_slice logging
@@ -288,19 +299,20 @@ class GameSimulator:
                 else:
                     decision_taken = "Go"
 
-                self.trace.log("policy_decision", {
-                    "quarter": game_state.quarter,
-                    "time_remaining": game_state.time_remaining,
-                    "yardline": game_state.yardline,
-                    "to_go": game_state.ydstogo,
-                    "score_diff": game_state.score_differential,
-                    "fg_epa": fg_epa,
-                    "punt_epa": punt_epa,
-                    "go_epa": go_epa,
-                    "decision": decision_taken,
-                    "fg_reasoning": fg_reasoning,
-                    "punt_reasoning": punt_reasoning
-                })
+                if self.trace.active:
+                    self.trace.log("policy_decision", {
+                        "quarter": game_state.quarter,
+                        "time_remaining": game_state.time_remaining,
+                        "yardline": game_state.yardline,
+                        "to_go": game_state.ydstogo,
+                        "score_diff": game_state.score_differential,
+                        "fg_epa": fg_epa,
+                        "punt_epa": punt_epa,
+                        "go_epa": go_epa,
+                        "decision": decision_taken,
+                        "fg_reasoning": fg_reasoning,
+                        "punt_reasoning": punt_reasoning
+                    })
 
                 if fg_decision:
                     # Attempt field goal
@@ -402,7 +414,7 @@ class GameSimulator:
 
                     # Only apply if close to first down (within 20% of needed)
                     if yards_gained >= (ydstogo_before * 0.8):
-                        if np.random.random() < first_down_bonus:
+                        if self.rng.random() < first_down_bonus:
                             # Grant first down bonus
                             game_state.down = 1
                             game_state.ydstogo = min(10, 100 - game_state.yardline)
@@ -418,6 +430,8 @@ class GameSimulator:
                 result_text = "Turnover_on_Downs"
                 break
 
+        self.stats.record_drive(drive_plays, result_text, drive_explosive_plays)
+
         # Log drive summary with anchor_slice
         drive_time_used = drive_start_time - game_state.time_remaining
         drive_success_rate = drive_successful_plays / drive_plays if drive_plays > 0 else 0
@@ -449,12 +463,31 @@ class GameSimulator:
             "result": result_text
         })
 
-    def simulate_monte_carlo(self, n_sims: int = 10000) -> Dict:
+    def batch_simulator(self, rng: Optional[np.random.Generator] = None) -> BatchGameSimulator:
+        """
+        Vectorized engine for this matchup (same profiles, situational
+        factors and pressure calibrator).
+        
+        Its trials are not traced. Without rng it draws from the next child
+        of the simulator's seed, so a seeded simulator gives a reproducible batch.
+        """
+        if rng is None:
+            rng = trial_rngs(self.seed_seq, 1)[0]
+        return BatchGameSimulator(self.home_team, self.away_team,
+                                  pressure_calibrator=self.pressure_calibrator, rng=rng)
+
+    def simulate_monte_carlo(self, n_sims: int = 10000, batch: bool = False) -> Dict:
         """
         Run Monte Carlo simulation (multiple game simulations).
         
+        Each trial draws from its own Generator spawned from the simulator's
+        seed, so a seeded run is reproducible trial by trial.
+        
         Args:
             n_sims: Number of simulations to run
+            batch: Run all trials at once on BatchGameSimulator (same score
+                distribution, ~30x faster, but not traced and not
+                draw-for-draw equal to the per-trial loop)
         
         Returns:
             Dict with keys:
@@ -466,11 +499,15 @@ class GameSimulator:
                 - home_win_prob: Probability home team wins
                 - spread_distribution: Array of spread results
                 - total_distribution: Array of total results
+                - score_histogram: Joint (home, away) ScoreHistogram
         """
+        if batch:
+            return self.batch_simulator().simulate_monte_carlo(n_sims)
+
         results = []
 
-        for _ in range(n_sims):
-            result = self.simulate_game()
+        for rng in trial_rngs(self.seed_seq, n_sims):
+            result = self.simulate_game(rng=rng)
             results.append(result)
 
         # Aggregate results
@@ -491,7 +528,8 @@ class GameSimulator:
             'total_median': np.median(totals),
             'home_win_prob': sum(1 for r in results if r['home_score'] > r['away_score']) / n_sims,
             'spread_distribution': np.array(spreads),
-            'total_distribution': np.array(totals)
+            'total_distribution': np.array(totals),
+            'score_histogram': ScoreHistogram.from_scores(home_scores, away_scores)
         }
 
     def get_betting_recommendations(self, mc_results: Dict, market_spread: float, market_total: float) -> Dict:
@@ -594,7 +632,13 @@ class GameSimulator:
     def _check_realism_guards(self, plays_per_drive: float, drives_per_team: float,
                               td_pct: float, fg_pct: float, to_pct: float,
                               explosive_rate: float, pass_rate: float, total_points: int):
-        """Check if simulation output matches NFL reality."""
+        """
+        Check if simulation output matches NFL reality.
+        
+        Returns:
+            List of violation dicts (empty if all guards pass); also logged
+            to the trace when it is recording
+        """
 
         guards = [
             ("plays_per_drive", plays_per_drive, (5.5, 7.0)),
@@ -617,6 +661,9 @@ class GameSimulator:
                     "violation": "too_low" if observed < min_val else "too_high"
                 })
 
+        if not self.trace.active:
+            return violations
+
         if violations:
             self.trace.log("anchors.violation", {
                 "violations": violations,
@@ -627,3 +674,4 @@ class GameSimulator:
                 "message": "All realism guards passed"
             })
 
+        return violations
@@ -12,6 +12,12 @@ from dataclasses import dataclass
 from typing import Literal, Dict, Tuple
 
 
+# Play-calling bucket labels, in index order (used by array lookups)
+DISTANCE_BUCKETS = ('short', 'medium', 'long')
+SCORE_DIFF_BUCKETS = ('down_14+', 'down_7-13', 'down_1-6', 'tied', 'up_1-6', 'up_7-13', 'up_14+')
+TIME_BUCKETS = ('Q1-Q2', 'Q2-Q3', 'Q3-Q4', 'Q4_late', '2min')
+
+
 @dataclass
 class GameState:
     """Tracks the current state of the game during simulation."""
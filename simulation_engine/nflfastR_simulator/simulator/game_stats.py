@@ -0,0 +1,74 @@
+"""
+GameStats: Per-game counters behind the realism guards.
+
+GameSimulator resets one GameStats per simulated game; _simulate_drive
+records each finished drive and PlaySimulator records each pass/run call,
+all in O(1). The game.summary event and _check_realism_guards read
+metrics() instead of rescanning trace events, so the guards work with
+tracing disabled or sampled.
+"""
+
+from typing import Dict
+
+
+class GameStats:
+    """Drive and play-call counters for one simulated game."""
+
+    __slots__ = ('drives', 'plays', 'tds', 'fgs', 'turnovers',
+                 'explosive_plays', 'play_calls', 'pass_calls')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Zero all counters (start of a game)."""
+        self.drives = 0
+        self.plays = 0
+        self.tds = 0
+        self.fgs = 0
+        self.turnovers = 0
+        self.explosive_plays = 0
+        self.play_calls = 0
+        self.pass_calls = 0
+
+    def record_call(self, play_type: str):
+        """Count a pass/run decision."""
+        self.play_calls += 1
+        if play_type == 'pass':
+            self.pass_calls += 1
+
+    def record_drive(self, plays: int, result: str, explosive_plays: int):
+        """
+        Count a finished drive.
+
+        Args:
+            plays: Plays run on the drive
+            result: drive.summary result ('TD', 'FG', 'Missed_FG', 'Punt',
+                'Turnover', 'Turnover_on_Downs', ...)
+            explosive_plays: Plays of 15+ yards on the drive
+        """
+        self.drives += 1
+        self.plays += plays
+        self.explosive_plays += explosive_plays
+        # Same classification the trace-based metrics used (FG attempts and
+        # turnovers on downs included)
+        if result == 'TD':
+            self.tds += 1
+        elif 'FG' in result:
+            self.fgs += 1
+        elif 'Turnover' in result:
+            self.turnovers += 1
+
+    def metrics(self) -> Dict[str, float]:
+        """Realism metrics as logged in game.summary."""
+        drives = self.drives
+        plays = self.plays
+        return {
+            "drives_per_team": drives / 2 if drives > 0 else 0,
+            "plays_per_drive": plays / drives if drives > 0 else 0,
+            "td_pct": self.tds / drives if drives > 0 else 0,
+            "fg_pct": self.fgs / drives if drives > 0 else 0,
+            "turnover_pct": self.turnovers / drives if drives > 0 else 0,
+            "explosive_rate": self.explosive_plays / plays if plays > 0 else 0,
+            "pass_rate": self.pass_calls / self.play_calls if self.play_calls > 0 else 0,
+        }
@@ -12,6 +12,11 @@ import pandas as pd
 from pathlib import Path
 from typing import Dict, Optional
 
+try:
+    from .data_store import get_data_store
+except ImportError:
+    from data_store import get_data_store
+
 
 class InjuryLoader:
     """Load and apply weekly injury data."""
@@ -53,11 +58,9 @@ class InjuryLoader:
             return pd.DataFrame(columns=['team', 'season', 'week', 'qb_downgrade',
                                          'wr_depth_loss', 'ol_starters_out', 'cb_starters_out'])
 
-        df = pd.read_csv(injury_file)
-        weekly = df[
-            (df['season'] == season) &
-            (df['week'] == week)
-        ].copy()
+        store = get_data_store()
+        df = store.read_csv(injury_file)
+        weekly = store.rows(df, season=season, week=week).copy()
 
         return weekly
 
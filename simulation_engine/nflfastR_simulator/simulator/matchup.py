@@ -0,0 +1,139 @@
+"""
+MatchupParams: Play-model constants for one (offense, defense) pairing.
+
+Everything in PlaySimulator's pass and run models that depends only on the
+two team profiles (EPA/YPP/ANY/A differentials, PFF grade deltas, injury
+multipliers, weather and rest adjustments, the pressure matchup base) is
+resolved here once. PFF grades are validated at construction, so a
+missing grade fails before the first snap instead of on it.
+
+GameSimulator builds one per possession direction; BatchGameSimulator
+stacks the same values into its per-possession arrays. The per-snap path
+only adds situational terms and draws random numbers.
+
+Per-split values are (clean pocket, under pressure) tuples of Python
+floats, which index faster than NumPy arrays on the scalar path.
+"""
+
+import numpy as np
+
+CLEAN, PRESSURE = 0, 1
+
+# League-average pressure rate (nflfastR) used without a PressureCalibrator
+BASE_PRESSURE_RATE = 0.212
+
+
+class MatchupParams:
+    """Constants for one offense vs defense pairing."""
+
+    __slots__ = (
+        'offense_team', 'defense_team', 'calibrated', 'pressure_base',
+        'ol_grade', 'dl_grade', 'qb_completion', 'completion', 'yards_per_att',
+        'anya_advantage', 'int_mult', 'completion_adj', 'outdoor', 'rest_adj',
+        'explosive_rate', 'ypa_advantage', 'run_avg', 'turnover_factor',
+    )
+
+    def __init__(self, offense, defense, pressure_calibrator=None):
+        """
+        Args:
+            offense: Offensive TeamProfile
+            defense: Defensive TeamProfile
+            pressure_calibrator: Optional PressureCalibrator (else legacy PFF pressure model)
+
+        Raises:
+            ValueError: If a required PFF grade is missing
+        """
+        self._validate(offense, defense, legacy_pressure=pressure_calibrator is None)
+
+        self.offense_team = offense.team
+        self.defense_team = defense.team
+        mult = getattr(offense, 'injury_multipliers', {})
+
+        # Pressure: matchup base for the calibrator, or the final legacy rate
+        self.calibrated = pressure_calibrator is not None
+        self.ol_grade = getattr(offense, 'ol_grade', None)
+        self.dl_grade = getattr(defense, 'dl_grade', None)
+        if self.calibrated:
+            self.pressure_base = pressure_calibrator.matchup_base(
+                offense.team, defense.team,
+                injuries={
+                    'OL': {'starters_out': getattr(offense, 'ol_starters_out', 0)},
+                    'DL': {'starters_out': getattr(defense, 'dl_starters_out', 0)}
+                },
+                ol_rank=getattr(offense, 'ol_rank', None),
+                dl_rank=getattr(defense, 'dl_rank', None)
+            )
+        else:
+            self.pressure_base = self._legacy_pressure_rate(offense, defense, mult)
+
+        # QB splits after ANY/A, calibration boost and injuries
+        self.anya_advantage = offense.off_anya - defense.def_anya_allowed
+        qb_completion, completion, yards_per_att = [], [], []
+        for split in ('clean', 'pressure'):
+            comp = offense.qb_stats[split]['completion_pct']
+            qb_completion.append(float(comp))
+            comp = comp * (1.0 + self.anya_advantage * 0.02)
+            comp = min(0.88, comp * 1.40)
+            comp = comp * mult.get('qb_completion_mult', 1.0) * mult.get('wr_completion_mult', 1.0)
+            completion.append(float(comp))
+            yards_per_att.append(float(np.clip(offense.qb_stats[split]['yards_per_att'] + self.anya_advantage * 0.5,
+                                               2.0, 12.0)))
+        self.qb_completion = tuple(qb_completion)
+        self.completion = tuple(completion)
+        self.yards_per_att = tuple(yards_per_att)
+
+        # Interceptions: global calibration, ANY/A, turnover regression, QB injury
+        self.turnover_factor = offense.turnover_regression_factor
+        self.int_mult = float(0.60 * np.clip(1.0 - self.anya_advantage * 0.10, 0.5, 1.2)
+                              * self.turnover_factor * mult.get('qb_int_mult', 1.0))
+
+        # Completion: PFF passing vs coverage, weather, rest
+        passing_advantage = offense.passing_grade - defense.coverage_grade
+        self.completion_adj = float(np.clip(passing_advantage * 0.004, -0.12, 0.12))
+        self.outdoor = hasattr(offense, 'is_dome') and not offense.is_dome
+        self.rest_adj = 0.0
+        rest_days = getattr(offense, 'home_rest_days', 7)
+        if rest_days < 7:
+            self.rest_adj = -(7 - rest_days) * 0.01
+        elif rest_days > 7:
+            self.rest_adj = min((rest_days - 7) * 0.005, 0.02)
+
+        # Explosive completions (only drawn from a clean pocket)
+        explosive_clean = np.clip(0.15 + passing_advantage / 50.0 * 0.05, 0.05, 0.30)
+        weather = 0.85 if self.outdoor else 1.0
+        wr_mult = mult.get('wr_explosive_mult', 1.0)
+        self.explosive_rate = (float(explosive_clean * wr_mult * weather), 0.15 * wr_mult * weather)
+        self.ypa_advantage = offense.off_yards_per_pass_attempt - defense.def_yards_per_pass_allowed
+
+        # Run mean: EPA, PFF run blocking, YPP (capped), OL injuries
+        run_adj = (offense.off_epa - defense.def_epa) * 12
+        run_adj += (offense.ol_run_grade - defense.dl_run_grade) * 0.06
+        run_adj += np.clip((offense.off_yards_per_play - defense.def_yards_per_play_allowed) * 0.8, -0.8, 0.8)
+        self.run_avg = float(4.8 + run_adj * mult.get('ol_run_mult', 1.0))
+
+    @staticmethod
+    def _validate(offense, defense, legacy_pressure: bool):
+        """NO FALLBACKS - all PFF data must be loaded."""
+        required = [
+            (offense, 'passing_grade', 'Offense'),
+            (defense, 'coverage_grade', 'Defense'),
+            (offense, 'ol_run_grade', 'Offense'),
+            (defense, 'dl_run_grade', 'Defense'),
+        ]
+        if legacy_pressure:
+            required = [(offense, 'ol_grade', 'Offense'), (defense, 'dl_grade', 'Defense')] + required
+        for team, attr, side in required:
+            if getattr(team, attr, None) is None:
+                raise ValueError(f"{side} {team.team} missing {attr} - PFF data required")
+
+    @staticmethod
+    def _legacy_pressure_rate(offense, defense, mult) -> float:
+        """Matchup pressure rate without a calibrator (PFF OL vs DL mismatch)."""
+        rate = BASE_PRESSURE_RATE * mult.get('ol_pressure_mult', 1.0)
+        if getattr(offense, 'pff_pressure_z', None) is not None:
+            # Zero-mean z-score: 1 SD mismatch -> ±1.5% pressure
+            factor = np.clip(1.0 + 0.015 * offense.pff_pressure_z, 0.80, 1.20)
+            return float(np.clip(rate * factor, 0.05, 0.55))
+        # Raw grades: 10-point DL advantage = +4% pressure, capped at ±15%
+        adjustment = np.clip((defense.dl_grade - offense.ol_grade) * 0.004, -0.15, 0.15)
+        return float(np.clip(rate + adjustment, 0.05, 0.55))
@@ -0,0 +1,211 @@
+"""
+Model-performance aggregates of a graded backtest, materialized once.
+
+The dashboard's /model-performance pages used to re-read the backtest CSV
+on every request, recompute each conviction tier's record and iterrows()
+over every bet for the team tables. build_summary() computes all of it
+with grouped pandas operations; backtest_runner writes it next to the
+results CSV (<name>.summary.json) and the routes only look it up:
+
+    summary = load_summary(ARTIFACTS_DIR / "backtest_all_games_conviction.csv")
+    summary['spread']['high']                 # count, wins, losses, pushes, win_rate, roi, avg_edge
+    summary['bets']['total']['MEDIUM']        # per-bet rows for the detail page
+    summary['teams']['spread']                # per-team record (teams with 3+ bets)
+
+load_summary() rebuilds the JSON if the CSV is newer (e.g. written by
+another script), so the pages never show stale numbers.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+CONVICTIONS = ('HIGH', 'MEDIUM', 'LOW')
+MIN_TEAM_BETS = 3  # team tables only list teams with this many bets
+WIN_PAYOUT = 0.91  # -110 odds: win +0.91, loss -1.00
+
+# market -> (bet, result, edge, conviction, line, model mean) columns
+MARKETS = {
+    'spread': ('spread_bet', 'spread_result', 'spread_edge', 'spread_conviction', 'spread_line', 'spread_mean'),
+    'total': ('total_bet', 'total_result', 'total_edge', 'total_conviction', 'total_line', 'total_mean'),
+}
+
+
+def summary_path(csv_path: Path) -> Path:
+    csv_path = Path(csv_path)
+    return csv_path.with_name(csv_path.stem + '.summary.json')
+
+
+def _bets(df: pd.DataFrame, market: str) -> pd.DataFrame:
+    bet_col = MARKETS[market][0]
+    return df[df[bet_col].notna() & (df[bet_col] != '')]
+
+
+def _record(bets: pd.DataFrame, market: str) -> Dict:
+    """Win/loss/push, win rate and ROI (both over all bets, pushes included) and average edge."""
+    _, result_col, edge_col, *_ = MARKETS[market]
+    count = len(bets)
+    if count == 0:
+        return {'count': 0, 'wins': 0, 'losses': 0, 'pushes': 0, 'win_rate': 0, 'roi': 0, 'avg_edge': 0}
+    wins = int((bets[result_col] == 1.0).sum())
+    losses = int((bets[result_col] == 0.0).sum())
+    avg_edge = float(bets[edge_col].mean() * 100) if edge_col in bets.columns else 0.0
+    return {
+        'count': count,
+        'wins': wins,
+        'losses': losses,
+        'pushes': count - wins - losses,
+        'win_rate': round(wins / count * 100, 1),
+        'roi': round((wins * WIN_PAYOUT - losses) / count * 100, 1),
+        'avg_edge': round(avg_edge, 1),
+    }
+
+
+def _result_labels(result: pd.Series) -> np.ndarray:
+    return np.select([result == 1.0, result == 0.0], ['WIN', 'LOSS'], 'PUSH')
+
+
+def _bet_rows(bets: pd.DataFrame, market: str) -> List[Dict]:
+    """Detail-page rows for one tier's bets."""
+    bet_col, result_col, edge_col, _, line_col, mean_col = MARKETS[market]
+    played = bets['actual_home_score'].notna()
+    away = bets['actual_away_score'].fillna(0).astype(int).astype(str)
+    home = bets['actual_home_score'].fillna(0).astype(int).astype(str)
+    rows = pd.DataFrame({
+        'week': bets['week'].astype(int),
+        'away_team': bets['away_team'],
+        'home_team': bets['home_team'],
+        f'market_{market}': bets[line_col],
+        f'our_{market}': bets[mean_col].round(1),
+        'bet': bets[bet_col],
+        'edge': (bets[edge_col] * 100).round(1),
+        'result': _result_labels(bets[result_col]),
+    })
+    if market == 'spread':
+        rows['actual_score'] = np.where(played, away + '-' + home, '-')
+    else:
+        total = (bets['actual_away_score'] + bets['actual_home_score']).fillna(0).astype(int)
+        rows['actual_total'] = np.where(played, total.astype(object), '-')
+    return rows.to_dict('records')
+
+
+def _team_table(long: pd.DataFrame) -> List[Dict]:
+    """Per-team records from (team, result, conviction) rows, in order of first appearance."""
+    if long.empty:
+        return []
+    win = long['result'] == 1.0
+    grouped = pd.DataFrame({
+        'team': long['team'],
+        'bets': 1,
+        'wins': win.astype(int),
+        'losses': (long['result'] == 0.0).astype(int),
+        'high_bets': (long['conviction'] == 'HIGH').astype(int),
+        'high_wins': ((long['conviction'] == 'HIGH') & win).astype(int),
+        'med_bets': (long['conviction'] == 'MEDIUM').astype(int),
+        'med_wins': ((long['conviction'] == 'MEDIUM') & win).astype(int),
+        'low_bets': (long['conviction'] == 'LOW').astype(int),
+        'low_wins': ((long['conviction'] == 'LOW') & win).astype(int),
+    }).groupby('team', sort=False).sum().reset_index()
+    grouped = grouped[grouped['bets'] >= MIN_TEAM_BETS]
+
+    records = pd.DataFrame({
+        'team': grouped['team'],
+        'bets': grouped['bets'],
+        'wins': grouped['wins'],
+        'losses': grouped['losses'],
+        'pushes': grouped['bets'] - grouped['wins'] - grouped['losses'],
+        'win_rate': (grouped['wins'] / grouped['bets'] * 100).round(1),
+    }).to_dict('records')
+
+    # Tier win rates stay None (not NaN) for tiers without bets
+    for tier in ('high', 'med', 'low'):
+        for record, wins, bets in zip(records, grouped[f'{tier}_wins'], grouped[f'{tier}_bets']):
+            record[f'{tier}_wr'] = round(wins / bets * 100, 1) if bets > 0 else None
+    return records
+
+
+def _team_rows(df: pd.DataFrame, market: str) -> pd.DataFrame:
+    """(team, result, conviction) per bet: the side bet on for spreads, both teams for totals."""
+    bet_col, result_col, _, conviction_col, *_ = MARKETS[market]
+    bets = _bets(df, market)
+    if market == 'spread':
+        bet = bets[bet_col].astype(str).str.upper()
+        home, away = bets['home_team'].astype(str), bets['away_team'].astype(str)
+        on_home = bet.str.contains('HOME') | np.array([h in b for h, b in zip(home, bet)], dtype=bool)
+        on_away = ~on_home & (bet.str.contains('AWAY') | np.array([a in b for a, b in zip(away, bet)], dtype=bool))
+        keep = on_home | on_away
+        return pd.DataFrame({'team': np.where(on_home, home, away)[keep.to_numpy()],
+                             'result': bets[result_col][keep].to_numpy(),
+                             'conviction': bets[conviction_col][keep].to_numpy()})
+    # Totals count for both teams, home first, game by game
+    n = len(bets)
+    teams = np.empty(2 * n, dtype=object)
+    teams[0::2], teams[1::2] = bets['home_team'].to_numpy(), bets['away_team'].to_numpy()
+    return pd.DataFrame({'team': teams,
+                         'result': np.repeat(bets[result_col].to_numpy(), 2),
+                         'conviction': np.repeat(bets[conviction_col].to_numpy(), 2)})
+
+
+def build_summary(df: pd.DataFrame) -> Dict:
+    """All /model-performance aggregates of a graded backtest frame."""
+    summary = {
+        'total_games': int(len(df)),
+        'weeks': sorted(int(w) for w in df['week'].dropna().unique()),
+        'bets': {},
+        'teams': {},
+    }
+    for market in MARKETS:
+        conviction_col = MARKETS[market][3]
+        bets = _bets(df, market)
+        tiers = {c.lower(): _record(bets[bets[conviction_col] == c], market) for c in CONVICTIONS}
+        tiers['all'] = _record(bets, market)
+        summary[market] = tiers
+        summary['bets'][market] = {c: _bet_rows(bets[bets[conviction_col] == c], market) for c in CONVICTIONS}
+        summary['teams'][market] = _team_table(_team_rows(df, market))
+    return summary
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Not JSON serializable: {type(value)}")
+
+
+def write_summary(df: pd.DataFrame, csv_path: Path) -> Path:
+    """Build and write <csv stem>.summary.json next to csv_path."""
+    path = summary_path(csv_path)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(json.dumps(build_summary(df), default=_json_default))
+    tmp.replace(path)
+    return path
+
+
+_loaded: Dict[str, Tuple[int, Dict]] = {}
+
+
+def load_summary(csv_path: Path) -> Optional[Dict]:
+    """
+    Summary for a backtest CSV, rebuilt if the CSV is newer than its JSON.
+
+    Returns:
+        Summary dict, or None if the CSV does not exist
+    """
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        return None
+    path = summary_path(csv_path)
+    if not path.exists() or path.stat().st_mtime_ns < csv_path.stat().st_mtime_ns:
+        try:
+            write_summary(pd.read_csv(csv_path), csv_path)
+        except OSError:
+            return build_summary(pd.read_csv(csv_path))
+
+    mtime = path.stat().st_mtime_ns
+    cached = _loaded.get(str(path))
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, json.loads(path.read_text()))
+        _loaded[str(path)] = cached
+    return cached[1]
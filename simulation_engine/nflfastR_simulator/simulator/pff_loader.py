@@ -8,6 +8,11 @@ import pandas as pd
 from pathlib import Path
 from typing import Dict, Optional
 
+try:
+    from .data_store import get_data_store
+except ImportError:
+    from data_store import get_data_store
+
 
 class PFFLoader:
     """Load PFF team grades for a given season."""
@@ -53,7 +58,7 @@ class PFFLoader:
         if not filepath.exists():
             raise FileNotFoundError(f"PFF data not found: {filepath}")
 
-        df = pd.read_csv(filepath)
+        df = get_data_store().read_csv(filepath)
 
         # Select relevant columns
         cols = [
@@ -20,11 +20,15 @@ try:
     from .game_state import GameState
     from .team_profile import TeamProfile
     from .tracing import SimTrace
+    from .game_stats import GameStats
+    from .matchup import MatchupParams, BASE_PRESSURE_RATE, CLEAN, PRESSURE
     from .pressure_calibration import PressureCalibrator
 except ImportError:
     from game_state import GameState
     from team_profile import TeamProfile
     from tracing import SimTrace
+    from game_stats import GameStats
+    from matchup import MatchupParams, BASE_PRESSURE_RATE, CLEAN, PRESSURE
     try:
         from pressure_calibration import PressureCalibrator
     except ImportError:
@@ -35,24 +39,37 @@ class PlaySimulator:
     """Simulates individual plays based on team profiles and game state."""
 
     # Base pressure rate (league average) - fallback if calibrator not available
-    BASE_PRESSURE_RATE = 0.212  # 21.2% from nflfastR data
+    BASE_PRESSURE_RATE = BASE_PRESSURE_RATE  # 21.2% from nflfastR data
 
     def __init__(self, offense: TeamProfile, defense: TeamProfile, 
                  trace: Optional[SimTrace] = None,
-                 pressure_calibrator: Optional[PressureCalibrator] = None):
+                 pressure_calibrator: Optional[PressureCalibrator] = None,
+                 stats: Optional[GameStats] = None,
+                 matchup: Optional[MatchupParams] = None,
+                 rng: Optional[np.random.Generator] = None):
         """
         Initialize play simulator.
         
         Args:
             offense: Offensive team profile
             defense: Defensive team profile
-            trace: Optional SimTrace for logging
+            trace: Optional SimTrace for logging (checked once; create a new
+                PlaySimulator after SimTrace.begin_trial())
             pressure_calibrator: Optional PressureCalibrator for team-specific pressure rates
+            stats: Optional GameStats that counts play calls for the realism guards
+            matchup: Optional precomputed MatchupParams for offense vs defense
+                (built here if omitted; raises ValueError if PFF grades are missing)
+            rng: numpy Generator to draw from (GameSimulator passes its own;
+                a fresh unseeded one if omitted)
         """
         self.offense = offense
         self.defense = defense
-        self.trace = trace
+        # Drop an inactive trace so the `if self.trace:` guards skip payload building
+        self.trace = trace if trace is not None and trace.active else None
         self.pressure_calibrator = pressure_calibrator
+        self.stats = stats
+        self.matchup = matchup if matchup is not None else MatchupParams(offense, defense, pressure_calibrator)
+        self.rng = rng if rng is not None else np.random.default_rng()
 
     def decide_play_type(self, game_state: GameState) -> str:
         """
@@ -73,7 +90,9 @@ class PlaySimulator:
         )
 
         # Random decision based on pass rate
-        choice = 'pass' if np.random.random() < pass_rate else 'run'
+        choice = 'pass' if self.rng.random() < pass_rate else 'run'
+        if self.stats is not None:
+            self.stats.record_call(choice)
 
         # Log decision with reasoning
         if self.trace:
@@ -131,8 +150,10 @@ class PlaySimulator:
         Returns:
             Dict with keys: type, yards, td, turnover
         """
+        m = self.matchup
+
         # Step 1: Determine if pressure occurs
-        if self.pressure_calibrator:
+        if m.calibrated:
             # Use new pressure calibration system (team-specific baselines + situational adjustments)
             # Calculate offense trailing by (from offense perspective)
             if game_state.possession == 'home':
@@ -148,24 +169,14 @@ class PlaySimulator:
             # Determine half
             half = 1 if game_state.quarter <= 2 else 2
             
-            # Get injury info
-            injuries = {
-                'OL': {'starters_out': getattr(self.offense, 'ol_starters_out', 0)},
-                'DL': {'starters_out': getattr(self.defense, 'dl_starters_out', 0)}
-            }
-            
-            # Get PFF ranks if available (optional, for mismatch adjustment)
-            ol_rank = getattr(self.offense, 'ol_rank', None)
-            dl_rank = getattr(self.defense, 'dl_rank', None)
-            
             # TODO: Track play_action and shotgun from play-calling logic
             # For now, use defaults (can enhance later)
             play_action = False
             shotgun = True  # Most modern NFL passes are from shotgun
             
-            pressure_rate = self.pressure_calibrator.pressure_prob(
-                offense_team=self.offense.team,
-                defense_team=self.defense.team,
+            # Matchup base (team baselines, OL/DL ranks, injuries) is precomputed
+            pressure_rate = self.pressure_calibrator.situational_prob(
+                m.pressure_base,
                 down=game_state.down,
                 ydstogo=game_state.ydstogo,
                 quarter=game_state.quarter,
@@ -173,13 +184,10 @@ class PlaySimulator:
                 offense_trailing_by=offense_trailing_by,
                 half=half,
                 play_action=play_action,
-                shotgun=shotgun,
-                injuries=injuries,
-                ol_rank=ol_rank,
-                dl_rank=dl_rank
+                shotgun=shotgun
             )
             
-            is_pressure = np.random.random() < pressure_rate
+            is_pressure = self.rng.random() < pressure_rate
             
             # Log pressure calculation with new system
             if self.trace:
@@ -199,46 +207,16 @@ class PlaySimulator:
                     "is_pressure": bool(is_pressure)
                 })
         else:
-            # Fallback to old system (for backward compatibility)
-            pressure_rate = self.BASE_PRESSURE_RATE
-
-            # FIXED: Apply injury multipliers (OL starters out increases pressure)
-            ol_injury_mult = getattr(self.offense, 'injury_multipliers', {}).get('ol_pressure_mult', 1.0)
-            pressure_rate = pressure_rate * ol_injury_mult
-
-            # Step 2: Apply PFF OL vs DL mismatch for pressure adjustment
-            # Strategy: OL/DL mismatch is a key predictive factor
-            # NO FALLBACKS - all PFF data must be loaded
-            if not hasattr(self.offense, 'ol_grade') or self.offense.ol_grade is None:
-                raise ValueError(f"Offense {self.offense.team} missing ol_grade - PFF data required")
-            if not hasattr(self.defense, 'dl_grade') or self.defense.dl_grade is None:
-                raise ValueError(f"Defense {self.defense.team} missing dl_grade - PFF data required")
-
-            # Apply zero-mean PFF adjustments if available (preferred method)
-            if hasattr(self.offense, 'pff_pressure_z') and self.offense.pff_pressure_z is not None:
-                # Use pre-computed zero-mean z-score
-                # Beta = 0.015 means 1 SD mismatch → ±1.5% pressure change
-                beta = 0.015
-                adjustment_factor = 1.0 + beta * self.offense.pff_pressure_z
-                adjustment_factor = np.clip(adjustment_factor, 0.80, 1.20)
-                pressure_rate = np.clip(pressure_rate * adjustment_factor, 0.05, 0.55)
-            else:
-                # Use raw PFF grades directly for OL vs DL mismatch
-                # Each 10-point DL advantage = +2% pressure rate
-                # Each 10-point OL advantage = -2% pressure rate
-                ol_grade = self.offense.ol_grade
-                dl_grade = self.defense.dl_grade
-                mismatch = dl_grade - ol_grade  # Positive = defense advantage = more pressure
-                pressure_adjustment = mismatch * 0.004  # 2x boost: 10 points = 4% change (was 2%)
-                pressure_adjustment = np.clip(pressure_adjustment, -0.15, 0.15)  # Cap at ±15% (was ±10%)
-                pressure_rate = np.clip(pressure_rate + pressure_adjustment, 0.05, 0.55)
-
-            is_pressure = np.random.random() < pressure_rate
+            # Fallback to old system (for backward compatibility): the PFF
+            # OL vs DL mismatch and OL injuries give a fixed per-matchup rate
+            pressure_rate = m.pressure_base
+
+            is_pressure = self.rng.random() < pressure_rate
 
             # Log pressure calculation
             if self.trace:
-                ol_grade = getattr(self.offense, 'ol_grade', None)
-                dl_grade = getattr(self.defense, 'dl_grade', None)
+                ol_grade = m.ol_grade
+                dl_grade = m.dl_grade
                 mismatch = dl_grade - ol_grade if (ol_grade and dl_grade) else None
                 self.trace.log("pass.pressure", {
                     "method": "legacy",
@@ -250,35 +228,18 @@ class PlaySimulator:
                     "is_pressure": bool(is_pressure)
                 })
 
-        # Calculate ANY/A advantage once for use throughout pass play
-        # USE ANY/A METRIC: Adjust QB efficiency based on team ANY/A vs defense allowed
-        league_avg_anya = 6.0
-        anya_advantage = self.offense.off_anya - self.defense.def_anya_allowed
-
-        # Step 2: Get QB's performance splits
-        if is_pressure:
-            qb_stats = self.offense.qb_stats['pressure'].copy()
-        else:
-            qb_stats = self.offense.qb_stats['clean'].copy()
-
-        # USE ANY/A METRIC: Adjust QB efficiency based on ANY/A advantage
-        # Strategy: ANY/A rolls up yards, TDs, INTs, sacks - comprehensive efficiency metric
-        # Adjust completion rate: each 1 ANY/A advantage = +2% completion
-        anya_completion_boost = 1.0 + (anya_advantage * 0.02)
-        qb_stats['completion_pct'] = qb_stats['completion_pct'] * anya_completion_boost
+        # ANY/A advantage (precomputed, also drives INT rate below)
+        anya_advantage = m.anya_advantage
 
-        # CALIBRATION TUNING: Completion boost (+40%, cap at 0.88) - applied after ANY/A
+        # Step 2: Get QB's performance splits, already adjusted for ANY/A
+        # (+2% completion and +0.5 YPA per point), the +40% completion
+        # calibration boost (cap 0.88) and QB/WR injuries
+        split = PRESSURE if is_pressure else CLEAN
+        qb_stats = {
+            'completion_pct': m.completion[split],
+            'yards_per_att': m.yards_per_att[split]
+        }
         completion_boost = 1.40
-        qb_stats['completion_pct'] = min(0.88, qb_stats['completion_pct'] * completion_boost)
-
-        # FIXED: Apply injury multipliers (QB downgrade, WR depth loss)
-        qb_comp_mult = getattr(self.offense, 'injury_multipliers', {}).get('qb_completion_mult', 1.0)
-        wr_comp_mult = getattr(self.offense, 'injury_multipliers', {}).get('wr_completion_mult', 1.0)
-        qb_stats['completion_pct'] = qb_stats['completion_pct'] * qb_comp_mult * wr_comp_mult
-
-        # Adjust yards per attempt: each 1 ANY/A advantage = +0.5 yards
-        qb_stats['yards_per_att'] = qb_stats['yards_per_att'] + (anya_advantage * 0.5)
-        qb_stats['yards_per_att'] = np.clip(qb_stats['yards_per_att'], 2.0, 12.0)
 
         # CALIBRATION TUNING: Drive persistence bias
         # If last play gained >4 yards, boost completion by 15%
@@ -289,7 +250,7 @@ class PlaySimulator:
 
         # Log completion probability calculation
         if self.trace:
-            qb_baseline = self.offense.qb_stats['pressure' if is_pressure else 'clean']['completion_pct']
+            qb_baseline = m.qb_completion[split]
             completion_pct_final = qb_stats['completion_pct']
             self.trace.log("pass.completion_model", {
                 "split": "pressure" if is_pressure else "clean",
@@ -306,11 +267,11 @@ class PlaySimulator:
 
         # PRESSURE OUTLETS: Allocate realistic escape routes before pass attempt
         if is_pressure:
-            pressure_outlet = np.random.random()
+            pressure_outlet = self.rng.random()
 
             # Scramble: 18%
             if pressure_outlet < 0.18:
-                yards = int(np.random.normal(5, 4))
+                yards = int(self.rng.normal(5, 4))
                 yards = np.clip(yards, -2, 15)
                 is_td = self._check_touchdown(yards, game_state)
                 result = {
@@ -335,14 +296,14 @@ class PlaySimulator:
 
             # Sack: 28%
             elif pressure_outlet < 0.56:  # 0.28 + 0.28
-                yards = np.random.randint(-10, -1)
+                yards = self.rng.integers(-10, -1)
                 # CALIBRATION: Fumble on sack - halved rate
                 p_fumble_sack = 0.50 * 0.006
                 # USE TURNOVER REGRESSION FACTOR: Apply regression to fumble rate
                 p_fumble_sack = p_fumble_sack * self.offense.turnover_regression_factor
-                fumble = np.random.random() < p_fumble_sack
+                fumble = self.rng.random() < p_fumble_sack
                 if fumble:
-                    fumble = np.random.random() < 0.50  # 50% recovery rate
+                    fumble = self.rng.random() < 0.50  # 50% recovery rate
                 result = {
                     'type': 'sack',
                     'yards': yards,
@@ -363,33 +324,21 @@ class PlaySimulator:
             p_int_base = 0.015  # Clean pocket
 
         # Add throw-depth term (estimate 15 yards for deep passes)
-        air_yards = 15 if np.random.random() < 0.20 else 8  # 20% deep shots
+        air_yards = 15 if self.rng.random() < 0.20 else 8  # 20% deep shots
         p_int = p_int_base + 0.002 * max(0, air_yards - 12)
 
         # Desperation cap: Late and behind
         if game_state.game_seconds_remaining < 120 and game_state.score_differential < -8:
             p_int = min(p_int, 0.06)
 
-        # CALIBRATION: 40% reduction globally
-        p_int = 0.60 * p_int
-
-        # USE ANY/A METRIC: Adjust INT rate based on ANY/A efficiency
-        # Teams with higher ANY/A have lower INT rates (part of the formula)
-        # Each 1 ANY/A advantage = -10% INT rate
-        anya_int_reduction = 1.0 - (anya_advantage * 0.10)
-        p_int = p_int * np.clip(anya_int_reduction, 0.5, 1.2)  # Cap reduction between 50-120%
+        # CALIBRATION: 40% reduction globally (in int_mult)
 
-        # USE TURNOVER REGRESSION FACTOR: Adjust turnover rates for regression
-        # Strategy: Teams with unsustainable turnover luck should regress
-        # Factor < 1.0 = fade (reduce efficiency), Factor > 1.0 = boost (regression opportunity)
-        p_int = p_int * self.offense.turnover_regression_factor
-
-        # FIXED: Apply injury multipliers (QB downgrade increases INT rate)
-        qb_int_mult = getattr(self.offense, 'injury_multipliers', {}).get('qb_int_mult', 1.0)
-        p_int = p_int * qb_int_mult
+        # ANY/A (-10% INT rate per point, capped 50-120%), turnover regression
+        # and QB injury multipliers, combined per matchup
+        p_int = p_int * m.int_mult
 
         # Check for interception FIRST
-        if np.random.random() < p_int:
+        if self.rng.random() < p_int:
             result = {
                 'type': 'interception',
                 'yards': 0,
@@ -401,68 +350,32 @@ class PlaySimulator:
 
         # Step 4: Adjust completion probability for WR vs Coverage matchup
         # Strategy: Coverage grades vs Passing grades affect completion rate
-        # NO FALLBACKS - all PFF data required
-        if not hasattr(self.offense, 'passing_grade') or self.offense.passing_grade is None:
-            raise ValueError(f"Offense {self.offense.team} missing passing_grade - PFF data required")
-        if not hasattr(self.defense, 'coverage_grade') or self.defense.coverage_grade is None:
-            raise ValueError(f"Defense {self.defense.team} missing coverage_grade - PFF data required")
-
+        # Each 10-point passing advantage = +4% completion rate (capped at ±12%)
         completion_pct = qb_stats['completion_pct']
-
-        # Apply PFF coverage vs passing offense matchup
-        # Each 10-point passing advantage = +2% completion rate
-        # Each 10-point coverage advantage = -2% completion rate
-        passing_advantage = self.offense.passing_grade - self.defense.coverage_grade
-        completion_adjustment = passing_advantage * 0.004  # 2x boost: 10 points = 4% change (was 2%)
-        completion_adjustment = np.clip(completion_adjustment, -0.12, 0.12)  # Cap at ±12% (was ±8%)
-        completion_pct = np.clip(completion_pct + completion_adjustment, 0.30, 0.90)
+        completion_pct = np.clip(completion_pct + m.completion_adj, 0.30, 0.90)
 
         # SITUATIONAL FACTOR: Weather impact on passing efficiency
         # Strategy: Wind and precipitation reduce completion rates and explosive plays
-        if hasattr(self.offense, 'is_dome') and not self.offense.is_dome:
-            # Outdoor game - check for weather impact
-            # Assume moderate wind impact if outdoor (can enhance with actual wind data later)
-            weather_penalty = 0.02  # -2% completion in outdoor conditions (base)
-            completion_pct = np.clip(completion_pct - weather_penalty, 0.30, 0.90)
+        if m.outdoor:
+            # Outdoor game: -2% completion (can enhance with actual wind data later)
+            completion_pct = np.clip(completion_pct - 0.02, 0.30, 0.90)
 
         # SITUATIONAL FACTOR: Rest days impact on team efficiency
-        # Strategy: Short week (<7 days) = fatigue, Bye week (>7 days) = rest advantage
-        if hasattr(self.offense, 'home_rest_days'):
-            rest_days = self.offense.home_rest_days  # For home team
-            if rest_days < 7:
-                # Short week penalty: -1% per day under 7
-                rest_penalty = (7 - rest_days) * 0.01
-                completion_pct = np.clip(completion_pct - rest_penalty, 0.30, 0.90)
-            elif rest_days > 7:
-                # Bye week or extra rest bonus: +0.5% per day over 7
-                rest_bonus = min((rest_days - 7) * 0.005, 0.02)  # Cap at +2%
-                completion_pct = np.clip(completion_pct + rest_bonus, 0.30, 0.90)
+        # Short week: -1% per day under 7; extra rest: +0.5% per day over 7 (cap +2%)
+        if m.rest_adj != 0.0:
+            completion_pct = np.clip(completion_pct + m.rest_adj, 0.30, 0.90)
 
         # Completion or incomplete
-        if np.random.random() < completion_pct:
+        if self.rng.random() < completion_pct:
             # Completion
 
-            # Step 5: Adjust explosive play rate based on passing grade vs coverage
-            # Strategy: Explosive plays depend on receiver/coverage matchup
-            # PFF grades already validated above
-            explosive_rate = 0.15  # Base 15% on clean pocket
-            if not is_pressure:
-                # Higher passing grade vs lower coverage = more explosive plays
-                explosive_advantage = (self.offense.passing_grade - self.defense.coverage_grade) / 50.0
-                explosive_rate = np.clip(0.15 + explosive_advantage * 0.05, 0.05, 0.30)
-
-            # FIXED: Apply injury multipliers (WR depth loss reduces explosive plays)
-            wr_explosive_mult = getattr(self.offense, 'injury_multipliers', {}).get('wr_explosive_mult', 1.0)
-            explosive_rate = explosive_rate * wr_explosive_mult
-
-            # SITUATIONAL FACTOR: Weather reduces explosive play rate
-            if hasattr(self.offense, 'is_dome') and not self.offense.is_dome:
-                # Outdoor conditions reduce big plays
-                explosive_rate = explosive_rate * 0.85  # -15% explosive rate outdoors
-
-            if not is_pressure and np.random.random() < explosive_rate:
+            # Step 5: Explosive play rate from passing grade vs coverage, WR
+            # injuries and weather (precomputed per matchup)
+            explosive_rate = m.explosive_rate[split]
+
+            if not is_pressure and self.rng.random() < explosive_rate:
                 # Log-normal distribution for explosive plays
-                yards = int(np.random.lognormal(3.2, 0.9))  # Mean ~25, tail to 60+
+                yards = int(self.rng.lognormal(3.2, 0.9))  # Mean ~25, tail to 60+
                 yards = np.clip(yards, 15, 80)
             else:
                 # Normal completion
@@ -472,17 +385,16 @@ class PlaySimulator:
 
                 # Apply team YPA adjustment
                 # Offensive YPA advantage = more yards per completion
-                ypa_advantage = self.offense.off_yards_per_pass_attempt - self.defense.def_yards_per_pass_allowed
-                avg_yards = base_ypa + (ypa_advantage * 1.2)  # Each 1 YPA advantage = 1.2 yards per completion
+                avg_yards = base_ypa + (m.ypa_advantage * 1.2)  # Each 1 YPA advantage = 1.2 yards per completion
 
                 # SITUATIONAL FACTOR: Weather reduces yards per completion
-                if hasattr(self.offense, 'is_dome') and not self.offense.is_dome:
+                if m.outdoor:
                     avg_yards = avg_yards * 0.93  # -7% yards in outdoor conditions
 
                 avg_yards = max(3.0, avg_yards)  # At least 3 yards on completion
 
                 # Add variance
-                yards = int(np.random.gamma(2, avg_yards / 2))  # Gamma distribution for right-skewed yards
+                yards = int(self.rng.gamma(2, avg_yards / 2))  # Gamma distribution for right-skewed yards
                 yards = np.clip(yards, 0, 80)
 
             # Adjust for field position (can't gain more than distance to end zone)
@@ -509,7 +421,7 @@ class PlaySimulator:
                     distance_multiplier = (20 - distance_to_goal) / 20  # 1.0 at goal, 0 at 20
                     final_td_rate = td_rate * (1.0 + 2.0 * distance_multiplier)  # Boost near goal
 
-                    if np.random.random() < min(0.88, final_td_rate):
+                    if self.rng.random() < min(0.88, final_td_rate):
                         is_td = True
                         yards = distance_to_goal
 
@@ -517,9 +429,9 @@ class PlaySimulator:
             p_fumble_completion = 0.50 * 0.002
             # USE TURNOVER REGRESSION FACTOR: Apply regression to fumble rate
             p_fumble_completion = p_fumble_completion * self.offense.turnover_regression_factor
-            fumble = np.random.random() < p_fumble_completion
+            fumble = self.rng.random() < p_fumble_completion
             if fumble:
-                fumble = np.random.random() < 0.50  # 50% recovery rate
+                fumble = self.rng.random() < 0.50  # 50% recovery rate
 
             result = {
                 'type': 'completion',
@@ -555,40 +467,12 @@ class PlaySimulator:
         Returns:
             Dict with keys: type, yards, td, turnover
         """
-        # Base yards: league average ~4.8 yards per carry
-        base_yards = 4.8
-
-        # FIXED: Reduced stacked signals - EPA and YPP share credit, don't double-count
-        # USE MULTIPLE METRICS FOR RUN YARDS:
-        # 1. EPA differential (team strength) - REDUCED from 24 to 12
-        epa_diff = self.offense.off_epa - self.defense.def_epa
-        yards_adjustment = epa_diff * 12  # Reduced: 0.1 EPA = 1.2 yards (was 2.4)
-
-        # 2. PFF OL/DL run blocking matchup - REDUCED from 0.10 to 0.06
-        if not hasattr(self.offense, 'ol_run_grade') or self.offense.ol_run_grade is None:
-            raise ValueError(f"Offense {self.offense.team} missing ol_run_grade - PFF data required")
-        if not hasattr(self.defense, 'dl_run_grade') or self.defense.dl_run_grade is None:
-            raise ValueError(f"Defense {self.defense.team} missing dl_run_grade - PFF data required")
-
-        grade_adjustment = (self.offense.ol_run_grade - self.defense.dl_run_grade) * 0.06  # Reduced (was 0.10)
-        yards_adjustment += grade_adjustment
-
-        # 3. USE YPP METRIC: Team yards per play vs defense allowed
-        # Strategy: YPP is highly predictive (97% win rate for teams winning YPP)
-        # REDUCED: Share credit with EPA (they measure similar team strength)
-        ypp_advantage = self.offense.off_yards_per_play - self.defense.def_yards_per_play_allowed
-        # Use 50% of YPP adjustment to avoid double-counting with EPA
-        ypp_adjustment = ypp_advantage * 0.8  # Reduced: 1 YPP = 0.8 yards (was 1.6)
-        ypp_adjustment = np.clip(ypp_adjustment, -0.8, 0.8)  # Cap at ±0.8 yards
-        yards_adjustment += ypp_adjustment
-
-        # FIXED: Apply injury multipliers (OL starters out reduces run yards)
-        ol_run_mult = getattr(self.offense, 'injury_multipliers', {}).get('ol_run_mult', 1.0)
-        yards_adjustment = yards_adjustment * ol_run_mult
+        # Mean yards per carry: league average 4.8 adjusted for EPA differential,
+        # PFF run blocking, YPP advantage and OL injuries (precomputed per matchup)
+        avg_yards = self.matchup.run_avg
 
         # Sample yards from distribution
-        avg_yards = base_yards + yards_adjustment
-        yards = int(np.random.normal(avg_yards, 3.5))
+        yards = int(self.rng.normal(avg_yards, 3.5))
 
         # Clip to reasonable range
         yards = np.clip(yards, -5, 80)
@@ -603,9 +487,9 @@ class PlaySimulator:
         p_fumble_run = 0.50 * 0.010
         # USE TURNOVER REGRESSION FACTOR: Apply regression to fumble rate
         p_fumble_run = p_fumble_run * self.offense.turnover_regression_factor
-        fumble = np.random.random() < p_fumble_run
+        fumble = self.rng.random() < p_fumble_run
         if fumble:
-            fumble = np.random.random() < 0.50  # 50% recovery rate
+            fumble = self.rng.random() < 0.50  # 50% recovery rate
 
         result = {
             'type': 'run',
@@ -654,7 +538,7 @@ class PlaySimulator:
         make_prob = base_make_prob + fg_adjustment * 0.3  # Scale adjustment by 30%
         make_prob = np.clip(make_prob, 0.05, 0.98)  # Cap between 5-98%
 
-        made = np.random.random() < make_prob
+        made = self.rng.random() < make_prob
 
         return {
             'type': 'field_goal',
@@ -684,7 +568,7 @@ class PlaySimulator:
             net_yards = (100 - game_state.yardline) - 20
         else:
             # Use team's net average (includes return yards)
-            net_yards = int(np.random.normal(team_net, 5))
+            net_yards = int(self.rng.normal(team_net, 5))
             net_yards = np.clip(net_yards, 15, 60)
 
         return {
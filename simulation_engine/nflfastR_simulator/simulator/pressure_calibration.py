@@ -20,6 +20,11 @@ import math
 import pandas as pd
 import numpy as np
 
+try:
+    from .data_store import get_data_store
+except ImportError:
+    from data_store import get_data_store
+
 
 @dataclass
 class PressureConfig:
@@ -93,7 +98,7 @@ class PressureCalibrator:
                 val = alpha * x + (1 - alpha) * val
             return float(val)
         
-        for tm, g in d.groupby("team"):
+        for tm, g in d.groupby("team", observed=True):
             g = g.sort_values(["season", "week"])
             
             # Use last K weeks window up to 'week'
@@ -115,6 +120,14 @@ class PressureCalibrator:
             self.off_current[tm] = max(0.05, min(0.55, off))
             self.def_current[tm] = max(0.05, min(0.55, de))
     
+    def fit_from_file(self, path, season: int, week: int) -> None:
+        """
+        fit_from_weekly() on a pressure_rates_weekly.csv file.
+        
+        The file is parsed once per process through the shared data store.
+        """
+        self.fit_from_weekly(get_data_store().read_csv(path), season, week)
+    
     def pressure_prob(
         self,
         offense_team: str,
@@ -142,6 +155,75 @@ class PressureCalibrator:
         
         Rankings: lower is better line (e.g., 1 = best unit). If provided, used for mismatch.
         """
+        p = self.matchup_base(offense_team, defense_team, injuries=injuries,
+                              ol_rank=ol_rank, dl_rank=dl_rank)
+        return self.situational_prob(
+            p, down=down, ydstogo=ydstogo, quarter=quarter,
+            sec_left_in_quarter=sec_left_in_quarter, offense_trailing_by=offense_trailing_by,
+            half=half, play_action=play_action, shotgun=shotgun,
+        )
+    
+    def situational_prob(
+        self,
+        base: float,
+        *,
+        down: int,
+        ydstogo: int,
+        quarter: int,
+        sec_left_in_quarter: int,
+        offense_trailing_by: int,
+        half: int,
+        play_action: bool = False,
+        shotgun: bool = False,
+    ) -> float:
+        """
+        Apply situational multipliers and clamps to a matchup_base() value.
+        
+        Scalar counterpart of pressure_probs(); pressure_prob() is
+        matchup_base() followed by this.
+        """
+        p = base
+        
+        # 4) Situation multipliers
+        # Third and long
+        if down == 3 and ydstogo >= 7:
+            p *= self.cfg.third_long_mult
+        
+        # Trailing late in half (two-minute)
+        if sec_left_in_quarter <= 120 and quarter in (2, 4) and offense_trailing_by > 0:
+            p *= self.cfg.two_minute_trailing_mult
+        
+        # Trailing big after halftime
+        if half == 2 and offense_trailing_by >= 10:
+            p *= self.cfg.pass_commit_trail_10p_mult
+        
+        # Formation effects
+        if play_action:
+            p *= self.cfg.play_action_discount
+        
+        if shotgun:
+            p *= self.cfg.shotgun_uptick
+        
+        # Clamp
+        p = max(self.cfg.min_pressure, min(self.cfg.max_pressure, p))
+        
+        return float(p)
+    
+    def matchup_base(
+        self,
+        offense_team: str,
+        defense_team: str,
+        *,
+        injuries: Optional[Dict[str, Dict[str, int]]] = None,
+        ol_rank: Optional[int] = None,
+        dl_rank: Optional[int] = None,
+    ) -> float:
+        """
+        Pressure probability before situational multipliers.
+        
+        Depends only on the (offense, defense) pairing, so callers that
+        simulate many snaps of the same matchup can compute it once.
+        """
         # 1) Base from blended offense + defense
         off_base = self.off_current.get(offense_team, 0.21)
         def_base = self.def_current.get(defense_team, 0.21)
@@ -162,32 +244,45 @@ class PressureCalibrator:
             mismatch_mult *= (1.0 + self.cfg.injury_ol_per_starter_out * ol_out)
             mismatch_mult *= (1.0 + self.cfg.injury_dl_per_starter_out * dl_out)
         
-        p = base * mismatch_mult
+        return base * mismatch_mult
+    
+    def pressure_probs(
+        self,
+        base: np.ndarray,
+        *,
+        down: np.ndarray,
+        ydstogo: np.ndarray,
+        quarter: np.ndarray,
+        sec_left_in_quarter: np.ndarray,
+        offense_trailing_by: np.ndarray,
+        half: np.ndarray,
+        play_action: bool = False,
+        shotgun: bool = False,
+    ) -> np.ndarray:
+        """
+        Vectorized pressure_prob for many snaps at once.
+        
+        base: per-snap matchup_base() values (one per game in the batch).
+        Situation arrays must share base's shape.
+        """
+        p = np.asarray(base, dtype=np.float64).copy()
         
-        # 4) Situation multipliers
-        # Third and long
-        if down == 3 and ydstogo >= 7:
-            p *= self.cfg.third_long_mult
+        third_long = (down == 3) & (ydstogo >= 7)
+        p[third_long] *= self.cfg.third_long_mult
         
-        # Trailing late in half (two-minute)
-        if sec_left_in_quarter <= 120 and quarter in (2, 4) and offense_trailing_by > 0:
-            p *= self.cfg.two_minute_trailing_mult
+        two_minute = (sec_left_in_quarter <= 120) & ((quarter == 2) | (quarter == 4)) & (offense_trailing_by > 0)
+        p[two_minute] *= self.cfg.two_minute_trailing_mult
         
-        # Trailing big after halftime
-        if half == 2 and offense_trailing_by >= 10:
-            p *= self.cfg.pass_commit_trail_10p_mult
+        trailing_big = (half == 2) & (offense_trailing_by >= 10)
+        p[trailing_big] *= self.cfg.pass_commit_trail_10p_mult
         
-        # Formation effects
         if play_action:
             p *= self.cfg.play_action_discount
         
         if shotgun:
             p *= self.cfg.shotgun_uptick
         
-        # Clamp
-        p = max(self.cfg.min_pressure, min(self.cfg.max_pressure, p))
-        
-        return float(p)
+        return np.clip(p, self.cfg.min_pressure, self.cfg.max_pressure)
     
     def snapshot(self) -> pd.DataFrame:
         """Return current team baselines for quick inspection."""
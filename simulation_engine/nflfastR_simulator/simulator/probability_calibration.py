@@ -3,13 +3,22 @@ Probability Calibration: Convert raw simulator output to calibrated probabilitie
 
 Uses z-scores (normalized by simulator SD) as features and isotonic/Platt scaling
 for calibration. Completely separate from UI centering.
+
+Inference is array-in/array-out: calibrator.predict(sim_means, sim_sds,
+market_values) and calibrate_many() price a whole season in one call.
+A fitted calibrator reduces to a CompactCalibrator (isotonic breakpoints
+or Platt coefficients evaluated with np.interp / a sigmoid), which
+load_calibrators() reads from JSON without sklearn or unpickling.
+sklearn is only needed to fit.
 """
 
-import numpy as np
-from typing import Dict, Optional, Callable
-from sklearn.isotonic import IsotonicRegression
-from sklearn.linear_model import LogisticRegression
+import json
+import pickle
 import warnings
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 class PlattScaling:
@@ -20,7 +29,7 @@ class PlattScaling:
     """
 
     def __init__(self, regularization: float = 1e-6):
-        self.model: Optional[LogisticRegression] = None
+        self.model = None  # sklearn LogisticRegression once fitted
         self.is_fitted: bool = False
         self.regularization = regularization
 
@@ -32,6 +41,8 @@ class PlattScaling:
             z_scores: Normalized deltas (sim_mean - market) / sim_sd
             outcomes: Binary outcomes (1 = positive event, 0 = negative)
         """
+        from sklearn.linear_model import LogisticRegression
+
         z_scores = np.asarray(z_scores).reshape(-1, 1)
         outcomes = np.asarray(outcomes).astype(int)
 
@@ -70,11 +81,12 @@ class ProbabilityCalibrator:
         """
         self.method = method
         self.z_cap = z_cap
-        self.isotonic: Optional[IsotonicRegression] = None
+        self.isotonic = None  # sklearn IsotonicRegression
         self.platt: Optional[PlattScaling] = None
         self.is_fitted: bool = False
 
         if method == 'isotonic':
+            from sklearn.isotonic import IsotonicRegression
             self.isotonic = IsotonicRegression(out_of_bounds='clip')
         elif method == 'platt':
             self.platt = PlattScaling()
@@ -134,12 +146,39 @@ class ProbabilityCalibrator:
 
         return z_scores
 
+    def predict(self,
+                sim_means: np.ndarray,
+                sim_sds: np.ndarray,
+                market_values: np.ndarray) -> np.ndarray:
+        """
+        Calibrated probabilities for arrays of raw simulator output.
+        
+        Args:
+            sim_means: Raw simulator means
+            sim_sds: Raw simulator standard deviations
+            market_values: Market lines
+        
+        Returns:
+            Array of calibrated probabilities
+        """
+        z = self._calculate_z_scores(np.asarray(sim_means, dtype=float),
+                                     np.asarray(sim_sds, dtype=float),
+                                     np.asarray(market_values, dtype=float))
+        if not self.is_fitted:
+            # Fallback: simple sigmoid (rough approximation)
+            return _sigmoid(0.5 * z)
+        if self.method == 'isotonic':
+            prob = self.isotonic.predict(np.atleast_1d(z)).reshape(np.shape(z))
+        else:
+            prob = self.platt.predict_proba(np.atleast_1d(z)).reshape(np.shape(z))
+        return np.clip(prob, 0.0, 1.0)
+
     def predict_proba(self,
                      sim_mean: float,
                      sim_sd: float,
                      market_value: float) -> float:
         """
-        Predict calibrated probability from raw simulator output.
+        Predict calibrated probability for one game (see predict for arrays).
         
         Args:
             sim_mean: Raw simulator mean
@@ -149,28 +188,167 @@ class ProbabilityCalibrator:
         Returns:
             Calibrated probability
         """
-        if not self.is_fitted:
-            # Fallback: simple sigmoid
-            delta = sim_mean - market_value
-            sim_sd = max(sim_sd, 1e-6)
-            z = np.clip(delta / sim_sd, -self.z_cap, self.z_cap)
-            prob = 1.0 / (1.0 + np.exp(-0.5 * z))  # Rough approximation
-            return float(prob)
-
-        # Calculate z-score
-        z = self._calculate_z_scores(
-            np.array([sim_mean]),
-            np.array([sim_sd]),
-            np.array([market_value])
-        )[0]
-
-        # Predict probability
-        if self.method == 'isotonic':
-            prob = self.isotonic.predict([z])[0]
+        return float(self.predict([sim_mean], [sim_sd], [market_value])[0])
+
+    def to_compact(self) -> 'CompactCalibrator':
+        """sklearn-free copy of the fitted curve."""
+        return CompactCalibrator.from_calibrator(self)
+
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+class CompactCalibrator:
+    """
+    A fitted calibrator reduced to its curve over capped z-scores.
+    
+    kind='isotonic': piecewise-linear through (x, y) breakpoints, flat
+    beyond the ends (IsotonicRegression with out_of_bounds='clip').
+    kind='logistic': sigmoid(coef * z + intercept) (Platt scaling, and the
+    unfitted fallback with coef=0.5).
+    
+    Predictions match the source calibrator; they are clipped to clip.
+    """
+
+    is_fitted = True
+
+    def __init__(self, kind: str, z_cap: float = 3.0,
+                 x: Optional[Sequence[float]] = None, y: Optional[Sequence[float]] = None,
+                 coef: float = 0.5, intercept: float = 0.0,
+                 clip: Tuple[float, float] = (0.0, 1.0)):
+        if kind not in ('isotonic', 'logistic'):
+            raise ValueError(f"Unknown kind: {kind}")
+        self.kind = kind
+        self.z_cap = float(z_cap)
+        self.x = None if x is None else np.asarray(x, dtype=float)
+        self.y = None if y is None else np.asarray(y, dtype=float)
+        self.coef = float(coef)
+        self.intercept = float(intercept)
+        self.clip = (float(clip[0]), float(clip[1]))
+
+    def predict_z(self, z: np.ndarray) -> np.ndarray:
+        """Probabilities for already-capped z-scores."""
+        if self.kind == 'isotonic':
+            prob = np.interp(z, self.x, self.y)
         else:
-            prob = self.platt.predict_proba(np.array([z]))[0]
+            prob = _sigmoid(self.coef * np.asarray(z, dtype=float) + self.intercept)
+        return np.clip(prob, *self.clip)
+
+    def predict(self,
+                sim_means: np.ndarray,
+                sim_sds: np.ndarray,
+                market_values: np.ndarray) -> np.ndarray:
+        """Calibrated probabilities for arrays of raw simulator output."""
+        z = calculate_z_scores(np.asarray(sim_means, dtype=float), np.asarray(sim_sds, dtype=float),
+                               np.asarray(market_values, dtype=float), self.z_cap)
+        return self.predict_z(z)
+
+    def predict_proba(self, sim_mean: float, sim_sd: float, market_value: float) -> float:
+        return float(self.predict([sim_mean], [sim_sd], [market_value])[0])
+
+    @classmethod
+    def from_calibrator(cls, calibrator) -> 'CompactCalibrator':
+        """
+        Convert a ProbabilityCalibrator or a global isotonic
+        AdvancedProbabilityCalibrator (scripts/improve_calibration.py).
+        
+        Raises:
+            ValueError: For regime-split or spline calibrators
+        """
+        if isinstance(calibrator, cls):
+            return calibrator
+        z_cap = getattr(calibrator, 'z_cap', 3.0)
+
+        if hasattr(calibrator, 'calibrators'):
+            # AdvancedProbabilityCalibrator: predictions clipped to [0.01, 0.99]
+            if calibrator.method != 'isotonic' or set(calibrator.calibrators) != {'global'}:
+                raise ValueError("Only global isotonic calibrators have a compact form")
+            iso = calibrator.calibrators['global']
+            return cls('isotonic', z_cap, iso.X_thresholds_, iso.y_thresholds_, clip=(0.01, 0.99))
+
+        if not calibrator.is_fitted:
+            return cls('logistic', z_cap, coef=0.5, intercept=0.0)
+        if calibrator.method == 'isotonic':
+            iso = calibrator.isotonic
+            return cls('isotonic', z_cap, iso.X_thresholds_, iso.y_thresholds_)
+        model = calibrator.platt.model
+        return cls('logistic', z_cap, coef=model.coef_[0, 0], intercept=model.intercept_[0])
+
+    def to_dict(self) -> Dict:
+        out = {'kind': self.kind, 'z_cap': self.z_cap, 'clip': list(self.clip)}
+        if self.kind == 'isotonic':
+            out.update(x=self.x.tolist(), y=self.y.tolist())
+        else:
+            out.update(coef=self.coef, intercept=self.intercept)
+        return out
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CompactCalibrator':
+        return cls(data['kind'], data.get('z_cap', 3.0), data.get('x'), data.get('y'),
+                   data.get('coef', 0.5), data.get('intercept', 0.0), tuple(data.get('clip', (0.0, 1.0))))
+
+
+def save_compact_calibrators(calibrators: Dict, path: Path):
+    """Write {name: calibrator} as compact JSON (e.g. next to isotonic_calibrators.pkl); metadata entries are skipped."""
+    data = {name: CompactCalibrator.from_calibrator(cal).to_dict()
+            for name, cal in calibrators.items() if hasattr(cal, 'is_fitted')}
+    path = Path(path)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(json.dumps(data))
+    tmp.replace(path)
+
 
-        return float(np.clip(prob, 0.0, 1.0))
+_loaded: Dict[str, Tuple[float, Dict]] = {}
+
+
+def load_calibrators(path: Path) -> Dict[str, CompactCalibrator]:
+    """
+    Load {name: CompactCalibrator} for a calibrator pickle.
+    
+    Reads the compact JSON beside path (path with .json suffix) when it is
+    at least as new as the pickle; otherwise unpickles, converts and
+    rewrites the JSON so the next load skips sklearn. Results are cached
+    per process until the file changes. Calibrators without a compact
+    form are returned as unpickled; non-calibrator entries are dropped.
+    
+    Returns:
+        Dict (empty if neither file exists)
+    """
+    path = Path(path)
+    compact = path.with_suffix('.json')
+    pkl_mtime = path.stat().st_mtime if path.exists() else None
+    json_mtime = compact.stat().st_mtime if compact.exists() else None
+    if pkl_mtime is None and json_mtime is None:
+        return {}
+
+    use_json = json_mtime is not None and (pkl_mtime is None or json_mtime >= pkl_mtime)
+    source, mtime = (compact, json_mtime) if use_json else (path, pkl_mtime)
+    cached = _loaded.get(str(source))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    if use_json:
+        calibrators = {name: CompactCalibrator.from_dict(d)
+                       for name, d in json.loads(compact.read_text()).items()}
+    else:
+        with open(path, 'rb') as f:
+            raw = pickle.load(f)
+        calibrators = {}
+        for name, cal in raw.items():
+            if not hasattr(cal, 'is_fitted'):
+                continue  # metadata such as 'trained_on'
+            try:
+                calibrators[name] = CompactCalibrator.from_calibrator(cal)
+            except (ValueError, AttributeError):
+                calibrators[name] = cal
+        if all(isinstance(c, CompactCalibrator) for c in calibrators.values()):
+            try:
+                save_compact_calibrators(calibrators, compact)
+            except OSError:
+                pass
+    _loaded[str(source)] = (mtime, calibrators)
+    return calibrators
 
 
 class AdaptiveEnsemble:
@@ -185,30 +363,30 @@ class AdaptiveEnsemble:
     def __init__(self, alpha_fn: Optional[Callable[[float], float]] = None):
         """
         Args:
-            alpha_fn: Function mapping |z| to α. Default: linear from 0.6 to 0.9
+            alpha_fn: Function mapping |z| to α (scalar or array). Default: linear from 0.6 to 0.9
         """
         if alpha_fn is None:
             # Default: α = 0.6 + 0.3 * min(|z| / 2.0, 1.0)
             # At |z|=0: α=0.6, at |z|≥2: α=0.9
-            alpha_fn = lambda z: 0.6 + 0.3 * min(abs(z) / 2.0, 1.0)
+            alpha_fn = lambda z: 0.6 + 0.3 * np.minimum(np.abs(z) / 2.0, 1.0)
 
         self.alpha_fn = alpha_fn
         self.neutral_prob = 0.50  # NOT 0.524!
 
-    def blend(self, model_prob: float, z_score: float) -> float:
+    def blend(self, model_prob, z_score):
         """
         Blend model probability with neutral baseline.
         
         Args:
-            model_prob: Calibrated model probability
+            model_prob: Calibrated model probability (scalar or array)
             z_score: Z-score (for adaptive α)
         
         Returns:
-            Blended probability
+            Blended probability (float for scalar input)
         """
         alpha = self.alpha_fn(z_score)
-        blended = alpha * model_prob + (1 - alpha) * self.neutral_prob
-        return float(np.clip(blended, 0.0, 1.0))
+        blended = np.clip(alpha * np.asarray(model_prob) + (1 - alpha) * self.neutral_prob, 0.0, 1.0)
+        return float(blended) if np.ndim(blended) == 0 else blended
 
 
 def calculate_z_scores(sim_means: np.ndarray,
@@ -234,6 +412,38 @@ def calculate_z_scores(sim_means: np.ndarray,
     return z_scores
 
 
+def calibrate_many(sim_means: np.ndarray,
+                   sim_sds: np.ndarray,
+                   market_values: np.ndarray,
+                   calibrator=None,
+                   ensemble: Optional[AdaptiveEnsemble] = None) -> np.ndarray:
+    """
+    Calibrated P(sim > market) for arrays of games (spreads or totals).
+    
+    Args:
+        sim_means, sim_sds, market_values: Raw simulator means/SDs and lines
+        calibrator: Fitted ProbabilityCalibrator / CompactCalibrator (or None)
+        ensemble: Optional AdaptiveEnsemble
+    
+    Returns:
+        Array of probabilities
+    """
+    sim_means = np.asarray(sim_means, dtype=float)
+    sim_sds = np.asarray(sim_sds, dtype=float)
+    market_values = np.asarray(market_values, dtype=float)
+    z = calculate_z_scores(sim_means, sim_sds, market_values)
+
+    if calibrator is not None and calibrator.is_fitted:
+        prob = np.asarray(calibrator.predict(sim_means, sim_sds, market_values), dtype=float)
+    else:
+        # Fallback: simple sigmoid
+        prob = _sigmoid(0.5 * z)
+
+    if ensemble:
+        prob = np.asarray(ensemble.blend(prob, z))
+    return prob
+
+
 def calibrate_probabilities(raw_spread_mean: float,
                            raw_spread_sd: float,
                            market_spread: float,
@@ -254,25 +464,13 @@ def calibrate_probabilities(raw_spread_mean: float,
     Returns:
         Dict with calibrated probabilities
     """
-    # Calculate z-score
     z_spread = calculate_z_scores(
         np.array([raw_spread_mean]),
         np.array([raw_spread_sd]),
         np.array([market_spread])
     )[0]
-
-    # Get calibrated probability
-    if spread_calibrator and spread_calibrator.is_fitted:
-        p_home_cover = spread_calibrator.predict_proba(
-            raw_spread_mean, raw_spread_sd, market_spread
-        )
-    else:
-        # Fallback: simple sigmoid
-        p_home_cover = 1.0 / (1.0 + np.exp(-0.5 * z_spread))
-
-    # Optional ensemble blending
-    if ensemble:
-        p_home_cover = ensemble.blend(p_home_cover, z_spread)
+    p_home_cover = calibrate_many([raw_spread_mean], [raw_spread_sd], [market_spread],
+                                  spread_calibrator, ensemble)[0]
 
     p_away_cover = 1.0 - p_home_cover
 
@@ -306,25 +504,13 @@ def calibrate_total_probabilities(raw_total_mean: float,
     Returns:
         Dict with calibrated probabilities
     """
-    # Calculate z-score
     z_total = calculate_z_scores(
         np.array([raw_total_mean]),
         np.array([raw_total_sd]),
         np.array([market_total])
     )[0]
-
-    # Get calibrated probability
-    if total_calibrator and total_calibrator.is_fitted:
-        p_over = total_calibrator.predict_proba(
-            raw_total_mean, raw_total_sd, market_total
-        )
-    else:
-        # Fallback: simple sigmoid
-        p_over = 1.0 / (1.0 + np.exp(-0.5 * z_total))
-
-    # Optional ensemble blending
-    if ensemble:
-        p_over = ensemble.blend(p_over, z_total)
+    p_over = calibrate_many([raw_total_mean], [raw_total_sd], [market_total],
+                            total_calibrator, ensemble)[0]
 
     p_under = 1.0 - p_over
 
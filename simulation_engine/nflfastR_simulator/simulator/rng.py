@@ -0,0 +1,40 @@
+"""
+Random streams for the simulators.
+
+GameSimulator and PlaySimulator draw from an injected numpy Generator
+instead of the global np.random state. Monte Carlo runs give every trial
+its own child of one SeedSequence, so trial i's stream depends only on
+(seed, i): results are bit-reproducible whether the trials run in one
+loop or are split across worker processes/threads, and no trial reseeds
+global state.
+
+    for rng in trial_rngs(seed, n_sims):
+        result = sim.simulate_game(rng=rng)
+
+    # Worker k of n_workers runs the same trials as the serial loop
+    rngs = trial_rngs(seed, n_sims)[k::n_workers]
+"""
+
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+SeedLike = Optional[Union[int, Sequence[int], np.random.SeedSequence]]
+
+
+def seed_sequence(seed: SeedLike = None) -> np.random.SeedSequence:
+    """SeedSequence for an int (or int sequence) seed; None = fresh OS entropy."""
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def trial_rngs(seed: SeedLike, n: int) -> List[np.random.Generator]:
+    """
+    One independent Generator per trial, spawned from seed.
+
+    With an int (or None) seed the children are always the first n spawns,
+    so the same seed gives the same streams. Passing a SeedSequence
+    continues its spawn counter instead (fresh trials on every call).
+    """
+    return [np.random.default_rng(child) for child in seed_sequence(seed).spawn(n)]
@@ -0,0 +1,196 @@
+"""
+ScoreHistogram: Compact joint (home, away) score distribution of a simulated game.
+
+Backtests and predictions used to reduce each Monte Carlo run to a few
+scalars (p_home_cover, p_over, means/SDs), so any other market needed a
+re-simulation. A ScoreHistogram keeps the sparse joint count matrix
+(a few hundred distinct score pairs even for 10k+ trials), which prices
+any spread, alt line, teaser leg, total, team total or same-game
+combination exactly:
+
+    hist = ScoreHistogram.from_scores(home_scores, away_scores)
+    home_cover, push, away_cover = hist.spread_probs(3.5)          # home - away > 3.5
+    over, push, under = hist.total_probs([44.5, 45.5, 46.5])       # alt totals at once
+    p_sgp = hist.prob(lambda h, a: (h - a > 3.5) & (h + a > 45.5))
+
+Lines follow the simulator's convention: spread_line is home - away
+(positive = home favored). HistogramStore persists histograms per
+(model version, game_id) so later pricing never re-simulates.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class ScoreHistogram:
+    """Sparse joint counts of (home_score, away_score)."""
+
+    __slots__ = ('home', 'away', 'count')
+
+    def __init__(self, home: np.ndarray, away: np.ndarray, count: np.ndarray):
+        """
+        Args:
+            home, away: Distinct score pairs (int)
+            count: Trials that ended with each pair
+        """
+        self.home = np.asarray(home, dtype=np.int16)
+        self.away = np.asarray(away, dtype=np.int16)
+        self.count = np.asarray(count, dtype=np.int32)
+
+    @classmethod
+    def from_scores(cls, home_scores, away_scores) -> 'ScoreHistogram':
+        """Histogram of per-trial final scores."""
+        pairs = np.stack([np.rint(home_scores), np.rint(away_scores)], axis=1).astype(np.int16)
+        unique, count = np.unique(pairs, axis=0, return_counts=True)
+        return cls(unique[:, 0], unique[:, 1], count)
+
+    @property
+    def n(self) -> int:
+        """Number of simulated trials."""
+        return int(self.count.sum())
+
+    def dense(self) -> np.ndarray:
+        """(max_home + 1, max_away + 1) count matrix."""
+        matrix = np.zeros((int(self.home.max()) + 1, int(self.away.max()) + 1), dtype=np.int64)
+        np.add.at(matrix, (self.home, self.away), self.count)
+        return matrix
+
+    def scores(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Expand back to per-trial (home, away) arrays (trial order is not kept)."""
+        return (np.repeat(self.home, self.count).astype(float),
+                np.repeat(self.away, self.count).astype(float))
+
+    # ------------------------------------------------------------------
+    # Pricing
+    # ------------------------------------------------------------------
+
+    def prob(self, event: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> float:
+        """P(event) for a vectorized predicate over (home, away) score arrays."""
+        mask = np.asarray(event(self.home.astype(float), self.away.astype(float)), dtype=bool)
+        return float(self.count[mask].sum() / self.n)
+
+    def _three_way(self, values: np.ndarray, lines):
+        """(P(value > line), P(push), P(value < line)) for scalar or array lines."""
+        lines = np.asarray(lines, dtype=float)
+        diff = values[:, None].astype(float) - np.atleast_1d(lines)[None, :]
+        weights = self.count[:, None] / self.n
+        above = (weights * (diff > 0)).sum(axis=0)
+        push = (weights * (diff == 0)).sum(axis=0)
+        below = 1.0 - above - push
+        if lines.ndim == 0:
+            return float(above[0]), float(push[0]), float(below[0])
+        return above, push, below
+
+    def spread_probs(self, spread_line):
+        """(home covers, push, away covers) for home - away vs spread_line (scalar or array)."""
+        return self._three_way(self.home.astype(np.int32) - self.away, spread_line)
+
+    def total_probs(self, total_line):
+        """(over, push, under) for total_line (scalar or array)."""
+        return self._three_way(self.home.astype(np.int32) + self.away, total_line)
+
+    def team_total_probs(self, team: str, line):
+        """(over, push, under) for the 'home' or 'away' team total."""
+        return self._three_way(self.home if team == 'home' else self.away, line)
+
+    def moneyline_probs(self) -> Tuple[float, float, float]:
+        """(home win, tie, away win)."""
+        return self.spread_probs(0.0)
+
+    def teaser_probs(self, spread_line: float, points: float, side: str = 'home'):
+        """Spread probabilities after teasing side's line by points (e.g. 6)."""
+        line = spread_line - points if side == 'home' else spread_line + points
+        return self.spread_probs(line)
+
+    def joint_probs(self, spread_line: float, total_line: float) -> Dict[str, float]:
+        """Same-game spread x total outcome probabilities (pushes excluded from each cell)."""
+        margin = self.home.astype(float) - self.away
+        total = self.home.astype(float) + self.away
+        out = {}
+        for side, s_mask in (('home', margin > spread_line), ('away', margin < spread_line)):
+            for ou, t_mask in (('over', total > total_line), ('under', total < total_line)):
+                out[f'{side}_{ou}'] = float(self.count[s_mask & t_mask].sum() / self.n)
+        return out
+
+    def moments(self) -> Dict[str, float]:
+        """Means and SDs of home, away, spread (home - away) and total."""
+        w = self.count / self.n
+        out = {}
+        for name, values in (('home', self.home.astype(float)), ('away', self.away.astype(float)),
+                             ('spread', self.home.astype(float) - self.away),
+                             ('total', self.home.astype(float) + self.away)):
+            mean = float(w @ values)
+            out[f'{name}_mean'] = mean
+            out[f'{name}_sd'] = float(np.sqrt(w @ (values - mean) ** 2))
+        return out
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict:
+        return {'home': self.home.tolist(), 'away': self.away.tolist(), 'count': self.count.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ScoreHistogram':
+        return cls(data['home'], data['away'], data['count'])
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, ScoreHistogram) and np.array_equal(self.home, other.home)
+                and np.array_equal(self.away, other.away) and np.array_equal(self.count, other.count))
+
+
+def model_version(config: Dict, source_dir: Optional[Path] = None) -> str:
+    """
+    Short hash of a run config plus the simulator source.
+
+    Any change to the model code or to the settings in config (n_sims,
+    seed, calibration flags, ...) gives a new version, so stored
+    histograms never mix models.
+    """
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode())
+    source_dir = Path(source_dir or Path(__file__).parent)
+    for path in sorted(source_dir.glob('*.py')):
+        if not path.name.startswith('test_'):
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+class HistogramStore:
+    """On-disk ScoreHistograms, one small .npz per (model version, game_id)."""
+
+    def __init__(self, root: Path, version: str):
+        """
+        Args:
+            root: Store directory (histograms go in root/version/)
+            version: Model version (see model_version)
+        """
+        self.version = version
+        self.dir = Path(root) / version
+
+    def path(self, game_id: str) -> Path:
+        return self.dir / f"{game_id}.npz"
+
+    def put(self, game_id: str, hist: ScoreHistogram):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.dir / f".{game_id}.tmp.npz"
+        np.savez_compressed(tmp, home=hist.home, away=hist.away, count=hist.count)
+        tmp.replace(self.path(game_id))
+
+    def get(self, game_id: str) -> Optional[ScoreHistogram]:
+        path = self.path(game_id)
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            return ScoreHistogram(data['home'], data['away'], data['count'])
+
+    def __contains__(self, game_id: str) -> bool:
+        return self.path(game_id).exists()
+
+    def game_ids(self):
+        return sorted(p.stem for p in self.dir.glob('*.npz') if not p.name.startswith('.'))
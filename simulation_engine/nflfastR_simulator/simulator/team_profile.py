@@ -9,14 +9,42 @@ Per strategy doc:
 - (Phase 2: PFF OL/DL grades)
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Dict
 
 try:
     from .pff_loader import get_pff_loader
+    from .data_store import get_data_store
+    from .game_state import DISTANCE_BUCKETS, SCORE_DIFF_BUCKETS, TIME_BUCKETS
 except ImportError:
     from pff_loader import get_pff_loader
+    from data_store import get_data_store
+    from game_state import DISTANCE_BUCKETS, SCORE_DIFF_BUCKETS, TIME_BUCKETS
+
+
+# Provenance codes for pass_rate_source, in get_pass_rate() cascade order
+PASS_RATE_SOURCES = ('exact', 'no_time', 'down_score', 'down', 'prev_season', 'league', 'default')
+PASS_RATE_PREV_SEASON = PASS_RATE_SOURCES.index('prev_season')
+
+_PASS_RATE_FALLBACK_NOTES = {
+    PASS_RATE_SOURCES.index('prev_season'): "Play-calling: Used {prev_season} season data for down={down}",
+    PASS_RATE_SOURCES.index('league'): "Play-calling: Used league average for down={down}",
+    PASS_RATE_SOURCES.index('default'): "Play-calling: Used hardcoded default for down={down}",
+}
+
+# Hardcoded last-resort pass rates by down (only used if no data exists anywhere)
+DEFAULT_PASS_RATES = {
+    1: 0.51,  # ~51% pass on 1st down
+    2: 0.50,  # ~50% pass on 2nd down
+    3: 0.68,  # ~68% pass on 3rd down
+    4: 0.70,  # ~70% pass on 4th down (often go for it)
+}
+
+_DISTANCE_INDEX = {b: i for i, b in enumerate(DISTANCE_BUCKETS)}
+_SCORE_DIFF_INDEX = {b: i for i, b in enumerate(SCORE_DIFF_BUCKETS)}
+_TIME_INDEX = {b: i for i, b in enumerate(TIME_BUCKETS)}
 
 
 class TeamProfile:
@@ -48,6 +76,7 @@ class TeamProfile:
         self.off_epa, self.def_epa = self._load_epa()
         self.qb_name, self.qb_stats = self._load_qb_stats()
         self.playcalling = self._load_playcalling()
+        self._build_pass_rate_table()
         self.drive_probs = self._load_drive_probs()
         self.pace = self._load_pace()
 
@@ -85,7 +114,7 @@ class TeamProfile:
             print("⚠️  Warning: EPA file not found, using league average")
             return 0.0, 0.0
 
-        epa_df = pd.read_csv(epa_file)
+        epa_df = self._store.read_csv(epa_file)
 
         # Team abbreviation mapping (schedule uses "LA" but data might use "LAR")
         team_map = {'LA': 'LAR'}
@@ -95,10 +124,7 @@ class TeamProfile:
         # For week N, aggregate weeks 1 through N-1
         if self.week == 1:
             # Week 1: Fall back to season average
-            team_epa = epa_df[
-                (epa_df['team'] == lookup_team) &
-                (epa_df['season'] == self.season)
-            ]
+            team_epa = self._store.rows(epa_df, team=lookup_team, season=self.season)
 
             if len(team_epa) == 0:
                 print(f"⚠️  Warning: No EPA data for {self.team} {self.season} W{self.week}")
@@ -108,21 +134,14 @@ class TeamProfile:
             def_epa = float(team_epa['def_epa_per_play'].mean())
         else:
             # Aggregate prior weeks only
-            prior_weeks = epa_df[
-                (epa_df['team'] == lookup_team) &
-                (epa_df['season'] == self.season) &
-                (epa_df['week'] < self.week)  # KEY: Only prior weeks
-            ]
-            if len(prior_weeks) > 0:
-                # Aggregate prior weeks
-                off_epa = float(prior_weeks['off_epa_per_play'].mean())
-                def_epa = float(prior_weeks['def_epa_per_play'].mean())
+            prior = self._prior_mean(epa_df, ['off_epa_per_play', 'def_epa_per_play'],
+                                     team=lookup_team, team_col='team', prev_season=False)  # KEY: Only prior weeks
+            if prior is not None:
+                off_epa = prior['off_epa_per_play']
+                def_epa = prior['def_epa_per_play']
             else:
                 # Fall back to season average if no prior weeks
-                team_epa = epa_df[
-                    (epa_df['team'] == lookup_team) &
-                    (epa_df['season'] == self.season)
-                ]
+                team_epa = self._store.rows(epa_df, team=lookup_team, season=self.season)
 
                 if len(team_epa) == 0:
                     print(f"⚠️  Warning: No EPA data for {self.team} {self.season} W{self.week}")
@@ -146,14 +165,10 @@ class TeamProfile:
         weekly_qb_file = self.data_dir / "qb_stats_weekly.csv"
 
         if weekly_qb_file.exists():
-            qb_df = pd.read_csv(weekly_qb_file)
+            qb_df = self._store.read_csv(weekly_qb_file)
 
             # Find QB for this team/week
-            qb_data = qb_df[
-                (qb_df['team'] == self.team) &
-                (qb_df['season'] == self.season) &
-                (qb_df['week'] == self.week)
-            ]
+            qb_data = self._store.rows(qb_df, team=self.team, season=self.season, week=self.week)
 
             if len(qb_data) > 0:
                 qb_row = qb_data.iloc[0]
@@ -219,6 +234,26 @@ class TeamProfile:
             }
         }
 
+    @property
+    def _store(self):
+        """Shared per-process CSV cache (not stored on the instance, so profiles pickle small)."""
+        return get_data_store()
+
+    def _prior_mean(self, df: pd.DataFrame, cols, team: Optional[str] = None, team_col: str = 'posteam',
+                    prev_season: bool = True, clip: Optional[Dict] = None) -> Optional[Dict[str, float]]:
+        """
+        Mean of cols over the team's weeks before self.week (as-of lookup, no look-ahead).
+
+        Falls back to the previous season's weeks before self.week when the
+        current season has none. Returns None if neither has prior rows.
+        """
+        table = self._store.asof(df, team_col)
+        team = team or self._get_lookup_team()
+        means = table.prior_mean(team, self.season, self.week, cols, clip=clip)
+        if means is None and prev_season:
+            means = table.prior_mean(team, self.season - 1, self.week, cols, clip=clip)
+        return means
+
     def _get_lookup_team(self) -> str:
         """
         Get the team abbreviation to use for data lookup.
@@ -238,7 +273,7 @@ class TeamProfile:
         if not season_file.exists():
             raise ValueError(f"Play-calling file not found: {season_file}. Run preprocessing/extract_playcalling.py first.")
 
-        playcalling_df = pd.read_csv(season_file)
+        playcalling_df = self._store.read_csv(season_file)
         
         # Store full dataframe for fallback lookups (used in get_pass_rate)
         self._playcalling_df = playcalling_df
@@ -247,25 +282,19 @@ class TeamProfile:
         lookup_team = self._get_lookup_team()
 
         # Get team's tendencies for this season
-        team_playcalling = playcalling_df[
-            (playcalling_df['posteam'] == lookup_team) &
-            (playcalling_df['season'] == self.season)
-        ]
+        team_playcalling = self._store.rows(playcalling_df, posteam=lookup_team, season=self.season)
 
         # Always supplement with weekly data to ensure complete coverage
         # (Season data may have gaps due to 20+ play requirement)
         weekly_file = self.data_dir / "playcalling_tendencies_weekly.csv"
         if weekly_file.exists():
-            weekly_df = pd.read_csv(weekly_file)
-            weekly_team = weekly_df[
-                (weekly_df['posteam'] == lookup_team) &
-                (weekly_df['season'] == self.season)
-            ]
+            weekly_df = self._store.read_csv(weekly_file)
+            weekly_team = self._store.rows(weekly_df, posteam=lookup_team, season=self.season)
             if len(weekly_team) > 0:
                 # Aggregate weekly data to season-level
                 weekly_agg = weekly_team.groupby([
                     'down', 'distance_bucket', 'score_diff_bucket', 'time_bucket'
-                ]).agg({
+                ], observed=True).agg({
                     'pass_count': 'sum',
                     'run_count': 'sum',
                     'total_plays': 'sum'
@@ -290,10 +319,7 @@ class TeamProfile:
         if len(team_playcalling) == 0:
             # Fallback: try previous season's data if current season not available
             prev_season = self.season - 1
-            team_playcalling = playcalling_df[
-                (playcalling_df['posteam'] == lookup_team) &
-                (playcalling_df['season'] == prev_season)
-            ]
+            team_playcalling = self._store.rows(playcalling_df, posteam=lookup_team, season=prev_season)
             
             if len(team_playcalling) > 0:
                 # Update season to current for consistency
@@ -317,21 +343,15 @@ class TeamProfile:
             print("⚠️  Warning: Drive probs file not found, using league average")
             return self._get_league_average_drive_probs()
 
-        drive_df = pd.read_csv(season_file)
+        drive_df = self._store.read_csv(season_file)
 
         # Get team's drive probs
-        team_drives = drive_df[
-            (drive_df['posteam'] == lookup_team) &
-            (drive_df['season'] == self.season)
-        ]
+        team_drives = self._store.rows(drive_df, posteam=lookup_team, season=self.season)
         
         # Fallback to previous season
         if len(team_drives) == 0:
             prev_season = self.season - 1
-            team_drives = drive_df[
-                (drive_df['posteam'] == lookup_team) &
-                (drive_df['season'] == prev_season)
-            ]
+            team_drives = self._store.rows(drive_df, posteam=lookup_team, season=prev_season)
             if len(team_drives) > 0:
                 print(f"⚠️  Warning: No drive data for {self.team} {self.season}, using {prev_season}")
             else:
@@ -346,7 +366,7 @@ class TeamProfile:
         league_file = self.data_dir / "drive_probabilities_league.csv"
 
         if league_file.exists():
-            return pd.read_csv(league_file)
+            return self._store.read_csv(league_file).copy()
 
         # Hardcoded fallback
         return pd.DataFrame({
@@ -365,23 +385,17 @@ class TeamProfile:
         if not pace_file.exists():
             return 6.6  # League average
 
-        pace_df = pd.read_csv(pace_file)
+        pace_df = self._store.read_csv(pace_file)
 
         # CRITICAL: Use only PRIOR weeks (exclude current week)
         if self.week == 1:
             # Week 1: Fall back to season average
-            team_pace = pace_df[
-                (pace_df['posteam'] == lookup_team) &
-                (pace_df['season'] == self.season)
-            ]
+            team_pace = self._store.rows(pace_df, posteam=lookup_team, season=self.season)
             
             # Fallback to previous season
             if len(team_pace) == 0:
                 prev_season = self.season - 1
-                team_pace = pace_df[
-                    (pace_df['posteam'] == lookup_team) &
-                    (pace_df['season'] == prev_season)
-                ]
+                team_pace = self._store.rows(pace_df, posteam=lookup_team, season=prev_season)
 
             if len(team_pace) == 0:
                 return 6.6  # League average
@@ -389,36 +403,18 @@ class TeamProfile:
             return float(team_pace['avg_plays_per_drive'].mean())
         else:
             # Aggregate prior weeks only
-            prior_weeks = pace_df[
-                (pace_df['posteam'] == lookup_team) &
-                (pace_df['season'] == self.season) &
-                (pace_df['week'] < self.week)  # Only prior weeks
-            ]
-            # Fallback to previous season
-            if len(prior_weeks) == 0:
-                prev_season = self.season - 1
-                prior_weeks = pace_df[
-                    (pace_df['posteam'] == lookup_team) &
-                    (pace_df['season'] == prev_season) &
-                    (pace_df['week'] < self.week)
-                ]
-            
-            if len(prior_weeks) > 0:
-                return float(prior_weeks['avg_plays_per_drive'].mean())
+            # (falls back to the previous season's prior weeks)
+            prior = self._prior_mean(pace_df, ['avg_plays_per_drive'])  # Only prior weeks
+            if prior is not None:
+                return prior['avg_plays_per_drive']
             else:
                 # Fall back to season average if no prior weeks
-                team_pace = pace_df[
-                    (pace_df['posteam'] == lookup_team) &
-                    (pace_df['season'] == self.season)
-                ]
+                team_pace = self._store.rows(pace_df, posteam=lookup_team, season=self.season)
                 
                 # Fallback to previous season
                 if len(team_pace) == 0:
                     prev_season = self.season - 1
-                    team_pace = pace_df[
-                        (pace_df['posteam'] == lookup_team) &
-                        (pace_df['season'] == prev_season)
-                    ]
+                    team_pace = self._store.rows(pace_df, posteam=lookup_team, season=prev_season)
 
                 if len(team_pace) == 0:
                     return 6.6  # League average
@@ -442,10 +438,60 @@ class TeamProfile:
         weighted_pass_rate = (self.playcalling['pass_count'].sum() / total_plays)
         return float(weighted_pass_rate)
 
+    def _build_pass_rate_table(self):
+        """
+        Resolve the get_pass_rate() fallback cascade once for every situation.
+
+        Fills self.pass_rate_table (down, distance, score, time buckets, indexed
+        in GameState bucket order) and self.pass_rate_source with the
+        PASS_RATE_SOURCES code of the cascade level that produced each cell.
+        """
+        keys = ['down', 'distance_bucket', 'score_diff_bucket', 'time_bucket']
+        pc = self.playcalling
+        exact = pc.drop_duplicates(subset=keys, keep='first').set_index(keys)['pass_rate'].to_dict()
+        no_time = pc.groupby(keys[:3], observed=True)['pass_rate'].mean().to_dict()
+        down_score = pc.groupby(['down', 'score_diff_bucket'], observed=True)['pass_rate'].mean().to_dict()
+        by_down = pc.groupby('down')['pass_rate'].mean().to_dict()
+
+        prev_by_down = {}
+        league_by_down = {}
+        if hasattr(self, '_playcalling_df'):
+            if self.season > 2022:
+                prev = self._store.rows(self._playcalling_df, posteam=self._get_lookup_team(),
+                                        season=self.season - 1)
+                prev_by_down = prev.groupby('down')['pass_rate'].mean().to_dict()
+            league_by_down = self._playcalling_df.groupby('down')['pass_rate'].mean().to_dict()
+
+        shape = (4, len(DISTANCE_BUCKETS), len(SCORE_DIFF_BUCKETS), len(TIME_BUCKETS))
+        self.pass_rate_table = np.empty(shape)
+        self.pass_rate_source = np.empty(shape, dtype=np.int8)
+
+        for d in range(1, 5):
+            for i, dist in enumerate(DISTANCE_BUCKETS):
+                for j, score in enumerate(SCORE_DIFF_BUCKETS):
+                    for k, tb in enumerate(TIME_BUCKETS):
+                        for source, value in enumerate((
+                            exact.get((d, dist, score, tb)),
+                            no_time.get((d, dist, score)),
+                            down_score.get((d, score)),
+                            by_down.get(d),
+                            prev_by_down.get(d),
+                            league_by_down.get(d),
+                            DEFAULT_PASS_RATES[d],
+                        )):
+                            if value is not None:
+                                break
+                        self.pass_rate_table[d - 1, i, j, k] = value
+                        self.pass_rate_source[d - 1, i, j, k] = source
+
     def get_pass_rate(self, down: int, distance_bucket: str, score_diff_bucket: str, time_bucket: str) -> float:
         """
         Get team's pass rate for a given situation.
         
+        O(1) lookup into the table built by _build_pass_rate_table(). Cells
+        resolved from previous-season, league or hardcoded data are recorded
+        in _fallbacks_used each time they are read.
+        
         Args:
             down: Down (1-4)
             distance_bucket: 'short', 'medium', 'long'
@@ -455,93 +501,23 @@ class TeamProfile:
         Returns:
             Pass rate (0-1)
         """
-        lookup_team = self._get_lookup_team()
-        # Look up in team's playcalling data - try most specific first
-        situation = self.playcalling[
-            (self.playcalling['down'] == down) &
-            (self.playcalling['distance_bucket'] == distance_bucket) &
-            (self.playcalling['score_diff_bucket'] == score_diff_bucket) &
-            (self.playcalling['time_bucket'] == time_bucket)
-        ]
-
-        if len(situation) > 0:
-            return float(situation['pass_rate'].iloc[0])
-
-        # Fall back to simpler lookup (down + score + distance, no time)
-        situation = self.playcalling[
-            (self.playcalling['down'] == down) &
-            (self.playcalling['distance_bucket'] == distance_bucket) &
-            (self.playcalling['score_diff_bucket'] == score_diff_bucket)
-        ]
-
-        if len(situation) > 0:
-            return float(situation['pass_rate'].mean())
-
-        # Fall back to even simpler (just down and score)
-        situation = self.playcalling[
-            (self.playcalling['down'] == down) &
-            (self.playcalling['score_diff_bucket'] == score_diff_bucket)
-        ]
-
-        if len(situation) > 0:
-            return float(situation['pass_rate'].mean())
-
-        # Fall back to just down
-        situation = self.playcalling[
-            (self.playcalling['down'] == down)
-        ]
-
-        if len(situation) > 0:
-            return float(situation['pass_rate'].mean())
-
-        # LAST RESORT: Try previous season data (for early season weeks with sparse data)
-        if self.season > 2022:
-            prev_season = self.season - 1
-            if hasattr(self, '_playcalling_df'):
-                prev_season_data = self._playcalling_df[
-                    (self._playcalling_df['posteam'] == lookup_team) &
-                    (self._playcalling_df['season'] == prev_season)
-                ]
-                if len(prev_season_data) > 0:
-                    # Try to find matching situation by down (don't require distance/score match)
-                    prev_situation = prev_season_data[
-                        (prev_season_data['down'] == down)
-                    ]
-                    if len(prev_situation) > 0:
-                        if self.debug:
-                            print(f"   ⚠️  FALLBACK: Using {prev_season} data for {self.team} down={down} (no {self.season} data)")
-                        self._fallbacks_used.append(f"Play-calling: Used {prev_season} season data for down={down}")
-                        return float(prev_situation['pass_rate'].mean())
-
-        # LAST RESORT: Use league average for this down (4th downs are rare)
-        # Get league average pass rate for this down from all teams
-        if hasattr(self, '_playcalling_df'):
-            league_situation = self._playcalling_df[
-                (self._playcalling_df['down'] == down)
-            ]
-            if len(league_situation) > 0:
-                if self.debug:
-                    print(f"   ⚠️  FALLBACK: Using league average for {self.team} down={down} (no team data)")
-                self._fallbacks_used.append(f"Play-calling: Used league average for down={down}")
-                return float(league_situation['pass_rate'].mean())
-
-        # LAST LAST RESORT: Hardcoded defaults by down (4th downs are handled by FG/Punt logic anyway)
-        # These are only used if absolutely no data exists anywhere
-        default_pass_rates = {
-            1: 0.51,  # ~51% pass on 1st down
-            2: 0.50,  # ~50% pass on 2nd down
-            3: 0.68,  # ~68% pass on 3rd down
-            4: 0.70,  # ~70% pass on 4th down (often go for it)
-        }
-        if down in default_pass_rates:
+        if not 1 <= down <= 4:
+            prev_season = self.season - 1 if self.season > 2022 else None
+            raise ValueError(f"No play-calling data for {self.team} {self.season} (or {prev_season}) - even for down={down}. Run preprocessing/extract_playcalling.py.")
+        try:
+            idx = (down - 1, _DISTANCE_INDEX[distance_bucket],
+                   _SCORE_DIFF_INDEX[score_diff_bucket], _TIME_INDEX[time_bucket])
+        except KeyError as e:
+            raise ValueError(f"Unknown play-calling bucket {e} for {self.team}") from None
+
+        source = self.pass_rate_source[idx]
+        if source >= PASS_RATE_PREV_SEASON:
+            note = _PASS_RATE_FALLBACK_NOTES[source].format(prev_season=self.season - 1, down=down)
             if self.debug:
-                print(f"   ⚠️  FALLBACK: Using hardcoded default for {self.team} down={down} (no data anywhere)")
-            self._fallbacks_used.append(f"Play-calling: Used hardcoded default for down={down}")
-            return default_pass_rates[down]
+                print(f"   ⚠️  FALLBACK: {self.team} {note}")
+            self._fallbacks_used.append(note)
 
-        # NO FALLBACK - raise error if absolutely no data
-        prev_season = self.season - 1 if self.season > 2022 else None
-        raise ValueError(f"No play-calling data for {self.team} {self.season} (or {prev_season}) - even for down={down}. Run preprocessing/extract_playcalling.py.")
+        return float(self.pass_rate_table[idx])
 
     def _load_pff_grades(self):
         """Load PFF grades for OL/DL matchups."""
@@ -588,23 +564,17 @@ class TeamProfile:
             if not season_file.exists():
                 raise ValueError("YPP data not found. Run preprocessing/extract_yards_per_play.py first.")
 
-            ypp_df = pd.read_csv(season_file)
-            team_data = ypp_df[
-                (ypp_df['posteam'] == lookup_team) &
-                (ypp_df['season'] == self.season)
-            ]
+            ypp_df = self._store.read_csv(season_file)
+            team_data = self._store.rows(ypp_df, posteam=lookup_team, season=self.season)
             
             # Fallback to previous season if current season not available
             if len(team_data) == 0:
                 prev_season = self.season - 1
-                team_data = ypp_df[
-                    (ypp_df['posteam'] == lookup_team) &
-                    (ypp_df['season'] == prev_season)
-                ]
+                team_data = self._store.rows(ypp_df, posteam=lookup_team, season=prev_season)
                 if len(team_data) > 0 and self.debug:
                     print(f"⚠️  Using {prev_season} YPP data for {self.team} (no {self.season} data available)")
         else:
-            ypp_df = pd.read_csv(weekly_file)
+            ypp_df = self._store.read_csv(weekly_file)
             # CRITICAL: Use only PRIOR weeks to avoid look-ahead bias
             # For week N, use weeks 1 through N-1 (or season average if N=1)
             if self.week == 1:
@@ -612,60 +582,37 @@ class TeamProfile:
                 # Fall through to season average below
                 season_file = self.data_dir / "team_yards_per_play_season.csv"
                 if season_file.exists():
-                    season_df = pd.read_csv(season_file)
-                    team_data = season_df[
-                        (season_df['posteam'] == lookup_team) &
-                        (season_df['season'] == self.season)
-                    ]
+                    season_df = self._store.read_csv(season_file)
+                    team_data = self._store.rows(season_df, posteam=lookup_team, season=self.season)
                     # Fallback to previous season
                     if len(team_data) == 0:
                         prev_season = self.season - 1
-                        team_data = season_df[
-                            (season_df['posteam'] == lookup_team) &
-                            (season_df['season'] == prev_season)
-                        ]
+                        team_data = self._store.rows(season_df, posteam=lookup_team, season=prev_season)
                         if len(team_data) > 0 and self.debug:
                             print(f"⚠️  Using {prev_season} YPP season data for {self.team} (no {self.season} data available)")
                 else:
                     team_data = pd.DataFrame()
             else:
                 # Week N: Aggregate weeks 1 through N-1 (exclude current week)
-                prior_weeks = ypp_df[
-                    (ypp_df['posteam'] == lookup_team) &
-                    (ypp_df['season'] == self.season) &
-                    (ypp_df['week'] < self.week)  # KEY: Only prior weeks
-                ]
-                
-                # Fallback: try previous season if no current season data
-                if len(prior_weeks) == 0:
-                    prev_season = self.season - 1
-                    prior_weeks = ypp_df[
-                        (ypp_df['posteam'] == lookup_team) &
-                        (ypp_df['season'] == prev_season) &
-                        (ypp_df['week'] < self.week)
-                    ]
-                    if len(prior_weeks) > 0 and self.debug:
-                        print(f"⚠️  Using {prev_season} YPP weekly data for {self.team} (no {self.season} data available)")
-
-                if len(prior_weeks) > 0:
-                    # Apply regression to mean for extreme weekly values
-                    # Cap individual weeks to prevent one bad game from destroying average
-                    league_avg_ypp = 5.5  # NFL average
-                    league_avg_ypa = 6.5
-
-                    def shrink_extreme(values, league_avg, max_dev=1.5):
-                        """Shrink extreme values towards league average"""
-                        return values.apply(lambda x: max(league_avg - max_dev, min(league_avg + max_dev, x)))
-
-                    # Aggregate prior weeks with extreme value capping
-                    team_data = pd.DataFrame([{
-                        'posteam': self.team,
-                        'season': self.season,
-                        'off_yards_per_play': shrink_extreme(prior_weeks['off_yards_per_play'], league_avg_ypp).mean(),
-                        'off_yards_per_pass_attempt': shrink_extreme(prior_weeks['off_yards_per_pass_attempt'], league_avg_ypa).mean(),
-                        'def_yards_per_play_allowed': shrink_extreme(prior_weeks['def_yards_per_play_allowed'], league_avg_ypp).mean(),
-                        'def_yards_per_pass_allowed': shrink_extreme(prior_weeks['def_yards_per_pass_allowed'], league_avg_ypa).mean(),
-                    }])
+                # Apply regression to mean for extreme weekly values
+                # Cap individual weeks to prevent one bad game from destroying average
+                league_avg_ypp = 5.5  # NFL average
+                league_avg_ypa = 6.5
+                max_dev = 1.5
+                ypp_clip = (league_avg_ypp - max_dev, league_avg_ypp + max_dev)
+                ypa_clip = (league_avg_ypa - max_dev, league_avg_ypa + max_dev)
+                clip = {
+                    'off_yards_per_play': ypp_clip,
+                    'off_yards_per_pass_attempt': ypa_clip,
+                    'def_yards_per_play_allowed': ypp_clip,
+                    'def_yards_per_pass_allowed': ypa_clip,
+                }
+
+                # Aggregate prior weeks with extreme value capping
+                # (falls back to the previous season's prior weeks)
+                prior = self._prior_mean(ypp_df, list(clip), clip=clip)  # KEY: Only prior weeks
+                if prior is not None:
+                    team_data = pd.DataFrame([{'posteam': self.team, 'season': self.season, **prior}])
                 else:
                     team_data = pd.DataFrame()
 
@@ -673,18 +620,12 @@ class TeamProfile:
                 # Fall back to season average
                 season_file = self.data_dir / "team_yards_per_play_season.csv"
                 if season_file.exists():
-                    season_df = pd.read_csv(season_file)
-                    team_data = season_df[
-                        (season_df['posteam'] == lookup_team) &
-                        (season_df['season'] == self.season)
-                    ]
+                    season_df = self._store.read_csv(season_file)
+                    team_data = self._store.rows(season_df, posteam=lookup_team, season=self.season)
                     # Fallback to previous season
                     if len(team_data) == 0:
                         prev_season = self.season - 1
-                        team_data = season_df[
-                            (season_df['posteam'] == lookup_team) &
-                            (season_df['season'] == prev_season)
-                        ]
+                        team_data = self._store.rows(season_df, posteam=lookup_team, season=prev_season)
                         if len(team_data) > 0 and self.debug:
                             print(f"⚠️  Using {prev_season} YPP season fallback for {self.team} (no {self.season} data available)")
 
@@ -707,61 +648,34 @@ class TeamProfile:
                 self.early_down_success_rate = 0.48
                 return
 
-            success_df = pd.read_csv(season_file)
-            team_data = success_df[
-                (success_df['posteam'] == lookup_team) &
-                (success_df['season'] == self.season)
-            ]
+            success_df = self._store.read_csv(season_file)
+            team_data = self._store.rows(success_df, posteam=lookup_team, season=self.season)
             # Fallback to previous season
             if len(team_data) == 0:
                 prev_season = self.season - 1
-                team_data = success_df[
-                    (success_df['posteam'] == lookup_team) &
-                    (success_df['season'] == prev_season)
-                ]
+                team_data = self._store.rows(success_df, posteam=lookup_team, season=prev_season)
         else:
-            success_df = pd.read_csv(weekly_file)
+            success_df = self._store.read_csv(weekly_file)
             # CRITICAL: Use only PRIOR weeks
             if self.week == 1:
                 team_data = pd.DataFrame()
             else:
-                prior_weeks = success_df[
-                    (success_df['posteam'] == lookup_team) &
-                    (success_df['season'] == self.season) &
-                    (success_df['week'] < self.week)  # Only prior weeks
-                ]
-                # Fallback to previous season
-                if len(prior_weeks) == 0:
-                    prev_season = self.season - 1
-                    prior_weeks = success_df[
-                        (success_df['posteam'] == lookup_team) &
-                        (success_df['season'] == prev_season) &
-                        (success_df['week'] < self.week)
-                    ]
-                if len(prior_weeks) > 0:
-                    team_data = pd.DataFrame([{
-                        'posteam': self.team,
-                        'season': self.season,
-                        'early_down_success_rate': prior_weeks['early_down_success_rate'].mean(),
-                    }])
+                # Only prior weeks (falls back to the previous season's prior weeks)
+                prior = self._prior_mean(success_df, ['early_down_success_rate'])
+                if prior is not None:
+                    team_data = pd.DataFrame([{'posteam': self.team, 'season': self.season, **prior}])
                 else:
                     team_data = pd.DataFrame()
 
             if len(team_data) == 0:
                 season_file = self.data_dir / "early_down_success_season.csv"
                 if season_file.exists():
-                    season_df = pd.read_csv(season_file)
-                    team_data = season_df[
-                        (season_df['posteam'] == lookup_team) &
-                        (season_df['season'] == self.season)
-                    ]
+                    season_df = self._store.read_csv(season_file)
+                    team_data = self._store.rows(season_df, posteam=lookup_team, season=self.season)
                     # Fallback to previous season
                     if len(team_data) == 0:
                         prev_season = self.season - 1
-                        team_data = season_df[
-                            (season_df['posteam'] == lookup_team) &
-                            (season_df['season'] == prev_season)
-                        ]
+                        team_data = self._store.rows(season_df, posteam=lookup_team, season=prev_season)
 
         if len(team_data) > 0:
             self.early_down_success_rate = float(team_data['early_down_success_rate'].iloc[0])
@@ -780,62 +694,34 @@ class TeamProfile:
                 self.def_anya_allowed = 6.0
                 return
 
-            anya_df = pd.read_csv(season_file)
-            team_data = anya_df[
-                (anya_df['posteam'] == lookup_team) &
-                (anya_df['season'] == self.season)
-            ]
+            anya_df = self._store.read_csv(season_file)
+            team_data = self._store.rows(anya_df, posteam=lookup_team, season=self.season)
             # Fallback to previous season
             if len(team_data) == 0:
                 prev_season = self.season - 1
-                team_data = anya_df[
-                    (anya_df['posteam'] == lookup_team) &
-                    (anya_df['season'] == prev_season)
-                ]
+                team_data = self._store.rows(anya_df, posteam=lookup_team, season=prev_season)
         else:
-            anya_df = pd.read_csv(weekly_file)
+            anya_df = self._store.read_csv(weekly_file)
             # CRITICAL: Use only PRIOR weeks
             if self.week == 1:
                 team_data = pd.DataFrame()
             else:
-                prior_weeks = anya_df[
-                    (anya_df['posteam'] == lookup_team) &
-                    (anya_df['season'] == self.season) &
-                    (anya_df['week'] < self.week)  # Only prior weeks
-                ]
-                # Fallback to previous season
-                if len(prior_weeks) == 0:
-                    prev_season = self.season - 1
-                    prior_weeks = anya_df[
-                        (anya_df['posteam'] == lookup_team) &
-                        (anya_df['season'] == prev_season) &
-                        (anya_df['week'] < self.week)
-                    ]
-                if len(prior_weeks) > 0:
-                    team_data = pd.DataFrame([{
-                        'posteam': self.team,
-                        'season': self.season,
-                        'off_anya': prior_weeks['off_anya'].mean(),
-                        'def_anya_allowed': prior_weeks['def_anya_allowed'].mean(),
-                    }])
+                # Only prior weeks (falls back to the previous season's prior weeks)
+                prior = self._prior_mean(anya_df, ['off_anya', 'def_anya_allowed'])
+                if prior is not None:
+                    team_data = pd.DataFrame([{'posteam': self.team, 'season': self.season, **prior}])
                 else:
                     team_data = pd.DataFrame()
 
             if len(team_data) == 0:
                 season_file = self.data_dir / "team_anya_season.csv"
                 if season_file.exists():
-                    season_df = pd.read_csv(season_file)
-                    team_data = season_df[
-                        (season_df['posteam'] == lookup_team) &
-                        (season_df['season'] == self.season)
-                    ]
+                    season_df = self._store.read_csv(season_file)
+                    team_data = self._store.rows(season_df, posteam=lookup_team, season=self.season)
                     # Fallback to previous season
                     if len(team_data) == 0:
                         prev_season = self.season - 1
-                        team_data = season_df[
-                            (season_df['posteam'] == lookup_team) &
-                            (season_df['season'] == prev_season)
-                        ]
+                        team_data = self._store.rows(season_df, posteam=lookup_team, season=prev_season)
 
         if len(team_data) > 0:
             self.off_anya = float(team_data['off_anya'].iloc[0])
@@ -846,37 +732,21 @@ class TeamProfile:
 
     def _load_turnover_regression(self):
         """Load turnover regression factors."""
-        lookup_team = self._get_lookup_team()
         weekly_file = self.data_dir / "turnover_regression_weekly.csv"
 
         if not weekly_file.exists():
             self.turnover_regression_factor = 1.0
             return
 
-        turnovers_df = pd.read_csv(weekly_file)
+        turnovers_df = self._store.read_csv(weekly_file)
         # CRITICAL: Use only PRIOR weeks
         if self.week == 1:
             team_data = pd.DataFrame()
         else:
-            prior_weeks = turnovers_df[
-                (turnovers_df['posteam'] == lookup_team) &
-                (turnovers_df['season'] == self.season) &
-                (turnovers_df['week'] < self.week)  # Only prior weeks
-            ]
-            # Fallback to previous season
-            if len(prior_weeks) == 0:
-                prev_season = self.season - 1
-                prior_weeks = turnovers_df[
-                    (turnovers_df['posteam'] == lookup_team) &
-                    (turnovers_df['season'] == prev_season) &
-                    (turnovers_df['week'] < self.week)
-                ]
-            if len(prior_weeks) > 0:
-                team_data = pd.DataFrame([{
-                    'posteam': self.team,
-                    'season': self.season,
-                    'regression_factor': prior_weeks['regression_factor'].mean(),
-                }])
+            # Only prior weeks (falls back to the previous season's prior weeks)
+            prior = self._prior_mean(turnovers_df, ['regression_factor'])
+            if prior is not None:
+                team_data = pd.DataFrame([{'posteam': self.team, 'season': self.season, **prior}])
             else:
                 team_data = pd.DataFrame()
 
@@ -897,62 +767,34 @@ class TeamProfile:
                 self.red_zone_td_pct = 0.60
                 return
 
-            redzone_df = pd.read_csv(season_file)
-            team_data = redzone_df[
-                (redzone_df['posteam'] == lookup_team) &
-                (redzone_df['season'] == self.season)
-            ]
+            redzone_df = self._store.read_csv(season_file)
+            team_data = self._store.rows(redzone_df, posteam=lookup_team, season=self.season)
             # Fallback to previous season
             if len(team_data) == 0:
                 prev_season = self.season - 1
-                team_data = redzone_df[
-                    (redzone_df['posteam'] == lookup_team) &
-                    (redzone_df['season'] == prev_season)
-                ]
+                team_data = self._store.rows(redzone_df, posteam=lookup_team, season=prev_season)
         else:
-            redzone_df = pd.read_csv(weekly_file)
+            redzone_df = self._store.read_csv(weekly_file)
             # CRITICAL: Use only PRIOR weeks
             if self.week == 1:
                 team_data = pd.DataFrame()
             else:
-                prior_weeks = redzone_df[
-                    (redzone_df['posteam'] == lookup_team) &
-                    (redzone_df['season'] == self.season) &
-                    (redzone_df['week'] < self.week)  # Only prior weeks
-                ]
-                # Fallback to previous season
-                if len(prior_weeks) == 0:
-                    prev_season = self.season - 1
-                    prior_weeks = redzone_df[
-                        (redzone_df['posteam'] == lookup_team) &
-                        (redzone_df['season'] == prev_season) &
-                        (redzone_df['week'] < self.week)
-                    ]
-                if len(prior_weeks) > 0:
-                    team_data = pd.DataFrame([{
-                        'posteam': self.team,
-                        'season': self.season,
-                        'red_zone_trips_per_game': prior_weeks['red_zone_trips_per_game'].mean(),
-                        'red_zone_td_pct': prior_weeks['red_zone_td_pct'].mean(),
-                    }])
+                # Only prior weeks (falls back to the previous season's prior weeks)
+                prior = self._prior_mean(redzone_df, ['red_zone_trips_per_game', 'red_zone_td_pct'])
+                if prior is not None:
+                    team_data = pd.DataFrame([{'posteam': self.team, 'season': self.season, **prior}])
                 else:
                     team_data = pd.DataFrame()
 
             if len(team_data) == 0:
                 season_file = self.data_dir / "red_zone_stats_season.csv"
                 if season_file.exists():
-                    season_df = pd.read_csv(season_file)
-                    team_data = season_df[
-                        (season_df['posteam'] == lookup_team) &
-                        (season_df['season'] == self.season)
-                    ]
+                    season_df = self._store.read_csv(season_file)
+                    team_data = self._store.rows(season_df, posteam=lookup_team, season=self.season)
                     # Fallback to previous season
                     if len(team_data) == 0:
                         prev_season = self.season - 1
-                        team_data = season_df[
-                            (season_df['posteam'] == lookup_team) &
-                            (season_df['season'] == prev_season)
-                        ]
+                        team_data = self._store.rows(season_df, posteam=lookup_team, season=prev_season)
 
         if len(team_data) > 0:
             self.red_zone_trips_per_game = float(team_data['red_zone_trips_per_game'].iloc[0])
@@ -973,49 +815,29 @@ class TeamProfile:
                 self.field_goal_make_pct = 0.85
                 return
 
-            st_df = pd.read_csv(season_file)
-            team_data = st_df[
-                (st_df['posteam'] == lookup_team) &
-                (st_df['season'] == self.season)
-            ]
+            st_df = self._store.read_csv(season_file)
+            team_data = self._store.rows(st_df, posteam=lookup_team, season=self.season)
             # Fallback to previous season
             if len(team_data) == 0:
                 prev_season = self.season - 1
-                team_data = st_df[
-                    (st_df['posteam'] == lookup_team) &
-                    (st_df['season'] == prev_season)
-                ]
+                team_data = self._store.rows(st_df, posteam=lookup_team, season=prev_season)
         else:
-            st_df = pd.read_csv(weekly_file)
-            team_data = st_df[
-                (st_df['posteam'] == lookup_team) &
-                (st_df['season'] == self.season) &
-                (st_df['week'] == self.week)
-            ]
+            st_df = self._store.read_csv(weekly_file)
+            team_data = self._store.rows(st_df, posteam=lookup_team, season=self.season, week=self.week)
             # Fallback: try previous season if current week not available
             if len(team_data) == 0:
                 prev_season = self.season - 1
-                team_data = st_df[
-                    (st_df['posteam'] == lookup_team) &
-                    (st_df['season'] == prev_season) &
-                    (st_df['week'] == self.week)
-                ]
+                team_data = self._store.rows(st_df, posteam=lookup_team, season=prev_season, week=self.week)
 
             if len(team_data) == 0:
                 season_file = self.data_dir / "special_teams_season.csv"
                 if season_file.exists():
-                    season_df = pd.read_csv(season_file)
-                    team_data = season_df[
-                        (season_df['posteam'] == lookup_team) &
-                        (season_df['season'] == self.season)
-                    ]
+                    season_df = self._store.read_csv(season_file)
+                    team_data = self._store.rows(season_df, posteam=lookup_team, season=self.season)
                     # Fallback to previous season
                     if len(team_data) == 0:
                         prev_season = self.season - 1
-                        team_data = season_df[
-                            (season_df['posteam'] == lookup_team) &
-                            (season_df['season'] == prev_season)
-                        ]
+                        team_data = self._store.rows(season_df, posteam=lookup_team, season=prev_season)
 
         if len(team_data) > 0:
             self.punt_net_yards = float(team_data['punt_net_yards'].iloc[0]) if 'punt_net_yards' in team_data.columns else 40.0
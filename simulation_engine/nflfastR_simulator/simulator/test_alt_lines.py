@@ -0,0 +1,77 @@
+"""
+Tests for alt-line / teaser pricing.
+
+Tests:
+1. LinePricer matches np.mean on rounded outcomes for half and whole lines
+2. Slate ladders match per-game pricing
+3. Teaser legs and key-number mass
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulator.alt_lines import LinePricer, key_number_mass, spread_ladder, teaser_legs, total_ladder
+
+
+def _spreads(seed=0, n_sims=4000, n_games=1):
+    rng = np.random.default_rng(seed)
+    return rng.normal(2.5, 13.5, (n_sims, n_games)).squeeze()
+
+
+def test_matches_brute_force():
+    spreads = _spreads()
+    margin = np.rint(spreads)
+    pricer = LinePricer(spreads)
+    for line in (-7.0, -2.5, 0.0, 3.0, 3.5, 14.0, 99.5):
+        above, push, below = pricer.probs(line)
+        assert np.isclose(above, np.mean(margin > line))
+        assert np.isclose(push, np.mean(margin == line))
+        assert np.isclose(below, np.mean(margin < line))
+
+    lines = np.arange(-10, 10.5, 0.5)
+    above, push, _ = pricer.probs(lines)
+    assert np.allclose(above, [(margin > l).mean() for l in lines])
+    assert np.allclose(push, [(margin == l).mean() for l in lines])
+
+
+def test_slate_ladders():
+    spreads = _spreads(1, n_games=5)
+    lines = np.array([-3.5, 3.0, 7.0, 0.5, -1.0])
+    table = spread_ladder(spreads, lines, half_width=3.0)
+    assert len(table) == 5 * 13
+    for g in range(5):
+        rows = table[table['game'] == g]
+        single = LinePricer(spreads[:, g]).probs(rows['line'].to_numpy())
+        assert np.allclose(rows['p_home_cover'], single[0])
+        assert np.allclose(rows['p_push'], single[1])
+        assert np.allclose(rows['p_home_cover'] + rows['p_push'] + rows['p_away_cover'], 1.0)
+
+    totals = total_ladder(np.abs(spreads) + 40, 45.5, half_width=2.0)
+    assert sorted(totals['line'].unique()) == [43.5, 44.0, 44.5, 45.0, 45.5, 46.0, 46.5, 47.0, 47.5]
+
+
+def test_teasers_and_keys():
+    spreads = _spreads(2)
+    margin = np.rint(spreads)
+    legs = teaser_legs(spreads, 3.0, points=(6.0,))
+    home = legs[legs['side'] == 'home'].iloc[0]
+    away = legs[legs['side'] == 'away'].iloc[0]
+    assert home['line'] == -3.0 and away['line'] == 9.0
+    assert np.isclose(home['p_win'], np.mean(margin > -3.0))
+    assert np.isclose(home['p_push'], np.mean(margin == -3.0))
+    assert np.isclose(away['p_win'], np.mean(margin < 9.0))
+
+    keys = key_number_mass(spreads, keys=(3, 7))
+    assert np.isclose(keys['key_3'][0], np.mean(np.abs(margin) == 3))
+    assert np.isclose(keys['key_7'][0], np.mean(np.abs(margin) == 7))
+
+
+if __name__ == "__main__":
+    test_matches_brute_force()
+    test_slate_ladders()
+    test_teasers_and_keys()
+    print("✅ Alt-line pricing tests passed")
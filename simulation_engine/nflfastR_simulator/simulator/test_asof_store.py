@@ -0,0 +1,114 @@
+"""
+Tests for AsOfTable prior-week lookups.
+
+Tests:
+1. prior_mean / last_n / clip / latest match brute-force masks on random data
+2. Rows at or after the target week never change any result (no leakage)
+3. DataStore.asof caches per frame and tolerates unknown teams
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulator.asof_store import AsOfTable
+from simulator.data_store import DataStore
+
+
+def _weekly_frame(seed=0):
+    """Shuffled weekly rows for a few teams, with a bye week and NaNs."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for team in ('KC', 'BUF', 'LA'):
+        for season in (2023, 2024):
+            for week in range(1, 19):
+                if week == 7:  # bye
+                    continue
+                rows.append({'posteam': team, 'season': season, 'week': week,
+                             'ypp': rng.normal(5.5, 1.2), 'anya': rng.normal(6.0, 1.5)})
+    df = pd.DataFrame(rows).sample(frac=1.0, random_state=seed).reset_index(drop=True)
+    df.loc[df.index[::11], 'anya'] = np.nan
+    return df
+
+
+def _brute(df, team, season, week):
+    mask = (df['posteam'] == team) & (df['season'] == season) & (df['week'] < week)
+    return df[mask].sort_values('week')
+
+
+def test_matches_brute_force():
+    """As-of aggregates equal the full-table masks they replace."""
+    df = _weekly_frame()
+    table = AsOfTable(df, 'posteam')
+
+    for team in ('KC', 'LA'):
+        for week in (1, 2, 7, 8, 19):
+            expected = _brute(df, team, 2024, week)
+            means = table.prior_mean(team, 2024, week, ['ypp', 'anya'])
+            if len(expected) == 0:
+                assert means is None and table.latest(team, 2024, week) is None
+                continue
+
+            assert np.isclose(means['ypp'], expected['ypp'].mean())
+            assert np.isclose(means['anya'], expected['anya'].mean())
+
+            last3 = table.prior_mean(team, 2024, week, ['ypp'], last_n=3)
+            assert np.isclose(last3['ypp'], expected['ypp'].tail(3).mean())
+
+            clipped = table.prior_mean(team, 2024, week, ['ypp'], clip={'ypp': (4.0, 7.0)})
+            assert np.isclose(clipped['ypp'], expected['ypp'].clip(4.0, 7.0).mean())
+
+            ema = table.prior_ema(team, 2024, week, ['ypp'], alpha=0.4)
+            assert np.isclose(ema['ypp'], expected['ypp'].ewm(alpha=0.4, adjust=False).mean().iloc[-1])
+
+            assert table.latest(team, 2024, week)['week'] == expected['week'].iloc[-1]
+            assert list(table.prior_rows(team, 2024, week)['week']) == list(expected['week'])
+
+
+def test_no_leakage():
+    """Changing or adding rows at/after week W leaves every week-W lookup unchanged."""
+    df = _weekly_frame(seed=1)
+    week = 10
+    before = AsOfTable(df, 'posteam')
+
+    future = df.copy()
+    leak = (future['season'] == 2024) & (future['week'] >= week)
+    future.loc[leak, ['ypp', 'anya']] = 1e6
+    extra = future[leak].head(3).assign(week=week)  # duplicate rows in week W itself
+    after = AsOfTable(pd.concat([future, extra], ignore_index=True), 'posteam')
+
+    for team in ('KC', 'BUF', 'LA'):
+        args = (team, 2024, week)
+        assert before.prior_mean(*args, ['ypp', 'anya']) == after.prior_mean(*args, ['ypp', 'anya'])
+        assert before.prior_mean(*args, ['ypp'], last_n=4) == after.prior_mean(*args, ['ypp'], last_n=4)
+        assert before.prior_ema(*args, ['anya'], alpha=0.3) == after.prior_ema(*args, ['anya'], alpha=0.3)
+        assert after.prior_rows(*args)['week'].max() == week - 1
+        assert after.latest(*args)['ypp'] < 1e6
+
+
+def test_store_caches_tables():
+    """DataStore.asof builds one table per (frame, team column)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "weekly.csv"
+        _weekly_frame().to_csv(path, index=False)
+
+        store = DataStore(columnar=False)
+        df = store.read_csv(path)
+        table = store.asof(df, 'posteam')
+        assert store.asof(df, 'posteam') is table
+        assert table.prior_mean('NYJ', 2024, 5, ['ypp']) is None
+
+        prior = store.rows(df, posteam='KC', season=2024, week_before=5)
+        assert np.isclose(table.prior_mean('KC', 2024, 5, ['ypp'])['ypp'], prior['ypp'].mean())
+
+
+if __name__ == "__main__":
+    test_matches_brute_force()
+    test_no_leakage()
+    test_store_caches_tables()
+    print("✅ AsOfTable tests passed")
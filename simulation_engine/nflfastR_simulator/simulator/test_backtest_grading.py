@@ -0,0 +1,49 @@
+"""
+Tests for backtest line conventions and bet grading.
+
+Tests:
+1. Odds-CSV spread_home is converted to the nflverse home - away spread_line
+2. Home cover / no cover / push against a home favorite and a home underdog
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backtest_runner import game_specs, grade_results
+
+
+def test_spread_home_conversion():
+    """KC -3 at home is spread_line +3 whether it arrives as spread_line or spread_home."""
+    row = {'season': 2024, 'week': 1, 'away_team': 'BAL', 'home_team': 'KC', 'total_line': 46.5,
+           'home_score': 27, 'away_score': 20}
+    nflverse = game_specs(pd.DataFrame([{**row, 'spread_line': 3.0}]))[0]
+    odds_csv = game_specs(pd.DataFrame([{**row, 'spread_home': -3.0}]))[0]
+    assert nflverse.spread_line == odds_csv.spread_line == 3.0
+
+
+def test_cover_grading():
+    """Home covers when it wins by more than spread_line (negative line = home underdog)."""
+    df = pd.DataFrame({
+        'spread_line': [3.0, 3.0, 3.0, -3.5, -3.5],
+        'total_line': [45.5] * 5,
+        'actual_home_score': [27, 21, 23, 20, 17],
+        'actual_away_score': [20, 20, 20, 23, 24],
+        'spread_bet': ['HOME', 'HOME', 'AWAY', 'HOME', 'AWAY'],
+        'total_bet': ['OVER', 'UNDER', None, None, None],
+    })
+    graded = grade_results(df)
+    # Favorite by 7 covers -3; by 1 does not; by 3 pushes; dog losing by 3 covers +3.5, by 7 does not
+    np.testing.assert_array_equal(graded['home_covered'].to_numpy(), [1.0, 0.0, np.nan, 1.0, 0.0])
+    np.testing.assert_array_equal(graded['spread_result'].to_numpy(), [1.0, 0.0, np.nan, 1.0, 1.0])
+    np.testing.assert_array_equal(graded['total_result'].to_numpy()[:2], [1.0, 1.0])
+
+
+if __name__ == "__main__":
+    test_spread_home_conversion()
+    test_cover_grading()
+    print("✅ Backtest grading tests passed")
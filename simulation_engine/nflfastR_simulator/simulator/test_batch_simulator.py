@@ -0,0 +1,144 @@
+"""
+Statistical equivalence test: BatchGameSimulator vs scalar GameSimulator.
+
+Tests:
+1. Run the same matchup through both engines (legacy and calibrated pressure)
+2. Compare mean scores, total SD and home win probability within
+   sampling error
+3. Check the batch engine is reproducible for a fixed seed
+4. GameSimulator.simulate_monte_carlo(batch=True) runs the batch engine
+   from the simulator's seed with the same result keys
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Import through the package (as the backtests do) so GameState's relative
+# import of fourth_down_model resolves instead of using its heuristic fallback
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulator.team_profile import TeamProfile
+from simulator.game_simulator import GameSimulator
+from simulator.batch_simulator import BatchGameSimulator
+from simulator.tracing import SimTrace
+from simulator.pressure_calibration import PressureCalibrator
+
+N_SCALAR = 1000
+N_BATCH = 20000
+Z_TOL = 4.0  # Allowed difference in combined standard errors
+
+
+def _scalar_scores(home_team, away_team, pressure_calibrator, n_sims, seed):
+    """Run the scalar engine with tracing disabled."""
+    simulator = GameSimulator(home_team, away_team, trace=SimTrace(game_id="equiv", enable=False),
+                              seed=seed, pressure_calibrator=pressure_calibrator)
+    home = np.empty(n_sims)
+    away = np.empty(n_sims)
+    for i in range(n_sims):
+        result = simulator.simulate_game()
+        home[i] = result['home_score']
+        away[i] = result['away_score']
+    return home, away
+
+
+def _assert_close(label, a, b):
+    """Means of a and b agree within Z_TOL standard errors."""
+    se = np.sqrt(a.var(ddof=1) / len(a) + b.var(ddof=1) / len(b))
+    z = abs(a.mean() - b.mean()) / se
+    print(f"   {label:<12} scalar {a.mean():7.3f}  batch {b.mean():7.3f}  z={z:.2f}")
+    assert z < Z_TOL, f"{label} differs: scalar {a.mean():.3f} vs batch {b.mean():.3f} (z={z:.2f})"
+
+
+def _compare(home_team, away_team, pressure_calibrator):
+    t0 = time.time()
+    s_home, s_away = _scalar_scores(home_team, away_team, pressure_calibrator, N_SCALAR, seed=7)
+    t_scalar = time.time() - t0
+
+    t0 = time.time()
+    batch = BatchGameSimulator(home_team, away_team, pressure_calibrator=pressure_calibrator, seed=7)
+    games = batch.simulate_games(N_BATCH)
+    t_batch = time.time() - t0
+    b_home = games['home_score'].astype(float)
+    b_away = games['away_score'].astype(float)
+
+    print(f"   scalar: {N_SCALAR} games in {t_scalar:.1f}s | batch: {N_BATCH} games in {t_batch:.1f}s")
+
+    _assert_close("home_score", s_home, b_home)
+    _assert_close("away_score", s_away, b_away)
+    _assert_close("spread", s_away - s_home, b_away - b_home)
+    _assert_close("home_win", (s_home > s_away).astype(float), (b_home > b_away).astype(float))
+
+    # Spread of the total: compare squared deviations from the pooled mean
+    s_total = s_home + s_away
+    b_total = b_home + b_away
+    mu = np.concatenate([s_total, b_total]).mean()
+    _assert_close("total_var", (s_total - mu) ** 2, (b_total - mu) ** 2)
+
+
+def test_batch_matches_scalar():
+    """Batch and scalar engines produce the same score distribution."""
+    print("=" * 80)
+    print("TESTING BATCH SIMULATOR EQUIVALENCE")
+    print("=" * 80)
+
+    data_dir = Path(__file__).parent.parent / "data" / "nflfastR"
+    home_team = TeamProfile('KC', 2024, 1, data_dir)
+    away_team = TeamProfile('BUF', 2024, 1, data_dir)
+
+    print("\n📊 Legacy pressure model")
+    _compare(home_team, away_team, None)
+
+    print("\n📊 Calibrated pressure model")
+    pressure_file = data_dir / "pressure_rates_weekly.csv"
+    pressure_df = pd.read_csv(pressure_file)
+    season = int(pressure_df['season'].max())
+    week = int(pressure_df.loc[pressure_df['season'] == season, 'week'].max())
+    calibrator = PressureCalibrator()
+    calibrator.fit_from_file(pressure_file, season, week)
+    _compare(home_team, away_team, calibrator)
+
+    print("\n✅ Batch simulator matches scalar simulator")
+
+
+def test_batch_reproducible():
+    """Same seed gives identical batch results."""
+    data_dir = Path(__file__).parent.parent / "data" / "nflfastR"
+    home_team = TeamProfile('KC', 2024, 1, data_dir)
+    away_team = TeamProfile('BUF', 2024, 1, data_dir)
+
+    a = BatchGameSimulator(home_team, away_team, seed=123).simulate_monte_carlo(500)
+    b = BatchGameSimulator(home_team, away_team, seed=123).simulate_monte_carlo(500)
+
+    assert np.array_equal(a['spread_distribution'], b['spread_distribution'])
+    assert np.array_equal(a['total_distribution'], b['total_distribution'])
+    assert 20 <= a['total_avg'] <= 70, "Average total out of range"
+
+
+
+def test_game_simulator_batch_option():
+    """simulate_monte_carlo(batch=True) is seeded by the simulator and returns the usual keys."""
+    data_dir = Path(__file__).parent.parent / "data" / "nflfastR"
+    home_team = TeamProfile('KC', 2024, 1, data_dir)
+    away_team = TeamProfile('BUF', 2024, 1, data_dir)
+
+    def simulator(seed):
+        return GameSimulator(home_team, away_team, trace=SimTrace(game_id="batch", enable=False), seed=seed)
+
+    a = simulator(5).simulate_monte_carlo(n_sims=400, batch=True)
+    b = simulator(5).simulate_monte_carlo(n_sims=400, batch=True)
+    scalar = simulator(5).simulate_monte_carlo(n_sims=20)
+    assert set(a) == set(scalar)
+    assert len(a['results']) == 400 and a['score_histogram'].n == 400
+    assert np.array_equal(a['spread_distribution'], b['spread_distribution'])
+    assert not np.array_equal(a['spread_distribution'],
+                              simulator(6).simulate_monte_carlo(n_sims=400, batch=True)['spread_distribution'])
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
+    test_batch_reproducible()
+    test_game_simulator_batch_option()
@@ -0,0 +1,95 @@
+"""
+Tests for the materialized model-performance summary.
+
+Tests:
+1. Tier records and team tables match a row-by-row recount
+2. load_summary writes the JSON once and rebuilds when the CSV is newer
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulator.performance_summary import build_summary, load_summary, summary_path
+
+TEAMS = ['KC', 'BUF', 'LV', 'DEN', 'NYJ', 'MIA']
+
+
+def _graded(seed=0, n=120):
+    rng = np.random.default_rng(seed)
+    pairs = [rng.choice(TEAMS, 2, replace=False) for _ in range(n)]
+    return pd.DataFrame({
+        'week': rng.integers(1, 9, n),
+        'away_team': [p[0] for p in pairs],
+        'home_team': [p[1] for p in pairs],
+        'spread_line': rng.normal(0, 5, n).round() + 0.5,
+        'spread_mean': rng.normal(0, 5, n),
+        'total_line': rng.normal(45, 3, n).round() + 0.5,
+        'total_mean': rng.normal(45, 3, n),
+        'spread_bet': rng.choice(['HOME', 'AWAY', None], n),
+        'total_bet': rng.choice(['OVER', 'UNDER', None], n),
+        'spread_edge': rng.uniform(0, 0.1, n),
+        'total_edge': rng.uniform(0, 0.1, n),
+        'spread_conviction': rng.choice(['HIGH', 'MEDIUM', 'LOW'], n),
+        'total_conviction': rng.choice(['HIGH', 'MEDIUM', 'LOW'], n),
+        'spread_result': rng.choice([1.0, 0.0, np.nan], n, p=[0.5, 0.45, 0.05]),
+        'total_result': rng.choice([1.0, 0.0, np.nan], n, p=[0.5, 0.45, 0.05]),
+        'actual_home_score': rng.integers(0, 40, n).astype(float),
+        'actual_away_score': rng.integers(0, 40, n).astype(float),
+    })
+
+
+def test_matches_row_recount():
+    df = _graded()
+    summary = build_summary(df)
+
+    spread_bets = df[df['spread_bet'].notna()]
+    high = spread_bets[spread_bets['spread_conviction'] == 'HIGH']
+    wins, losses = (high['spread_result'] == 1.0).sum(), (high['spread_result'] == 0.0).sum()
+    assert summary['spread']['high']['count'] == len(high)
+    assert summary['spread']['high']['wins'] == wins
+    assert summary['spread']['high']['roi'] == round((wins * 0.91 - losses) / len(high) * 100, 1)
+    assert len(summary['bets']['total']['LOW']) == ((df['total_bet'].notna()) & (df['total_conviction'] == 'LOW')).sum()
+
+    # Spread team table: the side bet on
+    counts = {}
+    for _, row in spread_bets.iterrows():
+        team = row['home_team'] if row['spread_bet'] == 'HOME' else row['away_team']
+        bets, won = counts.get(team, (0, 0))
+        counts[team] = (bets + 1, won + (row['spread_result'] == 1.0))
+    for record in summary['teams']['spread']:
+        assert (record['bets'], record['wins']) == counts[record['team']]
+        assert record['high_wr'] is None or 0 <= record['high_wr'] <= 100
+
+    # Totals count for both teams
+    total_bets = df[df['total_bet'].notna()]
+    kc = ((total_bets['home_team'] == 'KC') | (total_bets['away_team'] == 'KC')).sum()
+    assert next(r for r in summary['teams']['total'] if r['team'] == 'KC')['bets'] == kc
+
+
+def test_load_summary_rebuilds():
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = Path(tmp) / "backtest.csv"
+        assert load_summary(csv) is None
+
+        _graded(1).to_csv(csv, index=False)
+        first = load_summary(csv)
+        assert summary_path(csv).exists()
+        assert load_summary(csv) is first
+
+        _graded(2, n=60).to_csv(csv, index=False)
+        st = summary_path(csv).stat()
+        os.utime(csv, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_summary(csv)['total_games'] == 60
+
+
+if __name__ == "__main__":
+    test_matches_row_recount()
+    test_load_summary_rebuilds()
+    print("✅ Performance summary tests passed")
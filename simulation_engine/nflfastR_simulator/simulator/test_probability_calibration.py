@@ -0,0 +1,86 @@
+"""
+Tests for batched probability calibration and the compact calibrator form.
+
+Tests:
+1. calibrate_many matches the per-game calibrate_probabilities wrappers
+2. CompactCalibrator isotonic curve interpolates its breakpoints and clips
+3. load_calibrators reads the compact JSON and caches it
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulator.probability_calibration import (
+    AdaptiveEnsemble,
+    CompactCalibrator,
+    ProbabilityCalibrator,
+    calibrate_many,
+    calibrate_probabilities,
+    calibrate_total_probabilities,
+    load_calibrators,
+    save_compact_calibrators,
+)
+
+
+def _games(n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(1, 6, n), rng.uniform(10, 15, n), rng.normal(0, 6, n)
+
+
+def test_batch_matches_scalar():
+    means, sds, lines = _games()
+    curve = CompactCalibrator('isotonic', x=[-2, 0, 2], y=[0.3, 0.5, 0.75])
+    ensemble = AdaptiveEnsemble()
+
+    for cal, ens in ((None, None), (curve, None), (curve, ensemble)):
+        batch = calibrate_many(means, sds, lines, cal, ens)
+        scalar = [calibrate_probabilities(m, s, l, cal, ens)['p_home_cover'] for m, s, l in zip(means, sds, lines)]
+        assert np.allclose(batch, scalar)
+        assert np.isclose(calibrate_total_probabilities(means[0], sds[0], lines[0], cal, ens)['p_over'], batch[0])
+
+    # Unfitted calibrator: sigmoid fallback, same as its compact form
+    unfitted = ProbabilityCalibrator(method='platt')
+    assert np.allclose(unfitted.predict(means, sds, lines), unfitted.to_compact().predict(means, sds, lines))
+    assert np.isclose(unfitted.predict_proba(means[0], sds[0], lines[0]), unfitted.predict(means, sds, lines)[0])
+
+
+def test_compact_isotonic():
+    curve = CompactCalibrator('isotonic', z_cap=3.0, x=[-1.0, 0.0, 1.0], y=[0.2, 0.5, 0.6], clip=(0.01, 0.99))
+    z = np.array([-5.0, -1.0, -0.5, 0.0, 0.5, 4.0])
+    assert np.allclose(curve.predict_z(z), [0.2, 0.2, 0.35, 0.5, 0.55, 0.6])
+    # z = (mean - line) / sd, capped at z_cap
+    assert np.isclose(curve.predict([5.0], [10.0], [0.0])[0], 0.55)
+
+    copy = CompactCalibrator.from_dict(json.loads(json.dumps(curve.to_dict())))
+    assert np.allclose(copy.predict_z(z), curve.predict_z(z))
+    assert copy.clip == (0.01, 0.99)
+
+
+def test_load_calibrators():
+    with tempfile.TemporaryDirectory() as tmp:
+        pkl = Path(tmp) / "isotonic_calibrators.pkl"
+        assert load_calibrators(pkl) == {}
+
+        calibrators = {
+            'spread': CompactCalibrator('isotonic', x=[-1, 1], y=[0.4, 0.6]),
+            'total': CompactCalibrator('logistic', coef=0.8, intercept=0.1),
+            'trained_on': '2022-2024',
+        }
+        save_compact_calibrators(calibrators, pkl.with_suffix('.json'))
+        loaded = load_calibrators(pkl)
+        assert set(loaded) == {'spread', 'total'}
+        assert load_calibrators(pkl) is loaded
+        assert np.isclose(loaded['total'].predict_z(0.0), 1 / (1 + np.exp(-0.1)))
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
+    test_compact_isotonic()
+    test_load_calibrators()
+    print("✅ Probability calibration tests passed")
@@ -0,0 +1,85 @@
+"""
+Tests for ScoreHistogram pricing and HistogramStore.
+
+Tests:
+1. Spread / total / team total / joint probabilities match the raw score arrays
+2. Array lines price every alt line at once
+3. HistogramStore round-trips histograms under their model version
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulator.score_histogram import HistogramStore, ScoreHistogram, model_version
+
+
+def _scores(seed=0, n=5000):
+    rng = np.random.default_rng(seed)
+    return rng.poisson(24, n).astype(float), rng.poisson(21, n).astype(float)
+
+
+def test_matches_raw_scores():
+    home, away = _scores()
+    hist = ScoreHistogram.from_scores(home, away)
+    assert hist.n == len(home)
+    assert len(hist.count) < len(home)
+
+    cover, push, away_cover = hist.spread_probs(3.0)
+    assert np.isclose(cover, np.mean(home - away > 3.0))
+    assert np.isclose(push, np.mean(home - away == 3.0))
+    assert np.isclose(away_cover, np.mean(home - away < 3.0))
+
+    over, _, under = hist.total_probs(45.5)
+    assert np.isclose(over, np.mean(home + away > 45.5))
+    assert np.isclose(under, np.mean(home + away < 45.5))
+    assert np.isclose(hist.team_total_probs('away', 20.5)[0], np.mean(away > 20.5))
+
+    joint = hist.joint_probs(3.5, 45.5)
+    assert np.isclose(joint['home_over'], np.mean((home - away > 3.5) & (home + away > 45.5)))
+    assert np.isclose(hist.teaser_probs(3.5, 6)[0], np.mean(home - away > -2.5))
+
+    moments = hist.moments()
+    assert np.isclose(moments['spread_mean'], np.mean(home - away))
+    assert np.isclose(moments['total_sd'], np.std(home + away))
+
+    h, a = hist.scores()
+    assert np.array_equal(np.sort(h), np.sort(home))
+
+
+def test_array_lines():
+    home, away = _scores(1)
+    hist = ScoreHistogram.from_scores(home, away)
+    lines = np.array([-3.5, 0.0, 2.5, 7.0])
+    cover, push, _ = hist.spread_probs(lines)
+    assert cover.shape == (4,)
+    for i, line in enumerate(lines):
+        assert np.isclose(cover[i], hist.spread_probs(line)[0])
+        assert np.isclose(push[i], hist.spread_probs(line)[1])
+
+
+def test_store_round_trip():
+    hist = ScoreHistogram.from_scores(*_scores(2, 500))
+    version = model_version({'n_sims': 500, 'seed': 2})
+    assert version != model_version({'n_sims': 500, 'seed': 3})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistogramStore(tmp, version)
+        assert store.get('2024_01_KC_BAL') is None
+        store.put('2024_01_KC_BAL', hist)
+        assert '2024_01_KC_BAL' in store
+        assert store.get('2024_01_KC_BAL') == hist
+        assert store.game_ids() == ['2024_01_KC_BAL']
+        assert HistogramStore(tmp, 'other').get('2024_01_KC_BAL') is None
+        assert ScoreHistogram.from_dict(hist.to_dict()) == hist
+
+
+if __name__ == "__main__":
+    test_matches_raw_scores()
+    test_array_lines()
+    test_store_round_trip()
+    print("✅ ScoreHistogram tests passed")
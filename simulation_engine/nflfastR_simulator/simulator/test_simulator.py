@@ -6,6 +6,7 @@ Tests:
 2. Run single game simulation
 3. Run Monte Carlo (100 sims for speed)
 4. Check outputs are reasonable
+5. Seeded runs are reproducible trial by trial, however trials are split
 """
 
 import sys
@@ -16,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from team_profile import TeamProfile
 from game_simulator import GameSimulator
+from rng import trial_rngs
 
 
 def test_simulator():
@@ -81,6 +83,28 @@ def test_simulator():
     print("\n✅ All sanity checks passed!")
 
 
+def test_reproducible_streams():
+    """Per-trial Generators give the same games serially or split across workers."""
+    data_dir = Path(__file__).parent.parent / "data" / "nflfastR"
+    home_team = TeamProfile('KC', 2024, 1, data_dir)
+    away_team = TeamProfile('BUF', 2024, 1, data_dir)
+
+    a = GameSimulator(home_team, away_team, seed=11).simulate_monte_carlo(n_sims=20)
+    b = GameSimulator(home_team, away_team, seed=11).simulate_monte_carlo(n_sims=20)
+    assert a['results'] == b['results']
+
+    # Two "workers" running interleaved trials reproduce the serial games
+    simulator = GameSimulator(home_team, away_team)
+    rngs = trial_rngs(11, 20)
+    split = {}
+    for k in range(2):
+        for i in range(k, 20, 2):
+            split[i] = simulator.simulate_game(rng=rngs[i])
+    serial = [GameSimulator(home_team, away_team).simulate_game(rng=rng) for rng in trial_rngs(11, 20)]
+    assert [split[i] for i in range(20)] == serial
+
+
 if __name__ == "__main__":
     test_simulator()
+    test_reproducible_streams()
 
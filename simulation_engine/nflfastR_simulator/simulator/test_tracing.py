@@ -0,0 +1,165 @@
+"""
+Tests for SimTrace trial scoping, sampling and bounded buffers.
+
+Tests:
+1. Trial-scoped get_events only sees the current trial
+2. sample_every records 1 in N trials
+3. max_events keeps the most recent events
+4. Events are serialized and written only on flush
+5. Monte Carlo with a sampled trace still logs one game.summary per traced trial
+6. GameStats counters agree with the traced drives and play calls
+7. gzip trace files round-trip through read_trace_events, with rotation
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulator.tracing import SimTrace
+from simulator.trace_sink import find_trace_file, read_trace_events
+
+
+def test_trial_scoping():
+    """trial_only returns just the current trial's events."""
+    trace = SimTrace(game_id="t")
+    trace.log("inputs.audit", {})
+    for _ in range(3):
+        trace.begin_trial()
+        trace.log("drive.summary", {"result": "TD"})
+        trace.log("drive.summary", {"result": "Punt"})
+
+    assert len(trace.get_events("drive.summary")) == 6
+    current = trace.get_events("drive.summary", trial_only=True)
+    assert [e["result"] for e in current] == ["TD", "Punt"]
+    assert all(e["trial"] == 3 for e in current)
+
+
+def test_sampling():
+    """sample_every=N records the 1st, (N+1)th, ... trials."""
+    trace = SimTrace(game_id="t", sample_every=4)
+    recorded = []
+    for _ in range(10):
+        trace.begin_trial()
+        recorded.append(trace.active)
+        trace.log("play.result", {"yards": np.int64(3)})
+
+    assert recorded == [True, False, False, False, True, False, False, False, True, False]
+    assert [e["trial"] for e in trace.get_events()] == [1, 5, 9]
+    assert trace.get_events(trial_only=True) == []
+
+
+def test_ring_buffer():
+    """max_events bounds memory and keeps the newest events."""
+    trace = SimTrace(game_id="t", max_events=5)
+    for i in range(20):
+        trace.log("play.result", {"i": i})
+
+    assert [e["i"] for e in trace.get_events()] == [15, 16, 17, 18, 19]
+
+
+def test_lazy_flush():
+    """Nothing is written until flush(); numpy values are converted then."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "trace.jsonl"
+        trace = SimTrace(game_id="t", out_path=path)
+        trace.log("pass.pressure", {"final": np.float32(0.25), "is_pressure": np.bool_(True)})
+        assert not path.exists()
+
+        trace.flush()
+        trace.flush()  # no duplicate lines
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(lines) == 1
+        assert lines[0]["final"] == 0.25 and lines[0]["is_pressure"] is True
+
+
+def test_disabled_trace_records_nothing():
+    """A disabled trace keeps no events."""
+    trace = SimTrace(game_id="t", enable=False)
+    trace.begin_trial()
+    assert not trace.active
+    trace.log("play.result", {"yards": 5})
+    assert trace.get_events() == []
+
+
+def test_monte_carlo_sampled_summaries():
+    """Sampled Monte Carlo keeps only the traced trials' events."""
+    from simulator.team_profile import TeamProfile
+    from simulator.game_simulator import GameSimulator
+
+    data_dir = Path(__file__).parent.parent / "data" / "nflfastR"
+    home_team = TeamProfile('KC', 2024, 1, data_dir)
+    away_team = TeamProfile('BUF', 2024, 1, data_dir)
+
+    trace = SimTrace(game_id="mc", sample_every=10)
+    simulator = GameSimulator(home_team, away_team, trace=trace, seed=1)
+    simulator.simulate_monte_carlo(n_sims=30)
+
+    summaries = trace.get_events("game.summary")
+    assert [e["trial"] for e in summaries] == [1, 11, 21]
+    # Per-trial metrics, not accumulated over all earlier trials
+    for summary in summaries:
+        assert 0 < summary["drives_per_team"] < 20
+
+
+def test_game_stats_match_trace():
+    """game.summary metrics (from GameStats) match a rescan of the trace."""
+    from simulator.team_profile import TeamProfile
+    from simulator.game_simulator import GameSimulator
+
+    data_dir = Path(__file__).parent.parent / "data" / "nflfastR"
+    home_team = TeamProfile('KC', 2024, 1, data_dir)
+    away_team = TeamProfile('BUF', 2024, 1, data_dir)
+
+    trace = SimTrace(game_id="stats")
+    simulator = GameSimulator(home_team, away_team, trace=trace, seed=3)
+    simulator.simulate_game()
+
+    drives = trace.get_events("drive.summary", trial_only=True)
+    calls = trace.get_events("call.pass_run", trial_only=True)
+    summary = trace.get_events("game.summary", trial_only=True)[0]
+
+    assert summary["drives_per_team"] == len(drives) / 2
+    assert summary["td_pct"] == sum(d["result"] == "TD" for d in drives) / len(drives)
+    assert summary["pass_rate"] == sum(c["choice"] == "pass" for c in calls) / len(calls)
+
+    # Guards still run with tracing off
+    quiet = GameSimulator(home_team, away_team, trace=SimTrace(game_id="quiet", enable=False), seed=3)
+    quiet.simulate_game()
+    assert quiet.stats.drives > 0
+    assert isinstance(quiet.realism_violations, list)
+
+
+def test_compressed_sink_rotation():
+    """gzip traces read back transparently; rotate starts a fresh file per run."""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "BUF_KC_10_2025.jsonl"
+        for run in range(2):
+            trace = SimTrace(game_id="g", out_path=out, compression="gzip", rotate=True)
+            for _ in range(2):  # two games appended as separate gzip members
+                trace.begin_trial()
+                for i in range(600):
+                    trace.log("play.result", {"i": i, "run": run})
+                trace.flush()
+
+        path = find_trace_file(Path(tmp), "BUF_KC_10_2025")
+        assert path == trace.path and path.name.endswith(".jsonl.gz")
+        events = read_trace_events(path)
+        assert len(events) == 1200 and {e["run"] for e in events} == {1}
+        assert len(read_trace_events(path.with_name(path.name + ".1"))) == 1200
+
+
+if __name__ == "__main__":
+    test_trial_scoping()
+    test_sampling()
+    test_ring_buffer()
+    test_lazy_flush()
+    test_disabled_trace_records_nothing()
+    test_monte_carlo_sampled_summaries()
+    test_game_stats_match_trace()
+    test_compressed_sink_rotation()
+    print("✅ SimTrace tests passed")
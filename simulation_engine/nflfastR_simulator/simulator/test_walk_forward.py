@@ -0,0 +1,90 @@
+"""
+Tests for walk-forward calibration.
+
+Tests:
+1. Pool-adjacent-violators and weighted logistic fits on known data
+2. A week's probabilities never depend on that week's or later outcomes
+3. Fold artifacts are reused from the cache and keyed by config
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulator.walk_forward import WalkForwardConfig, _logistic, _pav, evaluate, walk_forward
+
+
+def _backtest(seed=0, seasons=(2022, 2023), weeks=10, games=8):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for season in seasons:
+        for week in range(1, weeks + 1):
+            for g in range(games):
+                spread_raw, total_raw = rng.normal(0, 5), rng.normal(45, 4)
+                spread_line, total_line = round(rng.normal(0, 5)) + 0.5, round(rng.normal(45, 3)) + 0.5
+                margin = rng.normal(spread_raw, 13)
+                total = rng.normal(total_raw, 12)
+                rows.append({
+                    'game_id': f'{season}_{week:02d}_G{g}', 'season': season, 'week': week,
+                    'spread_raw': spread_raw, 'spread_raw_sd': 13.0, 'spread_line': spread_line,
+                    'total_raw': total_raw, 'total_raw_sd': 12.0, 'total_line': total_line,
+                    'actual_home_score': round((total + margin) / 2), 'actual_away_score': round((total - margin) / 2),
+                })
+    return pd.DataFrame(rows)
+
+
+def test_fitters():
+    assert np.allclose(_pav(np.array([1.0, 3.0, 2.0, 4.0]), np.ones(4)), [1, 2.5, 2.5, 4])
+    assert np.allclose(_pav(np.array([0.2, 0.1]), np.array([3.0, 1.0])), [0.175, 0.175])
+
+    z = np.linspace(-3, 3, 61)
+    p = 1 / (1 + np.exp(-(0.7 * z - 0.2)))
+    coef, intercept = _logistic(z, p, np.full_like(z, 100.0))
+    assert np.isclose(coef, 0.7, atol=1e-6) and np.isclose(intercept, -0.2, atol=1e-6)
+
+
+def test_no_leakage():
+    df = _backtest()
+    config = WalkForwardConfig(min_samples=20)
+    base = walk_forward(df, config, start_season=2023, cache_dir=None)
+    assert set(base['season']) == {2023}
+    assert base['p_home_cover_wf'].notna().all() and base['p_over_wf'].notna().all()
+
+    # Flip every outcome from 2023 week 5 on: weeks 1-5 must not move
+    changed = df.copy()
+    later = (changed['season'] == 2023) & (changed['week'] >= 5)
+    changed.loc[later, ['actual_home_score', 'actual_away_score']] = \
+        changed.loc[later, ['actual_away_score', 'actual_home_score']].to_numpy()
+    moved = walk_forward(changed, config, start_season=2023, cache_dir=None)
+    early = base['week'] <= 5
+    assert np.allclose(base.loc[early, 'p_home_cover_wf'], moved.loc[early, 'p_home_cover_wf'])
+    assert np.allclose(base.loc[early, 'p_over_wf'], moved.loc[early, 'p_over_wf'])
+
+    summary = evaluate(base)
+    assert list(summary['market']) == ['spread', 'total']
+    assert (summary['brier'] < 0.5).all()
+
+
+def test_fold_cache():
+    df = _backtest(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        first = walk_forward(df, WalkForwardConfig(min_samples=20), cache_dir=tmp)
+        assert first.attrs['cache_hits'] == 0
+        second = walk_forward(df, WalkForwardConfig(min_samples=20), cache_dir=tmp)
+        assert second.attrs['cache_hits'] == 2 * df[['season', 'week']].drop_duplicates().shape[0]
+        assert np.allclose(first['p_home_cover_wf'], second['p_home_cover_wf'])
+
+        platt = walk_forward(df, WalkForwardConfig(method='platt', min_samples=20), cache_dir=tmp)
+        assert platt.attrs['cache_hits'] == 0
+
+
+if __name__ == "__main__":
+    test_fitters()
+    test_no_leakage()
+    test_fold_cache()
+    print("✅ Walk-forward calibration tests passed")
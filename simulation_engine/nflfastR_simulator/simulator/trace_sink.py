@@ -0,0 +1,169 @@
+"""
+TraceSink: Buffered JSONL writer for SimTrace files.
+
+SimTrace used to open, append one line and close out_path for every
+event. The sink keeps one handle per game, buffers lines in memory and
+writes them when flush_bytes or flush_interval is exceeded; SimTrace
+closes it at the end of each traced game.
+
+Files can be gzip (.jsonl.gz) or zstd (.jsonl.zst, needs the zstandard
+package) compressed. Each game is appended as its own gzip member / zstd
+frame, and read_trace_events() decompresses them transparently:
+
+    events = read_trace_events(find_trace_file(trace_dir, "BUF_KC_10_2025"))
+
+With rotate=True an existing file is moved to <name>.1 (older copies to
+.2 ... .keep) when the sink first opens it, so re-running a game starts a
+fresh trace instead of appending to the previous run.
+"""
+
+import gzip
+import io
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+COMPRESSION_SUFFIXES = {None: ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+
+def trace_path(path: Path, compression: Optional[str] = None) -> Path:
+    """Path with the .jsonl[.gz|.zst] suffix for the given compression."""
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown trace compression: {compression!r} (use None, 'gzip' or 'zstd')")
+    path = Path(path)
+    name = path.name
+    for suffix in sorted(COMPRESSION_SUFFIXES.values(), key=len, reverse=True):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    return path.with_name(name + COMPRESSION_SUFFIXES[compression])
+
+
+def _compression_for(path: Path) -> Optional[str]:
+    """Compression by suffix, ignoring a trailing rotation number (trace.jsonl.gz.1)."""
+    name = re.sub(r"\.\d+$", "", path.name)
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if compression and name.endswith(suffix):
+            return compression
+    return None
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd trace compression requires the zstandard package (pip install zstandard)") from None
+    return zstandard
+
+
+def _open_text(path: Path, mode: str):
+    """Open a trace file in text mode ('a' or 'r'), decompressing by suffix."""
+    compression = _compression_for(path)
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if compression == "zstd":
+        zstandard = _zstandard()
+        raw = path.open(mode + "b")
+        if mode == "a":
+            stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+class TraceSink:
+    """Append-only, buffered JSONL trace writer."""
+
+    def __init__(self, path: Path, compression: Optional[str] = None,
+                 flush_bytes: int = 1 << 16, flush_interval: float = 5.0,
+                 rotate: bool = False, keep: int = 3):
+        """
+        Args:
+            path: Trace file path (suffix adjusted to match compression)
+            compression: None, 'gzip' or 'zstd'
+            flush_bytes: Write to the file once this many bytes are buffered
+            flush_interval: ... or once this many seconds passed since the last write
+            rotate: Move an existing file aside on first open instead of appending
+            keep: Number of rotated copies to keep
+        """
+        self.path = trace_path(path, compression)
+        if compression == "zstd":
+            _zstandard()  # fail at construction, not mid-simulation
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.rotate = rotate
+        self.keep = keep
+
+        self._handle = None
+        self._opened = False
+        self._lines: List[str] = []
+        self._size = 0
+        self._last_write = time.monotonic()
+
+    def write(self, line: str):
+        """Buffer one JSONL line (without newline)."""
+        self._lines.append(line)
+        self._size += len(line) + 1
+        if self._size >= self.flush_bytes or time.monotonic() - self._last_write >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write buffered lines to the file (handle stays open)."""
+        if self._lines:
+            if self._handle is None:
+                self._open()
+            self._handle.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+            self._size = 0
+        if self._handle is not None:
+            self._handle.flush()
+        self._last_write = time.monotonic()
+
+    def close(self):
+        """Flush and close the handle (ends the gzip member / zstd frame)."""
+        self.flush()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.rotate and not self._opened and self.path.exists():
+            self._rotate()
+        self._handle = _open_text(self.path, "a")
+        self._opened = True
+
+    def _rotate(self):
+        oldest = self.path.with_name(f"{self.path.name}.{self.keep}")
+        if oldest.exists():
+            oldest.unlink()
+        for n in range(self.keep - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{n}")
+            if src.exists():
+                src.rename(self.path.with_name(f"{self.path.name}.{n + 1}"))
+        if self.keep > 0:
+            self.path.rename(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+
+def find_trace_file(trace_dir: Path, stem: str) -> Optional[Path]:
+    """Existing trace file for stem (plain, gzip or zstd), or None."""
+    for suffix in COMPRESSION_SUFFIXES.values():
+        path = Path(trace_dir) / (stem + suffix)
+        if path.exists():
+            return path
+    return None
+
+
+def read_trace_events(path: Path) -> List[Dict[str, Any]]:
+    """Load all events from a (possibly compressed) JSONL trace file."""
+    events = []
+    with _open_text(Path(path), "r") as f:
+        for line in f:
+            if line.strip():
+                events.append(json.loads(line))
+    return events
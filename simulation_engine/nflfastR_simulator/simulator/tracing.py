@@ -9,13 +9,22 @@ This enables:
 - Auditing (what inputs were used?)
 """
 
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 import json
 import time
 from pathlib import Path
 import numpy as np
 
+try:
+    from .trace_sink import TraceSink, trace_path
+except ImportError:
+    from trace_sink import TraceSink, trace_path
+
+# Serialize pending events into the sink after this many log() calls
+_DRAIN_EVENTS = 512
+
 
 def _convert_to_json_serializable(obj):
     """Recursively convert numpy types to native Python types for JSON serialization."""
@@ -37,13 +46,48 @@ def _convert_to_json_serializable(obj):
 
 @dataclass
 class SimTrace:
-    """Game-wide trace for complete transparency."""
+    """Game-wide trace for complete transparency.
+
+    Monte Carlo runs reuse one trace across trials. GameSimulator calls
+    begin_trial() before each game; with sample_every=N only every Nth trial
+    is recorded (the first always is), and max_events turns the buffer into
+    a ring that keeps the most recent events. Payloads are stored as given
+    and only converted to JSON-safe dicts when read or flushed, so callers
+    must not mutate a payload after logging it.
+
+    Hot-path callers should check `active` before building a payload.
+
+    With out_path set, events go to a TraceSink (one buffered handle per
+    game, optional 'gzip'/'zstd' compression, rotate=True to start a fresh
+    file instead of appending to an earlier run).
+    """
 
     game_id: str
     enable: bool = True
-    buffer: List[Dict[str, Any]] = field(default_factory=list)
     out_path: Optional[Path] = None
     seed: Optional[int] = None
+    sample_every: int = 1
+    max_events: Optional[int] = None
+    compression: Optional[str] = None
+    rotate: bool = False
+
+    def __post_init__(self):
+        # Raw records: (t, kind, trial, payload)
+        self._events = deque(maxlen=self.max_events) if self.max_events else []
+        self._pending: List[tuple] = []  # not yet written to out_path
+        self._sink: Optional[TraceSink] = None
+        self.trial = 0  # 0 = setup events logged before the first trial
+        self._sampled = True
+
+    @property
+    def active(self) -> bool:
+        """True if log() will record events for the current trial."""
+        return self.enable and self._sampled
+
+    def begin_trial(self):
+        """Start a new simulated game; decides whether it is sampled."""
+        self.trial += 1
+        self._sampled = (self.trial - 1) % self.sample_every == 0
 
     def log(self, kind: str, payload: Dict[str, Any]):
         """Log an event to the trace.
@@ -52,48 +96,86 @@ class SimTrace:
             kind: Event type (e.g., 'inputs.audit', 'call.pass_run', 'play.result')
             payload: Event data (dict of key-value pairs)
         """
-        if not self.enable:
+        if not (self.enable and self._sampled):
             return
 
-        rec = {
-            "t": time.time(),
+        rec = (time.time(), kind, self.trial, payload)
+        self._events.append(rec)
+        if self.out_path:
+            self._pending.append(rec)
+            if len(self._pending) >= _DRAIN_EVENTS:
+                self._drain()
+
+    def _serialize(self, rec: tuple) -> Dict[str, Any]:
+        t, kind, trial, payload = rec
+        out = {
+            "t": t,
             "kind": kind,
             "game_id": self.game_id,
+            "trial": trial,
             **payload
         }
-
         # Convert numpy types to native Python types for JSON serialization
-        rec = _convert_to_json_serializable(rec)
-
-        self.buffer.append(rec)
-
-        # Write to file if path provided (JSONL format)
-        if self.out_path:
-            with self.out_path.open("a") as f:
-                f.write(json.dumps(rec) + "\n")
+        return _convert_to_json_serializable(out)
+
+    @property
+    def buffer(self) -> List[Dict[str, Any]]:
+        """All retained events as JSON-safe dicts."""
+        return [self._serialize(rec) for rec in self._events]
+
+    def _drain(self):
+        """Serialize pending events into the sink's write buffer."""
+        if self._sink is None:
+            self._sink = TraceSink(self.out_path, compression=self.compression, rotate=self.rotate)
+        for rec in self._pending:
+            self._sink.write(json.dumps(self._serialize(rec)))
+        self._pending.clear()
+
+    @property
+    def path(self) -> Optional[Path]:
+        """Actual trace file path (out_path with the compression suffix)."""
+        if self.out_path is None:
+            return None
+        return trace_path(self.out_path, self.compression)
 
     def flush(self):
-        """Flush buffer to disk if using file output."""
-        if self.out_path and self.buffer:
-            # Already written incrementally, but ensure flush
-            pass
+        """Write events logged since the last flush to out_path and close the handle.
+
+        Called by GameSimulator at the end of every traced game.
+        """
+        if not self.out_path:
+            return
+        if self._pending:
+            self._drain()
+        if self._sink is not None:
+            self._sink.close()
 
-    def get_events(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_events(self, kind: Optional[str] = None, trial_only: bool = False) -> List[Dict[str, Any]]:
         """Get all events, optionally filtered by kind.
         
         Args:
             kind: Optional event type filter
+            trial_only: Only events of the current trial (scans back from the
+                newest event, so cost is bounded by the trial's own events)
             
         Returns:
             List of event dictionaries
         """
-        if kind is None:
-            return self.buffer.copy()
-        return [e for e in self.buffer if e.get('kind') == kind]
+        if trial_only:
+            recs = []
+            for rec in reversed(self._events):
+                if rec[2] != self.trial:
+                    break
+                recs.append(rec)
+            recs.reverse()
+        else:
+            recs = self._events
+        return [self._serialize(rec) for rec in recs if kind is None or rec[1] == kind]
 
     def clear(self):
-        """Clear the trace buffer."""
-        self.buffer.clear()
+        """Clear the trace buffer (events already flushed stay on disk)."""
+        self._events.clear()
+        self._pending.clear()
 
     def save_summary(self, path: Path):
         """Save a summary of the trace to JSON.
@@ -101,22 +183,19 @@ class SimTrace:
         Args:
             path: Path to save summary JSON
         """
+        events = self.buffer
         summary = {
             "game_id": self.game_id,
             "seed": self.seed,
-            "total_events": len(self.buffer),
+            "total_events": len(events),
             "event_types": {},
-            "events": self.buffer
+            "events": events
         }
 
         # Count events by type
-        for event in self.buffer:
+        for event in events:
             event_type = event.get('kind', 'unknown')
             summary["event_types"][event_type] = summary["event_types"].get(event_type, 0) + 1
 
-        # Convert numpy types to native Python types for JSON serialization
-        summary = _convert_to_json_serializable(summary)
-
         with path.open("w") as f:
             json.dump(summary, f, indent=2)
-
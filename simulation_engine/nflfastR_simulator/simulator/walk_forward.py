@@ -0,0 +1,309 @@
+"""
+Walk-forward probability calibration over backtest results.
+
+The fit scripts (fit_isotonic_calibrators.py, fit_isotonic_on_2022_2024_only.py,
+fit_calibrator.py, ...) each refit from scratch over overlapping windows.
+Here every (season, week) is a fold whose calibrator is trained on the
+weeks before it only, then scores that week's games out of sample:
+
+- Sufficient statistics are per-week (games, covers) counts on a grid of
+  capped z-scores, z = (sim_mean - line) / sim_sd. Fold W's training data
+  is a difference of cumulative sums, so adding a week costs one row.
+- Isotonic (weighted pool-adjacent-violators) and Platt (weighted Newton)
+  fits run on the grid (~600 points), with no sklearn dependency.
+- Each fold's CompactCalibrator is cached under cache_dir by a hash of its
+  training counts and the config, so re-runs only fit folds whose data or
+  settings changed. Missing folds are fitted in parallel.
+
+    python simulator/walk_forward.py --backtest artifacts/backtest_all_games_conviction.csv \\
+        --start-season 2022 --method isotonic --workers 8
+
+    from simulator.walk_forward import WalkForwardConfig, walk_forward, evaluate
+    preds = walk_forward(backtest_df, WalkForwardConfig(method='platt', window_weeks=34))
+    evaluate(preds)
+
+Outcomes follow the backtest convention: home covers when
+actual_home - actual_away > spread_line; pushes are dropped.
+"""
+
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .probability_calibration import CompactCalibrator, calibrate_many
+except ImportError:
+    from probability_calibration import CompactCalibrator, calibrate_many
+
+BREAKEVEN = 0.524  # -110 vig breakeven
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "artifacts" / "walk_forward"
+
+# market -> (sim mean column, sim SD column, line column, probability column written)
+MARKETS = {
+    'spread': ('spread_raw', 'spread_raw_sd', 'spread_line', 'p_home_cover_wf'),
+    'total': ('total_raw', 'total_raw_sd', 'total_line', 'p_over_wf'),
+}
+
+
+@dataclass
+class WalkForwardConfig:
+    """Settings that define a calibration idea (all part of the fold cache key)."""
+    method: str = 'isotonic'                 # 'isotonic' or 'platt'
+    z_cap: float = 3.0                       # |z| cap before binning
+    z_step: float = 0.01                     # z grid spacing
+    min_samples: int = 50                    # fewer training games -> sigmoid fallback
+    window_weeks: Optional[int] = None       # train on the last N weeks (None = all prior)
+    clip: Tuple[float, float] = (0.01, 0.99)
+
+    @property
+    def n_bins(self) -> int:
+        return int(round(2 * self.z_cap / self.z_step)) + 1
+
+    def bin_centers(self) -> np.ndarray:
+        return -self.z_cap + self.z_step * np.arange(self.n_bins)
+
+
+def _outcomes(df: pd.DataFrame, market: str) -> np.ndarray:
+    """1 = home cover / over, 0 = not, NaN = push or not played."""
+    home, away = df['actual_home_score'], df['actual_away_score']
+    actual = (home - away) if market == 'spread' else (home + away)
+    line = df[MARKETS[market][2]]
+    out = np.where(actual > line, 1.0, 0.0)
+    out[(actual == line).to_numpy() | actual.isna().to_numpy()] = np.nan
+    return out
+
+
+def weekly_stats(df: pd.DataFrame, config: WalkForwardConfig, market: str,
+                 week_index: np.ndarray, n_weeks: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-week sufficient statistics on the z grid.
+
+    Returns:
+        (games, covers), each (n_weeks, n_bins)
+    """
+    mean_col, sd_col, line_col, _ = MARKETS[market]
+    z = np.clip((df[mean_col].to_numpy(float) - df[line_col].to_numpy(float))
+                / np.maximum(df[sd_col].to_numpy(float), 1e-6), -config.z_cap, config.z_cap)
+    y = _outcomes(df, market)
+    valid = ~(np.isnan(z) | np.isnan(y))
+    bins = np.rint((z[valid] + config.z_cap) / config.z_step).astype(np.int64)
+
+    games = np.zeros((n_weeks, config.n_bins))
+    covers = np.zeros((n_weeks, config.n_bins))
+    np.add.at(games, (week_index[valid], bins), 1.0)
+    np.add.at(covers, (week_index[valid], bins), y[valid])
+    return games, covers
+
+
+def _pav(y: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """Weighted non-decreasing isotonic fit (pool adjacent violators)."""
+    means, weights, sizes = [], [], []
+    for yi, wi in zip(y, w):
+        means.append(yi)
+        weights.append(wi)
+        sizes.append(1)
+        while len(means) > 1 and means[-2] > means[-1]:
+            w2 = weights[-2] + weights[-1]
+            means[-2] = (means[-2] * weights[-2] + means[-1] * weights[-1]) / w2
+            weights[-2] = w2
+            sizes[-2] += sizes[-1]
+            means.pop(); weights.pop(); sizes.pop()
+    return np.repeat(means, sizes)
+
+
+def _logistic(z: np.ndarray, y: np.ndarray, w: np.ndarray, max_iter: int = 50) -> Tuple[float, float]:
+    """Weighted logistic regression of y on z (Newton); returns (coef, intercept)."""
+    X = np.column_stack([z, np.ones_like(z)])
+    beta = np.zeros(2)
+    for _ in range(max_iter):
+        p = 1.0 / (1.0 + np.exp(-X @ beta))
+        grad = X.T @ (w * (y - p))
+        hess = (X.T * (w * p * (1 - p))) @ X + 1e-9 * np.eye(2)
+        step = np.linalg.solve(hess, grad)
+        beta += step
+        if np.abs(step).max() < 1e-10:
+            break
+    return float(beta[0]), float(beta[1])
+
+
+def fit_binned(games: np.ndarray, covers: np.ndarray, config: WalkForwardConfig) -> Optional[CompactCalibrator]:
+    """
+    Calibrator from z-grid counts.
+
+    Returns:
+        CompactCalibrator, or None with fewer than config.min_samples games
+    """
+    if games.sum() < config.min_samples:
+        return None
+    used = games > 0
+    z, n, rate = config.bin_centers()[used], games[used], covers[used] / games[used]
+    if config.method == 'isotonic':
+        return CompactCalibrator('isotonic', config.z_cap, x=z, y=_pav(rate, n), clip=config.clip)
+    if config.method == 'platt':
+        coef, intercept = _logistic(z, rate, n)
+        return CompactCalibrator('logistic', config.z_cap, coef=coef, intercept=intercept, clip=config.clip)
+    raise ValueError(f"Unknown method: {config.method}")
+
+
+def fold_key(games: np.ndarray, covers: np.ndarray, config: WalkForwardConfig, market: str) -> str:
+    """Cache key of one fold: its training counts plus the config."""
+    digest = hashlib.sha256(json.dumps([market, asdict(config)], sort_keys=True).encode())
+    digest.update(np.ascontiguousarray(games).tobytes())
+    digest.update(np.ascontiguousarray(covers).tobytes())
+    return digest.hexdigest()[:20]
+
+
+def _fit_fold(args) -> Optional[Dict]:
+    """Process-pool entry point: fit one fold, return its dict form."""
+    games, covers, config = args
+    calibrator = fit_binned(games, covers, config)
+    return calibrator.to_dict() if calibrator is not None else None
+
+
+def _load_cached(path: Path):
+    """(hit, calibrator dict or None)."""
+    if not path.exists():
+        return False, None
+    try:
+        return True, json.loads(path.read_text())
+    except (OSError, ValueError):
+        return False, None
+
+
+def walk_forward(df: pd.DataFrame, config: Optional[WalkForwardConfig] = None,
+                 start_season: Optional[int] = None, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+                 workers: int = 1) -> pd.DataFrame:
+    """
+    Out-of-sample calibrated probabilities for every completed week.
+
+    Args:
+        df: Backtest results (backtest_runner RESULT_COLUMNS with actual scores)
+        config: Calibration settings
+        start_season: First season to score (earlier weeks still train)
+        cache_dir: Fold artifact cache (None disables caching)
+        workers: Processes for fitting uncached folds
+
+    Returns:
+        game_id, season, week, p_home_cover_wf, p_over_wf and each market's
+        fold calibrator key (NaN-free; folds without enough history use the
+        sigmoid fallback)
+    """
+    config = config or WalkForwardConfig()
+    df = df[df['actual_home_score'].notna()].sort_values(['season', 'week']).reset_index(drop=True)
+    weeks = df[['season', 'week']].drop_duplicates().reset_index(drop=True)
+    week_index = df.merge(weeks.reset_index(), on=['season', 'week'], how='left')['index'].to_numpy()
+    n_weeks = len(weeks)
+    scored = [w for w in range(n_weeks) if start_season is None or weeks.loc[w, 'season'] >= start_season]
+
+    out = df[['game_id', 'season', 'week']].copy()
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
+    hits = 0
+
+    for market, (mean_col, sd_col, line_col, prob_col) in MARKETS.items():
+        games, covers = weekly_stats(df, config, market, week_index, n_weeks)
+        cum_games = np.vstack([np.zeros(config.n_bins), np.cumsum(games, axis=0)])
+        cum_covers = np.vstack([np.zeros(config.n_bins), np.cumsum(covers, axis=0)])
+
+        # Fold w trains on weeks [lo, w)
+        folds, keys, fitted = {}, {}, {}
+        for w in scored:
+            lo = 0 if config.window_weeks is None else max(0, w - config.window_weeks)
+            train = (cum_games[w] - cum_games[lo], cum_covers[w] - cum_covers[lo])
+            keys[w] = fold_key(*train, config, market)
+            hit, cached = _load_cached(cache_dir / f"{keys[w]}.json") if cache_dir else (False, None)
+            if hit:
+                fitted[w] = cached
+                hits += 1
+            else:
+                folds[w] = train
+
+        todo = sorted(folds)
+        args = [(*folds[w], config) for w in todo]
+        if workers > 1 and len(todo) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                results = list(ex.map(_fit_fold, args, chunksize=max(1, len(args) // (4 * workers))))
+        else:
+            results = [_fit_fold(a) for a in args]
+        for w, result in zip(todo, results):
+            fitted[w] = result
+            if cache_dir:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                (cache_dir / f"{keys[w]}.json").write_text(json.dumps(result))
+
+        probs = np.full(len(df), np.nan)
+        key_col = np.full(len(df), None, dtype=object)
+        for w in scored:
+            rows = week_index == w
+            calibrator = CompactCalibrator.from_dict(fitted[w]) if fitted[w] else None
+            probs[rows] = calibrate_many(df.loc[rows, mean_col], df.loc[rows, sd_col],
+                                         df.loc[rows, line_col], calibrator)
+            key_col[rows] = keys[w]
+        out[prob_col] = probs
+        out[f'{market}_fold'] = key_col
+        out[f'{market}_outcome'] = _outcomes(df, market)
+
+    out = out[out['spread_fold'].notna()].reset_index(drop=True)
+    out.attrs['cache_hits'] = hits
+    return out
+
+
+def evaluate(preds: pd.DataFrame, breakeven: float = BREAKEVEN) -> pd.DataFrame:
+    """
+    Brier score, log loss and betting record of walk-forward probabilities.
+
+    A bet is placed on whichever side's probability exceeds breakeven.
+    """
+    rows = []
+    for market, (_, _, _, prob_col) in MARKETS.items():
+        p, y = preds[prob_col].to_numpy(float), preds[f'{market}_outcome'].to_numpy(float)
+        valid = ~np.isnan(y)
+        p, y = p[valid], y[valid]
+        pc = np.clip(p, 1e-6, 1 - 1e-6)
+        bet_home, bet_away = p > breakeven, (1 - p) > breakeven
+        wins = (bet_home & (y == 1)).sum() + (bet_away & (y == 0)).sum()
+        n_bets = int(bet_home.sum() + bet_away.sum())
+        rows.append({
+            'market': market,
+            'games': int(valid.sum()),
+            'brier': float(np.mean((p - y) ** 2)),
+            'log_loss': float(-np.mean(y * np.log(pc) + (1 - y) * np.log(1 - pc))),
+            'bets': n_bets,
+            'win_rate': float(wins / n_bets) if n_bets else np.nan,
+        })
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Walk-forward calibration over backtest results')
+    parser.add_argument('--backtest', type=Path,
+                        default=Path(__file__).parent.parent / "artifacts" / "backtest_all_games_conviction.csv")
+    parser.add_argument('--start-season', type=int, default=None, help='First season to score')
+    parser.add_argument('--method', choices=['isotonic', 'platt'], default='isotonic')
+    parser.add_argument('--z-cap', type=float, default=3.0)
+    parser.add_argument('--window-weeks', type=int, default=None, help='Rolling training window (default: all prior weeks)')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--output', type=Path, help='Write per-game walk-forward probabilities here')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    config = WalkForwardConfig(method=args.method, z_cap=args.z_cap, window_weeks=args.window_weeks)
+    preds = walk_forward(pd.read_csv(args.backtest), config, start_season=args.start_season,
+                         cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR, workers=args.workers)
+    elapsed = time.perf_counter() - t0
+
+    print(f"✅ {len(preds)} games scored in {elapsed:.2f}s ({preds.attrs['cache_hits']} cached folds)")
+    print(evaluate(preds).to_string(index=False))
+    if args.output:
+        preds.to_csv(args.output, index=False)
+        print(f"💾 Saved to: {args.output}")
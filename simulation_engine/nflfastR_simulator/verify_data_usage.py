@@ -8,7 +8,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from simulator.team_profile import TeamProfile
 from simulator.game_simulator import GameSimulator
-from backtest_ultra_fast import load_games_2025
+from backtest_runner import load_games
 import inspect
 
 print("="*80)
@@ -16,7 +16,7 @@ print("DATA USAGE VERIFICATION FOR BACKTEST")
 print("="*80)
 
 # Load sample game
-games = load_games_2025()
+games = load_games([2025], range(1, 9))
 sample = games.iloc[0]
 home = sample['home_team']
 away = sample['away_team']
@@ -1,12 +1,12 @@
 #!/bin/bash
-# Watch backtest progress
+# Watch backtest progress (backtest_runner.py checkpoints each finished week)
 
 echo "🔍 BACKTEST PROGRESS MONITOR"
 echo "=============================="
 echo ""
 
 # Check if process is running
-if ps aux | grep "python3 backtest_proper.py" | grep -v grep > /dev/null; then
+if ps aux | grep -E "python3? (backtest_runner|backtest_all_games_conviction).py" | grep -v grep > /dev/null; then
     echo "✅ Backtest is RUNNING"
     echo ""
 else
@@ -22,21 +22,18 @@ tail -30 backtest_full.log 2>/dev/null || echo "No log file yet..."
 echo ""
 echo "------------------------"
 
-# Check output file
-if [ -f "artifacts/backtest_proper.csv" ]; then
-    ROWS=$(wc -l < artifacts/backtest_proper.csv)
-    GAMES=$((ROWS - 1))
-    echo "📊 Games completed: $GAMES / 831"
-    
-    if [ $GAMES -gt 1 ]; then
-        PERCENT=$((GAMES * 100 / 831))
-        echo "📈 Progress: $PERCENT%"
-    fi
+# Count games in the checkpoint(s) (first line is the run config)
+shopt -s nullglob
+CHECKPOINTS=(artifacts/*.checkpoint.jsonl)
+if [ ${#CHECKPOINTS[@]} -gt 0 ]; then
+    for CP in "${CHECKPOINTS[@]}"; do
+        ROWS=$(wc -l < "$CP")
+        echo "📊 $(basename "$CP"): $((ROWS - 1)) games completed"
+    done
 else
-    echo "📊 Output file not created yet..."
+    echo "📊 No checkpoint yet (or the run already finished)..."
 fi
 
 echo ""
 echo "Run this script again to check progress:"
 echo "  bash watch_backtest.sh"
-
@@ -0,0 +1,353 @@
+"""
+Background-refreshed team snapshots for the game detail page.
+
+Every /game/<away>/<home> view used to download the nflverse team-week
+CSV, fan out a dozen ESPN calls and build two TeamProfiles before it
+could render. TeamSnapshotStore does that work on a daemon thread and
+the page only reads memory:
+
+    snapshots = TeamSnapshotStore(profile_builder=build_profile, slate=current_slate)
+    snapshots.start()
+
+    snap = snapshots.team('KC')        # {'espn': {...}, 'team_stats': {...}} or None
+    prof = snapshots.profile('KC', 10)  # TeamProfile display dict (built once per refresh)
+
+A refresh pulls nflverse stats_team_week (one CSV for all teams) and the
+ESPN season stats, leaders, last five games, splits and schedule of all
+32 teams through http_cache, then swaps the new snapshot in. Until the
+first refresh finishes the page falls back to the last snapshot written
+to disk (data/team_snapshots.json) or to empty defaults; a view never
+waits on the network.
+"""
+import io
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from espn_data_fetcher import ESPNDataFetcher
+from nfl_edge.fetch_pool import fan_out, gather
+from nfl_edge.http_cache import get as cached_get
+
+NFLVERSE_TEAM_WEEK_URL = "https://github.com/nflverse/nflverse-data/releases/download/stats_team/stats_team_week_{season}.csv"
+SNAPSHOT_FILE = Path("data/team_snapshots.json")
+REFRESH_SECONDS = 15 * 60  # matches the espn TTL in http_cache
+
+TD_COLS = ['passing_tds', 'rushing_tds', 'receiving_tds', 'def_tds', 'special_teams_tds']
+TWO_PT_COLS = ['passing_2pt_conversions', 'rushing_2pt_conversions', 'receiving_2pt_conversions']
+
+
+def empty_espn() -> Dict:
+    """ESPN block shown when a team has no snapshot yet"""
+    return {'team_info': {}, 'leaders': {}, 'splits': {'overall': {'games': 0}}, 'last_five': [],
+            'rest_days': 7, 'travel_distance': 0}
+
+
+def empty_team_stats(team: str) -> Dict:
+    stats = dict.fromkeys(['games', 'ppg', 'pa_pg', 'off_epa', 'def_epa', 'pass_epa', 'rush_epa',
+                           'def_pass_epa', 'def_rush_epa', 'passing_yards', 'rushing_yards', 'turnovers',
+                           'sacks_taken', 'takeaways', 'last_5_ppg', 'last_5_pa'], 0)
+    stats['team'] = team
+    return stats
+
+
+def _col(df: pd.DataFrame, name: str) -> pd.Series:
+    return df[name].fillna(0) if name in df.columns else pd.Series(0.0, index=df.index)
+
+
+def nflverse_team_stats(df: pd.DataFrame) -> Dict[str, Dict]:
+    """
+    Season aggregates per team from an nflverse stats_team_week frame.
+
+    nflverse has no points column, so points per game come from TDs, FGs,
+    PATs, safeties and 2-pt conversions; last_5_ppg uses the five latest weeks.
+    """
+    if df.empty:
+        return {}
+    df = df.sort_values('week') if 'week' in df.columns else df
+    points = (6 * sum(_col(df, c) for c in TD_COLS) + 3 * _col(df, 'fg_made') + _col(df, 'pat_made')
+              + 2 * (_col(df, 'def_safeties') + sum(_col(df, c) for c in TWO_PT_COLS)))
+    df = df.assign(_points=points,
+                   _turnovers=_col(df, 'passing_interceptions') + _col(df, 'sack_fumbles_lost') + _col(df, 'rushing_fumbles_lost'),
+                   _takeaways=_col(df, 'def_interceptions') + _col(df, 'fumble_recovery_opp'))
+    grouped = df.groupby('team', sort=False)
+    means = grouped[[c for c in ('passing_epa', 'rushing_epa', 'passing_yards', 'rushing_yards', 'def_epa_per_play')
+                     if c in df.columns]].mean()
+    sums = grouped[['_turnovers', '_takeaways']].sum()
+    if 'sacks_suffered' in df.columns:
+        sums['sacks_suffered'] = grouped['sacks_suffered'].sum()
+    last_5 = grouped.tail(5).groupby('team')['_points'].mean()
+
+    def mean(team, col):
+        return float(means.at[team, col]) if col in means.columns and pd.notna(means.at[team, col]) else 0.0
+
+    stats = {}
+    for team in means.index:
+        stats[team] = {
+            'off_epa': mean(team, 'passing_epa') + mean(team, 'rushing_epa'),
+            'def_epa': mean(team, 'def_epa_per_play'),
+            'pass_epa': mean(team, 'passing_epa'),
+            'rush_epa': mean(team, 'rushing_epa'),
+            'passing_yards': mean(team, 'passing_yards'),
+            'rushing_yards': mean(team, 'rushing_yards'),
+            'turnovers': int(sums.at[team, '_turnovers']),
+            'takeaways': int(sums.at[team, '_takeaways']),
+            'sacks_taken': int(sums.at[team, 'sacks_suffered']) if 'sacks_suffered' in sums.columns else 0,
+            'def_pass_epa': 0,  # Not in raw data
+            'def_rush_epa': 0,  # Not in raw data
+            'last_5_ppg': float(last_5.get(team, 0.0)),
+        }
+    return stats
+
+
+def _rest_days(schedule: List[Dict]) -> int:
+    """Days between the last two games on the schedule (7 if unknown)"""
+    dates = sorted(g['date'] for g in schedule if g.get('date'))
+    if len(dates) < 2:
+        return 7
+    try:
+        last, current = (datetime.fromisoformat(d.replace('Z', '+00:00')) for d in dates[-2:])
+        return (current - last).days
+    except ValueError:
+        return 7
+
+
+def fetch_espn_team(team: str, season: int) -> Dict:
+    """The per-team ESPN block game_detail renders (team info, leaders, form, splits, rest)"""
+    info, leaders, last_five, splits, schedule = gather(
+        lambda: ESPNDataFetcher.fetch_team_season_stats(team, season),
+        lambda: ESPNDataFetcher.fetch_team_leaders(team),
+        lambda: ESPNDataFetcher.fetch_last_five_games(team, season),
+        lambda: ESPNDataFetcher.calculate_performance_splits(team, season),
+        lambda: ESPNDataFetcher.fetch_team_schedule(team, season),
+    )
+    return {
+        'team_info': info,
+        'detailed_stats': {},
+        'leaders': leaders,
+        'schedule': [],
+        'last_five': last_five,
+        'splits': splits,
+        'rest_days': _rest_days(schedule),
+        'travel_distance': 0,
+    }
+
+
+def fetch_nflverse_team_week(season: int) -> pd.DataFrame:
+    response = cached_get(NFLVERSE_TEAM_WEEK_URL.format(season=season), source="nflverse", timeout=30)
+    response.raise_for_status()
+    return pd.read_csv(io.BytesIO(response.content))
+
+
+def team_stats(team: str, espn: Dict, nflverse: Optional[Dict]) -> Dict:
+    """game_detail's team_stats block: record from ESPN splits, efficiency from nflverse"""
+    stats = empty_team_stats(team)
+    overall = espn.get('splits', {}).get('overall', {})
+    stats.update(games=overall.get('games', 0), ppg=overall.get('ppg', 0), pa_pg=overall.get('papg', 0))
+    if nflverse:
+        last_five = espn.get('last_five', [])[:5]
+        stats.update(nflverse)
+        stats['last_5_pa'] = float(np.mean([g.get('opp_score', 0) for g in last_five])) if last_five else 0
+    return stats
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Not JSON serializable: {type(value)}")
+
+
+class TeamSnapshotStore:
+    """Team stats and profile dicts refreshed off the request path"""
+
+    def __init__(self, season: int = 2025, teams: Optional[Iterable[str]] = None,
+                 profile_builder: Optional[Callable[[str, int, int], Dict]] = None,
+                 slate: Optional[Callable[[], Iterable[Tuple[str, int]]]] = None,
+                 path: Optional[Path] = SNAPSHOT_FILE, interval: float = REFRESH_SECONDS,
+                 fetch_team: Callable[[str, int], Dict] = fetch_espn_team,
+                 fetch_stats: Callable[[int], pd.DataFrame] = fetch_nflverse_team_week):
+        """
+        Args:
+            season: Season to snapshot
+            teams: Team abbreviations (default: every ESPN team)
+            profile_builder: (team, season, week) -> TeamProfile display dict
+            slate: Returns the (team, week) pairs whose profiles to prebuild
+            path: JSON file the last snapshot is persisted to (None = memory only)
+            interval: Seconds between refreshes
+        """
+        self.season = season
+        self.teams = list(teams or ESPNDataFetcher.TEAM_MAP)
+        self.profile_builder = profile_builder
+        self.slate = slate
+        self.path = Path(path) if path else None
+        self.interval = interval
+        self.fetch_team = fetch_team
+        self.fetch_stats = fetch_stats
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._teams: Dict[str, Dict] = {}
+        self._profiles: Dict[Tuple[str, int], Dict] = {}
+        self._wanted: set = set()
+        self.updated: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.errors: List[str] = []
+        self._load()
+
+    # --- reads (request path) ---
+
+    def team(self, team: str) -> Optional[Dict]:
+        """Snapshot {'espn', 'team_stats', 'updated'} for team, or None before the first refresh"""
+        with self._lock:
+            return self._teams.get(team)
+
+    def profile(self, team: str, week: int) -> Optional[Dict]:
+        """
+        TeamProfile display dict for (team, week).
+
+        Profiles read local nflfastR files only, so a miss is built here once
+        and kept until the next refresh (which rebuilds it in the background).
+        """
+        key = (team, int(week))
+        with self._lock:
+            cached = self._profiles.get(key)
+            self._wanted.add(key)
+        if cached is not None or self.profile_builder is None:
+            return cached
+        built = self.profile_builder(team, self.season, int(week))
+        with self._lock:
+            self._profiles[key] = built
+        return built
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'teams': len(self._teams),
+                'profiles': len(self._profiles),
+                'updated': self.updated,
+                'age_seconds': round(time.time() - self.updated, 1) if self.updated else None,
+                'last_refresh_seconds': self.last_duration,
+                'errors': list(self.errors),
+                'running': bool(self._thread and self._thread.is_alive()),
+            }
+
+    # --- refresh (background thread) ---
+
+    def refresh(self):
+        """Fetch every team, rebuild wanted profiles, swap them in and persist"""
+        start = time.perf_counter()
+        errors = []
+        try:
+            nflverse = nflverse_team_stats(self.fetch_stats(self.season))
+        except Exception as e:
+            errors.append(f"nflverse: {e}")
+            nflverse = None
+
+        def fetch(team):
+            try:
+                return self.fetch_team(team, self.season)
+            except Exception as e:
+                errors.append(f"{team}: {e}")
+                return None
+
+        now = time.time()
+        with self._lock:
+            previous = dict(self._teams)
+        teams = {}
+        for team, espn in zip(self.teams, fan_out(fetch, self.teams)):
+            old = previous.get(team)
+            if espn is None and old is None:
+                continue
+            espn = espn if espn is not None else old['espn']
+            # Keep the previous nflverse numbers if the CSV could not be fetched
+            team_nflverse = nflverse.get(team) if nflverse is not None else None
+            stats = (team_stats(team, espn, team_nflverse) if nflverse is not None or old is None
+                     else old['team_stats'])
+            teams[team] = {'espn': espn, 'team_stats': stats, 'updated': now}
+
+        profiles = self._build_profiles(errors)
+        with self._lock:
+            self._teams = teams
+            self._profiles = profiles
+            self.updated = now
+            self.last_duration = round(time.perf_counter() - start, 2)
+            self.errors = errors
+        self._save()
+
+    def _build_profiles(self, errors: List[str]) -> Dict[Tuple[str, int], Dict]:
+        if self.profile_builder is None:
+            return {}
+        with self._lock:
+            keys = set(self._wanted)
+        if self.slate is not None:
+            try:
+                keys |= {(team, int(week)) for team, week in self.slate()}
+            except Exception as e:
+                errors.append(f"slate: {e}")
+        profiles = {}
+        for team, week in sorted(keys):
+            try:
+                profiles[(team, week)] = self.profile_builder(team, self.season, week)
+            except Exception as e:
+                errors.append(f"profile {team} week {week}: {e}")
+        return profiles
+
+    def start(self) -> 'TeamSnapshotStore':
+        """Refresh now and every interval seconds on a daemon thread"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="team-snapshots", daemon=True)
+            self._thread.start()
+        return self
+
+    def refresh_soon(self):
+        """Wake the refresh thread early (e.g. after new predictions are written)"""
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+                print(f"✅ Team snapshots refreshed ({len(self._teams)} teams, {self.last_duration}s)", flush=True)
+            except Exception as e:
+                print(f"⚠️ Team snapshot refresh failed: {e}", flush=True)
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    # --- persistence ---
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get('season') != self.season:
+            return
+        self._teams = data.get('teams', {})
+        self._profiles = {(p['team'], p['week']): p['profile'] for p in data.get('profiles', [])}
+        self.updated = data.get('updated')
+
+    def _save(self):
+        if self.path is None:
+            return
+        with self._lock:
+            data = {
+                'season': self.season,
+                'updated': self.updated,
+                'teams': self._teams,
+                'profiles': [{'team': t, 'week': w, 'profile': p} for (t, w), p in self._profiles.items()],
+            }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + '.tmp')
+            tmp.write_text(json.dumps(data, default=_json_default))
+            tmp.replace(self.path)
+        except (OSError, TypeError) as e:
+            print(f"⚠️ Could not save team snapshots: {e}", flush=True)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test incremental team features against the full build_features() recompute
+"""
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from nfl_edge.features import FEATURE_COLS
+from nfl_edge.feature_state import FeatureState, check_consistency, incremental_features
+
+
+def _teamweeks(season, weeks=8, seed=0):
+    rng = np.random.default_rng(seed + season)
+    rows = []
+    for team in ("KC", "BUF", "SF"):
+        for week in range(1, weeks + 1):
+            if team == "BUF" and week == 5:
+                continue  # bye
+            if team == "SF" and week == weeks:
+                continue  # bye in the latest week: SF's features end at week - 1
+            row = {"season": season, "team": team, "week": week}
+            row.update({col: rng.normal(0.05, 0.2) for col in FEATURE_COLS})
+            rows.append(row)
+    df = pd.DataFrame(rows)
+    # Missing stats: one scattered NaN, and KC's turnover_diff missing for the last four weeks
+    df.loc[(df["team"] == "BUF") & (df["week"] == 2), "off_success_rate"] = np.nan
+    df.loc[(df["team"] == "KC") & (df["week"] > weeks - 4), "turnover_diff"] = np.nan
+    return df.sample(frac=1, random_state=seed)  # fetch order is not week order
+
+
+def test_week_by_week_matches_full_recompute():
+    teamweeks = _teamweeks(2024)
+    state = FeatureState()
+    for week in range(1, 9):
+        seen = teamweeks[teamweeks["week"] <= week]
+        absorbed = state.update(seen)
+        assert absorbed == (teamweeks["week"] == week).sum()
+        check_consistency(state, seen, recent_weight=0.88)
+        check_consistency(state, seen, recent_weight=0.67)
+
+    # Re-feeding weeks already absorbed is a no-op
+    assert state.update(teamweeks) == 0
+    feats = state.features(0.88).set_index("team")
+    assert np.isnan(feats.loc["KC", "TO_DIFF"])  # last-4 window all NaN -> NaN blend
+    assert np.isfinite(feats.loc["BUF", "OFF_SR"])
+
+
+def test_season_rollover_and_persistence():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "feature_state.json"
+        incremental_features(_teamweeks(2024), path=path, verify=True)
+        assert FeatureState.load(path).season == 2024
+
+        # A new season's frame discards the old season's aggregates
+        new_season = _teamweeks(2025, weeks=3)
+        for week in range(1, 4):
+            incremental_features(new_season[new_season["week"] <= week], path=path, verify=True)
+        state = FeatureState.load(path)
+        assert state.season == 2025 and state.teams["KC"]["week"] == 3
+        check_consistency(state, new_season)
+
+        # Two seasons in one frame: only the latest is kept, as build_features on that season
+        both = pd.concat([_teamweeks(2024), new_season])
+        state.rebuild(both)
+        check_consistency(state, new_season)
+
+
+def test_inconsistency_is_reported():
+    teamweeks = _teamweeks(2024)
+    state = FeatureState()
+    state.update(teamweeks[teamweeks["week"] <= 6])
+    # A stat correction to an absorbed week is not picked up without rebuild()
+    corrected = teamweeks.copy()
+    corrected.loc[(corrected["team"] == "KC") & (corrected["week"] == 6), "points"] += 7
+    try:
+        check_consistency(state, corrected[corrected["week"] <= 6])
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("stale state passed the consistency check")
+    state.rebuild(corrected[corrected["week"] <= 6])
+    check_consistency(state, corrected[corrected["week"] <= 6])
+
+
+if __name__ == "__main__":
+    test_week_by_week_matches_full_recompute()
+    test_season_rollover_and_persistence()
+    test_inconsistency_is_reported()
+    print("✅ Feature state tests passed")
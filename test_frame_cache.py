@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test the mtime-keyed DataFrame cache used by the dashboard loaders
+"""
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from nfl_edge.frame_cache import FrameCache
+
+
+def test_frame_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "predictions_2025_week1.csv").write_text("week,team\n1,KC\n")
+        builds = []
+
+        def sources():
+            return sorted(tmp.glob("predictions_2025_week*.csv"))
+
+        def build():
+            builds.append(1)
+            return pd.concat([pd.read_csv(p) for p in sources()], ignore_index=True)
+
+        cache = FrameCache()
+        first = cache.get("weeks", sources(), build)
+        assert len(first) == 1 and len(builds) == 1
+
+        # Unchanged files -> served from memory; callers get independent copies
+        first["team"] = "XX"
+        again = cache.get("weeks", sources(), build)
+        assert len(builds) == 1 and again["team"].tolist() == ["KC"]
+
+        # New week file -> rebuild
+        (tmp / "predictions_2025_week2.csv").write_text("week,team\n2,BUF\n")
+        assert len(cache.get("weeks", sources(), build)) == 2 and len(builds) == 2
+
+        # Rewritten file (new mtime) -> rebuild
+        path = tmp / "predictions_2025_week1.csv"
+        path.write_text("week,team\n1,KC\n1,LV\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert len(cache.get("weeks", sources(), build)) == 3 and len(builds) == 3
+
+        assert cache.stats() == {"hits": 1, "misses": 3, "entries": ["weeks"]}
+        cache.invalidate("weeks")
+        cache.get("weeks", sources(), build)
+        assert len(builds) == 4
+
+
+if __name__ == "__main__":
+    test_frame_cache()
+    print("✅ Frame cache tests passed")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test the normalized game lookups used by the live-games, grading and game detail routes
+"""
+import pandas as pd
+
+from nfl_edge.game_index import GameIndex, TeamGameIndex
+from nfl_edge.team_mapping import to_abbr
+
+
+def test_team_normalization():
+    assert to_abbr('Los Angeles Rams') == to_abbr('LA') == to_abbr('LAR') == 'LAR'
+    assert to_abbr('WSH') == to_abbr('Washington Commanders') == 'WAS'
+    assert to_abbr('packers') == 'GB' and to_abbr('Unknown FC') == 'Unknown FC'
+    assert to_abbr('Florida Panthers') == 'Florida Panthers'
+
+
+def test_game_index():
+    df = pd.DataFrame([
+        {'season': 2024, 'week': 12, 'away_team': 'KC', 'home_team': 'BUF', 'best_bet': 'old'},
+        {'season': 2025, 'week': 10, 'away_team': 'KC', 'home_team': 'BUF', 'best_bet': 'SPREAD'},
+        {'season': 2025, 'week': 10, 'away_team': 'LA', 'home_team': 'SF', 'best_bet': 'TOTAL'},
+    ])
+    index = GameIndex.from_frame(df)
+    assert len(index) == 3
+    assert index.get('KC', 'BUF')['best_bet'] == 'SPREAD'  # latest meeting
+    assert index.get('KC', 'BUF', latest=False)['season'] == 2024  # first row, as game_detail used
+    assert index.get('KC', 'BUF', week=12)['season'] == 2024
+    assert index.get('Kansas City Chiefs', 'Buffalo Bills', week=10.0, season=2025)['best_bet'] == 'SPREAD'
+    assert index.get('Los Angeles Rams', 'San Francisco 49ers')['best_bet'] == 'TOTAL'
+    assert index.get('BUF', 'KC') is None and index.get('KC', 'BUF', week=3) is None
+
+    legacy = GameIndex.from_frame(pd.DataFrame([{'week': 9, 'away': 'WAS', 'home': 'DAL'}]))
+    assert legacy.get('WSH', 'DAL', week=9) is not None
+    assert len(GameIndex.from_frame(None)) == 0
+
+
+def test_team_game_index():
+    games = [
+        {'away_team': 'Atlanta Falcons', 'home_team': 'Carolina Panthers', 'away_abbr': 'ATL',
+         'home_abbr': 'CAR', 'status': 'Final', 'sport': 'NFL'},
+        {'away_team': 'New York Jets', 'home_team': 'Buffalo Bills', 'away_abbr': 'NYJ',
+         'home_abbr': 'BUF', 'status': '2nd 4:12', 'sport': 'NFL'},
+        {'away_team': 'Florida Panthers', 'home_team': 'Boston Bruins', 'away_abbr': 'FLA',
+         'home_abbr': 'BOS', 'status': '2nd 10:00', 'sport': 'NHL'},
+        {'away_team': 'Los Angeles Lakers', 'home_team': 'Boston Celtics', 'away_abbr': 'LAL',
+         'home_abbr': 'BOS', 'status': 'Final', 'sport': 'NBA'},
+    ]
+    index = TeamGameIndex(games)
+    assert index.for_team('CAR') is games[0] and index.for_team('Jets') is games[1]
+    assert index.for_team('Cowboys') is None and index.for_team('') is None
+    assert index.in_text('Football - NFL - Buffalo Bills -3 -110') is games[1]
+
+    # Other sports match by full name only; NFL nicknames never capture them
+    assert index.in_text('Hockey - NHL - Florida Panthers -1.5') is games[2]
+    assert index.for_team('Florida Panthers') is games[2]
+    assert index.in_text('Basketball - NBA - Los Angeles Lakers -4') is games[3]
+    assert index.for_team('BOS') is None  # abbreviations are NFL-only
+
+    finals = index.filter(lambda g: 'final' in g['status'].lower())
+    assert finals.for_team('Florida Panthers') is None and finals.in_text('Florida Panthers -1.5') is None
+    assert finals.for_team('Lakers') is games[3] and finals.for_team('BUF') is None
+
+
+if __name__ == "__main__":
+    test_team_normalization()
+    test_game_index()
+    test_team_game_index()
+    print("✅ Game index tests passed")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test the shared HTTP cache against a local fixture server
+"""
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from nfl_edge import fetch_pool, http_cache
+
+BODY = b"season,week,team\n2025,1,KC\n"
+ETAG = '"v1"'
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves BODY with an ETag and counts full vs conditional requests"""
+    hits = {"full": 0, "not_modified": 0}
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == ETAG:
+            FixtureHandler.hits["not_modified"] += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        FixtureHandler.hits["full"] += 1
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_http_cache():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/stats_team_week_2025.csv"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["NFL_EDGE_HTTP_CACHE"] = tmp
+        try:
+            # Miss -> full download, stored
+            r = http_cache.get(url, source="nflverse")
+            assert r.ok and r.content == BODY and not r.from_cache
+            assert FixtureHandler.hits == {"full": 1, "not_modified": 0}
+
+            # Fresh -> served from disk, no request
+            r = http_cache.get(url, source="nflverse")
+            assert r.from_cache and r.content == BODY and r.headers["Content-Type"] == "text/csv"
+            assert FixtureHandler.hits["full"] + FixtureHandler.hits["not_modified"] == 1
+
+            # Stale -> revalidated with If-None-Match, 304, cached body
+            r = http_cache.get(url, source="nflverse", ttl=0)
+            assert r.from_cache and r.text.startswith("season")
+            assert FixtureHandler.hits == {"full": 1, "not_modified": 1}
+
+            # Query params are part of the key; identical bodies share one object
+            http_cache.get(url, params={"v": 2}, ttl=0)
+            objects = [p for p in (http_cache.cache_dir() / "objects").rglob("*") if p.is_file()]
+            assert len(objects) == 1
+
+            # Offline: cached entries served regardless of age, misses raise
+            server.shutdown()
+            http_cache.set_offline(True)
+            assert http_cache.get(url, ttl=0).content == BODY
+            try:
+                http_cache.get(url + "?missing=1")
+                assert False, "offline miss should raise"
+            except requests.ConnectionError:
+                pass
+        finally:
+            http_cache.set_offline(None)
+            del os.environ["NFL_EDGE_HTTP_CACHE"]
+            server.server_close()
+
+
+def test_fan_out_host_limits():
+    """fan_out keeps input order; host_slot never exceeds the host's concurrency cap"""
+    fetch_pool.HOST_LIMITS["fixture.test"] = (1000.0, 100, 3)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fetch(i):
+        with fetch_pool.host_slot(f"http://fixture.test/{i}"):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+        return i * i
+
+    assert fetch_pool.fan_out(fetch, range(12)) == [i * i for i in range(12)]
+    assert peak[0] == 3
+
+
+if __name__ == "__main__":
+    test_http_cache()
+    test_fan_out_host_limits()
+    print("✅ HTTP cache tests passed")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test the background job runner behind the dashboard script buttons
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from nfl_edge.jobs import JobQueue, parse_progress
+
+
+def _wait(jobs, job_id, timeout=20):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = jobs.get(job_id)
+        if job['status'] in ('succeeded', 'failed', 'cancelled'):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_parse_progress():
+    assert parse_progress("PROGRESS 40") == 0.4
+    assert parse_progress("PROGRESS: 0.25") == 0.25
+    assert parse_progress("Simulating game [3/4] KC @ BUF") == 0.75
+    assert parse_progress("✅ Loaded 272 games") is None
+
+
+def test_job_queue():
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs = JobQueue(db_path=str(Path(tmp) / "jobs.db"), log_dir=str(Path(tmp) / "logs"))
+
+        script = "import sys; print('PROGRESS 50'); print('done'); sys.exit(0)"
+        job, created = jobs.submit("demo", [sys.executable, "-c", script])
+        assert created and job['status'] in ('queued', 'running')
+        job = _wait(jobs, job['id'])
+        assert job['status'] == 'succeeded' and job['returncode'] == 0 and job['progress'] == 1.0
+        assert job['message'] == 'done'
+        assert jobs.tail(job['id']) == ['PROGRESS 50', 'done']
+
+        failed = _wait(jobs, jobs.submit("demo", [sys.executable, "-c", "import sys; print('boom'); sys.exit(3)"])[0]['id'])
+        assert failed['status'] == 'failed' and failed['returncode'] == 3 and failed['message'] == 'boom'
+
+        # Identical requests join the running job; cancel stops it
+        slow = [sys.executable, "-c", "import time; print('working', flush=True); time.sleep(30)"]
+        first, created = jobs.submit("slow", slow)
+        second, created_again = jobs.submit("slow", slow)
+        assert created and not created_again and second['id'] == first['id']
+        time.sleep(0.5)
+        assert jobs.cancel(first['id'])
+        assert _wait(jobs, first['id'])['status'] == 'cancelled'
+        assert not jobs.cancel(first['id'])
+
+        # A new runner marks jobs orphaned by a dead process as failed
+        orphan, _ = jobs.submit("short", [sys.executable, "-c", "import time; time.sleep(1)"])
+        restarted = JobQueue(db_path=str(Path(tmp) / "jobs.db"), log_dir=str(Path(tmp) / "logs"))
+        assert restarted.get(orphan['id'])['status'] == 'failed'
+        assert [j['kind'] for j in restarted.list(kind='demo')] == ['demo', 'demo']
+        jobs.shutdown()
+
+
+if __name__ == "__main__":
+    test_parse_progress()
+    test_job_queue()
+    print("✅ Job queue tests passed")
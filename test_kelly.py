@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test the vectorized betting columns against the scalar EV/Kelly helpers
+"""
+import numpy as np
+import pandas as pd
+
+from nfl_edge.kelly import (add_betting_columns, calculate_confidence_level, calculate_ev,
+                            kelly_fraction, side_prices)
+
+
+def _card():
+    return pd.DataFrame({
+        "away": ["KC", "DAL", "NYJ", "LAR", "MIA", "DET"],
+        "home": ["BUF", "PHI", "NE", "SF", "GB", "CHI"],
+        # PHI 50.0 at equal prices is a tie; NE 45.0 takes the away side; GB 56.0 at +105 is a big edge
+        "Home cover %": [58.0, 50.0, 45.0, 52.0, 56.0, 51.0],
+        "Over %": [50.0, 61.0, 40.0, 52.5, 49.0, 55.0],
+        "Spread used (home-)": [-3.0, -6.5, 2.5, -1.0, 0.0, -2.5],
+        "Total used": [47.5, 44.0, 39.5, 48.0, 41.0, 45.5],
+        "Model spread home-": [-8.0, np.nan, 3.0, -15.5, np.nan, -6.0],
+        # Per-row book prices; NaN falls back to vig
+        "Price_home_cover": [np.nan, np.nan, np.nan, +105, +105, np.nan],
+        "Price_away_cover": [np.nan, np.nan, +100, -120, np.nan, np.nan],
+        "Price_over": [np.nan, np.nan, np.nan, -125, np.nan, -102],
+        "Price_under": [np.nan, np.nan, +100, np.nan, np.nan, np.nan],
+    })
+
+
+def _scalar_row(r, vig, cap, bankroll, min_ev):
+    """The per-row computation add_betting_columns used before vectorization, with per-side prices"""
+    def price(col):
+        return vig if pd.isna(r.get(col, np.nan)) else r[col]
+
+    p_home, p_over = r["Home cover %"] / 100.0, r["Over %"] / 100.0
+    ev = {"HOME": calculate_ev(p_home, price("Price_home_cover")), "AWAY": calculate_ev(1 - p_home, price("Price_away_cover")),
+          "OVER": calculate_ev(p_over, price("Price_over")), "UNDER": calculate_ev(1 - p_over, price("Price_under"))}
+    spread_side = "HOME" if ev["HOME"] > ev["AWAY"] else "AWAY"
+    total_side = "OVER" if ev["OVER"] > ev["UNDER"] else "UNDER"
+    spread_prob = p_home if spread_side == "HOME" else 1 - p_home
+    total_prob = p_over if total_side == "OVER" else 1 - p_over
+    spread_price = price("Price_home_cover" if spread_side == "HOME" else "Price_away_cover")
+    total_price = price("Price_over" if total_side == "OVER" else "Price_under")
+    kelly_spread = kelly_fraction(spread_prob, spread_price, cap) * 100
+    kelly_total = kelly_fraction(total_prob, total_price, cap) * 100
+    level, pct = calculate_confidence_level(abs(r["Model spread home-"]))
+    return {
+        "EV_home_cover": ev["HOME"], "EV_away_cover": ev["AWAY"], "EV_over": ev["OVER"], "EV_under": ev["UNDER"],
+        "EV_spread": max(ev["HOME"], ev["AWAY"]), "EV_total": max(ev["OVER"], ev["UNDER"]),
+        "Spread_side": spread_side, "Total_side": total_side,
+        "Spread_prob": spread_prob, "Total_prob": total_prob,
+        "Kelly_spread_pct": kelly_spread, "Kelly_total_pct": kelly_total,
+        "Stake_spread": kelly_spread / 100 * bankroll, "Stake_total": kelly_total / 100 * bankroll,
+        "spread_ok": max(ev["HOME"], ev["AWAY"]) >= min_ev, "total_ok": max(ev["OVER"], ev["UNDER"]) >= min_ev,
+        "confidence_level": level, "confidence_pct": pct,
+    }
+
+
+def test_matches_scalar_helpers():
+    card = _card()
+    for vig in (-110, -105):
+        out = add_betting_columns(card, bankroll=5000, vig=vig, min_ev=0.02, kelly_fraction_cap=0.25)
+        assert len(out) == len(card) and list(out["home"]) == list(card["home"])
+        for (_, r), (_, got) in zip(card.iterrows(), out.iterrows()):
+            want = _scalar_row(r, vig, 0.25, 5000, 0.02)
+            for col, value in want.items():
+                if col == "spread_ok":
+                    assert (got["Rec_spread"] != "SKIP") == value, (r["home"], col)
+                elif col == "total_ok":
+                    assert (got["Rec_total"] != "SKIP") == value, (r["home"], col)
+                elif isinstance(value, str):
+                    assert got[col] == value, (r["home"], col, got[col], value)
+                else:
+                    assert abs(got[col] - value) < 1e-12, (r["home"], col, got[col], value)
+
+    out = add_betting_columns(card)
+    # Tie: equal EVs pick AWAY, as the scalar "HOME if h > a else AWAY" did
+    assert out["Spread_side"].iloc[1] == "AWAY" and out["Spread_prob"].iloc[1] == 0.5
+    # NaN model margins fall through to LOW like calculate_confidence_level(nan)
+    assert list(out["confidence_level"].iloc[[1, 4]]) == ["LOW", "LOW"]
+    assert list(out["confidence_pct"].iloc[[1, 4]]) == [46, 46]
+
+
+def test_recommendation_text():
+    out = add_betting_columns(_card(), bankroll=5000)
+    row = out.iloc[0]  # BUF 58% at -110
+    ev, kelly = calculate_ev(0.58), kelly_fraction(0.58) * 100
+    assert row["Rec_spread"] == f"BET BUF -3.0 @ {kelly:.1f}% (EV: {ev * 100:+.1f}%, Prob: 58.0%)"
+    assert row["Best_bet"] == "SPREAD: " + row["Rec_spread"]
+    nyj = out.iloc[2]  # away side at +100: the line is shown from the away team's view
+    assert nyj["Spread_side"] == "AWAY" and nyj["Rec_spread"].startswith("BET NYJ -2.5 @ ")
+    assert nyj["Rec_total"].startswith("BET UNDER 39.5 @ ")  # +100 under beats the spread's EV
+    assert nyj["Best_bet"] == "TOTAL: " + nyj["Rec_total"]
+    det = out.iloc[5]  # spread below min_ev, over at -102 clears it
+    assert det["Rec_spread"] == "SKIP" and det["Best_bet"] == "TOTAL: " + det["Rec_total"]
+    assert out.iloc[1]["Rec_spread"] == "SKIP"
+
+
+def test_side_prices():
+    card = _card()
+    assert list(side_prices(card, "home_cover")) == [-110, -110, -110, 105, 105, -110]
+    assert list(side_prices(card.drop(columns="Price_over"), "over", -105)) == [-105] * 6
+
+
+def test_empty_frame():
+    empty = _card().iloc[0:0]
+    out = add_betting_columns(empty)
+    assert out.empty
+    for col in ("EV_spread", "Kelly_total_pct", "Rec_spread", "Best_bet", "confidence_level"):
+        assert col in out.columns
+
+
+if __name__ == "__main__":
+    test_matches_scalar_helpers()
+    test_recommendation_text()
+    test_side_prices()
+    test_empty_frame()
+    print("✅ Kelly tests passed")
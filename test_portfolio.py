@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test joint Kelly sizing of the betting card
+"""
+import numpy as np
+import pandas as pd
+
+from nfl_edge.kelly import american_to_decimal
+from nfl_edge.portfolio import add_portfolio_columns, optimize_portfolio, spread_returns, total_returns
+
+B = american_to_decimal(-110) - 1  # net win per unit at -110
+
+
+def _bet(p_win, n=10000, b=B):
+    """Exact win/loss returns: the first p_win * n samples win"""
+    wins = int(round(p_win * n))
+    return np.r_[np.full(wins, b), np.full(n - wins, -1.0)]
+
+
+def test_single_bet_matches_kelly():
+    result = optimize_portfolio(_bet(0.6)[:, None], max_bet=0.5, max_game=0.5, max_total=0.9)
+    kelly = (0.6 * B - 0.4) / B
+    assert abs(result.fractions[0] - kelly) < 1e-3
+    assert abs(result.independent_fractions[0] - kelly) < 1e-9
+
+
+def test_negative_ev_gets_nothing():
+    R = np.column_stack([_bet(0.6), _bet(0.45)])
+    result = optimize_portfolio(R, max_bet=0.5, max_game=0.5, max_total=0.9)
+    assert result.fractions[1] == 0 and result.fractions[0] > 0.1
+    assert result.independent_fractions[1] == 0
+
+
+def test_caps():
+    rng = np.random.default_rng(1)
+    # Six independent 70% bets: full Kelly (~37% each) is far above every cap
+    R = np.column_stack([rng.permutation(_bet(0.7)) for _ in range(6)])
+    f = optimize_portfolio(R, max_bet=0.05, max_game=1.0, max_total=0.9).fractions
+    assert np.all(f <= 0.05 + 1e-6) and np.allclose(f, 0.05, atol=1e-3)
+
+    f = optimize_portfolio(R, groups=[0, 0, 1, 1, 2, 2], max_bet=0.05, max_game=0.08, max_total=0.9).fractions
+    assert np.all(f[0::2] + f[1::2] <= 0.08 + 1e-6) and abs(f.sum() - 0.24) < 1e-3
+
+    f = optimize_portfolio(R, max_bet=0.05, max_game=1.0, max_total=0.2).fractions
+    assert f.sum() <= 0.2 + 1e-6 and abs(f.sum() - 0.2) < 1e-3
+
+
+def test_correlated_bets_sized_jointly():
+    rng = np.random.default_rng(2)
+    kelly = (0.6 * B - 0.4) / B
+    same = _bet(0.6)
+    joint = optimize_portfolio(np.column_stack([same, same]), max_bet=0.5, max_game=0.5, max_total=0.9)
+    # The same outcome twice is one bet: together they stake one Kelly, not two
+    assert abs(joint.fractions.sum() - kelly) < 1e-3
+    assert abs(joint.independent_fractions.sum() - 2 * kelly) < 1e-9
+
+    apart = optimize_portfolio(np.column_stack([same, rng.permutation(same)]), max_bet=0.5, max_game=0.5, max_total=0.9)
+    assert apart.fractions.sum() > 1.5 * kelly
+
+
+def test_returns_settle_pushes():
+    home, away = np.array([24.0, 20.0, 21.0]), np.array([20.0, 20.0, 24.0])
+    assert np.allclose(spread_returns(home, away, -3, "HOME"), [B, -1, -1])
+    assert np.allclose(spread_returns(home, away, -4, "AWAY"), [0, B, B])
+    assert np.allclose(total_returns(home, away, 44, "OVER", +150), [0, -1, 1.5])
+
+
+def test_add_portfolio_columns_uses_side_prices():
+    rng = np.random.default_rng(3)
+    n = 20000
+    home = rng.normal(27, 10, (n, 2)); away = rng.normal(20, 10, (n, 2))
+    card = pd.DataFrame({
+        "Rec_spread": ["BET KC -3.0", "SKIP"], "Rec_total": ["SKIP", "BET OVER 44.0"],
+        "Spread used (home-)": [-3.0, -1.0], "Total used": [50.0, 44.0],
+        "Spread_side": ["HOME", "AWAY"], "Total_side": ["OVER", "OVER"],
+    })
+    base = add_portfolio_columns(card, home, away, bankroll=1000)
+    assert base["Port_spread_pct"].iloc[0] > 0 and base["Port_total_pct"].iloc[1] > 0
+    assert base["Port_spread_pct"].iloc[1] == 0 and base["Port_total_pct"].iloc[0] == 0
+    assert np.allclose(base["Port_stake_spread"], base["Port_spread_pct"] * 10)
+
+    # A -200 home price makes the spread bet -EV; the away price is for the other side and is ignored
+    priced = card.assign(Price_home_cover=[-200, np.nan], Price_away_cover=[+300, np.nan])
+    priced = add_portfolio_columns(priced, home, away, bankroll=1000)
+    assert priced["Port_spread_pct"].iloc[0] == 0
+    assert abs(priced["Port_total_pct"].iloc[1] - base["Port_total_pct"].iloc[1]) < 1e-3
+
+
+if __name__ == "__main__":
+    test_single_bet_matches_kelly()
+    test_negative_ev_gets_nothing()
+    test_caps()
+    test_correlated_bets_sized_jointly()
+    test_returns_settle_pushes()
+    test_add_portfolio_columns_uses_side_prices()
+    print("✅ Portfolio tests passed")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test the background team snapshot store behind the game detail page
+"""
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from team_snapshots import TeamSnapshotStore, nflverse_team_stats
+
+
+def _team_week():
+    rows = []
+    for week in range(1, 8):
+        rows.append({'team': 'KC', 'week': week, 'passing_tds': 2, 'rushing_tds': week % 2, 'fg_made': 1,
+                     'pat_made': 2 + week % 2, 'passing_epa': 0.2, 'rushing_epa': 0.0, 'passing_yards': 250,
+                     'rushing_yards': 100, 'passing_interceptions': 1, 'sack_fumbles_lost': 0,
+                     'rushing_fumbles_lost': 0, 'def_interceptions': 1, 'fumble_recovery_opp': 0,
+                     'sacks_suffered': 2})
+    return pd.DataFrame(rows).sample(frac=1, random_state=0)
+
+
+def test_nflverse_team_stats():
+    stats = nflverse_team_stats(_team_week())['KC']
+    assert abs(stats['off_epa'] - 0.2) < 1e-9
+    assert stats['turnovers'] == 7 and stats['takeaways'] == 7 and stats['sacks_taken'] == 14
+    # Weeks 3-7: odd weeks score 24, even weeks 17 -> (24 * 3 + 17 * 2) / 5
+    assert abs(stats['last_5_ppg'] - 21.2) < 1e-9
+
+
+def test_snapshot_store():
+    fetched, built = [], []
+
+    def fetch_team(team, season):
+        fetched.append(team)
+        return {'team_info': {}, 'leaders': {}, 'splits': {'overall': {'games': 7, 'ppg': 21.0, 'papg': 18.0}},
+                'last_five': [{'opp_score': 20}, {'opp_score': 10}], 'rest_days': 7, 'travel_distance': 0}
+
+    def build_profile(team, season, week):
+        built.append((team, week))
+        return {'team': team, 'week': week}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "team_snapshots.json"
+        store = TeamSnapshotStore(teams=['KC', 'BUF'], profile_builder=build_profile,
+                                  slate=lambda: [('KC', 10)], path=path,
+                                  fetch_team=fetch_team, fetch_stats=lambda season: _team_week())
+        assert store.team('KC') is None
+
+        store.refresh()
+        assert sorted(fetched) == ['BUF', 'KC'] and built == [('KC', 10)]
+        kc = store.team('KC')['team_stats']
+        assert kc['games'] == 7 and kc['last_5_pa'] == 15.0 and kc['takeaways'] == 7
+        assert store.team('BUF')['team_stats']['off_epa'] == 0  # no nflverse rows
+
+        # Slate profiles are served from memory; a miss is built once and kept
+        assert store.profile('KC', 10) == {'team': 'KC', 'week': 10}
+        store.profile('BUF', 10)
+        store.profile('BUF', 10)
+        assert built == [('KC', 10), ('BUF', 10)]
+
+        # A new store serves the persisted snapshot before its first refresh
+        reloaded = TeamSnapshotStore(teams=['KC', 'BUF'], path=path, fetch_team=fetch_team)
+        assert reloaded.team('KC')['team_stats'] == kc
+        assert reloaded.profile('KC', 10) == {'team': 'KC', 'week': 10}
+
+
+if __name__ == "__main__":
+    test_nflverse_team_stats()
+    test_snapshot_store()
+    print("✅ Team snapshot tests passed")